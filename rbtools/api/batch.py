@@ -0,0 +1,228 @@
+"""Support for performing batches of API requests concurrently.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, TYPE_CHECKING, TypeVar
+
+from rbtools.api.request import HttpRequest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import TypeAlias
+
+    from rbtools.api.transport import Transport
+
+
+logger = logging.getLogger(__name__)
+
+
+_T = TypeVar('_T')
+
+
+#: An item in a batch.
+#:
+#: This may be either an :py:class:`~rbtools.api.request.HttpRequest` (such as
+#: one returned by calling a resource's request method with
+#: ``internal=True``), or a callable taking no arguments that performs the
+#: request, such as a bound request method (``review_request.get_draft``) or
+#: a :py:func:`functools.partial` wrapping one.
+#:
+#: Version Added:
+#:     7.0
+BatchItem: TypeAlias = 'HttpRequest | Callable[[], Any]'
+
+
+#: The default maximum number of items in a batch to run at once.
+#:
+#: Version Added:
+#:     7.0
+DEFAULT_BATCH_MAX_WORKERS = 8
+
+
+@dataclass
+class BatchResult(Generic[_T]):
+    """The result of an item in a batch of API requests.
+
+    Version Added:
+        7.0
+    """
+
+    #: The result of the item, if it succeeded.
+    #:
+    #: This is usually a resource.
+    value: _T | None = None
+
+    #: The error raised by the item, if it failed.
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the item succeeded.
+
+        Type:
+            bool
+        """
+        return self.error is None
+
+    def get(self) -> _T | None:
+        """Return the result of the item, raising any error.
+
+        Returns:
+            object:
+            The result of the item.
+
+        Raises:
+            Exception:
+                The error raised by the item.
+        """
+        if self.error is not None:
+            raise self.error
+
+        return self.value
+
+
+def execute_batch(
+    transport: Transport,
+    items: Sequence[BatchItem],
+    *,
+    max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+) -> list[BatchResult]:
+    """Perform a batch of API requests concurrently.
+
+    Each item is run on a pool of worker threads. The total number of
+    requests in flight to the server is additionally capped by the server's
+    shared request limiter (see the ``HTTP_MAX_CONCURRENT_REQUESTS``
+    setting).
+
+    Version Added:
+        7.0
+
+    Args:
+        transport (rbtools.api.transport.Transport):
+            The transport used to perform any
+            :py:class:`~rbtools.api.request.HttpRequest` items.
+
+        items (list):
+            The items to run. See :py:data:`BatchItem`.
+
+        max_workers (int, optional):
+            The maximum number of items to run at once.
+
+    Returns:
+        list of BatchResult:
+        The results for each item, in the same order as ``items``. Errors are
+        captured in each result rather than raised.
+    """
+    if not items:
+        return []
+
+    def _run_item(
+        item: BatchItem,
+    ) -> BatchResult:
+        try:
+            return BatchResult(value=_call_item(transport, item))
+        except Exception as e:
+            logger.debug('Batched API request %r failed: %s', item, e)
+
+            return BatchResult(error=e)
+
+    max_workers = max(1, min(max_workers, len(items)))
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix='rbtools-batch') as executor:
+        return list(executor.map(_run_item, items))
+
+
+async def execute_batch_async(
+    transport: Transport,
+    items: Sequence[BatchItem],
+    *,
+    max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+) -> list[BatchResult]:
+    """Perform a batch of API requests concurrently on an asynchronous
+    transport.
+
+    This works like :py:func:`execute_batch`, but awaits the items on the
+    running event loop.
+
+    Version Added:
+        7.0
+
+    Args:
+        transport (rbtools.api.transport.Transport):
+            The asynchronous transport used to perform any
+            :py:class:`~rbtools.api.request.HttpRequest` items.
+
+        items (list):
+            The items to run. Callables may return awaitables. See
+            :py:data:`BatchItem`.
+
+        max_workers (int, optional):
+            The maximum number of items to run at once.
+
+    Returns:
+        list of BatchResult:
+        The results for each item, in the same order as ``items``. Errors are
+        captured in each result rather than raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def _run_item(
+        item: BatchItem,
+    ) -> BatchResult:
+        async with semaphore:
+            try:
+                value = _call_item(transport, item)
+
+                if inspect.isawaitable(value):
+                    value = await value
+
+                return BatchResult(value=value)
+            except Exception as e:
+                logger.debug('Batched API request %r failed: %s', item, e)
+
+                return BatchResult(error=e)
+
+    return list(await asyncio.gather(*(
+        _run_item(item)
+        for item in items
+    )))
+
+
+def _call_item(
+    transport: Transport,
+    item: BatchItem,
+) -> Any:
+    """Run an item in a batch.
+
+    Args:
+        transport (rbtools.api.transport.Transport):
+            The transport used to perform HttpRequest items.
+
+        item (BatchItem):
+            The item to run.
+
+    Returns:
+        object:
+        The result of the item.
+
+    Raises:
+        TypeError:
+            The item was not an HttpRequest or callable.
+    """
+    if isinstance(item, HttpRequest):
+        return transport.execute_request_method(lambda: item)
+    elif callable(item):
+        return item()
+    else:
+        raise TypeError(
+            f'Batch items must be HttpRequests or callables, not {item!r}')
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
+import dataclasses
 import datetime
 import json
 import locale
@@ -10,15 +12,31 @@ import logging
 import os
 import sqlite3
 import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
 from urllib.request import urlopen, Request
 
 from appdirs import user_cache_dir
 
 from rbtools.api.errors import CacheError
 
+try:
+    # Python >= 3.14
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping, MutableMapping
+    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
     from email.message import Message
     from http.client import HTTPResponse
     from typing import Any
@@ -35,12 +53,43 @@ MINIMUM_VERSION = '2.0.14'
 
 _locale_lock = threading.Lock()  # Lock for getting / setting locale.
 
+#: The encoding used for zlib-compressed response bodies in the cache.
+#:
+#: Version Added:
+#:     7.0
+BODY_ENCODING_ZLIB = 'zlib'
+
+#: The encoding used for zstd-compressed response bodies in the cache.
+#:
+#: Version Added:
+#:     7.0
+BODY_ENCODING_ZSTD = 'zstd'
+
+# The local date given to expired entries.
+_EXPIRED_DATE = datetime.datetime(1970, 1, 1)
+
+# Caches with pending writes to flush when the process exits.
+_open_caches: weakref.WeakSet[APICache] = weakref.WeakSet()
+
 
 class CacheEntry:
     """An entry in the API Cache."""
 
     DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'  # ISO Date format
 
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The decoded response body, if it has been decoded.
+    #:
+    #: This is kept in memory only, and is shared by every resource built
+    #: from this entry, so it must be treated as read-only.
+    #:
+    #: Version Added:
+    #:     7.0
+    decoded_payload: Any
+
     def __init__(
         self,
         url: str,
@@ -52,9 +101,14 @@ class CacheEntry:
         mime_type: str,
         item_mime_type: str,
         response_body: bytes,
+        last_access: (datetime.datetime | None) = None,
     ) -> None:
         """Create a new cache entry.
 
+        Version Changed:
+            7.0:
+            Added the ``last_access`` argument.
+
         Args:
             url (str):
                 The URL of the entry.
@@ -82,6 +136,10 @@ class CacheEntry:
 
             response_body (bytes):
                 The cached response body.
+
+            last_access (datetime.datetime, optional):
+                The local time when the entry was last used. This defaults
+                to ``local_date``.
         """
         self.url = url
         self.vary_headers = vary_headers
@@ -92,6 +150,8 @@ class CacheEntry:
         self.mime_type = mime_type
         self.item_mime_type = item_mime_type
         self.response_body = response_body
+        self.last_access = last_access or local_date
+        self.decoded_payload = None
 
     def matches_request(
         self,
@@ -112,8 +172,10 @@ class CacheEntry:
             otherwise.
         """
         if self.vary_headers:
+            # urllib normalizes header names with str.capitalize(), so
+            # they must be looked up the same way.
             for header, value in self.vary_headers.items():
-                if request.headers.get(header) != value:
+                if request.headers.get(header.capitalize()) != value:
                     return False
 
         return True
@@ -160,6 +222,22 @@ class LiveHTTPResponse:
         self.content = response.read()
         self.status = response.status
 
+        #: The cache entry the response was stored in, if any.
+        #:
+        #: Version Added:
+        #:     7.0
+        self.cache_entry: (CacheEntry | None) = None
+
+        #: How the API cache handled the request, if it was used.
+        #:
+        #: This will be ``miss`` if the cache was checked. See
+        #: :py:attr:`HTTPRequestRecord.cache_status
+        #: <rbtools.api.instrumentation.HTTPRequestRecord.cache_status>`.
+        #:
+        #: Version Added:
+        #:     7.0
+        self.cache_status: (str | None) = None
+
     @property
     def code(self) -> int:
         """The HTTP response code.
@@ -203,6 +281,22 @@ class CachedHTTPResponse:
         self.content = cache_entry.response_body
         self.status = 200
 
+        #: The cache entry for the response.
+        #:
+        #: Version Added:
+        #:     7.0
+        self.cache_entry = cache_entry
+
+        #: How the API cache handled the request.
+        #:
+        #: This is one of ``hit``, ``stale``, or ``not_modified``. See
+        #: :py:attr:`HTTPRequestRecord.cache_status
+        #: <rbtools.api.instrumentation.HTTPRequestRecord.cache_status>`.
+        #:
+        #: Version Added:
+        #:     7.0
+        self.cache_status = 'hit'
+
     @property
     def code(self) -> int:
         """The HTTP response code.
@@ -222,8 +316,86 @@ class CachedHTTPResponse:
         return self.content
 
 
+@dataclass
+class APICacheStats:
+    """Statistics on the usage of an API cache.
+
+    The request counts cover requests made through the cache instance since
+    it was created. The entry and size counts cover the whole cache.
+
+    Version Added:
+        7.0
+    """
+
+    #: The number of entries in the cache.
+    entries: int = 0
+
+    #: The total size of all cached response bodies, in bytes.
+    #:
+    #: This is the size before compression.
+    total_bytes: int = 0
+
+    #: The total size of all cached response bodies as stored, in bytes.
+    #:
+    #: This is the size after compression.
+    stored_bytes: int = 0
+
+    #: The number of GET requests served from the cache without contacting
+    #: the server.
+    hits: int = 0
+
+    #: The number of GET requests served from the cache after the server
+    #: confirmed the entry was not modified.
+    revalidations: int = 0
+
+    #: The number of GET requests served from expired entries while they
+    #: were revalidated in the background.
+    stale_hits: int = 0
+
+    #: The number of GET requests that had to be fetched from the server.
+    misses: int = 0
+
+    #: The number of entries evicted from the cache.
+    evictions: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """The ratio of uncompressed to stored response body sizes.
+
+        Type:
+            float
+        """
+        if self.stored_bytes == 0:
+            return 1.0
+
+        return self.total_bytes / self.stored_bytes
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of GET requests served from the cache.
+
+        This includes stale and revalidated entries.
+
+        Type:
+            float
+        """
+        cached = self.hits + self.stale_hits + self.revalidations
+        total = cached + self.misses
+
+        if total == 0:
+            return 0.0
+
+        return cached / total
+
+
 class APICache:
-    """An API cache backed by a SQLite database."""
+    """An API cache backed by a SQLite database.
+
+    Version Changed:
+        7.0:
+        The cache can now be bounded in size and number of entries. Once
+        the limits are exceeded, the least-recently-used entries are evicted.
+    """
 
     # The format for the Expires: header. Requires an English locale.
     EXPIRES_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
@@ -233,12 +405,118 @@ class APICache:
 
     # The API Cache's schema version. If the schema is updated, update this
     # value.
-    SCHEMA_VERSION = 2
+    SCHEMA_VERSION = 4
+
+    # Operations for pending writes.
+    _PENDING_SAVE = 'save'
+    _PENDING_TOUCH = 'touch'
+    _PENDING_DELETE = 'delete'
+
+    #: The minimum number of seconds between updates to an entry's last
+    #: access time.
+    #:
+    #: This avoids a database write for every cache hit.
+    #:
+    #: Version Added:
+    #:     7.0
+    ACCESS_UPDATE_INTERVAL = 60
+
+    #: The number of entries saved between checks of the cache limits.
+    #:
+    #: Version Added:
+    #:     7.0
+    TRIM_INTERVAL = 100
+
+    #: The number of seconds to wait for another process to release a lock
+    #: on the cache database.
+    #:
+    #: Version Added:
+    #:     7.0
+    BUSY_TIMEOUT = 10
+
+    #: The maximum number of pending writes before they're committed.
+    #:
+    #: Writes to the cache are batched and committed in a single transaction,
+    #: rather than one transaction per response. Any pending writes are also
+    #: committed when the process exits.
+    #:
+    #: Version Added:
+    #:     7.0
+    COMMIT_BATCH_SIZE = 25
+
+    #: The maximum number of seconds to hold writes before they're committed.
+    #:
+    #: Version Added:
+    #:     7.0
+    COMMIT_INTERVAL = 5
+
+    #: The minimum size of a response body to compress, in bytes.
+    #:
+    #: Smaller bodies don't compress well enough to be worth the time spent
+    #: decompressing them.
+    #:
+    #: Version Added:
+    #:     7.0
+    COMPRESSION_THRESHOLD = 1024
+
+    #: The maximum number of URLs with fresh entries to keep in memory.
+    #:
+    #: Fresh entries are kept in memory along with their decoded payloads,
+    #: so repeated requests for them don't need to touch the database or
+    #: decode the response again.
+    #:
+    #: Version Added:
+    #:     7.0
+    MEMO_SIZE = 256
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The maximum total size of cached response bodies, in bytes.
+    #:
+    #: This applies to the bodies as stored, after compression.
+    #:
+    #: Version Added:
+    #:     7.0
+    max_size: int | None
+
+    #: The maximum number of entries in the cache.
+    #:
+    #: Version Added:
+    #:     7.0
+    max_entries: int | None
+
+    #: The maximum number of seconds an expired entry may be served.
+    #:
+    #: If set, expired entries within this many seconds of expiring are
+    #: returned immediately and revalidated in the background
+    #: (stale-while-revalidate). Older entries are revalidated before they're
+    #: returned.
+    #:
+    #: Version Added:
+    #:     7.0
+    stale_max_age: int
+
+    #: Minimum freshness lifetimes for specific URLs, in seconds.
+    #:
+    #: Responses for these URLs are considered up to date for at least this
+    #: long, even if the server asks for them to be revalidated sooner. This
+    #: is used for resources that rarely change, such as the API root.
+    #:
+    #: Version Added:
+    #:     7.0
+    min_max_ages: Mapping[str, int]
 
     def __init__(
         self,
         create_db_in_memory: bool = False,
         db_location: (str | None) = None,
+        *,
+        max_size: (int | None) = None,
+        max_entries: (int | None) = None,
+        stale_max_age: int = 0,
+        min_max_ages: (Mapping[str, int] | None) = None,
     ) -> None:
         """Create a new instance of the APICache
 
@@ -246,6 +524,11 @@ class APICache:
         database; otherwise, the default cache (in the CACHE_DIR) will be used.
         The urlopen parameter determines the method that is used to open URLs.
 
+        Version Changed:
+            7.0:
+            Added the ``max_size``, ``max_entries``, ``stale_max_age``, and
+            ``min_max_ages`` arguments.
+
         Version Changed:
             4.0:
             Deprecated the ``urlopen`` parameter.
@@ -257,14 +540,82 @@ class APICache:
             db_location (str):
                 The filename of the cache database, if using.
 
+            max_size (int, optional):
+                The maximum total size of cached response bodies, in bytes.
+
+                Version Added:
+                    7.0
+
+            max_entries (int, optional):
+                The maximum number of entries in the cache.
+
+                Version Added:
+                    7.0
+
+            stale_max_age (int, optional):
+                The maximum number of seconds an expired entry may be served
+                while it's revalidated in the background. If 0, expired
+                entries are always revalidated before they're returned.
+
+                Version Added:
+                    7.0
+
+            min_max_ages (dict, optional):
+                A mapping of URLs to the minimum number of seconds their
+                responses are considered up to date.
+
+                Version Added:
+                    7.0
+
         Raises:
             CacheError:
                 The database exists but the schema could not be read.
         """
+        self.max_size = max_size or None
+        self.max_entries = max_entries or None
+        self.stale_max_age = stale_max_age
+        self.min_max_ages = min_max_ages or {}
+        self._stats = APICacheStats()
+
+        # Background revalidation of stale entries.
+        self._revalidate_executor: (ThreadPoolExecutor | None) = None
+        self._revalidating: set[tuple[str, str]] = set()
+        self._revalidating_lock = threading.Lock()
+        self._saves_since_trim = 0
+
+        # Serializes replacing revalidated entries in memory and the store.
+        self._replace_lock = threading.Lock()
+
+        # On-disk caches use a connection per thread, so that readers don't
+        # block each other. An in-memory database only exists for the
+        # connection that created it, so that connection is shared between
+        # threads and access to it is serialized through this lock. The lock
+        # also guards the list of connections.
+        self._db_lock = threading.RLock()
+        self._shared_db: (sqlite3.Connection | None) = None
+        self._thread_state = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._available = False
+
+        # Writes waiting to be committed, keyed by URL and Vary headers.
+        self._pending: dict[tuple[str, str], tuple[str, CacheEntry]] = {}
+        self._pending_lock = threading.RLock()
+
+        # Base URLs whose stored entries are waiting to be expired. These
+        # are written along with the other pending writes.
+        self._pending_expirations: set[str] = set()
+        self._pending_since: (float | None) = None
+
+        # Fresh entries kept in memory, keyed by URL, in LRU order.
+        self._memo: OrderedDict[str, list[CacheEntry]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+
         if create_db_in_memory:
             logger.debug('Creating API cache in memory.')
 
-            self.db = sqlite3.connect(':memory:')
+            self._shared_db = sqlite3.connect(':memory:',
+                                              check_same_thread=False)
+            self._available = True
             self.cache_path = None
             self._create_schema()
         else:
@@ -286,11 +637,22 @@ class APICache:
                     logger.debug('API cache "%s" does not exist; creating.',
                                  self.cache_path)
 
-                self.db = sqlite3.connect(self.cache_path)
+                self._available = True
+                db = self._connect()
+
+                # Write-ahead logging lets readers in other processes
+                # continue while a write is in progress. This is stored in
+                # the database, so it only needs to be set once.
+                row = db.execute('PRAGMA journal_mode=WAL').fetchone()
+
+                if not row or row[0].lower() != 'wal':
+                    logger.debug('Could not enable write-ahead logging for '
+                                 'API cache "%s"',
+                                 self.cache_path)
 
                 if cache_exists:
                     try:
-                        with contextlib.closing(self.db.cursor()) as c:
+                        with contextlib.closing(db.cursor()) as c:
                             c.execute('SELECT version FROM cache_info')
                             row = c.fetchone()
 
@@ -308,13 +670,141 @@ class APICache:
                 # connect fails. In either case, HTTP requests can still be
                 # made, they will just passed through to the URL opener without
                 # attempting to interact with the API cache.
+                self._available = False
                 logger.warning(
                     'Could not create or access API cache "%s". Try running '
                     '"rbt clear-cache" to clear the HTTP cache for the API.',
                     self.cache_path)
 
         if self.db is not None:
-            self.db.row_factory = APICache._row_factory
+            _open_caches.add(self)
+
+            if self.max_size or self.max_entries:
+                self.trim()
+
+    @property
+    def db(self) -> sqlite3.Connection | None:
+        """The database connection for the current thread.
+
+        This will be ``None`` if the cache database could not be accessed.
+
+        Version Changed:
+            7.0:
+            On-disk caches now use a separate connection for each thread.
+
+        Type:
+            sqlite3.Connection
+        """
+        if not self._available:
+            return None
+
+        if self._shared_db is not None:
+            return self._shared_db
+
+        db = getattr(self._thread_state, 'db', None)
+
+        if db is None:
+            try:
+                db = self._connect()
+            except sqlite3.Error as e:
+                logger.warning('Could not access API cache "%s": %s',
+                               self.cache_path, e)
+                return None
+
+        return db
+
+    def flush(self) -> None:
+        """Commit any pending writes to the cache database.
+
+        This is called automatically once enough writes are pending, after
+        :py:attr:`COMMIT_INTERVAL` seconds, and when the process exits.
+
+        If the database is locked by another process for longer than
+        :py:attr:`BUSY_TIMEOUT` seconds, the pending writes are discarded.
+
+        Any pending expirations of entries are written before the other
+        writes, so that entries saved after the expiration are kept fresh.
+
+        Version Added:
+            7.0
+
+        Raises:
+            CacheError:
+                The pending writes could not be committed.
+        """
+        with self._pending_lock:
+            pending = self._pending
+            expirations = self._pending_expirations
+            db = self.db
+
+            if (not pending and not expirations) or db is None:
+                return
+
+            self._pending = {}
+            self._pending_expirations = set()
+            self._pending_since = None
+
+            try:
+                with self._cursor() as c:
+                    if expirations:
+                        self._write_expirations(c, expirations)
+
+                    for op, entry in pending.values():
+                        self._write_pending(c, op, entry)
+
+                # This commits directly, rather than through _write_db(), so
+                # that a locked database isn't treated as a fatal error.
+                with self._get_db_lock():
+                    db.commit()
+            except sqlite3.OperationalError as e:
+                # This is most likely a locked database. Losing cache writes
+                # is harmless, so don't fail the command.
+                self._rollback()
+                logger.warning('Could not write %d entries to the HTTP '
+                               'cache: %s',
+                               len(pending), e)
+            except sqlite3.Error as e:
+                self._rollback()
+                self._die('Could not write entries to the HTTP cache for '
+                          'the API', e)
+
+    def close(self) -> None:
+        """Commit any pending writes and close the cache database.
+
+        This will wait for any background revalidations to finish first.
+
+        The cache can't be used after it's closed.
+
+        Version Added:
+            7.0
+
+        Raises:
+            CacheError:
+                The pending writes could not be committed.
+        """
+        with self._revalidating_lock:
+            executor = self._revalidate_executor
+            self._revalidate_executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        try:
+            self.flush()
+        finally:
+            with self._db_lock:
+                self._available = False
+
+                for db in self._connections:
+                    db.close()
+
+                self._connections = []
+
+                if self._shared_db is not None:
+                    self._shared_db.close()
+                    self._shared_db = None
+
+            _open_caches.discard(self)
 
     def make_request(
         self,
@@ -335,78 +825,54 @@ class APICache:
             LiveHTTPResponse or CachedHTTPResponse:
             The response object.
         """
-        if self.db is None or request.method != 'GET':
-            # We can only cache HTTP GET requests and only if we were able to
-            # access the API cache database.
+        if self.db is None:
+            # We can only cache requests if we were able to access the API
+            # cache database.
             return LiveHTTPResponse(urlopen(request))
 
-        entry = self._get_entry(request)
+        if request.method != 'GET':
+            # We can only cache HTTP GET requests. Anything else may change
+            # the resource or its parent list, so cached copies of those
+            # can't be trusted anymore. This is done even if the request
+            # fails, since the server may have made the change anyway.
+            try:
+                return LiveHTTPResponse(urlopen(request))
+            finally:
+                self._invalidate_url(request.get_full_url())
+
+        entry = (self._get_memo_entry(request) or
+                 self._get_entry(request))
 
         if entry:
             if entry.up_to_date():
                 logger.debug('Cached response for HTTP GET %s up to date',
                              request.get_full_url())
+                self._stats.hits += 1
+                self._touch_entry(entry)
+                self._remember_entry(entry)
+                response = CachedHTTPResponse(entry)
+            elif self._can_serve_stale(entry):
+                logger.debug('Serving stale cached response for HTTP GET %s '
+                             'while revalidating',
+                             request.get_full_url())
+                self._stats.stale_hits += 1
+                self._revalidate_in_background(request, entry)
                 response = CachedHTTPResponse(entry)
+                response.cache_status = 'stale'
             else:
-                if entry.etag:
-                    request.add_header('If-none-match', entry.etag)
-
-                if entry.last_modified:
-                    request.add_header('If-modified-since',
-                                       entry.last_modified)
-
-                response = LiveHTTPResponse(urlopen(request))
-
-                if response.code == 304:
-                    logger.debug('Cached response for HTTP GET %s expired '
-                                 'and was not modified',
-                                 request.get_full_url())
-                    entry.local_date = datetime.datetime.now()
-                    self._save_entry(entry)
-                    response = CachedHTTPResponse(entry)
-                elif 200 <= response.code < 300:
-                    logger.debug('Cached response for HTTP GET %s expired '
-                                 'and was modified',
-                                 request.get_full_url())
-                    response_headers = response.headers
-                    cache_info = self._get_caching_info(request.headers,
-                                                        response_headers)
-
-                    if cache_info:
-                        entry.max_age = cache_info['max_age']
-                        entry.etag = cache_info['etag']
-                        entry.local_date = datetime.datetime.now()
-                        entry.last_modified = cache_info['last_modified']
-
-                        entry.mime_type = response_headers['Content-Type']
-                        entry.item_mime_type = \
-                            response_headers.get('Item-Content-Type')
-                        entry.response_body = response.read()
-
-                        if entry.vary_headers != cache_info['vary_headers']:
-                            # The Vary: header has changed since the last time
-                            # we retrieved the resource so we need to remove
-                            # the old cache entry and save the new one.
-                            self._delete_entry(entry)
-                            entry.vary_headers = cache_info['vary_headers']
-
-                        self._save_entry(entry)
-                    else:
-                        # This resource is no longer cache-able so we should
-                        # delete our cached version.
-                        logger.debug('Cached response for HTTP GET request '
-                                     'to %s is no longer cacheable',
-                                     request.get_full_url())
-                        self._delete_entry(entry)
+                response = self._revalidate_entry(request, entry)
         else:
+            self._stats.misses += 1
             response = LiveHTTPResponse(urlopen(request))
+            response.cache_status = 'miss'
             response_headers = response.headers
 
-            cache_info = self._get_caching_info(request.headers,
+            cache_info = self._get_caching_info(request.get_full_url(),
+                                                request.headers,
                                                 response_headers)
 
             if cache_info:
-                self._save_entry(CacheEntry(
+                entry = CacheEntry(
                     request.get_full_url(),
                     cache_info['vary_headers'],
                     cache_info['max_age'],
@@ -415,7 +881,9 @@ class APICache:
                     cache_info['last_modified'],
                     response_headers.get('Content-Type'),
                     response_headers.get('Item-Content-Type'),
-                    response.read()))
+                    response.read())
+                self._save_entry(entry)
+                response.cache_entry = entry
 
                 logger.debug('Added cache entry for HTTP GET request to %s',
                              request.get_full_url())
@@ -426,14 +894,381 @@ class APICache:
 
         return response
 
+    def _revalidate_entry(
+        self,
+        request: Request,
+        entry: CacheEntry,
+    ) -> LiveHTTPResponse | CachedHTTPResponse:
+        """Revalidate an expired entry with the server.
+
+        This performs a conditional request for the entry. If the resource
+        hasn't been modified, the entry is replaced with a fresh copy.
+        Otherwise, it's replaced with an entry for the new response, or
+        removed if the response can no longer be cached. The expired entry
+        itself is never modified.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (urllib.request.Request):
+                The HTTP request for the entry.
+
+            entry (CacheEntry):
+                The expired entry.
+
+        Returns:
+            LiveHTTPResponse or CachedHTTPResponse:
+            The response object.
+        """
+        if entry.etag:
+            request.add_header('If-none-match', entry.etag)
+
+        if entry.last_modified:
+            request.add_header('If-modified-since', entry.last_modified)
+
+        response = LiveHTTPResponse(urlopen(request))
+        response.cache_status = 'miss'
+
+        # The expired entry may already have been handed to a caller (for
+        # instance, when serving it stale while revalidating), so it must
+        # never be modified. A new entry replaces it instead.
+        if response.code == 304:
+            logger.debug('Cached response for HTTP GET %s expired and was '
+                         'not modified',
+                         request.get_full_url())
+            self._stats.revalidations += 1
+            max_age = entry.max_age
+
+            if min_max_age := self.min_max_ages.get(entry.url):
+                max_age = max(max_age or 0, min_max_age)
+
+            new_entry = CacheEntry(
+                entry.url,
+                entry.vary_headers,
+                max_age,
+                entry.etag,
+                datetime.datetime.now(),
+                entry.last_modified,
+                entry.mime_type,
+                entry.item_mime_type,
+                entry.response_body)
+            new_entry.decoded_payload = entry.decoded_payload
+
+            self._replace_entry(entry, new_entry)
+            response = CachedHTTPResponse(new_entry)
+            response.cache_status = 'not_modified'
+        elif 200 <= response.code < 300:
+            logger.debug('Cached response for HTTP GET %s expired and was '
+                         'modified',
+                         request.get_full_url())
+            self._stats.misses += 1
+            response_headers = response.headers
+            cache_info = self._get_caching_info(request.get_full_url(),
+                                                request.headers,
+                                                response_headers)
+
+            if cache_info:
+                new_entry = CacheEntry(
+                    entry.url,
+                    cache_info['vary_headers'],
+                    cache_info['max_age'],
+                    cache_info['etag'],
+                    datetime.datetime.now(),
+                    cache_info['last_modified'],
+                    response_headers['Content-Type'],
+                    response_headers.get('Item-Content-Type'),
+                    response.read())
+
+                self._replace_entry(entry, new_entry)
+                response.cache_entry = new_entry
+            else:
+                # This resource is no longer cache-able so we should delete
+                # our cached version.
+                logger.debug('Cached response for HTTP GET request to %s is '
+                             'no longer cacheable',
+                             request.get_full_url())
+
+                with self._replace_lock:
+                    self._delete_entry(entry)
+
+        return response
+
+    def _replace_entry(
+        self,
+        old_entry: CacheEntry,
+        new_entry: CacheEntry,
+    ) -> None:
+        """Replace a cached entry with a newer one.
+
+        The old entry is left untouched, since it may still be in use. If
+        the Vary headers have changed, it's removed from the store.
+
+        Version Added:
+            7.0
+
+        Args:
+            old_entry (CacheEntry):
+                The entry being replaced.
+
+            new_entry (CacheEntry):
+                The entry to store in its place.
+
+        Raises:
+            CacheError:
+                The pending entries could not be written.
+        """
+        with self._replace_lock:
+            if old_entry.vary_headers != new_entry.vary_headers:
+                # The Vary: header has changed since the last time we
+                # retrieved the resource so we need to remove the old
+                # cache entry and save the new one.
+                self._delete_entry(old_entry)
+
+            self._save_entry(new_entry)
+
+    def _can_serve_stale(
+        self,
+        entry: CacheEntry,
+    ) -> bool:
+        """Return whether an expired entry may be served while revalidating.
+
+        Version Added:
+            7.0
+
+        Args:
+            entry (CacheEntry):
+                The expired entry.
+
+        Returns:
+            bool:
+            ``True`` if the entry is within :py:attr:`stale_max_age` of
+            expiring.
+        """
+        if self.stale_max_age <= 0:
+            return False
+
+        expires = entry.local_date + datetime.timedelta(
+            seconds=entry.max_age or 0)
+        staleness = datetime.datetime.now() - expires
+
+        return staleness.total_seconds() <= self.stale_max_age
+
+    def _revalidate_in_background(
+        self,
+        request: Request,
+        entry: CacheEntry,
+    ) -> None:
+        """Revalidate an expired entry in a background thread.
+
+        Only one revalidation will run at a time for any given entry. Errors
+        are logged and otherwise ignored, leaving the entry expired.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (urllib.request.Request):
+                The HTTP request for the entry.
+
+            entry (CacheEntry):
+                The expired entry.
+        """
+        key = (entry.url, json.dumps(entry.vary_headers))
+
+        def _revalidate() -> None:
+            try:
+                self._revalidate_entry(request, entry)
+            except Exception as e:
+                logger.debug('Could not revalidate cached response for HTTP '
+                             'GET %s: %s',
+                             entry.url, e)
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+
+            if self._revalidate_executor is None:
+                self._revalidate_executor = ThreadPoolExecutor(
+                    max_workers=2,
+                    thread_name_prefix='rbtools-cache-revalidate')
+
+            self._revalidating.add(key)
+            self._revalidate_executor.submit(_revalidate)
+
+    def get_stats(self) -> APICacheStats:
+        """Return statistics on the cache.
+
+        Version Added:
+            7.0
+
+        Returns:
+            APICacheStats:
+            The cache statistics.
+
+        Raises:
+            CacheError:
+                The statistics could not be read from the database.
+        """
+        stats = dataclasses.replace(self._stats)
+
+        if self.db is not None:
+            self.flush()
+
+            try:
+                with self._cursor() as c:
+                    c.execute('SELECT COUNT(*), SUM(body_size), '
+                              '       SUM(LENGTH(response_body)) '
+                              '  FROM api_cache')
+                    row = c.fetchone()
+            except sqlite3.Error as e:
+                self._die('Could not read statistics for the HTTP cache', e)
+
+            stats.entries = row[0]
+            stats.total_bytes = row[1] or 0
+            stats.stored_bytes = row[2] or 0
+
+        return stats
+
+    def trim(
+        self,
+        *,
+        max_size: (int | None) = None,
+        max_entries: (int | None) = None,
+        vacuum: bool = False,
+    ) -> int:
+        """Remove stale and least-recently-used entries from the cache.
+
+        Expired entries that can't be revalidated (ones with no
+        :mailheader:`ETag` or :mailheader:`Last-Modified` header) are always
+        removed, since they can never be used again. After that, the
+        least-recently-used entries are evicted until the cache is within
+        its size and entry limits.
+
+        This is called automatically when the cache is opened and
+        periodically as new entries are saved.
+
+        Version Added:
+            7.0
+
+        Args:
+            max_size (int, optional):
+                The maximum total size of cached response bodies, in bytes.
+                This defaults to :py:attr:`max_size`.
+
+            max_entries (int, optional):
+                The maximum number of entries to keep. This defaults to
+                :py:attr:`max_entries`.
+
+            vacuum (bool, optional):
+                Whether to compact the database file afterward, returning
+                freed space to the filesystem. This can be slow on large
+                caches.
+
+        Returns:
+            int:
+            The number of entries removed.
+
+        Raises:
+            CacheError:
+                The cache could not be trimmed.
+        """
+        if self.db is None:
+            return 0
+
+        self.flush()
+
+        max_size = max_size or self.max_size
+        max_entries = max_entries or self.max_entries
+        now = datetime.datetime.now().strftime(CacheEntry.DATE_FORMAT)
+        removed = 0
+
+        try:
+            with self._cursor() as c:
+                c.execute(
+                    """
+                    DELETE FROM api_cache
+                     WHERE etag IS NULL
+                       AND last_modified IS NULL
+                       AND (max_age IS NULL OR
+                            STRFTIME('%Y-%m-%dT%H:%M:%S', local_date,
+                                     '+' || max_age || ' seconds') <= ?)
+                    """,
+                    (now,))
+                removed += c.rowcount
+
+                if max_entries:
+                    c.execute(
+                        """
+                        DELETE FROM api_cache
+                         WHERE rowid IN (SELECT rowid
+                                           FROM api_cache
+                                          ORDER BY last_access DESC
+                                          LIMIT -1 OFFSET ?)
+                        """,
+                        (max_entries,))
+                    removed += c.rowcount
+
+                if max_size:
+                    # Walk from the most to the least recently used entry,
+                    # keeping entries until the size limit is reached.
+                    total_size = 0
+                    evict: list[tuple[int]] = []
+
+                    c.execute(
+                        """
+                        SELECT rowid, LENGTH(response_body)
+                          FROM api_cache
+                         ORDER BY last_access DESC
+                        """)
+
+                    for rowid, size in c.fetchall():
+                        total_size += size or 0
+
+                        if total_size > max_size:
+                            evict.append((rowid,))
+
+                    if evict:
+                        c.executemany('DELETE FROM api_cache WHERE rowid=?',
+                                      evict)
+                        removed += len(evict)
+
+            self._write_db()
+
+            if vacuum:
+                with self._cursor() as c:
+                    c.execute('VACUUM')
+        except sqlite3.Error as e:
+            self._die('Could not trim the HTTP cache', e)
+
+        if removed:
+            logger.debug('Removed %d entries from the HTTP cache', removed)
+
+        self._stats.evictions += removed
+        self._saves_since_trim = 0
+
+        return removed
+
     def _get_caching_info(
         self,
+        url: str,
         request_headers: MutableMapping[str, str],
         response_headers: Message,
     ) -> dict[str, Any] | None:
         """Get the caching info for the response to the given request.
 
+        Version Changed:
+            7.0:
+            Added the ``url`` argument, used to apply
+            :py:attr:`min_max_ages`.
+
         Args:
+            url (str):
+                The URL of the request.
+
             request_headers (dict):
                 The headers for the HTTP request.
 
@@ -525,7 +1360,7 @@ class APICache:
         # headers have the same value as those provided in the request.
         if vary_headers:
             vary_headers = dict(
-                (header, request_headers.get(header))
+                (header, request_headers.get(header.capitalize()))
                 for header in self._split_csv(vary_headers)
             )
         else:
@@ -542,6 +1377,11 @@ class APICache:
             # be cached.
             return None
 
+        min_max_age = self.min_max_ages.get(url)
+
+        if min_max_age:
+            max_age = max(max_age or 0, min_max_age)
+
         return {
             'max_age': max_age,
             'etag': etag,
@@ -557,7 +1397,7 @@ class APICache:
                 The database schema could not be created.
         """
         try:
-            with contextlib.closing(self.db.cursor()) as c:
+            with self._cursor() as c:
                 c.execute('DROP TABLE IF EXISTS api_cache')
                 c.execute('DROP TABLE IF EXISTS cache_info')
 
@@ -571,8 +1411,13 @@ class APICache:
                                  mime_type      TEXT,
                                  item_mime_type TEXT,
                                  response_body  BLOB,
+                                 last_access    TEXT,
+                                 body_encoding  TEXT,
+                                 body_size      INTEGER,
                                  PRIMARY KEY(url, vary_headers)
                              )''')
+                c.execute('CREATE INDEX api_cache_last_access '
+                          'ON api_cache(last_access)')
 
                 c.execute('CREATE TABLE cache_info(version INTEGER)')
 
@@ -604,11 +1449,32 @@ class APICache:
         """
         url = request.get_full_url()
 
+        # Writes that haven't been committed yet take precedence over what's
+        # in the database.
+        overridden: set[str] = set()
+
+        with self._pending_lock:
+            for (entry_url, vary_headers), (op, entry) in \
+                    self._pending.items():
+                if entry_url == url and op != self._PENDING_TOUCH:
+                    if op == self._PENDING_SAVE and \
+                       entry.matches_request(request):
+                        return entry
+
+                    overridden.add(vary_headers)
+
         try:
-            with contextlib.closing(self.db.cursor()) as c:
+            with self._cursor() as c:
+                c.row_factory = APICache._row_factory
+
                 for row in c.execute('SELECT * FROM api_cache WHERE url=?',
                                      (url,)):
-                    if row.matches_request(request):
+                    if (row is not None and
+                        json.dumps(row.vary_headers) not in overridden and
+                        row.matches_request(request)):
+                        if self._is_expiration_pending(url):
+                            row.local_date = _EXPIRED_DATE
+
                         return row
         except sqlite3.Error as e:
             self._die('Could not retrieve an entry from the HTTP cache', e)
@@ -621,8 +1487,12 @@ class APICache:
     ) -> None:
         """Save the entry into the store.
 
-        If the entry already exists in the store, do an UPDATE; otherwise do an
-        INSERT. This does not commit to the database.
+        The entry is queued, and will be written to the database along with
+        other pending writes.
+
+        Version Changed:
+            7.0:
+            Entries are no longer committed immediately.
 
         Args:
             entry (CacheEntry):
@@ -630,47 +1500,46 @@ class APICache:
 
         Raises:
             CacheError:
-                The entry could not be saved.
+                The pending entries could not be written.
         """
-        vary_headers = json.dumps(entry.vary_headers)
-        local_date = entry.local_date.strftime(entry.DATE_FORMAT)
+        entry.last_access = datetime.datetime.now()
+        self._saves_since_trim += 1
+        self._remember_entry(entry)
+        self._queue_write(self._PENDING_SAVE, entry)
 
-        try:
-            with contextlib.closing(self.db.cursor()) as c:
-                try:
-                    c.execute('''INSERT INTO api_cache (url,
-                                                        vary_headers,
-                                                        max_age,
-                                                        etag,
-                                                        local_date,
-                                                        last_modified,
-                                                        mime_type,
-                                                        item_mime_type,
-                                                        response_body)
-                                 VALUES(?,?,?,?,?,?,?,?,?)''',
-                              (entry.url, vary_headers, entry.max_age,
-                               entry.etag, local_date, entry.last_modified,
-                               entry.mime_type, entry.item_mime_type,
-                               sqlite3.Binary(entry.response_body)))
-                except sqlite3.IntegrityError:
-                    c.execute('''UPDATE api_cache
-                                 SET max_age=?,
-                                     etag=?,
-                                     local_date=?,
-                                     last_modified=?,
-                                     mime_type=?,
-                                     item_mime_type=?,
-                                     response_body=?
-                                 WHERE url=? AND vary_headers=?''',
-                              (entry.max_age, entry.etag, local_date,
-                               entry.last_modified, entry.mime_type,
-                               entry.item_mime_type,
-                               sqlite3.Binary(entry.response_body), entry.url,
-                               vary_headers))
+        if (self._saves_since_trim >= self.TRIM_INTERVAL and
+            (self.max_size or self.max_entries)):
+            self.trim()
 
-            self._write_db()
-        except sqlite3.Error as e:
-            self._die('Could not write entry to the HTTP cache for the API', e)
+    def _touch_entry(
+        self,
+        entry: CacheEntry,
+    ) -> None:
+        """Record that an entry was used.
+
+        To avoid writing to the database on every cache hit, this only
+        updates the entry if it hasn't been touched within
+        :py:attr:`ACCESS_UPDATE_INTERVAL` seconds.
+
+        Version Added:
+            7.0
+
+        Args:
+            entry (CacheEntry):
+                The cache entry that was used.
+
+        Raises:
+            CacheError:
+                The pending entries could not be written.
+        """
+        now = datetime.datetime.now()
+
+        if ((now - entry.last_access).total_seconds() <
+            self.ACCESS_UPDATE_INTERVAL):
+            return
+
+        entry.last_access = now
+        self._queue_write(self._PENDING_TOUCH, entry)
 
     def _delete_entry(
         self,
@@ -678,32 +1547,452 @@ class APICache:
     ) -> None:
         """Remove the entry from the store.
 
+        Version Changed:
+            7.0:
+            Deletions are no longer committed immediately.
+
         Args:
             entry (CacheEntry):
                 The entry to delete.
 
         Raises:
             CacheError:
-                The entry could not be deleted.
+                The pending entries could not be written.
         """
-        try:
-            with contextlib.closing(self.db.cursor()) as c:
-                c.execute(
-                    'DELETE FROM api_cache WHERE URL=? AND vary_headers=?',
-                    (entry.url, json.dumps(entry.vary_headers)))
+        self._remember_entry(entry, forget=True)
+        self._queue_write(self._PENDING_DELETE, entry)
 
-            self._write_db()
-        except sqlite3.Error as e:
-            self._die('Could not delete entry from the HTTP cache for the API',
-                      e)
+    def _queue_write(
+        self,
+        op: str,
+        entry: CacheEntry,
+    ) -> None:
+        """Queue a write to the cache database.
+
+        The pending writes are committed once there are
+        :py:attr:`COMMIT_BATCH_SIZE` of them, or once the oldest has waited
+        :py:attr:`COMMIT_INTERVAL` seconds.
+
+        Version Added:
+            7.0
+
+        Args:
+            op (str):
+                The operation to perform.
+
+            entry (CacheEntry):
+                The entry to write.
+
+        Raises:
+            CacheError:
+                The pending entries could not be written.
+        """
+        key = (entry.url, json.dumps(entry.vary_headers))
+
+        with self._pending_lock:
+            if op == self._PENDING_TOUCH:
+                existing = self._pending.get(key)
+
+                if existing is not None and existing[0] != op:
+                    # A pending save will already store the new access
+                    # time, and a pending delete takes precedence.
+                    return
+
+            self._pending[key] = (op, entry)
+
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+
+            needs_flush = (
+                len(self._pending) >= self.COMMIT_BATCH_SIZE or
+                (time.monotonic() - self._pending_since >=
+                 self.COMMIT_INTERVAL))
+
+        if needs_flush:
+            self.flush()
+
+    def _write_pending(
+        self,
+        c: sqlite3.Cursor,
+        op: str,
+        entry: CacheEntry,
+    ) -> None:
+        """Write a pending operation to the database.
+
+        Version Added:
+            7.0
+
+        Args:
+            c (sqlite3.Cursor):
+                The cursor to write with.
+
+            op (str):
+                The operation to perform.
+
+            entry (CacheEntry):
+                The entry to write.
+
+        Raises:
+            sqlite3.Error:
+                The operation failed.
+        """
+        vary_headers = json.dumps(entry.vary_headers)
+        last_access = entry.last_access.strftime(entry.DATE_FORMAT)
+
+        if op == self._PENDING_SAVE:
+            body, body_encoding = self._compress_body(entry.response_body)
+
+            c.execute('''INSERT OR REPLACE INTO api_cache (url,
+                                                         vary_headers,
+                                                         max_age,
+                                                         etag,
+                                                         local_date,
+                                                         last_modified,
+                                                         mime_type,
+                                                         item_mime_type,
+                                                         response_body,
+                                                         last_access,
+                                                         body_encoding,
+                                                         body_size)
+                         VALUES(?,?,?,?,?,?,?,?,?,?,?,?)''',
+                      (entry.url, vary_headers, entry.max_age, entry.etag,
+                       entry.local_date.strftime(entry.DATE_FORMAT),
+                       entry.last_modified, entry.mime_type,
+                       entry.item_mime_type, sqlite3.Binary(body),
+                       last_access, body_encoding,
+                       len(entry.response_body)))
+        elif op == self._PENDING_TOUCH:
+            c.execute('UPDATE api_cache SET last_access=? '
+                      ' WHERE url=? AND vary_headers=?',
+                      (last_access, entry.url, vary_headers))
+        elif op == self._PENDING_DELETE:
+            c.execute('DELETE FROM api_cache WHERE url=? AND vary_headers=?',
+                      (entry.url, vary_headers))
+        else:
+            raise ValueError(f'Unknown cache operation "{op}"')
+
+    def _get_memo_entry(
+        self,
+        request: Request,
+    ) -> CacheEntry | None:
+        """Return an entry kept in memory that matches the request.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (urllib.request.Request):
+                The HTTP request to check.
+
+        Returns:
+            CacheEntry:
+            The matching entry, or ``None`` if no entry is in memory.
+        """
+        url = request.get_full_url()
+
+        with self._memo_lock:
+            entries = self._memo.get(url)
+
+            if entries:
+                for entry in entries:
+                    if entry.matches_request(request):
+                        self._memo.move_to_end(url)
+
+                        return entry
+
+        return None
+
+    def _remember_entry(
+        self,
+        entry: CacheEntry,
+        *,
+        forget: bool = False,
+    ) -> None:
+        """Keep an entry in memory, or forget it if it's no longer fresh.
+
+        Version Added:
+            7.0
+
+        Args:
+            entry (CacheEntry):
+                The entry to remember.
+
+            forget (bool, optional):
+                Whether to forget the entry even if it's fresh.
+        """
+        url = entry.url
+
+        with self._memo_lock:
+            entries = [
+                other_entry
+                for other_entry in self._memo.get(url, [])
+                if other_entry.vary_headers != entry.vary_headers
+            ]
+
+            if not forget and entry.up_to_date():
+                entries.append(entry)
+
+            if entries:
+                self._memo[url] = entries
+                self._memo.move_to_end(url)
+
+                while len(self._memo) > self.MEMO_SIZE:
+                    self._memo.popitem(last=False)
+            else:
+                self._memo.pop(url, None)
+
+    def _invalidate_url(
+        self,
+        url: str,
+    ) -> None:
+        """Expire cached entries for a URL and its parent.
+
+        This is used after a request that may have modified a resource.
+        Entries kept in memory are dropped, and stored entries for the URL
+        and its parent (including any query string variants) are marked as
+        expired, so they'll be revalidated with the server the next time
+        they're requested.
+
+        The expiration is queued along with other pending writes, rather
+        than committed immediately, so this never touches the database.
+
+        Version Added:
+            7.0
+
+        Args:
+            url (str):
+                The URL of the modified resource.
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip('/')
+        base_urls: set[str] = set()
+
+        for invalid_path in (path, path.rsplit('/', 1)[0]):
+            base_urls.add(urlunsplit(parts._replace(path=f'{invalid_path}/',
+                                                    query='',
+                                                    fragment='')))
+
+        def _is_invalid(
+            entry_url: str,
+        ) -> bool:
+            return entry_url.split('?', 1)[0] in base_urls
+
+        with self._memo_lock:
+            for entry_url in list(self._memo.keys()):
+                if _is_invalid(entry_url):
+                    del self._memo[entry_url]
+
+        with self._pending_lock:
+            # Entries saved before the expiration would otherwise be
+            # written as fresh. They may be in use, so expired copies are
+            # saved instead.
+            for key, (op, entry) in list(self._pending.items()):
+                if op == self._PENDING_SAVE and _is_invalid(entry.url):
+                    self._pending[key] = (
+                        op,
+                        CacheEntry(entry.url,
+                                   entry.vary_headers,
+                                   entry.max_age,
+                                   entry.etag,
+                                   _EXPIRED_DATE,
+                                   entry.last_modified,
+                                   entry.mime_type,
+                                   entry.item_mime_type,
+                                   entry.response_body,
+                                   last_access=entry.last_access))
+
+            self._pending_expirations.update(base_urls)
+
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+
+    def _is_expiration_pending(
+        self,
+        url: str,
+    ) -> bool:
+        """Return whether stored entries for a URL are waiting to expire.
+
+        Version Added:
+            7.0
+
+        Args:
+            url (str):
+                The URL to check.
+
+        Returns:
+            bool:
+            ``True`` if an expiration for the URL has been queued but not
+            yet written.
+        """
+        with self._pending_lock:
+            return url.split('?', 1)[0] in self._pending_expirations
+
+    def _write_expirations(
+        self,
+        c: sqlite3.Cursor,
+        base_urls: Iterable[str],
+    ) -> None:
+        """Expire stored entries for URLs and their query string variants.
+
+        Version Added:
+            7.0
+
+        Args:
+            c (sqlite3.Cursor):
+                The cursor to write with.
+
+            base_urls (iterable of str):
+                The URLs to expire, without query strings.
+
+        Raises:
+            sqlite3.Error:
+                The entries could not be expired.
+        """
+        expired_date = _EXPIRED_DATE.strftime(CacheEntry.DATE_FORMAT)
+
+        for base_url in base_urls:
+            c.execute(
+                'UPDATE api_cache SET local_date=? '
+                ' WHERE url=? OR SUBSTR(url, 1, ?)=?',
+                (expired_date, base_url, len(base_url) + 1, f'{base_url}?'))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database for the current thread.
+
+        Version Added:
+            7.0
+
+        Returns:
+            sqlite3.Connection:
+            The new connection.
+
+        Raises:
+            sqlite3.Error:
+                The database could not be opened.
+        """
+        assert self.cache_path
+
+        # The connection is only used by this thread, but may be closed from
+        # another thread in close().
+        db = sqlite3.connect(self.cache_path,
+                             timeout=self.BUSY_TIMEOUT,
+                             check_same_thread=False)
+
+        # With write-ahead logging, this is still safe against corruption,
+        # but avoids an fsync on every commit.
+        db.execute('PRAGMA synchronous=NORMAL')
+
+        self._thread_state.db = db
+
+        with self._db_lock:
+            self._connections.append(db)
+
+        return db
+
+    @contextlib.contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Return a cursor for the current thread's connection.
+
+        Version Added:
+            7.0
+
+        Context:
+            sqlite3.Cursor:
+            The cursor to use.
+        """
+        db = self.db
+        assert db is not None
+
+        with self._get_db_lock(), contextlib.closing(db.cursor()) as c:
+            yield c
+
+    def _get_db_lock(self) -> contextlib.AbstractContextManager:
+        """Return the lock needed to use the current thread's connection.
+
+        Only the shared in-memory connection needs locking.
+
+        Version Added:
+            7.0
+
+        Returns:
+            contextlib.AbstractContextManager:
+            The lock to hold while using the connection.
+        """
+        if self._shared_db is not None:
+            return self._db_lock
+        else:
+            return contextlib.nullcontext()
+
+    def _rollback(self) -> None:
+        """Roll back any uncommitted changes on the current connection.
+
+        Version Added:
+            7.0
+        """
+        db = self.db
+
+        if db is not None:
+            try:
+                db.rollback()
+            except sqlite3.Error:
+                pass
+
+    def _compress_body(
+        self,
+        body: bytes,
+    ) -> tuple[bytes, str | None]:
+        """Compress a response body for storage.
+
+        Bodies are compressed with zstd if available, or zlib otherwise.
+        Bodies smaller than :py:attr:`COMPRESSION_THRESHOLD`, or that don't
+        get any smaller, are stored as-is.
+
+        Version Added:
+            7.0
+
+        Args:
+            body (bytes):
+                The response body.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (bytes):
+                    The body to store.
+
+                1 (str):
+                    The encoding of the stored body, or ``None`` if it's
+                    not compressed.
+        """
+        if len(body) < self.COMPRESSION_THRESHOLD:
+            return body, None
+
+        if zstd is not None:
+            compressed = zstd.compress(body)
+            encoding = BODY_ENCODING_ZSTD
+        else:
+            compressed = zlib.compress(body)
+            encoding = BODY_ENCODING_ZLIB
+
+        if len(compressed) >= len(body):
+            return body, None
+
+        return compressed, encoding
 
     @staticmethod
     def _row_factory(
         cursor: sqlite3.Cursor,
         row: sqlite3.Row,
-    ) -> CacheEntry:
+    ) -> CacheEntry | None:
         """A factory for creating individual Cache Entries from db rows.
 
+        Version Changed:
+            7.0:
+            This now returns ``None`` if the response body can't be
+            decompressed.
+
         Args:
             cursor (sqlite3.Cursor):
                 The database cursor.
@@ -713,8 +2002,35 @@ class APICache:
 
         Returns:
             CacheEntry:
-            The cache entry representing the row.
+            The cache entry representing the row, or ``None`` if the entry
+            can't be read.
         """
+        body = bytes(row[8])
+        body_encoding = row[10]
+
+        try:
+            if body_encoding == BODY_ENCODING_ZLIB:
+                body = zlib.decompress(body)
+            elif body_encoding == BODY_ENCODING_ZSTD:
+                if zstd is None:
+                    # This may have been written by another version of
+                    # Python sharing the cache.
+                    logger.debug('Skipping zstd-compressed cache entry for '
+                                 '%s; zstd is not available.',
+                                 row[0])
+                    return None
+
+                body = zstd.decompress(body)
+            elif body_encoding is not None:
+                logger.debug('Skipping cache entry for %s with unknown '
+                             'encoding "%s".',
+                             row[0], body_encoding)
+                return None
+        except Exception as e:
+            logger.debug('Could not decompress cache entry for %s: %s',
+                         row[0], e)
+            return None
+
         return CacheEntry(
             url=row[0],
             vary_headers=json.loads(row[1]),
@@ -725,7 +2041,9 @@ class APICache:
             last_modified=row[5],
             mime_type=row[6],
             item_mime_type=row[7],
-            response_body=bytes(row[8]))
+            response_body=body,
+            last_access=datetime.datetime.strptime(
+                row[9], CacheEntry.DATE_FORMAT))
 
     def _write_db(self) -> None:
         """Flush the contents of the DB to the disk.
@@ -734,9 +2052,12 @@ class APICache:
             CacheError:
                 The cache database could not be written.
         """
-        if self.db:
+        db = self.db
+
+        if db is not None:
             try:
-                self.db.commit()
+                with self._get_db_lock():
+                    db.commit()
             except sqlite3.Error as e:
                 self._die('Could not write database to disk', e)
 
@@ -805,9 +2126,29 @@ def clear_cache(cache_path: str = APICache.DEFAULT_CACHE_PATH) -> bool:
     """
     try:
         os.unlink(cache_path)
+
+        # Remove any write-ahead log left by an unclean exit.
+        for suffix in ('-wal', '-shm'):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(cache_path + suffix)
+
         return True
     except Exception as e:
         logger.error('Could not clear cache in "%s": %s. Try manually '
                      'removing it if it exists.',
                      cache_path, e)
         return False
+
+
+@atexit.register
+def _flush_open_caches() -> None:
+    """Commit pending writes for all open caches at exit.
+
+    Version Added:
+        7.0
+    """
+    for cache in list(_open_caches):
+        try:
+            cache.flush()
+        except Exception as e:
+            logger.debug('Could not flush API cache on exit: %s', e)
@@ -6,9 +6,20 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from rbtools.api.batch import (DEFAULT_BATCH_MAX_WORKERS,
+                               execute_batch,
+                               execute_batch_async)
+from rbtools.api.transport.asynchronous import AsyncTransport
 from rbtools.api.transport.sync import SyncTransport
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from rbtools.api.batch import BatchItem, BatchResult
+    from rbtools.api.instrumentation import HTTPRequestStats
     from rbtools.api.resource import Resource, RootResource
     from rbtools.api.transport import Transport
 
@@ -278,6 +289,54 @@ class RBClient:
         """
         self._transport.logout(*args, **kwargs)
 
+    def batch(
+        self,
+        items: Sequence[BatchItem],
+        *,
+        max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+    ) -> list[BatchResult]:
+        """Perform a batch of independent API requests concurrently.
+
+        Each item may be a request method to call (such as
+        ``review_request.get_draft``, or a :py:func:`functools.partial`
+        wrapping ``review_request.get_reviews`` with arguments), or an
+        :py:class:`~rbtools.api.request.HttpRequest` returned by calling a
+        request method with ``internal=True``:
+
+        .. code-block:: python
+
+           results = client.batch([
+               review_request.get_draft
+               for review_request in review_requests
+           ])
+
+           for result in results:
+               if result.succeeded:
+                   draft = result.value
+
+        The total number of requests in flight to the server is capped by
+        the ``HTTP_MAX_CONCURRENT_REQUESTS`` setting, which is shared by all
+        clients in the process.
+
+        Version Added:
+            7.0
+
+        Args:
+            items (list):
+                The request methods or requests to perform.
+
+            max_workers (int, optional):
+                The maximum number of items to run at once.
+
+        Returns:
+            list of rbtools.api.batch.BatchResult:
+            The results for each item, in the same order as ``items``. If an
+            item fails, the error is stored in its result instead of being
+            raised.
+        """
+        return execute_batch(self._transport, items,
+                             max_workers=max_workers)
+
     def has_session_cookie(self) -> bool:
         """Return whether a local session cookie exists for this server.
 
@@ -293,3 +352,272 @@ class RBClient:
             Whether a local session cookie exists for this server.
         """
         return self._transport.has_session_cookie()
+
+    def get_request_stats(self) -> HTTPRequestStats | None:
+        """Return statistics on the HTTP requests made by the client.
+
+        Callbacks can be registered on the result to feed information on
+        each completed request into other metrics systems:
+
+        .. code-block:: python
+
+           def on_request(record: HTTPRequestRecord) -> None:
+               metrics.timing('rbtools.request', record.total_time)
+
+           client.get_request_stats().add_callback(on_request)
+
+        Version Added:
+            7.0
+
+        Returns:
+            rbtools.api.instrumentation.HTTPRequestStats:
+            The request statistics, or ``None`` if the transport doesn't
+            record them.
+        """
+        return self._transport.get_request_stats()
+
+
+class AsyncRBClient(RBClient):
+    """Asynchronous client used to talk to a Review Board server's API.
+
+    This works like :py:class:`RBClient`, but uses
+    :py:class:`~rbtools.api.transport.asynchronous.AsyncTransport` by
+    default. Methods that communicate with the server are coroutines, as
+    are all request methods on the resulting resources, and list resources
+    can be iterated using ``async for``:
+
+    .. code-block:: python
+
+       async with AsyncRBClient('https://reviews.example.com/',
+                                api_token=token) as client:
+           root = await client.get_root()
+           review_requests = await root.get_review_requests()
+
+           async for review_request in review_requests.all_items:
+               ...
+
+    The requests are not truly non-blocking. Each one is performed on a
+    worker thread from a pool, and at most
+    :py:attr:`AsyncTransport.DEFAULT_MAX_WORKERS
+    <rbtools.api.transport.asynchronous.AsyncTransport.DEFAULT_MAX_WORKERS>`
+    (8) requests run at once. Further requests wait for a free thread. The
+    limit can be changed by passing ``max_workers`` when constructing the
+    client.
+
+    Version Added:
+        7.0
+    """
+
+    def __init__(
+        self,
+        url: str,
+        transport_cls: type[Transport] = AsyncTransport,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            url (str):
+                The URL of the Review Board server.
+
+            transport_cls (type, optional):
+                The type of transport to use for communicating with the
+                server. This must provide an asynchronous interface.
+
+            *args (tuple):
+                Positional arguments to pass to :py:class:`RBClient`.
+
+            **kwargs (dict):
+                Keyword arguments to pass to :py:class:`RBClient`.
+        """
+        super().__init__(url, transport_cls, *args, **kwargs)
+
+    async def get_root(  # type: ignore[override]
+        self,
+        *args,
+        **kwargs,
+    ) -> RootResource:
+        """Return the root resource of the API.
+
+        Args:
+            *args (tuple):
+                Positional arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.get_root`.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.get_root`.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The root API resource.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The API returned an error. Details are in the error object.
+
+            rbtools.api.errors.ServerInterfaceError:
+                There was a non-API error communicating with the Review Board
+                server. The URL may have been invalid. The reason is in the
+                exception's message.
+        """
+        return await self._transport.get_root(*args, **kwargs)
+
+    async def get_path(  # type: ignore[override]
+        self,
+        path: str,
+        *args,
+        **kwargs,
+    ) -> Resource | None:
+        """Return the API resource at the given path.
+
+        Args:
+            path (str):
+                The path relative to the Review Board server URL.
+
+            *args (tuple):
+                Positional arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.get_path`.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.get_path`.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource at the given path.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The API returned an error. Details are in the error object.
+
+            rbtools.api.errors.ServerInterfaceError:
+                There was a non-API error communicating with the Review Board
+                server. The URL may have been invalid. The reason is in the
+                exception's message.
+        """
+        return await self._transport.get_path(path, *args, **kwargs)
+
+    async def get_url(  # type: ignore[override]
+        self,
+        url: str,
+        *args,
+        **kwargs,
+    ) -> Resource | None:
+        """Return the API resource at the given URL.
+
+        Args:
+            url (str):
+                The URL of the resource to fetch.
+
+            *args (tuple):
+                Positional arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.get_url`.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.get_url`.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource at the given path.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The API returned an error. Details are in the error object.
+
+            rbtools.api.errors.ServerInterfaceError:
+                There was a non-API error communicating with the Review Board
+                server. The URL may have been invalid. The reason is in the
+                exception's message.
+        """
+        return await self._transport.get_url(url, *args, **kwargs)
+
+    async def logout(self, *args, **kwargs) -> None:  # type: ignore[override]
+        """Log out from the Review Board server.
+
+        Args:
+            *args (tuple):
+                Positional arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.logout`.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the transport's
+                :py:meth:`~rbtools.api.transport.Transport.logout`.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The API returned an error. Details are in the error object.
+
+            rbtools.api.errors.ServerInterfaceError:
+                There was a non-API error communicating with the Review Board
+                server. The URL may have been invalid. The reason is in the
+                exception's message.
+        """
+        await self._transport.logout(*args, **kwargs)
+
+    async def batch(  # type: ignore[override]
+        self,
+        items: Sequence[BatchItem],
+        *,
+        max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+    ) -> list[BatchResult]:
+        """Perform a batch of independent API requests concurrently.
+
+        See :py:meth:`RBClient.batch` for details.
+
+        Args:
+            items (list):
+                The request methods or requests to perform.
+
+            max_workers (int, optional):
+                The maximum number of items to run at once.
+
+        Returns:
+            list of rbtools.api.batch.BatchResult:
+            The results for each item, in the same order as ``items``. If an
+            item fails, the error is stored in its result instead of being
+            raised.
+        """
+        return await execute_batch_async(self._transport, items,
+                                         max_workers=max_workers)
+
+    async def aclose(self) -> None:
+        """Shut down the client's transport.
+
+        Any pending requests will be allowed to finish.
+        """
+        aclose = getattr(self._transport, 'aclose', None)
+
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter the client's context.
+
+        Returns:
+            AsyncRBClient:
+            This client.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the client's context, shutting down the transport.
+
+        Args:
+            exc_type (type):
+                The type of exception raised in the context, if any.
+
+            exc_value (BaseException):
+                The exception raised in the context, if any.
+
+            traceback (types.TracebackType):
+                The traceback for the exception, if any.
+        """
+        await self.aclose()
@@ -0,0 +1,618 @@
+"""Persistent HTTP connection pooling for API communication.
+
+By default, :py:mod:`urllib.request` opens a new connection (and performs a
+new TLS handshake) for every request, closing it as soon as the response has
+been read. This module provides a pool of HTTP/1.1 keep-alive connections
+that can be shared by the URL handlers used to talk to a Review Board server,
+allowing sockets to be reused across API requests.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+import time
+from http.client import HTTPConnection, RemoteDisconnected
+from typing import TYPE_CHECKING
+from urllib.error import URLError
+
+from rbtools.api.instrumentation import get_active_request_record
+from rbtools.api.retry import IDEMPOTENT_METHODS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from email.message import Message
+    from typing import Any, TypeAlias
+    from urllib.request import Request
+
+
+logger = logging.getLogger(__name__)
+
+
+#: A key identifying a pooled connection.
+#:
+#: This is a 3-tuple of the URL scheme, the host (and port) being connected
+#: to, and the tunnel host (for connections made through a proxy).
+#:
+#: Version Added:
+#:     7.0
+ConnectionKey: TypeAlias = tuple[str, str, str | None]
+
+
+#: Exceptions indicating that a reused connection was closed by the server.
+#:
+#: If these occur while sending a request, the server never received it, and
+#: it's safe to send again on a fresh connection. If they occur while waiting
+#: for the response, the server may have already processed the request, so
+#: only idempotent requests can be sent again.
+_STALE_CONNECTION_ERRORS = (
+    BrokenPipeError,
+    ConnectionAbortedError,
+    ConnectionResetError,
+    RemoteDisconnected,
+)
+
+
+class BufferedHTTPResponse(io.BytesIO):
+    """A fully-read HTTP response.
+
+    The body of a pooled response must be read in full before its connection
+    can be handed to another request. This class stores that body along with
+    the response metadata, and is API-compatible with the
+    :py:class:`http.client.HTTPResponse` objects normally returned by
+    :py:func:`urllib.request.urlopen`.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The headers sent in the response.
+    headers: Message
+
+    #: The reason phrase sent with the response status.
+    #:
+    #: :py:mod:`urllib.request` stores this in :py:attr:`msg`, so it's
+    #: provided under both names.
+    msg: str
+
+    #: The reason phrase sent with the response status.
+    reason: str
+
+    #: The HTTP status code of the response.
+    status: int
+
+    #: The URL that was requested.
+    url: str
+
+    def __init__(
+        self,
+        *,
+        body: bytes,
+        headers: Message,
+        status: int,
+        reason: str,
+        url: str,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            body (bytes):
+                The full response body.
+
+            headers (email.message.Message):
+                The headers sent in the response.
+
+            status (int):
+                The HTTP status code of the response.
+
+            reason (str):
+                The reason phrase sent with the response status.
+
+            url (str):
+                The URL that was requested.
+        """
+        super().__init__(body)
+
+        self.headers = headers
+        self.status = status
+        self.reason = reason
+        self.msg = reason
+        self.url = url
+
+    @property
+    def code(self) -> int:
+        """The HTTP status code of the response.
+
+        Type:
+            int
+        """
+        return self.status
+
+    def getcode(self) -> int:
+        """Return the HTTP status code of the response.
+
+        Returns:
+            int:
+            The HTTP status code.
+        """
+        return self.status
+
+    def geturl(self) -> str:
+        """Return the URL that was requested.
+
+        Returns:
+            str:
+            The requested URL.
+        """
+        return self.url
+
+    def info(self) -> Message:
+        """Return the headers sent in the response.
+
+        Returns:
+            email.message.Message:
+            The response headers.
+        """
+        return self.headers
+
+    def getheader(
+        self,
+        name: str,
+        default: (str | None) = None,
+    ) -> str | None:
+        """Return the value of a response header.
+
+        Args:
+            name (str):
+                The name of the header.
+
+            default (str, optional):
+                The value to return if the header was not sent.
+
+        Returns:
+            str:
+            The header value, or ``default``.
+        """
+        return self.headers.get(name, default)
+
+    def getheaders(self) -> list[tuple[str, str]]:
+        """Return all response headers.
+
+        Returns:
+            list of tuple:
+            A list of ``(name, value)`` pairs.
+        """
+        return list(self.headers.items())
+
+
+class HTTPConnectionPool:
+    """A thread-safe pool of idle keep-alive HTTP connections.
+
+    Connections are stored per :py:data:`ConnectionKey` once a response has
+    been fully read from them. At most :py:attr:`max_idle_per_host` idle
+    connections are kept for each key, and any connection left idle for
+    longer than :py:attr:`idle_timeout` seconds is closed rather than reused.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The number of seconds an idle connection may be kept for reuse.
+    idle_timeout: float
+
+    #: The maximum number of idle connections to keep for each host.
+    max_idle_per_host: int
+
+    #: Idle connections for each key, with the time they were released.
+    _idle: dict[ConnectionKey, list[tuple[HTTPConnection, float]]]
+
+    #: A lock protecting :py:attr:`_idle`.
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_host: int = 4,
+        idle_timeout: float = 15,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_idle_per_host (int, optional):
+                The maximum number of idle connections to keep for each host.
+
+            idle_timeout (float, optional):
+                The number of seconds an idle connection may be kept for
+                reuse.
+        """
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        key: ConnectionKey,
+    ) -> HTTPConnection | None:
+        """Return an idle connection for the given key.
+
+        Any expired connections found along the way will be closed.
+
+        Args:
+            key (ConnectionKey):
+                The key identifying the connection.
+
+        Returns:
+            http.client.HTTPConnection:
+            An idle connection, or ``None`` if one is not available.
+        """
+        now = time.monotonic()
+        expired: list[HTTPConnection] = []
+        conn: (HTTPConnection | None) = None
+
+        with self._lock:
+            idle = self._idle.get(key)
+
+            while idle:
+                candidate, released = idle.pop()
+
+                if (candidate.sock is None or
+                    now - released > self.idle_timeout):
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+                    break
+
+        for expired_conn in expired:
+            expired_conn.close()
+
+        return conn
+
+    def release(
+        self,
+        key: ConnectionKey,
+        conn: HTTPConnection,
+    ) -> None:
+        """Return a connection to the pool for later reuse.
+
+        If the pool is already full for this key, the connection will be
+        closed instead.
+
+        Args:
+            key (ConnectionKey):
+                The key identifying the connection.
+
+            conn (http.client.HTTPConnection):
+                The connection to return to the pool.
+        """
+        if conn.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+
+                if len(idle) < self.max_idle_per_host:
+                    idle.append((conn, time.monotonic()))
+                    return
+
+        conn.close()
+
+    def close_all(self) -> None:
+        """Close all idle connections in the pool."""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+
+        for conns in idle.values():
+            for conn, released in conns:
+                conn.close()
+
+    def get_idle_count(
+        self,
+        key: (ConnectionKey | None) = None,
+    ) -> int:
+        """Return the number of idle connections in the pool.
+
+        Args:
+            key (ConnectionKey, optional):
+                A specific key to count connections for. If not provided,
+                all idle connections will be counted.
+
+        Returns:
+            int:
+            The number of idle connections.
+        """
+        with self._lock:
+            if key is None:
+                return sum(len(conns) for conns in self._idle.values())
+            else:
+                return len(self._idle.get(key, []))
+
+
+class PooledHTTPHandlerMixin:
+    """Mixin for urllib HTTP(S) handlers that reuse pooled connections.
+
+    This replaces :py:meth:`urllib.request.AbstractHTTPHandler.do_open` with
+    a version that fetches connections from a :py:class:`HTTPConnectionPool`
+    instead of opening (and then closing) a new one for every request.
+
+    Responses are read in full before being returned, so that the connection
+    can be released back to the pool immediately. They are returned as
+    :py:class:`BufferedHTTPResponse` instances.
+
+    If no pool is provided, the standard one-connection-per-request behavior
+    is used.
+
+    If a request limiter is provided, a slot is held only while talking to
+    the server. It's released before the response is handed to other
+    handlers, some of which (such as authentication handlers) may need to
+    make requests of their own.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The connection pool to use, if any.
+    connection_pool: HTTPConnectionPool | None
+
+    #: The limiter capping concurrent requests to the server, if any.
+    request_limiter: threading.BoundedSemaphore | None
+
+    def __init__(
+        self,
+        *args,
+        connection_pool: (HTTPConnectionPool | None) = None,
+        request_limiter: (threading.BoundedSemaphore | None) = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            *args (tuple):
+                Positional arguments to pass to the parent class.
+
+            connection_pool (HTTPConnectionPool, optional):
+                The connection pool to use.
+
+            request_limiter (threading.BoundedSemaphore, optional):
+                The limiter capping concurrent requests to the server.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the parent class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.connection_pool = connection_pool
+        self.request_limiter = request_limiter
+
+    def do_open(
+        self,
+        http_class: Callable[..., HTTPConnection],
+        req: Request,
+        **http_conn_args,
+    ) -> Any:
+        """Open a connection to the server and perform the request.
+
+        Args:
+            http_class (type):
+                The connection class to instantiate for new connections.
+
+            req (urllib.request.Request):
+                The request to perform.
+
+            **http_conn_args (dict):
+                Additional keyword arguments for the connection class.
+
+        Returns:
+            BufferedHTTPResponse:
+            The resulting HTTP response.
+
+        Raises:
+            urllib.error.URLError:
+                There was an error communicating with the server.
+        """
+        request_limiter = self.request_limiter
+
+        if request_limiter is None:
+            return self._open_request(http_class, req, **http_conn_args)
+
+        with request_limiter:
+            return self._open_request(http_class, req, **http_conn_args)
+
+    def _open_request(
+        self,
+        http_class: Callable[..., HTTPConnection],
+        req: Request,
+        **http_conn_args,
+    ) -> Any:
+        """Perform the request, using a pooled connection if possible.
+
+        Args:
+            http_class (type):
+                The connection class to instantiate for new connections.
+
+            req (urllib.request.Request):
+                The request to perform.
+
+            **http_conn_args (dict):
+                Additional keyword arguments for the connection class.
+
+        Returns:
+            BufferedHTTPResponse:
+            The resulting HTTP response.
+
+        Raises:
+            urllib.error.URLError:
+                There was an error communicating with the server.
+        """
+        pool = self.connection_pool
+
+        if pool is None:
+            return super().do_open(  # type: ignore
+                http_class, req, **http_conn_args)
+
+        host = req.host
+
+        if not host:
+            raise URLError('no host given')
+
+        tunnel_host: (str | None) = getattr(req, '_tunnel_host', None)
+        key: ConnectionKey = (req.type, host, tunnel_host)
+
+        # Build the headers the same way AbstractHTTPHandler does, minus the
+        # forced "Connection: close".
+        headers = dict(req.unredirected_hdrs)
+        headers.update({
+            name: value
+            for name, value in req.headers.items()
+            if name not in headers
+        })
+        headers = {
+            name.title(): value
+            for name, value in headers.items()
+        }
+
+        tunnel_headers: dict[str, str] = {}
+
+        if tunnel_host and 'Proxy-Authorization' in headers:
+            tunnel_headers['Proxy-Authorization'] = \
+                headers.pop('Proxy-Authorization')
+
+        method = req.get_method()
+        record = get_active_request_record()
+
+        while True:
+            conn = pool.acquire(key)
+            reused = conn is not None
+
+            if record is not None:
+                connect_time = record.connect_time + record.tls_time
+
+            start = time.perf_counter()
+
+            if conn is None:
+                conn = http_class(host, timeout=req.timeout,
+                                  **http_conn_args)
+                conn.set_debuglevel(
+                    getattr(self, '_debuglevel', 0))
+
+                if tunnel_host:
+                    conn.set_tunnel(tunnel_host, headers=tunnel_headers)
+
+            try:
+                sent = False
+
+                try:
+                    conn.request(
+                        method,
+                        req.selector,
+                        req.data,
+                        headers,
+                        encode_chunked=req.has_header('Transfer-encoding'))
+                    sent = True
+                    rsp = conn.getresponse()
+                except _STALE_CONNECTION_ERRORS as e:
+                    if reused and (not sent or method in IDEMPOTENT_METHODS):
+                        # The server closed this connection while it sat
+                        # idle in the pool. Try again on a new one.
+                        #
+                        # If the request was already sent, the server may
+                        # have processed it before closing the connection,
+                        # so this is only done for idempotent requests.
+                        logger.debug('Pooled connection to %s was closed '
+                                     'by the server; reconnecting.',
+                                     host)
+                        conn.close()
+                        continue
+
+                    raise URLError(e)
+                except OSError as e:
+                    raise URLError(e)
+
+                headers_received = time.perf_counter()
+                body = rsp.read()
+
+                if record is not None:
+                    # Connecting happens as part of sending the request, so
+                    # leave that out of the time to the first byte.
+                    record.ttfb_time += (
+                        headers_received - start -
+                        (record.connect_time + record.tls_time -
+                         connect_time))
+                    record.body_time += time.perf_counter() - headers_received
+            except BaseException:
+                conn.close()
+                raise
+
+            break
+
+        if rsp.will_close:
+            conn.close()
+        else:
+            pool.release(key, conn)
+
+        return BufferedHTTPResponse(body=body,
+                                    headers=rsp.headers,
+                                    status=rsp.status,
+                                    reason=rsp.reason,
+                                    url=req.get_full_url())
+
+
+#: Shared request limiters for each server.
+_request_limiters: dict[str, threading.BoundedSemaphore] = {}
+
+#: A lock protecting :py:data:`_request_limiters`.
+_request_limiters_lock = threading.Lock()
+
+
+def get_request_limiter(
+    server_url: str,
+    max_concurrent: int,
+) -> threading.BoundedSemaphore:
+    """Return the shared request limiter for a server.
+
+    The limiter caps the number of HTTP requests that may be in flight to a
+    server at once across all clients, transports, and threads in the
+    process, so that concurrent API usage (such as batches or asynchronous
+    transports) can't overload the server.
+
+    The limiter is created the first time it's requested for a server. Later
+    calls return the same limiter, regardless of ``max_concurrent``.
+
+    Version Added:
+        7.0
+
+    Args:
+        server_url (str):
+            The URL of the server.
+
+        max_concurrent (int):
+            The maximum number of concurrent requests to allow, if the
+            limiter must be created.
+
+    Returns:
+        threading.BoundedSemaphore:
+        The request limiter for the server.
+    """
+    with _request_limiters_lock:
+        try:
+            limiter = _request_limiters[server_url]
+        except KeyError:
+            limiter = threading.BoundedSemaphore(max_concurrent)
+            _request_limiters[server_url] = limiter
+
+    return limiter
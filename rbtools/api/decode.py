@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import json
+import logging
 from typing import TYPE_CHECKING
 
 from rbtools.api.utils import parse_mimetype
 from rbtools.utils.encoding import force_unicode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import TypeAlias
+
     from typelets.json import JSONDict
 
+    #: A function that decodes an API payload.
+    #:
+    #: Version Added:
+    #:     7.0
+    Decoder: TypeAlias = Callable[[bytes | str], JSONDict]
+
+
+logger = logging.getLogger(__name__)
+
 
 def DefaultDecoder(
     payload: bytes | str,
@@ -52,28 +70,133 @@ def JsonDecoder(
     return json.loads(force_unicode(payload))
 
 
+def OrjsonDecoder(
+    payload: bytes | str,
+) -> JSONDict:
+    """Decode an application/json-encoded API response using orjson.
+
+    This parses the payload bytes directly, without first decoding them to
+    a string, which is considerably faster and uses less memory for large
+    payloads. This is only available if :pypi:`orjson` is installed.
+
+    Version Added:
+        7.0
+
+    Args:
+        payload (bytes or str):
+            The API payload.
+
+    Returns:
+        dict:
+        The decoded API object.
+
+    Raises:
+        ValueError:
+            The payload could not be decoded.
+    """
+    assert orjson is not None
+
+    return orjson.loads(payload)
+
+
+#: Mapping from JSON decoder backend names to decoder methods.
+#:
+#: Only backends that are available in this environment are present.
+#:
+#: Version Added:
+#:     7.0
+#:
+#: Type: dict
+JSON_DECODERS: dict[str, Decoder] = {
+    'json': JsonDecoder,
+}
+
+if orjson is not None:
+    JSON_DECODERS['orjson'] = OrjsonDecoder
+
+
+def get_json_decoder(
+    name: (str | None) = None,
+) -> Decoder:
+    """Return the JSON decoder to use for API responses.
+
+    Version Added:
+        7.0
+
+    Args:
+        name (str, optional):
+            The name of the JSON decoder backend (``json`` or ``orjson``).
+            If not provided, or ``auto``, the fastest available backend will
+            be used. If the backend is not available, this will fall back to
+            the standard library.
+
+    Returns:
+        callable:
+        The decoder method.
+    """
+    if not name or name == 'auto':
+        name = 'orjson' if 'orjson' in JSON_DECODERS else 'json'
+
+    try:
+        return JSON_DECODERS[name]
+    except KeyError:
+        logger.warning('The "%s" JSON decoder is not available. Falling '
+                       'back to the "json" decoder.',
+                       name)
+
+        return JsonDecoder
+
+
 #: Mapping from API format to decoder method.
 #:
+#: Version Changed:
+#:     7.0:
+#:     ``application/json`` now uses the fastest available JSON decoder.
+#:     See :py:func:`get_json_decoder`.
+#:
 #: Type: dict
-DECODER_MAP = {
-    'application/json': JsonDecoder,
+DECODER_MAP: dict[str, Decoder] = {
+    'application/json': get_json_decoder(),
 }
 
 
 def decode_response(
     payload: bytes | str,
     mime_type: str,
+    decoder_map: (Mapping[str, Decoder] | None) = None,
 ) -> JSONDict:
     """Decode a Web API response.
 
     The body of a Web API response will be decoded into a dictionary,
     according to the provided mime_type.
+
+    Version Changed:
+        7.0:
+        Added the ``decoder_map`` argument.
+
+    Args:
+        payload (bytes or str):
+            The API payload.
+
+        mime_type (str):
+            The mimetype of the payload.
+
+        decoder_map (dict, optional):
+            A mapping from API format to decoder method to use instead of
+            :py:data:`DECODER_MAP`.
+
+    Returns:
+        dict:
+        The decoded API object.
     """
+    if decoder_map is None:
+        decoder_map = DECODER_MAP
+
     mime = parse_mimetype(mime_type)
     main_type = mime['main_type']
     mime_format = mime['format']
 
     api_format = f'{main_type}/{mime_format}'
-    decoder = DECODER_MAP.get(api_format, DefaultDecoder)
+    decoder = decoder_map.get(api_format, DefaultDecoder)
 
     return decoder(payload)
@@ -0,0 +1,364 @@
+"""Instrumentation for HTTP requests made to the Review Board API.
+
+Every request made through a
+:py:class:`~rbtools.api.request.ReviewBoardServer` is recorded as an
+:py:class:`HTTPRequestRecord`, covering the time spent connecting, waiting
+for and reading the response, along with the amount of data transferred and
+whether the API cache was used.
+
+Records are passed to any callbacks registered on the server's
+:py:class:`HTTPRequestStats`, which can be used to feed other metrics
+systems. They can also be kept for a summary once work is done.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import TypeAlias
+
+    from typelets.json import JSONDict
+
+
+logger = logging.getLogger(__name__)
+
+
+#: A callback for completed HTTP requests.
+#:
+#: Version Added:
+#:     7.0
+HTTPRequestCallback: TypeAlias = 'Callable[[HTTPRequestRecord], None]'
+
+
+#: A regex matching numeric path components, such as IDs.
+_ID_PATH_RE = re.compile(r'/\d+(?=/|$)')
+
+
+@dataclass
+class HTTPRequestRecord:
+    """Information on an HTTP request made to the API.
+
+    All times are in seconds.
+
+    Version Added:
+        7.0
+    """
+
+    #: The HTTP method.
+    method: str
+
+    #: The full URL of the request.
+    url: str
+
+    #: The path of the URL, with any IDs replaced by ``{id}``.
+    #:
+    #: This can be used to group requests for the same kind of resource.
+    url_template: str
+
+    #: The HTTP status code of the response.
+    #:
+    #: This will be ``None`` if the server couldn't be reached.
+    status: int | None = None
+
+    #: The number of bytes sent in the request body.
+    bytes_sent: int = 0
+
+    #: The number of bytes received in the response body.
+    #:
+    #: For compressed responses, this is the compressed size. This will be 0
+    #: for responses served entirely from the API cache.
+    bytes_received: int = 0
+
+    #: How the API cache handled the request.
+    #:
+    #: This is one of ``hit``, ``stale``, ``not_modified``, or ``miss``. It
+    #: will be ``None`` if the cache wasn't used for the request.
+    cache_status: str | None = None
+
+    #: The number of times the request was retried for authentication.
+    auth_retries: int = 0
+
+    #: The number of times the request was retried after a failure.
+    #:
+    #: See :py:mod:`rbtools.api.retry`.
+    retries: int = 0
+
+    #: The time spent waiting on retry backoff and the client rate limit.
+    wait_time: float = 0.0
+
+    #: The time spent establishing new connections.
+    connect_time: float = 0.0
+
+    #: The time spent in TLS handshakes for new connections.
+    tls_time: float = 0.0
+
+    #: The time spent waiting for the response headers.
+    #:
+    #: This doesn't include time spent connecting.
+    ttfb_time: float = 0.0
+
+    #: The time spent reading the response body.
+    #:
+    #: This may be included in :py:attr:`ttfb_time` when connection
+    #: pooling is disabled.
+    body_time: float = 0.0
+
+    #: The total time spent on the request.
+    total_time: float = 0.0
+
+    def to_json(self) -> JSONDict:
+        """Return a JSON-serializable version of the record.
+
+        Returns:
+            dict:
+            The record data.
+        """
+        return asdict(self)
+
+
+class HTTPRequestStats:
+    """Statistics on the HTTP requests made to a server.
+
+    Callbacks registered through :py:meth:`add_callback` are called for
+    every completed request. Records are only kept for summaries if
+    :py:attr:`keep_records` is set.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: Whether to keep records for completed requests.
+    keep_records: bool
+
+    #: The records for completed requests.
+    #:
+    #: This is only populated if :py:attr:`keep_records` is set.
+    records: list[HTTPRequestRecord]
+
+    def __init__(
+        self,
+        *,
+        keep_records: bool = False,
+    ) -> None:
+        """Initialize the statistics.
+
+        Args:
+            keep_records (bool, optional):
+                Whether to keep records for completed requests.
+        """
+        self.keep_records = keep_records
+        self.records = []
+        self._callbacks: list[HTTPRequestCallback] = []
+        self._lock = threading.Lock()
+
+    def add_callback(
+        self,
+        callback: HTTPRequestCallback,
+    ) -> None:
+        """Register a callback for completed requests.
+
+        Callbacks may be called from any thread making requests.
+
+        Args:
+            callback (callable):
+                The callback, which takes the
+                :py:class:`HTTPRequestRecord` for the request.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_callback(
+        self,
+        callback: HTTPRequestCallback,
+    ) -> None:
+        """Unregister a callback for completed requests.
+
+        Args:
+            callback (callable):
+                The callback to remove.
+
+        Raises:
+            ValueError:
+                The callback was not registered.
+        """
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def add_record(
+        self,
+        record: HTTPRequestRecord,
+    ) -> None:
+        """Add the record for a completed request.
+
+        This will call any registered callbacks. Errors from callbacks are
+        logged and otherwise ignored.
+
+        Args:
+            record (HTTPRequestRecord):
+                The record for the request.
+        """
+        with self._lock:
+            if self.keep_records:
+                self.records.append(record)
+
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(record)
+            except Exception as e:
+                logger.exception('Error in HTTP request callback %r: %s',
+                                 callback, e)
+
+    def clear(self) -> None:
+        """Clear all kept records."""
+        with self._lock:
+            self.records = []
+
+    def get_summary(self) -> list[JSONDict]:
+        """Return a summary of the kept records.
+
+        Requests are grouped by method and URL template.
+
+        Returns:
+            list of dict:
+            The summary for each group of requests, ordered by the total time
+            spent on them, highest first.
+        """
+        groups: dict[tuple[str, str], JSONDict] = {}
+
+        with self._lock:
+            records = list(self.records)
+
+        for record in records:
+            key = (record.method, record.url_template)
+
+            try:
+                group = groups[key]
+            except KeyError:
+                group = {
+                    'method': record.method,
+                    'url_template': record.url_template,
+                    'requests': 0,
+                    'cache_hits': 0,
+                    'auth_retries': 0,
+                    'retries': 0,
+                    'bytes_sent': 0,
+                    'bytes_received': 0,
+                    'total_time': 0.0,
+                }
+                groups[key] = group
+
+            group['requests'] += 1
+            group['auth_retries'] += record.auth_retries
+            group['retries'] += record.retries
+            group['bytes_sent'] += record.bytes_sent
+            group['bytes_received'] += record.bytes_received
+            group['total_time'] += record.total_time
+
+            if record.cache_status in ('hit', 'stale', 'not_modified'):
+                group['cache_hits'] += 1
+
+        return sorted(groups.values(),
+                      key=lambda group: group['total_time'],
+                      reverse=True)
+
+    def to_json(self) -> JSONDict:
+        """Return a JSON-serializable version of the statistics.
+
+        Returns:
+            dict:
+            A dictionary containing the ``summary`` and the individual
+            ``requests``.
+        """
+        with self._lock:
+            records = list(self.records)
+
+        return {
+            'summary': self.get_summary(),
+            'requests': [
+                record.to_json()
+                for record in records
+            ],
+        }
+
+
+def get_url_template(
+    url: str,
+) -> str:
+    """Return the URL template used to group requests.
+
+    Version Added:
+        7.0
+
+    Args:
+        url (str):
+            The URL of the request.
+
+    Returns:
+        str:
+        The path of the URL, with any numeric IDs replaced by ``{id}``.
+    """
+    return _ID_PATH_RE.sub('/{id}', urlsplit(url).path)
+
+
+_active = threading.local()
+
+
+@contextmanager
+def track_request(
+    record: HTTPRequestRecord,
+) -> Iterator[HTTPRequestRecord]:
+    """Make a record active for the current thread while performing a request.
+
+    Connection and authentication handlers add to the active record.
+
+    Version Added:
+        7.0
+
+    Args:
+        record (HTTPRequestRecord):
+            The record for the request.
+
+    Context:
+        HTTPRequestRecord:
+        The record.
+    """
+    old_record = getattr(_active, 'record', None)
+    _active.record = record
+    start = time.perf_counter()
+
+    try:
+        yield record
+    finally:
+        record.total_time = time.perf_counter() - start
+        _active.record = old_record
+
+
+def get_active_request_record() -> HTTPRequestRecord | None:
+    """Return the record for the request being made in this thread.
+
+    Version Added:
+        7.0
+
+    Returns:
+        HTTPRequestRecord:
+        The active record, or ``None`` if no request is being tracked.
+    """
+    return getattr(_active, 'record', None)
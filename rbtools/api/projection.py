@@ -0,0 +1,138 @@
+"""Support for limiting the fields and links returned by the API.
+
+The Review Board API can limit the payloads it returns to specific fields
+(``only-fields``) and links (``only-links``), and can expand links into
+full payloads (``expand``). For large servers, this can reduce the size of
+payloads several-fold.
+
+Callers can declare which fields and links they need from each type of
+resource through :py:class:`APIProjection`, and set those on the transport.
+The query arguments will then be added automatically to requests for those
+resources.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlparse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Any, TypeAlias
+
+
+@dataclass(frozen=True)
+class APIProjection:
+    """The fields and links to request for a type of resource.
+
+    Version Added:
+        7.0
+    """
+
+    #: The fields to include in the payload.
+    #:
+    #: If ``None``, all fields will be included. If empty, no fields will
+    #: be included.
+    fields: Sequence[str] | None = None
+
+    #: The links to include in the payload.
+    #:
+    #: If ``None``, all links will be included. If empty, no links will be
+    #: included.
+    links: Sequence[str] | None = None
+
+    #: The links to expand into full payloads.
+    expand: Sequence[str] | None = None
+
+    def get_query_args(self) -> dict[str, str]:
+        """Return the query arguments for the projection.
+
+        Returns:
+            dict:
+            The ``only_fields``, ``only_links``, and ``expand`` query
+            arguments to include in the request.
+        """
+        query_args: dict[str, str] = {}
+
+        if self.fields is not None:
+            query_args['only_fields'] = ','.join(self.fields)
+
+        if self.links is not None:
+            query_args['only_links'] = ','.join(self.links)
+
+        if self.expand:
+            query_args['expand'] = ','.join(self.expand)
+
+        return query_args
+
+
+#: A mapping of resource names to projections.
+#:
+#: Resource names are the names used for the resource's link or URI template,
+#: such as ``review_request`` or ``review_requests``.
+#:
+#: Version Added:
+#:     7.0
+APIProjections: TypeAlias = 'Mapping[str, APIProjection]'
+
+
+def apply_projection(
+    projection: APIProjection | None,
+    query_args: Mapping[str, Any],
+) -> dict[str, Any]:
+    """Return query arguments with a projection applied.
+
+    Any query arguments provided by the caller take precedence over those
+    in the projection.
+
+    Version Added:
+        7.0
+
+    Args:
+        projection (APIProjection):
+            The projection to apply, if any.
+
+        query_args (dict):
+            The query arguments provided by the caller.
+
+    Returns:
+        dict:
+        The new query arguments.
+    """
+    if projection is None:
+        return dict(query_args)
+
+    return dict(projection.get_query_args(), **query_args)
+
+
+def get_projected_fields(
+    url: str,
+) -> frozenset[str] | None:
+    """Return the fields a resource was limited to, based on its URL.
+
+    Version Added:
+        7.0
+
+    Args:
+        url (str):
+            The URL used to fetch the resource.
+
+    Returns:
+        frozenset:
+        The fields listed in the ``only-fields`` query argument, or ``None``
+        if the payload wasn't limited.
+    """
+    for key, value in parse_qsl(urlparse(url).query,
+                                keep_blank_values=True):
+        if key == 'only-fields':
+            return frozenset(
+                field
+                for field in value.split(',')
+                if field
+            )
+
+    return None
@@ -0,0 +1,396 @@
+"""Recording of API sessions for offline replay.
+
+A :py:class:`SessionRecorder` can be set on a
+:py:class:`~rbtools.api.transport.sync.SyncTransport` to capture every API
+request made and the response returned, along with how long each took.
+These are saved as a session archive, which can be loaded as a
+:py:class:`SessionArchive` and served back through
+:py:class:`~rbtools.api.transport.replay.ReplayTransport` without needing a
+network connection or a Review Board server.
+
+This is useful for reproducing the API behavior of a command, such as the
+number of requests it makes and the time spent on them, across RBTools
+versions or machines.
+
+Archives are JSON files, compressed with gzip if the filename ends with
+``.gz``.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import threading
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from rbtools import get_package_version
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import IO
+
+    from typelets.json import JSONDict
+
+
+#: The version of the session archive format.
+#:
+#: Version Added:
+#:     7.0
+SESSION_ARCHIVE_VERSION = 1
+
+
+#: Headers that are never written to a session archive.
+#:
+#: These may contain credentials or session information.
+_EXCLUDED_HEADERS = {
+    'authorization',
+    'cookie',
+    'proxy-authorization',
+    'set-cookie',
+}
+
+
+@dataclass
+class RecordedExchange:
+    """A recorded API request and its response.
+
+    Version Added:
+        7.0
+    """
+
+    #: The HTTP method of the request.
+    method: str
+
+    #: The full URL of the request.
+    url: str
+
+    #: The HTTP status code of the response.
+    status: int
+
+    #: The headers sent with the request.
+    request_headers: dict[str, str] = field(default_factory=dict)
+
+    #: The names of the form fields and files sent with the request.
+    request_fields: list[str] = field(default_factory=list)
+
+    #: The headers of the response.
+    response_headers: dict[str, str] = field(default_factory=dict)
+
+    #: The body of the response.
+    body: bytes = b''
+
+    #: The time spent on the request, in seconds.
+    elapsed: float = 0.0
+
+    #: Information on an API error returned for the request.
+    #:
+    #: If set, this contains the ``error_code``, ``rsp`` payload, and
+    #: ``message`` of the error.
+    error: JSONDict | None = None
+
+    @classmethod
+    def from_json(
+        cls,
+        data: JSONDict,
+    ) -> RecordedExchange:
+        """Return an exchange loaded from a session archive.
+
+        Args:
+            data (dict):
+                The serialized exchange.
+
+        Returns:
+            RecordedExchange:
+            The exchange.
+        """
+        data = dict(data)
+        body = data.pop('body', '')
+
+        if data.pop('body_encoding', 'utf-8') == 'base64':
+            data['body'] = base64.b64decode(body)
+        else:
+            data['body'] = body.encode('utf-8')
+
+        return cls(**data)
+
+    def to_json(self) -> JSONDict:
+        """Return a JSON-serializable version of the exchange.
+
+        Returns:
+            dict:
+            The serialized exchange.
+        """
+        data = asdict(self)
+
+        try:
+            data['body'] = self.body.decode('utf-8')
+            data['body_encoding'] = 'utf-8'
+        except UnicodeDecodeError:
+            data['body'] = base64.b64encode(self.body).decode('ascii')
+            data['body_encoding'] = 'base64'
+
+        return data
+
+
+class SessionRecorder:
+    """Records API requests and responses for a session.
+
+    Exchanges may be added from any thread.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The recorded exchanges, in the order they completed.
+    exchanges: list[RecordedExchange]
+
+    #: The URL of the Review Board server being recorded.
+    server_url: str
+
+    def __init__(
+        self,
+        server_url: str,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            server_url (str):
+                The URL of the Review Board server being recorded.
+        """
+        self.server_url = server_url
+        self.exchanges = []
+        self._lock = threading.Lock()
+
+    def add_exchange(
+        self,
+        exchange: RecordedExchange,
+    ) -> None:
+        """Add a completed exchange to the recording.
+
+        Any credentials in the request or response headers will be left
+        out.
+
+        Args:
+            exchange (RecordedExchange):
+                The exchange to add.
+        """
+        exchange.request_headers = _filter_headers(exchange.request_headers)
+        exchange.response_headers = _filter_headers(exchange.response_headers)
+
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def to_json(self) -> JSONDict:
+        """Return a JSON-serializable version of the recording.
+
+        Returns:
+            dict:
+            The session archive data.
+        """
+        with self._lock:
+            exchanges = list(self.exchanges)
+
+        return {
+            'version': SESSION_ARCHIVE_VERSION,
+            'rbtools_version': get_package_version(),
+            'server_url': self.server_url,
+            'exchanges': [
+                exchange.to_json()
+                for exchange in exchanges
+            ],
+        }
+
+    def save(
+        self,
+        filename: str,
+    ) -> None:
+        """Save the recording as a session archive.
+
+        Args:
+            filename (str):
+                The filename to write to. If this ends with ``.gz``, the
+                archive will be compressed.
+
+        Raises:
+            OSError:
+                The file could not be written.
+        """
+        with _open_archive(filename, 'w') as fp:
+            json.dump(self.to_json(), fp)
+
+
+class SessionArchive:
+    """A recorded session loaded for replay.
+
+    Responses are served in the order they were recorded for each method
+    and URL. Once all responses for a method and URL have been served, the
+    last one will continue to be served.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The recorded exchanges, in the order they completed.
+    exchanges: list[RecordedExchange]
+
+    #: The version of RBTools that recorded the session.
+    rbtools_version: str | None
+
+    #: The URL of the Review Board server that was recorded.
+    server_url: str
+
+    @classmethod
+    def load(
+        cls,
+        filename: str,
+    ) -> SessionArchive:
+        """Load a session archive from a file.
+
+        Args:
+            filename (str):
+                The filename of the archive.
+
+        Returns:
+            SessionArchive:
+            The loaded archive.
+
+        Raises:
+            OSError:
+                The file could not be read.
+
+            ValueError:
+                The file was not a valid session archive.
+        """
+        with _open_archive(filename, 'r') as fp:
+            data = json.load(fp)
+
+        if (not isinstance(data, dict) or
+            data.get('version') != SESSION_ARCHIVE_VERSION):
+            raise ValueError(
+                f'{filename} is not a supported session archive.')
+
+        return cls(
+            server_url=data['server_url'],
+            exchanges=[
+                RecordedExchange.from_json(exchange_data)
+                for exchange_data in data['exchanges']
+            ],
+            rbtools_version=data.get('rbtools_version'))
+
+    def __init__(
+        self,
+        *,
+        server_url: str,
+        exchanges: list[RecordedExchange],
+        rbtools_version: (str | None) = None,
+    ) -> None:
+        """Initialize the archive.
+
+        Args:
+            server_url (str):
+                The URL of the Review Board server that was recorded.
+
+            exchanges (list of RecordedExchange):
+                The recorded exchanges.
+
+            rbtools_version (str, optional):
+                The version of RBTools that recorded the session.
+        """
+        self.server_url = server_url
+        self.exchanges = exchanges
+        self.rbtools_version = rbtools_version
+
+        self._lock = threading.Lock()
+        self._pending: defaultdict[tuple[str, str],
+                                   deque[RecordedExchange]] = \
+            defaultdict(deque)
+
+        for exchange in exchanges:
+            self._pending[(exchange.method, exchange.url)].append(exchange)
+
+    def get_exchange(
+        self,
+        method: str,
+        url: str,
+    ) -> RecordedExchange | None:
+        """Return the next recorded exchange for a request.
+
+        Args:
+            method (str):
+                The HTTP method of the request.
+
+            url (str):
+                The full URL of the request.
+
+        Returns:
+            RecordedExchange:
+            The recorded exchange, or ``None`` if the request was never
+            recorded.
+        """
+        with self._lock:
+            pending = self._pending.get((method, url))
+
+            if not pending:
+                return None
+
+            if len(pending) > 1:
+                return pending.popleft()
+
+            return pending[0]
+
+
+def _filter_headers(
+    headers: Mapping[str, str],
+) -> dict[str, str]:
+    """Return headers without any credentials.
+
+    Args:
+        headers (dict):
+            The headers to filter.
+
+    Returns:
+        dict:
+        The filtered headers.
+    """
+    return {
+        key: value
+        for key, value in headers.items()
+        if key.lower() not in _EXCLUDED_HEADERS
+    }
+
+
+def _open_archive(
+    filename: str,
+    mode: str,
+) -> IO[str]:
+    """Open a session archive for reading or writing.
+
+    Args:
+        filename (str):
+            The filename of the archive.
+
+        mode (str):
+            The mode to open the file in (``r`` or ``w``).
+
+    Returns:
+        io.TextIOBase:
+        The opened file.
+    """
+    if filename.endswith('.gz'):
+        return gzip.open(filename, f'{mode}t', encoding='utf-8')
+
+    return open(filename, mode, encoding='utf-8')
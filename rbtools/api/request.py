@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
+import contextlib
+import gzip
 import logging
 import mimetypes
 import os
@@ -10,18 +13,22 @@ import random
 import shutil
 import ssl
 import sys
+import tempfile
+import threading
+import time
+import weakref
+import zlib
 from collections import OrderedDict
 from collections.abc import Callable
-from http.client import (HTTPMessage, HTTPResponse, HTTPSConnection,
-                         NOT_MODIFIED)
+from http.client import (HTTPConnection, HTTPMessage, HTTPResponse,
+                         HTTPSConnection, NOT_MODIFIED)
 from http.cookiejar import (Cookie,
                             CookieJar,
                             DefaultCookiePolicy,
                             MozillaCookieJar)
 from http.cookies import SimpleCookie
-from io import BytesIO
 from json import loads as json_loads
-from typing import TYPE_CHECKING
+from typing import BinaryIO, TYPE_CHECKING
 from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from urllib.request import (
@@ -30,6 +37,7 @@ from urllib.request import (
     HTTPCookieProcessor,
     HTTPDigestAuthHandler,
     HTTPErrorProcessor,
+    HTTPHandler,
     HTTPPasswordMgr,
     HTTPSHandler,
     ProxyHandler,
@@ -42,16 +50,29 @@ import certifi
 
 from rbtools import get_package_version
 from rbtools.api.cache import APICache, CachedHTTPResponse, LiveHTTPResponse
+from rbtools.api.connections import (BufferedHTTPResponse,
+                                     HTTPConnectionPool,
+                                     PooledHTTPHandlerMixin,
+                                     get_request_limiter)
 from rbtools.api.errors import (APIError,
                                 ServerInterfaceError,
                                 ServerInterfaceSSLError,
                                 create_api_error)
+from rbtools.api.instrumentation import (HTTPRequestRecord,
+                                         HTTPRequestStats,
+                                         get_active_request_record,
+                                         get_url_template,
+                                         track_request)
+from rbtools.api.retry import (IDEMPOTENT_METHODS,
+                               RateLimiter,
+                               RetryPolicy,
+                               get_rate_limiter)
 from rbtools.config import load_config
 from rbtools.utils.encoding import force_bytes, force_unicode
-from rbtools.utils.filesystem import get_home_path
+from rbtools.utils.filesystem import get_home_path, lock_file
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
     from typing import Any, TypeAlias
 
     from typing_extensions import Never
@@ -66,6 +87,9 @@ RBTOOLS_COOKIE_FILE = '.rbtools-cookies'
 RBTOOLS_USER_AGENT = 'RBTools/' + get_package_version()
 RB_COOKIE_NAME = 'rbsessionid'
 
+# Cookie jars with changes to save when the process exits.
+_cookie_jars: weakref.WeakSet[PersistentCookieJar] = weakref.WeakSet()
+
 
 AuthCallback: TypeAlias = Callable[..., tuple[str, str]]
 OTPCallback: TypeAlias = Callable[[str, str], str]
@@ -81,6 +105,18 @@ WebLoginCallback: TypeAlias = Callable[[], bool]
 QueryArgs: TypeAlias = bool | int | float | bytes | str
 
 
+#: The content of a file to upload in a request.
+#:
+#: This may be the content itself (as bytes or a string), a seekable binary
+#: file-like object, or the path to a file on disk (as an
+#: :py:class:`os.PathLike`, such as :py:class:`pathlib.Path`). File objects
+#: and paths are streamed to the server rather than loaded into memory.
+#:
+#: Version Added:
+#:     7.0
+FileContent: TypeAlias = bytes | str | BinaryIO | os.PathLike[str]
+
+
 def _normalize_url_parts(
     url: str,
     *,
@@ -141,6 +177,164 @@ def _assert_never_message(
     raise ValueError(message)
 
 
+class MultipartFormDataBody:
+    """A multi-part form-data request body that can be streamed.
+
+    This yields the body in chunks, reading the contents of any uploaded
+    files and paths only as they're sent, so large uploads can be sent with
+    constant memory. The total length is computed up front, allowing a
+    :mailheader:`Content-Length` header to be sent.
+
+    The body can be iterated more than once (for instance, if the request
+    needs to be retried after authenticating). File objects are rewound to
+    their original positions each time.
+
+    Version Added:
+        7.0
+    """
+
+    #: The size of each chunk read from files.
+    CHUNK_SIZE = 64 * 1024
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The total length of the body, in bytes.
+    content_length: int
+
+    #: The parts of the body.
+    #:
+    #: Each part is either literal bytes, or a tuple of a file object or
+    #: path, the offset to start reading from, and the number of bytes to
+    #: read.
+    _parts: list[bytes | tuple[BinaryIO | os.PathLike[str], int, int]]
+
+    def __init__(self) -> None:
+        """Initialize the body."""
+        self.content_length = 0
+        self._parts = []
+
+    def write(
+        self,
+        data: bytes,
+    ) -> None:
+        """Append literal data to the body.
+
+        Args:
+            data (bytes):
+                The data to append.
+        """
+        if data:
+            parts = self._parts
+
+            if parts and isinstance(parts[-1], bytes):
+                parts[-1] += data
+            else:
+                parts.append(data)
+
+            self.content_length += len(data)
+
+    def write_file(
+        self,
+        source: BinaryIO | os.PathLike[str],
+    ) -> None:
+        """Append the contents of a file to the body.
+
+        The file will not be read until the body is iterated. File objects
+        will be read from their current position.
+
+        Args:
+            source (io.BufferedIOBase or os.PathLike):
+                The file object or path to append.
+
+        Raises:
+            OSError:
+                The file could not be accessed.
+        """
+        if isinstance(source, os.PathLike):
+            offset = 0
+            size = os.path.getsize(source)
+        else:
+            offset = source.tell()
+            size = source.seek(0, os.SEEK_END) - offset
+            source.seek(offset)
+
+        self._parts.append((source, offset, size))
+        self.content_length += size
+
+    def __len__(self) -> int:
+        """Return the total length of the body.
+
+        Returns:
+            int:
+            The length of the body, in bytes.
+        """
+        return self.content_length
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate through chunks of the body.
+
+        Yields:
+            bytes:
+            Each chunk of the body.
+
+        Raises:
+            OSError:
+                A file could not be read, or its size changed after the body
+                was built.
+        """
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                source, offset, size = part
+
+                if isinstance(source, os.PathLike):
+                    with open(source, 'rb') as fp:
+                        yield from self._iter_file_chunks(fp, size)
+                else:
+                    source.seek(offset)
+
+                    yield from self._iter_file_chunks(source, size)
+
+    def _iter_file_chunks(
+        self,
+        fp: BinaryIO,
+        size: int,
+    ) -> Iterator[bytes]:
+        """Iterate through chunks of a file.
+
+        Args:
+            fp (io.BufferedIOBase):
+                The file to read from.
+
+            size (int):
+                The number of bytes to read.
+
+        Yields:
+            bytes:
+            Each chunk of the file.
+
+        Raises:
+            OSError:
+                The file was shorter than expected.
+        """
+        remaining = size
+
+        while remaining > 0:
+            chunk = fp.read(min(self.CHUNK_SIZE, remaining))
+
+            if not chunk:
+                raise OSError(
+                    f'File {getattr(fp, "name", fp)!r} changed size while '
+                    f'being uploaded')
+
+            remaining -= len(chunk)
+
+            yield chunk
+
+
 class HttpRequest:
     """A high-level HTTP request.
 
@@ -188,6 +382,7 @@ class HttpRequest:
         """
         self._method = method
         self.headers = headers or {}
+        self._idempotent: bool | None = None
         self._fields = OrderedDict()
         self._files = OrderedDict()
 
@@ -294,6 +489,39 @@ class HttpRequest:
         """
         self._method = str(method)
 
+    @property
+    def idempotent(self) -> bool:
+        """Whether the request can be safely repeated.
+
+        This defaults to ``True`` for idempotent HTTP methods, and determines
+        whether the request can be retried if the server may have processed
+        it. It can be set for other requests that have no side effects, such
+        as validation requests.
+
+        Version Added:
+            7.0
+        """
+        if self._idempotent is None:
+            return self._method.upper() in IDEMPOTENT_METHODS
+
+        return self._idempotent
+
+    @idempotent.setter
+    def idempotent(
+        self,
+        idempotent: bool,
+    ) -> None:
+        """Set whether the request can be safely repeated.
+
+        Version Added:
+            7.0
+
+        Args:
+            idempotent (bool):
+                Whether the request can be safely repeated.
+        """
+        self._idempotent = idempotent
+
     def add_field(
         self,
         name: bytes | str,
@@ -332,11 +560,16 @@ class HttpRequest:
         self,
         name: bytes | str,
         filename: bytes | str,
-        content: bytes | str,
+        content: FileContent,
         mimetype: (bytes | str | None) = None,
     ) -> None:
         """Add an uploaded file for the request.
 
+        Version Changed:
+            7.0:
+            ``content`` may now be a binary file-like object or a path to a
+            file, which will be streamed when sending the request.
+
         Args:
             name (bytes or str):
                 The name of the field representing the file.
@@ -344,8 +577,13 @@ class HttpRequest:
             filename (bytes or str):
                 The filename.
 
-            content (bytes or str):
-                The contents of the file.
+            content (FileContent):
+                The contents of the file. This may be bytes or a string, a
+                binary file-like object, or an :py:class:`os.PathLike` path
+                to a file.
+
+                File objects are read from their current position. Ones that
+                don't support seeking will be read into memory immediately.
 
             mimetype (bytes or str, optional):
                 The optional mimetype of the content. If not provided, it
@@ -356,9 +594,20 @@ class HttpRequest:
                 mimetypes.guess_type(force_unicode(filename))[0] or
                 b'application/octet-stream')
 
+        file_content: bytes | BinaryIO | os.PathLike[str]
+
+        if isinstance(content, (bytes, str)):
+            file_content = force_bytes(content)
+        elif isinstance(content, os.PathLike):
+            file_content = content
+        elif content.seekable():
+            file_content = content
+        else:
+            file_content = content.read()
+
         self._files[force_bytes(name)] = {
             'filename': force_bytes(filename),
-            'content': force_bytes(content),
+            'content': file_content,
             'mimetype': force_bytes(mimetype),
         }
 
@@ -367,6 +616,9 @@ class HttpRequest:
     ) -> tuple[str | None, bytes | None]:
         """Encode the request into a multi-part form-data payload.
 
+        This will read any uploaded files into memory. Use
+        :py:meth:`encode_multipart_formdata_stream` to stream them instead.
+
         Returns:
             tuple:
             A tuple containing:
@@ -377,12 +629,44 @@ class HttpRequest:
             If there are no fields or files in the request, both values will
             be ``None``.
         """
+        content_type, body = self.encode_multipart_formdata_stream()
+
+        if body is None:
+            return None, None
+
+        return content_type, b''.join(body)
+
+    def encode_multipart_formdata_stream(
+        self,
+    ) -> tuple[str | None, MultipartFormDataBody | None]:
+        """Encode the request into a streamable multi-part form-data payload.
+
+        The resulting body reads any uploaded file objects or paths only as
+        it's iterated.
+
+        Version Added:
+            7.0
+
+        Returns:
+            tuple:
+            A tuple containing:
+
+            * The content type (:py:class:`str`)
+            * The form-data payload (:py:class:`MultipartFormDataBody`)
+
+            If there are no fields or files in the request, both values will
+            be ``None``.
+
+        Raises:
+            OSError:
+                An uploaded file could not be accessed.
+        """
         if not (self._fields or self._files):
             return None, None
 
         NEWLINE = b'\r\n'
         BOUNDARY = self._make_mime_boundary()
-        content = BytesIO()
+        content = MultipartFormDataBody()
 
         for key, value in self._fields.items():
             content.write(b'--%s%s' % (BOUNDARY, NEWLINE))
@@ -400,7 +684,14 @@ class HttpRequest:
             content.write(b'Content-Type: %s%s' % (file_info['mimetype'],
                                                    NEWLINE))
             content.write(NEWLINE)
-            content.write(file_info['content'])
+
+            file_content = file_info['content']
+
+            if isinstance(file_content, bytes):
+                content.write(file_content)
+            else:
+                content.write_file(file_content)
+
             content.write(NEWLINE)
 
         content.write(b'--%s--%s%s' % (BOUNDARY, NEWLINE, NEWLINE))
@@ -408,7 +699,7 @@ class HttpRequest:
         boundary_str = BOUNDARY.decode('utf-8')
         content_type = f'multipart/form-data; boundary={boundary_str}'
 
-        return content_type, content.getvalue()
+        return content_type, content
 
     def _make_mime_boundary(self) -> bytes:
         """Create a mime boundary.
@@ -426,6 +717,69 @@ class HttpRequest:
         return (b'=' * 15) + (fmt % token).encode('utf-8') + b'=='
 
 
+def _timed_connect(
+    conn: HTTPConnection,
+    connect: Callable[[], None],
+) -> None:
+    """Connect to the server, recording the time spent.
+
+    The time spent opening the socket and in any TLS handshake will be added
+    to the active HTTP request record, if any.
+
+    Version Added:
+        7.0
+
+    Args:
+        conn (http.client.HTTPConnection):
+            The connection being opened.
+
+        connect (callable):
+            The parent class's method for connecting.
+    """
+    record = get_active_request_record()
+
+    if record is None:
+        connect()
+        return
+
+    create_connection = conn._create_connection
+    socket_time = 0.0
+
+    def _create_connection(*args, **kwargs) -> Any:
+        nonlocal socket_time
+
+        socket_start = time.perf_counter()
+
+        try:
+            return create_connection(*args, **kwargs)
+        finally:
+            socket_time += time.perf_counter() - socket_start
+
+    conn._create_connection = _create_connection
+    start = time.perf_counter()
+
+    try:
+        connect()
+    finally:
+        conn._create_connection = create_connection
+        record.connect_time += socket_time
+        record.tls_time += time.perf_counter() - start - socket_time
+
+
+class RBToolsHTTPConnection(HTTPConnection):
+    """Connection class for HTTP connections.
+
+    This records the time spent connecting for HTTP request instrumentation.
+
+    Version Added:
+        7.0
+    """
+
+    def connect(self) -> None:
+        """Connect to the server."""
+        _timed_connect(self, super().connect)
+
+
 class RBToolsHTTPSConnection(HTTPSConnection):
     """Connection class for HTTPS connections.
 
@@ -458,7 +812,10 @@ class RBToolsHTTPSConnection(HTTPSConnection):
                 in the error message.
         """
         try:
-            return super().connect(*args, **kwargs)
+            return _timed_connect(
+                self,
+                lambda: super(RBToolsHTTPSConnection, self).connect(
+                    *args, **kwargs))
         except ssl.SSLError as e:
             # This seems to be the only way to get access to the context
             # here. Assert that it's reachable.
@@ -472,12 +829,54 @@ class RBToolsHTTPSConnection(HTTPSConnection):
                 ssl_context=context)
 
 
-class RBToolsHTTPSHandler(HTTPSHandler):
+class RBToolsHTTPHandler(PooledHTTPHandlerMixin, HTTPHandler):
+    """Request/response handler for HTTP connections.
+
+    This wraps the default HTTP handler, allowing connections to be reused
+    through a :py:class:`~rbtools.api.connections.HTTPConnectionPool`.
+
+    Version Added:
+        7.0
+    """
+
+    def do_open(
+        self,
+        http_class: HTTPConnection,
+        *args,
+        **kwargs,
+    ) -> HTTPResponse:
+        """Open a connection to the server.
+
+        Args:
+            http_class (type, unused):
+                The original HTTP connection class. This will be replaced
+                with our own.
+
+            *args (tuple):
+                Positional arguments to pass to the parent method.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the parent method.
+
+        Returns:
+            http.client.HTTPResponse:
+            The resulting HTTP response.
+        """
+        return super().do_open(RBToolsHTTPConnection, *args, **kwargs)
+
+
+class RBToolsHTTPSHandler(PooledHTTPHandlerMixin, HTTPSHandler):
     """Request/response handler for HTTPS connections.
 
     This wraps the default HTTPS handler, passing in a specialized HTTPS
     connection class used to generate more useful SSL-related errors.
 
+    Version Changed:
+        7.0:
+        Connections can now be reused through a
+        :py:class:`~rbtools.api.connections.HTTPConnectionPool`, provided
+        in the ``connection_pool`` argument.
+
     Version Added:
         4.1
     """
@@ -560,6 +959,118 @@ class Request(URLRequest):
         return self.method
 
 
+class RBToolsContentDecodingProcessor(BaseHandler):
+    """Decodes compressed HTTP responses.
+
+    Responses sent with a :mailheader:`Content-Encoding` of ``gzip`` or
+    ``deflate`` are decompressed and returned as a
+    :py:class:`~rbtools.api.connections.BufferedHTTPResponse` with the
+    encoding headers removed. This happens before any other response
+    processing, so error handling, the API cache, and the payload decoders
+    only ever see identity-encoded bodies.
+
+    Responses with any other encoding are returned unchanged.
+
+    Version Added:
+        7.0
+    """
+
+    # Run before ReviewBoardHTTPErrorProcessor, so error payloads are
+    # decoded as well.
+    handler_order = 900
+
+    #: The value to send in :mailheader:`Accept-Encoding` headers.
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+    def http_response(
+        self,
+        request: Request,
+        response: HTTPResponse | BufferedHTTPResponse,
+    ) -> HTTPResponse | BufferedHTTPResponse:
+        """Decode a compressed response.
+
+        Args:
+            request (urllib.request.Request, unused):
+                The HTTP request.
+
+            response (http.client.HTTPResponse or
+                      rbtools.api.connections.BufferedHTTPResponse):
+                The HTTP response.
+
+        Returns:
+            http.client.HTTPResponse or
+            rbtools.api.connections.BufferedHTTPResponse:
+            The decoded response, or the original response if it wasn't
+            compressed.
+
+        Raises:
+            urllib.error.URLError:
+                The response could not be decompressed.
+        """
+        encoding = response.headers.get('Content-Encoding', '').strip().lower()
+
+        if encoding in ('gzip', 'x-gzip'):
+            decompress = gzip.decompress
+        elif encoding == 'deflate':
+            decompress = self._decompress_deflate
+        else:
+            return response
+
+        try:
+            raw_body = response.read()
+
+            if (record := get_active_request_record()) is not None:
+                record.bytes_received = len(raw_body)
+
+            body = decompress(raw_body)
+        except (OSError, EOFError, zlib.error) as e:
+            raise URLError(f'Unable to decode {encoding} response: {e}')
+        finally:
+            response.close()
+
+        headers = HTTPMessage()
+
+        for name, value in response.headers.items():
+            if name.lower() not in ('content-encoding', 'content-length'):
+                headers[name] = value
+
+        headers['Content-Length'] = str(len(body))
+
+        return BufferedHTTPResponse(body=body,
+                                    headers=headers,
+                                    status=response.status,
+                                    reason=response.reason,
+                                    url=response.url)
+
+    https_response = http_response
+
+    def _decompress_deflate(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Decompress a deflate-encoded body.
+
+        The ``deflate`` encoding is supposed to be zlib-wrapped, but some
+        servers send raw deflate data. Both are supported.
+
+        Args:
+            data (bytes):
+                The compressed data.
+
+        Returns:
+            bytes:
+            The decompressed data.
+
+        Raises:
+            zlib.error:
+                The data could not be decompressed.
+        """
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
 class ReviewBoardHTTPErrorProcessor(HTTPErrorProcessor):
     """Processes HTTP error codes.
 
@@ -792,6 +1303,9 @@ class ReviewBoardWebLoginHandler(BaseHandler):
 
             # Retry now that we're authenticated.
             if authenticated:
+                if (record := get_active_request_record()) is not None:
+                    record.auth_retries += 1
+
                 return self.parent.open(req, timeout=req.timeout)
 
         # Let the other handlers try next.
@@ -1074,6 +1588,9 @@ class ReviewBoardHTTPBasicAuthHandler(HTTPBasicAuthHandler):
 
         self._tried_login = True
 
+        if (record := get_active_request_record()) is not None:
+            record.auth_retries += 1
+
         return self.parent.open(request, timeout=request.timeout)
 
 
@@ -1152,11 +1669,271 @@ class CookiePolicy(DefaultCookiePolicy):
         return super().domain_return_ok(domain, request)
 
 
+class PersistentCookieJar(MozillaCookieJar):
+    """A cookie jar that only saves to its cookie file when cookies change.
+
+    This tracks whether any cookies have been added, changed, or removed
+    since the file was last loaded or saved, so that callers can save after
+    every request without rewriting the file each time.
+
+    The file is written atomically (to a temporary file, which then replaces
+    the cookie file) while holding a lock, so concurrent processes won't
+    leave a corrupted or partially-written file behind. Any unsaved changes
+    are saved when the process exits.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: Whether cookies have changed since the cookie file was loaded or saved.
+    dirty: bool
+
+    def __init__(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Initialize the cookie jar.
+
+        Args:
+            *args (tuple):
+                Positional arguments for the parent constructor.
+
+            **kwargs (dict):
+                Keyword arguments for the parent constructor.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.dirty = False
+
+        _cookie_jars.add(self)
+
+    def set_cookie(
+        self,
+        cookie: Cookie,
+    ) -> None:
+        """Set a cookie.
+
+        The jar will only be marked as changed if the cookie is new or
+        differs from the stored cookie.
+
+        Args:
+            cookie (http.cookiejar.Cookie):
+                The cookie to set.
+        """
+        with self._cookies_lock:
+            try:
+                existing = self._cookies[cookie.domain][cookie.path][
+                    cookie.name]
+            except KeyError:
+                existing = None
+
+            if existing is None or vars(existing) != vars(cookie):
+                self.dirty = True
+
+            super().set_cookie(cookie)
+
+    def clear(
+        self,
+        domain: (str | None) = None,
+        path: (str | None) = None,
+        name: (str | None) = None,
+    ) -> None:
+        """Clear cookies.
+
+        Args:
+            domain (str, optional):
+                The domain of the cookies to clear.
+
+            path (str, optional):
+                The path of the cookies to clear. This requires ``domain``.
+
+            name (str, optional):
+                The name of the cookie to clear. This requires ``domain``
+                and ``path``.
+
+        Raises:
+            KeyError:
+                No matching cookie was found.
+        """
+        with self._cookies_lock:
+            count = len(self)
+            super().clear(domain, path, name)
+
+            if len(self) != count:
+                self.dirty = True
+
+    def clear_session_cookies(self) -> None:
+        """Clear all session cookies."""
+        with self._cookies_lock:
+            count = len(self)
+            super().clear_session_cookies()
+
+            if len(self) != count:
+                self.dirty = True
+
+    def clear_expired_cookies(self) -> None:
+        """Clear all expired cookies."""
+        with self._cookies_lock:
+            count = len(self)
+            super().clear_expired_cookies()
+
+            if len(self) != count:
+                self.dirty = True
+
+    def load(
+        self,
+        filename: (str | None) = None,
+        ignore_discard: bool = False,
+        ignore_expires: bool = False,
+    ) -> None:
+        """Load cookies from a file.
+
+        Loading the jar's own cookie file resets the changed state. Cookies
+        loaded from any other file are considered changes, and will be
+        saved to the jar's cookie file.
+
+        Args:
+            filename (str, optional):
+                The file to load. This defaults to the jar's cookie file.
+
+            ignore_discard (bool, optional):
+                Whether to load cookies that would be discarded.
+
+            ignore_expires (bool, optional):
+                Whether to load expired cookies.
+
+        Raises:
+            OSError:
+                The file could not be read.
+        """
+        with self._cookies_lock:
+            super().load(filename, ignore_discard, ignore_expires)
+
+            if filename is None or filename == self.filename:
+                self.dirty = False
+
+    def save(
+        self,
+        filename: (str | None) = None,
+        ignore_discard: bool = False,
+        ignore_expires: bool = False,
+    ) -> None:
+        """Save cookies to a file.
+
+        The cookies are written to a temporary file, which then atomically
+        replaces the cookie file. This is done while holding a lock on the
+        cookie file, if possible.
+
+        Args:
+            filename (str, optional):
+                The file to save to. This defaults to the jar's cookie file.
+
+            ignore_discard (bool, optional):
+                Whether to save cookies that would be discarded.
+
+            ignore_expires (bool, optional):
+                Whether to save expired cookies.
+
+        Raises:
+            OSError:
+                The file could not be written.
+
+            ValueError:
+                No filename was provided, and the jar has no cookie file.
+        """
+        if filename is None:
+            filename = self.filename
+
+            if filename is None:
+                raise ValueError('A filename must be provided to save '
+                                 'cookies.')
+
+        # Resolve any symlink, so the link itself isn't replaced.
+        path = os.path.realpath(filename)
+
+        with contextlib.ExitStack() as stack:
+            try:
+                stack.enter_context(lock_file(path))
+            except OSError as e:
+                # Some network filesystems don't support locking. The file
+                # is still replaced atomically.
+                logger.debug('Could not lock cookie file "%s": %s',
+                             path, e)
+
+            with self._cookies_lock:
+                fd, temp_path = tempfile.mkstemp(
+                    prefix=f'.{os.path.basename(path)}.',
+                    dir=os.path.dirname(path))
+                os.close(fd)
+
+                try:
+                    super().save(temp_path, ignore_discard, ignore_expires)
+                    os.replace(temp_path, path)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.unlink(temp_path)
+
+                    raise
+
+                if filename == self.filename:
+                    self.dirty = False
+
+    def save_if_changed(self) -> bool:
+        """Save cookies to the jar's cookie file, if any have changed.
+
+        Returns:
+            bool:
+            ``True`` if the cookies were saved. ``False`` if there were no
+            changes to save.
+
+        Raises:
+            OSError:
+                The file could not be written.
+        """
+        # The cookie file lock must always be acquired before the cookies
+        # lock, so the cookies lock can't be held when calling save().
+        with self._cookies_lock:
+            if not self.dirty:
+                return False
+
+            self.dirty = False
+
+        try:
+            self.save()
+        except BaseException:
+            with self._cookies_lock:
+                self.dirty = True
+
+            raise
+
+        return True
+
+
+@atexit.register
+def _save_cookie_jars() -> None:
+    """Save any changed cookie jars at exit.
+
+    Version Added:
+        7.0
+    """
+    for cookie_jar in list(_cookie_jars):
+        try:
+            cookie_jar.save_if_changed()
+        except Exception as e:
+            logger.debug('Could not save cookies to "%s" on exit: %s',
+                         cookie_jar.filename, e)
+
+
 def _create_cookie_jar(
     *,
     cookie_file: (str | None) = None,
     config: RBToolsConfig,
-) -> tuple[MozillaCookieJar, str]:
+) -> tuple[PersistentCookieJar, str]:
     """Return a cookie jar backed by cookie_file
 
     If cooie_file is not provided, we will default it. If the
@@ -1166,6 +1943,10 @@ def _create_cookie_jar(
     In the case where we default cookie_file, and it does not exist,
     we will attempt to copy the .post-review-cookies.txt file.
 
+    Version Changed:
+        7.0:
+        This now returns a :py:class:`PersistentCookieJar`.
+
     Version Changed:
         5.1:
         * Added the required ``config`` argument.
@@ -1188,7 +1969,7 @@ def _create_cookie_jar(
         A two-tuple containing:
 
         Tuple:
-            0 (http.cookiejar.MozillaCookieJar):
+            0 (PersistentCookieJar):
                 The cookie jar object.
 
             1 (str):
@@ -1218,8 +1999,8 @@ def _create_cookie_jar(
                            'cookie file: %s', e)
 
     return (
-        MozillaCookieJar(filename=cookie_file,
-                         policy=CookiePolicy(config=config)),
+        PersistentCookieJar(filename=cookie_file,
+                            policy=CookiePolicy(config=config)),
         cookie_file,
     )
 
@@ -1259,6 +2040,58 @@ class ReviewBoardServer:
     #:     http.cookiejar.CookieJar
     cookie_jar: CookieJar
 
+    #: The pool of keep-alive connections used for requests.
+    #:
+    #: This will be ``None`` if connection pooling has been disabled through
+    #: the ``HTTP_CONNECTION_POOL_SIZE`` setting.
+    #:
+    #: Version Added:
+    #:     7.0
+    connection_pool: HTTPConnectionPool | None
+
+    #: The limiter capping concurrent requests to the server.
+    #:
+    #: This is shared by all instances talking to the same server. It will
+    #: be ``None`` if the limit has been disabled through the
+    #: ``HTTP_MAX_CONCURRENT_REQUESTS`` setting.
+    #:
+    #: Version Added:
+    #:     7.0
+    request_limiter: threading.BoundedSemaphore | None
+
+    #: The limiter capping the rate of requests to the server.
+    #:
+    #: This is shared by all instances talking to the same server. It will
+    #: be ``None`` unless enabled through the ``HTTP_RATE_LIMIT`` setting.
+    #:
+    #: Version Added:
+    #:     7.0
+    rate_limiter: RateLimiter | None
+
+    #: The policy for retrying failed requests.
+    #:
+    #: Version Added:
+    #:     7.0
+    retry_policy: RetryPolicy
+
+    #: The value to send in Accept-Encoding headers, if any.
+    #:
+    #: This is set when compressed responses have been enabled through the
+    #: ``HTTP_COMPRESSION`` setting.
+    #:
+    #: Version Added:
+    #:     7.0
+    accept_encoding: str | None
+
+    #: Statistics on the requests made to the server.
+    #:
+    #: Callbacks can be registered here to receive information on each
+    #: completed request.
+    #:
+    #: Version Added:
+    #:     7.0
+    request_stats: HTTPRequestStats
+
     _cache: (APICache | None) = None
 
     def __init__(
@@ -1473,9 +2306,56 @@ class ReviewBoardServer:
         if client_cert and client_key:
             context.load_cert_chain(client_cert, client_key)
 
+        # Set up a pool of keep-alive connections, so that sockets (and TLS
+        # sessions) can be reused across requests.
+        pool_size = config.HTTP_CONNECTION_POOL_SIZE
+
+        if pool_size > 0:
+            connection_pool = HTTPConnectionPool(
+                max_idle_per_host=pool_size,
+                idle_timeout=config.HTTP_CONNECTION_IDLE_TIMEOUT)
+        else:
+            connection_pool = None
+
+        self.connection_pool = connection_pool
+
+        # Cap the number of requests in flight to this server across all
+        # clients in the process.
+        max_concurrent = config.HTTP_MAX_CONCURRENT_REQUESTS
+
+        if max_concurrent > 0:
+            self.request_limiter = get_request_limiter(api_url,
+                                                       max_concurrent)
+        else:
+            self.request_limiter = None
+
+        # Limit the rate of requests to the server, if requested.
+        if config.HTTP_RATE_LIMIT > 0:
+            self.rate_limiter = get_rate_limiter(api_url,
+                                                 config.HTTP_RATE_LIMIT)
+        else:
+            self.rate_limiter = None
+
+        self.retry_policy = RetryPolicy(
+            max_retries=config.HTTP_MAX_RETRIES,
+            backoff=config.HTTP_RETRY_BACKOFF,
+            max_delay=config.HTTP_RETRY_MAX_DELAY)
+
+        # Negotiate compressed responses, if enabled. These are decoded by
+        # RBToolsContentDecodingProcessor before reaching the API cache.
+        if config.HTTP_COMPRESSION:
+            self.accept_encoding = \
+                RBToolsContentDecodingProcessor.ACCEPT_ENCODING
+        else:
+            self.accept_encoding = None
+
         # Set default headers and install urllib handlers.
         handlers: list[BaseHandler] = [
-            RBToolsHTTPSHandler(context=context),
+            RBToolsHTTPHandler(connection_pool=connection_pool,
+                               request_limiter=self.request_limiter),
+            RBToolsHTTPSHandler(context=context,
+                                connection_pool=connection_pool,
+                                request_limiter=self.request_limiter),
         ]
 
         if disable_proxy:
@@ -1487,6 +2367,7 @@ class ReviewBoardServer:
             ReviewBoardHTTPBasicAuthHandler(password_mgr),
             HTTPDigestAuthHandler(password_mgr),
             self.preset_auth_handler,
+            RBToolsContentDecodingProcessor(),
             ReviewBoardHTTPErrorProcessor(),
         ]
 
@@ -1501,12 +2382,16 @@ class ReviewBoardServer:
         install_opener(opener)
 
         self._cache = None
+        self._cookie_save_lock = threading.Lock()
         self._urlopen = urlopen
+        self.request_stats = HTTPRequestStats()
 
     def enable_cache(
         self,
         cache_location: (str | None) = None,
         in_memory: bool = False,
+        *,
+        stale_max_age: int = 0,
     ) -> None:
         """Enable caching for all future HTTP requests.
 
@@ -1515,6 +2400,13 @@ class ReviewBoardServer:
         If the in_memory parameter is True, the cache will be created in memory
         instead of on disk. This overrides the cache_location parameter.
 
+        Version Changed:
+            7.0:
+            The cache is now bounded by the ``CACHE_MAX_SIZE_MB`` and
+            ``CACHE_MAX_ENTRIES`` settings. The API root is reused without
+            revalidation for ``CACHE_ROOT_TTL`` seconds. Added the
+            ``stale_max_age`` argument.
+
         Args:
             cache_location (str, optional):
                 The name of the file to use for the cache database.
@@ -1522,10 +2414,27 @@ class ReviewBoardServer:
             in_memory (bool, optional):
                 Whether to only use in-memory caching. If ``True``, the
                 ``cache_location`` argument is ignored.
+
+            stale_max_age (int, optional):
+                The maximum number of seconds an expired response may be
+                used while it's revalidated in the background. If 0, expired
+                responses are always revalidated first.
+
+                Version Added:
+                    7.0
         """
         if not self._cache:
-            self._cache = APICache(create_db_in_memory=in_memory,
-                                   db_location=cache_location)
+            config = self.config
+
+            self._cache = APICache(
+                create_db_in_memory=in_memory,
+                db_location=cache_location,
+                max_size=config.CACHE_MAX_SIZE_MB * 1024 * 1024,
+                max_entries=config.CACHE_MAX_ENTRIES,
+                stale_max_age=stale_max_age,
+                min_max_ages={
+                    self.url: config.CACHE_ROOT_TTL,
+                })
 
             self._urlopen = self._cache.make_request
 
@@ -1536,6 +2445,7 @@ class ReviewBoardServer:
             5.0
         """
         if self._cache:
+            self._cache.close()
             self._cache = None
             self._urlopen = urlopen
 
@@ -1590,6 +2500,15 @@ class ReviewBoardServer:
             assert isinstance(self.cookie_jar, MozillaCookieJar)
             self.cookie_jar.save()
 
+    def close_connections(self) -> None:
+        """Close any idle keep-alive connections to the server.
+
+        Version Added:
+            7.0
+        """
+        if self.connection_pool is not None:
+            self.connection_pool.close_all()
+
     def process_error(
         self,
         http_status: int,
@@ -1631,6 +2550,10 @@ class ReviewBoardServer:
     ) -> HTTPResponse | CachedHTTPResponse | LiveHTTPResponse | None:
         """Perform an http request.
 
+        Version Changed:
+            7.0:
+            Each request is now recorded in :py:attr:`request_stats`.
+
         Args:
             request (rbtools.api.request.HttpRequest):
                 The request object.
@@ -1639,36 +2562,196 @@ class ReviewBoardServer:
             http.client.HTTPResponse:
             The HTTP response.
         """
-        rsp = None
+        record = HTTPRequestRecord(method=request.method,
+                                   url=request.url,
+                                   url_template=get_url_template(request.url))
 
         try:
-            content_type, body = request.encode_multipart_formdata()
-            headers = request.headers
-
-            if content_type and body:
-                headers.update({
-                    'Content-Type': content_type,
-                    'Content-Length': str(len(body)),
-                })
-            else:
-                headers['Content-Length'] = '0'
-
-            rsp = self._urlopen(Request(
-                request.url, body, headers, request.method))
-        except HTTPError as e:
-            self.process_error(e.code, e.read())
-        except URLError as e:
-            raise ServerInterfaceError('%s' % e.reason)
+            with track_request(record):
+                rsp = self._send_request(request, record)
+        finally:
+            self.request_stats.add_record(record)
 
         if self.save_cookies:
             try:
-                assert isinstance(self.cookie_jar, MozillaCookieJar)
-                self.cookie_jar.save()
+                assert isinstance(self.cookie_jar, PersistentCookieJar)
+
+                with self._cookie_save_lock:
+                    self.cookie_jar.save_if_changed()
             except IOError:
                 pass
 
         return rsp
 
+    def _send_request(
+        self,
+        request: HttpRequest,
+        record: HTTPRequestRecord,
+    ) -> HTTPResponse | CachedHTTPResponse | LiveHTTPResponse | None:
+        """Send a request to the server.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (rbtools.api.request.HttpRequest):
+                The request object.
+
+            record (rbtools.api.instrumentation.HTTPRequestRecord):
+                The record for the request, which will be updated with the
+                results.
+
+        Returns:
+            http.client.HTTPResponse:
+            The HTTP response.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The server returned an error.
+
+            rbtools.api.errors.ServerInterfaceError:
+                The server could not be reached.
+        """
+        rsp = None
+
+        # Stream the body, so that large uploads don't need to be held in
+        # memory. The body can be iterated again for retries.
+        content_type, body = request.encode_multipart_formdata_stream()
+        headers = request.headers
+
+        if content_type and body:
+            headers.update({
+                'Content-Type': content_type,
+                'Content-Length': str(body.content_length),
+            })
+            record.bytes_sent = body.content_length
+        else:
+            headers['Content-Length'] = '0'
+
+        # This must be set before the request reaches the API cache, so
+        # that cached entries are kept separate based on any Vary header.
+        if self.accept_encoding and 'Accept-Encoding' not in headers:
+            headers['Accept-Encoding'] = self.accept_encoding
+
+        retry_policy = self.retry_policy
+        attempt = 0
+
+        while True:
+            urllib_request = Request(request.url, body, headers,
+                                     request.method)
+
+            if self.rate_limiter is not None:
+                record.wait_time += self.rate_limiter.acquire()
+
+            open_start = time.perf_counter()
+
+            try:
+                rsp = self._urlopen(urllib_request)
+                open_time = time.perf_counter() - open_start
+                break
+            except HTTPError as e:
+                record.status = e.code
+
+                if retry_policy.should_retry(attempt=attempt,
+                                             idempotent=request.idempotent,
+                                             status=e.code):
+                    delay = retry_policy.get_delay(
+                        attempt=attempt,
+                        retry_after=(e.headers or {}).get('Retry-After'))
+
+                    if delay is not None:
+                        e.close()
+                        self._wait_for_retry(request=request,
+                                             record=record,
+                                             reason='HTTP %s' % e.code,
+                                             delay=delay)
+                        attempt += 1
+                        continue
+
+                self.process_error(e.code, e.read())
+            except (URLError, ConnectionError, TimeoutError) as e:
+                if isinstance(e, URLError):
+                    reason = e.reason
+                else:
+                    reason = e
+
+                if (isinstance(reason, BaseException) and
+                    retry_policy.should_retry(attempt=attempt,
+                                              idempotent=request.idempotent,
+                                              error=reason)):
+                    delay = retry_policy.get_delay(attempt=attempt)
+                    assert delay is not None
+
+                    self._wait_for_retry(request=request,
+                                         record=record,
+                                         reason=str(reason),
+                                         delay=delay)
+                    attempt += 1
+                    continue
+
+                if isinstance(e, URLError):
+                    raise ServerInterfaceError('%s' % e.reason)
+
+                raise
+
+        if rsp is not None:
+            record.status = rsp.status
+            record.cache_status = getattr(rsp, 'cache_status', None)
+
+            if record.cache_status not in ('hit', 'stale', 'not_modified'):
+                if not record.bytes_received:
+                    try:
+                        record.bytes_received = \
+                            int(rsp.headers.get('Content-Length') or 0)
+                    except ValueError:
+                        pass
+
+                if not record.ttfb_time:
+                    # The response wasn't timed by a pooled connection, so
+                    # count any time not spent connecting as waiting on the
+                    # server.
+                    record.ttfb_time = max(
+                        0.0,
+                        open_time - record.connect_time - record.tls_time)
+
+        return rsp
+
+    def _wait_for_retry(
+        self,
+        *,
+        request: HttpRequest,
+        record: HTTPRequestRecord,
+        reason: str,
+        delay: float,
+    ) -> None:
+        """Log and wait before retrying a failed request.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (rbtools.api.request.HttpRequest):
+                The request object.
+
+            record (rbtools.api.instrumentation.HTTPRequestRecord):
+                The record for the request.
+
+            reason (str):
+                The reason the request failed.
+
+            delay (float):
+                The time to wait before retrying, in seconds.
+        """
+        record.retries += 1
+        record.wait_time += delay
+
+        logger.warning('%s %s failed (%s). Retrying in %.1f seconds '
+                       '(retry %d of %d).',
+                       request.method, request.url, reason, delay,
+                       record.retries, self.retry_policy.max_retries)
+
+        time.sleep(delay)
+
     def has_session_cookie(self) -> bool:
         """Return whether a local session cookie exists for this server.
 
@@ -12,6 +12,7 @@ from rbtools.api.resource.archived_review_request import (
 )
 from rbtools.api.resource.base import (
     CountResource,
+    ItemPayloadView,
     ItemResource,
     ListResource,
     RESOURCE_MAP,
@@ -237,6 +238,7 @@ __all__ = [
     'HostingServiceAccountListResource',
     'HostingServiceItemResource',
     'HostingServiceListResource',
+    'ItemPayloadView',
     'ItemResource',
     'LastUpdateResource',
     'ListResource',
@@ -10,20 +10,22 @@ from __future__ import annotations
 import copy
 import json
 import logging
-from collections.abc import Callable, MutableMapping
+from collections.abc import Callable, Mapping, MutableMapping
 from functools import update_wrapper, wraps
 from typing import (Any, Generic, Literal, TYPE_CHECKING, TypeVar, cast,
                     overload)
-from urllib.parse import urljoin
+from urllib.parse import (parse_qsl, urlencode, urljoin, urlsplit,
+                          urlunsplit)
 
 from typelets.json import JSONDict, JSONValue
 from typing_extensions import NotRequired, ParamSpec, Self, TypedDict, Unpack
 
+from rbtools.api.projection import apply_projection, get_projected_fields
 from rbtools.api.request import HttpRequest, QueryArgs
 from rbtools.api.utils import rem_mime_format
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator
     from typing import ClassVar, Final, NoReturn
 
     from rbtools.api.transport import Transport
@@ -181,6 +183,66 @@ def replace_api_stub(
     setattr(obj, attr, implementation)
 
 
+def _replace_link_api_stubs(
+    cls: type[Resource],
+) -> None:
+    """Replace the API stubs defined on a class with link methods.
+
+    Each replacement method looks up the resource's link (through
+    :py:meth:`Resource._get_link_method`) when it's called, falling back on
+    the stub if the resource doesn't have the link. This is done once for
+    each class, rather than for each resource instance.
+
+    The replacement methods are still considered API stubs, so that
+    subclasses can tell them apart from real implementations.
+
+    Version Added:
+        7.0
+
+    Args:
+        cls (type):
+            The resource class.
+    """
+    for attr_name, stub in list(vars(cls).items()):
+        if callable(stub) and is_api_stub(stub):
+            setattr(cls, attr_name, _make_link_api_stub(attr_name, stub))
+
+
+def _make_link_api_stub(
+    attr_name: str,
+    stub: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Return a method that performs an API stub's request using a link.
+
+    Version Added:
+        7.0
+
+    Args:
+        attr_name (str):
+            The name of the method.
+
+        stub (callable):
+            The API stub.
+
+    Returns:
+        callable:
+        The new method.
+    """
+    def _method(
+        resource: Resource,
+        *args,
+        **kwargs,
+    ) -> Any:
+        method = resource._get_link_method(attr_name)
+
+        if method is None:
+            return stub(resource, *args, **kwargs)
+
+        return method(*args, **kwargs)
+
+    return wraps(stub)(_method)
+
+
 def _preprocess_fields(
     fields: JSONDict,
 ) -> Iterator[tuple[str, str | bytes]]:
@@ -512,6 +574,20 @@ SPECIAL_LINKS: Mapping[
 }
 
 
+#: A mapping of method names for special links to the links and methods.
+#:
+#: Version Added:
+#:     7.0
+_SPECIAL_LINK_METHODS: Mapping[
+    str,
+    tuple[str, Callable[..., RequestMethodResult]]
+] = {
+    attr_name: (link, method)
+    for link, (attr_name, method) in SPECIAL_LINKS.items()
+    if method is not None
+}
+
+
 class ResourceLink(TypedDict):
     """Type for a link within a payload.
 
@@ -618,6 +694,12 @@ class Resource:
     'self' link will be generated with the name 'get_self'. Each
     additional link will have a method generated which constructs a
     request for retrieving the linked resource.
+
+    Version Changed:
+        7.0:
+        The methods for links are now created when they're first used,
+        rather than when the resource is created. API stubs for links are
+        replaced once for each class, and look up the link when called.
     """
 
     #: Attributes which should be excluded when processing the payload.
@@ -652,9 +734,27 @@ class Resource:
     #: The links for the resource.
     _links: ResourceLinks
 
+    #: A mapping of method names to URLs for the resource's links.
+    #:
+    #: This excludes special links. It's computed when first needed.
+    #:
+    #: Version Added:
+    #:     7.0
+    _link_urls: dict[str, str] | None
+
     #: The full resource payload.
     _payload: JSONDict
 
+    #: The fields the payload was limited to, when debugging projections.
+    #:
+    #: This is only set if :py:attr:`Transport.debug_projections
+    #: <rbtools.api.transport.Transport.debug_projections>` is enabled and
+    #: the resource was fetched with ``only-fields``.
+    #:
+    #: Version Added:
+    #:     7.0
+    _projected_fields: frozenset[str] | None
+
     #: The key within the request payload for the resource data.
     #:
     #: If this is ``None``, the payload contains the resource data directly.
@@ -697,6 +797,11 @@ class Resource:
         self._token = token
         self._payload = payload
 
+        if transport.debug_projections:
+            self._projected_fields = get_projected_fields(url)
+        else:
+            self._projected_fields = None
+
         # Determine where the links live in the payload. This
         # can either be at the root, or inside the resources
         # token.
@@ -728,52 +833,166 @@ class Resource:
         else:
             self._expanded_info = {}
 
-        members = set(dir(self))
-
-        # Add a method for each supported REST operation, and
-        # for retrieving 'self'.
-        for link, method in SPECIAL_LINKS.items():
-            if link in self._links and method[1]:
-                attr_name = method[0]
-
-                def special_method(
-                    resource: Self = self,
-                    meth: Callable[..., RequestMethodResult] = method[1],
-                    **kwargs,
-                ) -> RequestMethodResult:
-                    return meth(resource, **kwargs)
-
-                if attr_name not in members:
-                    # This log message is useful for adding new stubs.
-                    logger.debug('%s is missing API stub for %s',
-                                 self.__class__.__name__, attr_name)
-                    setattr(self, attr_name, special_method)
-                elif is_api_stub(stub := getattr(self, attr_name)):
-                    replace_api_stub(self, attr_name, stub, special_method)
-
-        # Generate request methods for any additional links the resource has.
-        excluded_links = self._excluded_links
-
-        for link, body in self._links.items():
-            if link not in SPECIAL_LINKS and link not in excluded_links:
-                # Some resources have hyphens in the links.
-                attr_name = f'get_{link.replace("-", "_")}'
-                url = body['href']
-
-                def link_method(
-                    resource: Self = self,
-                    url: str = url,
-                    **kwargs,
-                ) -> RequestMethodResult:
-                    return resource._get_url(url, **kwargs)
-
-                if attr_name not in members:
-                    # This log message is useful for adding new stubs.
-                    logger.debug('%s is missing API stub for %s (%s)',
-                                 self.__class__.__name__, attr_name, url)
-                    setattr(self, attr_name, link_method)
-                elif is_api_stub(stub := getattr(self, attr_name)):
-                    replace_api_stub(self, attr_name, stub, link_method)
+        self._link_urls = None
+
+    def __init_subclass__(
+        cls,
+        **kwargs,
+    ) -> None:
+        """Set up a new resource class.
+
+        Any API stubs defined on the class are replaced with methods that
+        use the resource's links, when available.
+
+        Version Added:
+            7.0
+
+        Args:
+            **kwargs (dict):
+                Keyword arguments for the parent method.
+        """
+        super().__init_subclass__(**kwargs)
+
+        _replace_link_api_stubs(cls)
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        """Return a method for a link without an API stub.
+
+        Version Added:
+            7.0
+
+        Args:
+            name (str):
+                The name of the attribute.
+
+        Returns:
+            callable:
+            The method for the link.
+
+        Raises:
+            AttributeError:
+                The resource has no link for this attribute.
+        """
+        method = self._get_missing_link_method(name)
+
+        if method is None:
+            raise AttributeError(
+                f'This {self.__class__.__name__} does not have an attribute '
+                f'"{name}".')
+
+        return method
+
+    def _get_link_method(
+        self,
+        name: str,
+    ) -> Callable[..., RequestMethodResult] | None:
+        """Return a method for one of the resource's links.
+
+        Version Added:
+            7.0
+
+        Args:
+            name (str):
+                The name of the method, such as ``update`` or
+                ``get_repository``.
+
+        Returns:
+            callable:
+            The method for the link, or ``None`` if the resource doesn't have
+            a matching link.
+        """
+        # Attributes may be looked up before the resource is initialized, so
+        # don't rely on our own attributes being set.
+        state = self.__dict__
+
+        if (special := _SPECIAL_LINK_METHODS.get(name)) is not None:
+            # Add a method for each supported REST operation, and for
+            # retrieving 'self'.
+            link, meth = special
+
+            if link not in state.get('_links', {}):
+                return None
+
+            def special_method(
+                resource: Self = self,
+                meth: Callable[..., RequestMethodResult] = meth,
+                **kwargs,
+            ) -> RequestMethodResult:
+                return meth(resource, **kwargs)
+
+            return special_method
+
+        if not name.startswith('get_'):
+            return None
+
+        link_urls = state.get('_link_urls')
+
+        if link_urls is None:
+            if '_links' not in state:
+                return None
+
+            excluded_links = self._excluded_links
+
+            # Some resources have hyphens in the links.
+            link_urls = {
+                f'get_{link.replace("-", "_")}': body['href']
+                for link, body in self._links.items()
+                if link not in SPECIAL_LINKS and link not in excluded_links
+            }
+            self._link_urls = link_urls
+
+        url = link_urls.get(name)
+
+        if url is None:
+            return None
+
+        def link_method(
+            resource: Self = self,
+            url: str = url,
+            resource_name: str = name[4:],
+            **kwargs,
+        ) -> RequestMethodResult:
+            kwargs = apply_projection(
+                resource._transport.get_projection(resource_name),
+                kwargs)
+
+            return resource._get_url(url, **kwargs)
+
+        return link_method
+
+    def _get_missing_link_method(
+        self,
+        name: str,
+    ) -> Callable[..., RequestMethodResult] | None:
+        """Return a method for a link that doesn't have an API stub.
+
+        The method is stored on the resource, so it will be found directly
+        the next time it's accessed.
+
+        Version Added:
+            7.0
+
+        Args:
+            name (str):
+                The name of the method.
+
+        Returns:
+            callable:
+            The method for the link, or ``None`` if the resource doesn't have
+            a matching link.
+        """
+        method = self._get_link_method(name)
+
+        if method is not None:
+            # This log message is useful for adding new stubs.
+            logger.debug('%s is missing API stub for %s',
+                         self.__class__.__name__, name)
+            setattr(self, name, method)
+
+        return method
 
     def _make_httprequest(
         self,
@@ -997,6 +1216,9 @@ class Resource:
         raise NotImplementedError
 
 
+_replace_link_api_stubs(Resource)
+
+
 _TResource = TypeVar('_TResource', bound=Resource)
 _TResourceClass = TypeVar('_TResourceClass', bound=type[Resource])
 
@@ -1497,6 +1719,144 @@ class ResourceListField(Generic[_TListValue], list[_TListValue]):
                 f'list_field={super().__repr__()})')
 
 
+class ItemPayloadView(Mapping[str, Any]):
+    """A lightweight, read-only view of an item's payload.
+
+    This provides access to the fields of an item in a list without creating
+    a full :py:class:`ItemResource`. Fields can be accessed as attributes or
+    keys. Dictionaries within the payload are returned as views, and lists
+    are returned as tuples.
+
+    Views don't provide any of the methods or links for the resource. They're
+    meant for reading through large lists of items quickly. See
+    :py:meth:`ListResource.iter_payload_views`.
+
+    Version Added:
+        7.0
+    """
+
+    __slots__ = ('_payload',)
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The payload being viewed.
+    _payload: JSONDict
+
+    def __init__(
+        self,
+        payload: JSONDict,
+    ) -> None:
+        """Initialize the view.
+
+        Args:
+            payload (dict):
+                The payload to view.
+        """
+        self._payload = payload
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        """Return the value of a field as an attribute.
+
+        Args:
+            name (str):
+                The name of the field.
+
+        Returns:
+            object:
+            The value of the field.
+
+        Raises:
+            AttributeError:
+                The field was not found.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(
+                f'This {self.__class__.__name__} does not have an attribute '
+                f'"{name}".')
+
+    def __getitem__(
+        self,
+        key: str,
+    ) -> Any:
+        """Return the value of a field.
+
+        Args:
+            key (str):
+                The name of the field.
+
+        Returns:
+            object:
+            The value of the field.
+
+        Raises:
+            KeyError:
+                The field was not found.
+        """
+        return _make_payload_view(self._payload[key])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate through the names of the fields.
+
+        Yields:
+            str:
+            Each field name.
+        """
+        yield from self._payload
+
+    def __len__(self) -> int:
+        """Return the number of fields.
+
+        Returns:
+            int:
+            The number of fields.
+        """
+        return len(self._payload)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the view.
+
+        Returns:
+            str:
+            A string representation of the view.
+        """
+        return f'{self.__class__.__name__}({self._payload!r})'
+
+
+def _make_payload_view(
+    value: Any,
+) -> Any:
+    """Return a read-only view of a value in a payload.
+
+    Version Added:
+        7.0
+
+    Args:
+        value (object):
+            The value from the payload.
+
+    Returns:
+        object:
+        An :py:class:`ItemPayloadView` for dictionaries, a tuple of views for
+        lists, or the value itself for anything else.
+    """
+    if isinstance(value, dict):
+        return ItemPayloadView(value)
+    elif isinstance(value, list):
+        return tuple(
+            _make_payload_view(item)
+            for item in value
+        )
+    else:
+        return value
+
+
 class ItemResource(Resource):
     """The base class for Item Resources.
 
@@ -1584,9 +1944,22 @@ class ItemResource(Resource):
             AttributeError:
                 A field with the given attribute name was not found.
         """
+        if (method := self._get_missing_link_method(name)) is not None:
+            return method
+
         try:
             field_payload = self._fields[name]
         except KeyError:
+            projected_fields = self.__dict__.get('_projected_fields')
+
+            if (projected_fields is not None and
+                name not in projected_fields and
+                not name.startswith('_')):
+                logger.warning('The "%s" field was accessed on %s, but was '
+                               'not requested with only-fields (%s).',
+                               name, self.__class__.__name__,
+                               ','.join(sorted(projected_fields)))
+
             raise AttributeError(
                 f'This {self.__class__.__name__} does not have an attribute '
                 f'"{name}".')
@@ -1896,6 +2269,12 @@ class ListResource(Generic[TItemResource], Resource):
     #: The raw items in the list payload.
     _item_list: list[JSONValue]
 
+    #: The item resources created so far, keyed by index.
+    #:
+    #: Version Added:
+    #:     7.0
+    _items: dict[int, TItemResource]
+
     #: The MIME type of items in the list.
     _item_mime_type: str | None
 
@@ -1936,6 +2315,7 @@ class ListResource(Generic[TItemResource], Resource):
         assert token is not None
 
         self._item_list = cast(list[JSONValue], payload[token])
+        self._items = {}
 
         self.num_items = len(self._item_list)
         self.total_results = cast(int, payload.get('total_results'))
@@ -1964,6 +2344,11 @@ class ListResource(Generic[TItemResource], Resource):
     ) -> TItemResource:
         """Return the item at the specified index.
 
+        Version Changed:
+            7.0:
+            The item resource is now created on first access and reused
+            after that.
+
         Args:
             index (int):
                 The index of the item to retrieve.
@@ -1976,11 +2361,30 @@ class ListResource(Generic[TItemResource], Resource):
             IndexError:
                 The index is out of range.
         """
-        return self._wrap_field(self._item_list[index],
+        if index < 0:
+            index += self.num_items
+
+        try:
+            return self._items[index]
+        except KeyError:
+            pass
+
+        if index < 0:
+            raise IndexError('list index out of range')
+
+        item = self._wrap_field(self._item_list[index],
                                 field_mimetype=self._item_mime_type,
                                 force_resource=True,
                                 force_resource_type=self._item_resource_type)
 
+        if self._projected_fields is not None:
+            # Items share the fields requested for the list.
+            item._projected_fields = self._projected_fields
+
+        self._items[index] = item
+
+        return item
+
     def __iter__(self) -> Iterator[TItemResource]:
         """Iterate through the items.
 
@@ -1991,6 +2395,23 @@ class ListResource(Generic[TItemResource], Resource):
         for i in range(self.num_items):
             yield self[i]
 
+    def iter_payload_views(self) -> Iterator[ItemPayloadView]:
+        """Iterate through read-only views of the items in this page.
+
+        This is much faster than iterating through the item resources, and
+        is suitable for reading fields from large lists. Views don't provide
+        any of the methods or links for the resources.
+
+        Version Added:
+            7.0
+
+        Yields:
+            ItemPayloadView:
+            A view of each item in the page.
+        """
+        for item in self._item_list:
+            yield ItemPayloadView(cast(JSONDict, item))
+
     @request_method
     def get_next(
         self,
@@ -2069,27 +2490,154 @@ class ListResource(Generic[TItemResource], Resource):
 
         Each page of resources is itself an instance of the same
         ``ListResource`` class.
-        """
-        page = self
-
-        while True:
-            yield page
 
-            try:
-                page = cast(Self, page.get_next())
-            except StopIteration:
-                break
+        Version Changed:
+            7.0:
+            The iterator is now provided by the transport. Asynchronous
+            transports will return an asynchronous iterator.
+        """
+        return self.iter_pages()
 
     @property
     def all_items(self) -> Iterator[TItemResource]:
         """Yield all item resources in all pages of this resource.
 
+        Version Changed:
+            7.0:
+            The iterator is now provided by the transport. Asynchronous
+            transports will return an asynchronous iterator.
+
         Yields:
             TItemResource:
             All items in the list.
         """
-        for page in self.all_pages:
-            yield from page
+        return self.iter_items()
+
+    def iter_pages(
+        self,
+        *,
+        read_ahead: (int | None) = None,
+    ) -> Iterator[Self]:
+        """Yield all pages of item resources.
+
+        This works like :py:attr:`all_pages`, but allows the number of pages
+        to fetch ahead to be set.
+
+        With read-ahead enabled, the URLs of all remaining pages are computed
+        from ``total_results`` and the ``start``/``max-results`` arguments of
+        the next page's link. Up to ``read_ahead`` of those pages are then
+        fetched concurrently while the caller processes the current page.
+        Pages are still yielded in order.
+
+        Version Added:
+            7.0
+
+        Args:
+            read_ahead (int, optional):
+                The number of pages to fetch ahead of the current one. If
+                not provided, the transport's default (set by the
+                ``API_PAGINATION_READ_AHEAD`` setting) will be used. ``0``
+                fetches one page at a time.
+
+        Yields:
+            ListResource:
+            Each page of the list, starting with this one.
+        """
+        return cast('Iterator[Self]',
+                    self._transport.iter_list_pages(self,
+                                                    read_ahead=read_ahead))
+
+    @overload
+    def iter_items(
+        self,
+        *,
+        read_ahead: (int | None) = None,
+        payload_views: Literal[False] = False,
+    ) -> Iterator[TItemResource]:
+        ...
+
+    @overload
+    def iter_items(
+        self,
+        *,
+        read_ahead: (int | None) = None,
+        payload_views: Literal[True],
+    ) -> Iterator[ItemPayloadView]:
+        ...
+
+    def iter_items(
+        self,
+        *,
+        read_ahead: (int | None) = None,
+        payload_views: bool = False,
+    ) -> Iterator[TItemResource] | Iterator[ItemPayloadView]:
+        """Yield all item resources in all pages of this resource.
+
+        This works like :py:attr:`all_items`, but allows the number of pages
+        to fetch ahead to be set. See :py:meth:`iter_pages` for details.
+
+        Version Added:
+            7.0
+
+        Args:
+            read_ahead (int, optional):
+                The number of pages to fetch ahead of the current one. If
+                not provided, the transport's default will be used.
+
+            payload_views (bool, optional):
+                Whether to yield read-only views of the item payloads
+                instead of item resources. See :py:meth:`iter_payload_views`.
+
+        Yields:
+            TItemResource or ItemPayloadView:
+            All items in the list.
+        """
+        return self._transport.iter_list_items(self,
+                                               read_ahead=read_ahead,
+                                               payload_views=payload_views)
+
+    def _get_remaining_page_requests(self) -> list[HttpRequest] | None:
+        """Return requests for all remaining pages of the list.
+
+        This is used for read-ahead pagination. The requests are computed
+        from ``total_results`` and the ``start`` and ``max-results`` query
+        arguments in the link to the next page.
+
+        Version Added:
+            7.0
+
+        Returns:
+            list of rbtools.api.request.HttpRequest:
+            The requests for each remaining page, in order, or ``None`` if
+            they can't be computed.
+        """
+        next_link = self._links.get('next')
+        total_results = self.total_results
+
+        if not next_link or total_results is None:
+            return None
+
+        parts = urlsplit(next_link['href'])
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query_dict = dict(query)
+
+        try:
+            start = int(query_dict['start'])
+            max_results = int(query_dict.get('max-results', self.num_items))
+        except (KeyError, ValueError):
+            return None
+
+        if start < 0 or max_results <= 0:
+            return None
+
+        return [
+            self._make_httprequest(url=urlunsplit(parts._replace(
+                query=urlencode([
+                    (key, str(offset) if key == 'start' else value)
+                    for key, value in query
+                ]))))
+            for offset in range(start, total_results, max_results)
+        ]
 
     def __repr__(self) -> str:
         """Return a string representation of the resource.
@@ -23,7 +23,7 @@ from rbtools.api.resource.mixins import DiffUploaderMixin, GetPatchMixin
 if TYPE_CHECKING:
     from typing_extensions import Unpack
 
-    from rbtools.api.request import HttpRequest, QueryArgs
+    from rbtools.api.request import FileContent, HttpRequest, QueryArgs
     from rbtools.api.resource.base import (
         BaseGetListParams,
         BaseGetParams,
@@ -276,8 +276,8 @@ class DiffListResource(DiffUploaderMixin, ListResource[DiffItemResource]):
     @request_method_returns[DiffItemResource]()
     def upload_diff(
         self,
-        diff: bytes,
-        parent_diff: (bytes | None) = None,
+        diff: FileContent,
+        parent_diff: (FileContent | None) = None,
         base_dir: (str | None) = None,
         base_commit_id: (str | None) = None,
         **kwargs: QueryArgs,
@@ -287,11 +287,16 @@ class DiffListResource(DiffUploaderMixin, ListResource[DiffItemResource]):
         The diff and parent_diff arguments should be strings containing the
         diff output.
 
+        Version Changed:
+            7.0:
+            ``diff`` and ``parent_diff`` may now be file objects or paths,
+            which will be streamed to the server.
+
         Args:
-            diff (bytes):
+            diff (rbtools.api.request.FileContent):
                 The diff content.
 
-            parent_diff (bytes, optional):
+            parent_diff (rbtools.api.request.FileContent, optional):
                 The parent diff content, if present.
 
             base_dir (str, optional):
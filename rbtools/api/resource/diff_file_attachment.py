@@ -24,7 +24,7 @@ if TYPE_CHECKING:
 
     from typing_extensions import Unpack
 
-    from rbtools.api.request import HttpRequest, QueryArgs
+    from rbtools.api.request import FileContent, HttpRequest, QueryArgs
     from rbtools.api.resource.base import (
         BaseGetParams,
         ResourceExtraDataField,
@@ -156,19 +156,25 @@ class DiffFileAttachmentListResource(
         self,
         *,
         filename: str,
-        content: bytes,
+        content: FileContent,
         filediff_id: str,
         source_file: bool = False,
         **kwargs: QueryArgs,
     ) -> HttpRequest:
         """Upload a new attachment.
 
+        Version Changed:
+            7.0:
+            ``content`` may now be a file object or path, which will be
+            streamed to the server.
+
         Args:
             filename (str):
                 The name of the file.
 
-            content (bytes):
-                The content of the file to upload.
+            content (rbtools.api.request.FileContent):
+                The content of the file to upload. This may be bytes, a
+                binary file object, or a path to the file.
 
             filediff_id (str):
                 The ID of the filediff to attach the file to.
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 from rbtools.api.resource.base import request_method
 
 if TYPE_CHECKING:
-    from rbtools.api.request import HttpRequest, QueryArgs
+    from rbtools.api.request import FileContent, HttpRequest, QueryArgs
     from rbtools.api.resource.base import Resource
 
     MixinParent = Resource
@@ -31,19 +31,25 @@ class AttachmentUploadMixin(MixinParent):
     def upload_attachment(
         self,
         filename: str,
-        content: bytes,
+        content: FileContent,
         caption: (str | None) = None,
         attachment_history: (str | None) = None,
         **kwargs: QueryArgs,
     ) -> HttpRequest:
         """Upload a new attachment.
 
+        Version Changed:
+            7.0:
+            ``content`` may now be a file object or path, which will be
+            streamed to the server.
+
         Args:
             filename (str):
                 The name of the file.
 
-            content (bytes):
-                The content of the file to upload.
+            content (rbtools.api.request.FileContent):
+                The content of the file to upload. This may be bytes, a
+                binary file object, or a path to the file.
 
             caption (str, optional):
                 The caption to set on the file attachment.
@@ -76,8 +82,8 @@ class DiffUploaderMixin(MixinParent):
 
     def prepare_upload_diff_request(
         self,
-        diff: bytes,
-        parent_diff: (bytes | None) = None,
+        diff: FileContent,
+        parent_diff: (FileContent | None) = None,
         base_dir: (str | None) = None,
         base_commit_id: (str | None) = None,
         **kwargs: QueryArgs,
@@ -87,11 +93,16 @@ class DiffUploaderMixin(MixinParent):
         The diff and parent_diff arguments should be strings containing the
         diff output.
 
+        Version Changed:
+            7.0:
+            ``diff`` and ``parent_diff`` may now be file objects or paths,
+            which will be streamed to the server.
+
         Args:
-            diff (bytes):
+            diff (rbtools.api.request.FileContent):
                 The diff content.
 
-            parent_diff (bytes, optional):
+            parent_diff (rbtools.api.request.FileContent, optional):
                 The parent diff content, if present.
 
             base_dir (str, optional):
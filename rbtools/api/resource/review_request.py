@@ -13,6 +13,7 @@ from urllib.parse import urljoin
 
 from typing_extensions import Self
 
+from rbtools.api.projection import apply_projection
 from rbtools.api.resource.base import (
     BaseGetListParams,
     BaseGetParams,
@@ -234,10 +235,15 @@ class ReviewRequestItemResource(BaseReviewRequestItemResource):
         graph.
 
         A ValueError is raised if the graph would contain cycles.
+
+        Version Changed:
+            7.0:
+            Any projection for ``review_request`` set on the transport is
+            now applied when fetching dependencies.
         """
         def get_url(resource: Self) -> str:
             """Get the URL of the resource."""
-            if hasattr(resource, 'href'):
+            if 'href' in resource:
                 return resource.href
             else:
                 return resource.absolute_url
@@ -249,13 +255,17 @@ class ReviewRequestItemResource(BaseReviewRequestItemResource):
         review_requests_by_url = {}
         review_requests_by_url[self.absolute_url] = self
 
+        query_args = apply_projection(
+            self._transport.get_projection('review_request'),
+            {'expand': 'repository'})
+
         def get_review_request_resource(
             resource: Self,
         ) -> Self:
             url = get_url(resource)
 
             if url not in review_requests_by_url:
-                review_requests_by_url[url] = resource.get(expand='repository')
+                review_requests_by_url[url] = resource.get(**query_args)
 
             return review_requests_by_url[url]
 
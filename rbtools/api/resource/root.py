@@ -16,6 +16,7 @@ from typelets.json import JSONDict
 from typing_extensions import Unpack
 
 from rbtools.api.cache import MINIMUM_VERSION
+from rbtools.api.projection import apply_projection
 from rbtools.api.resource.archived_review_request import (
     ArchivedReviewRequestItemResource,
     ArchivedReviewRequestListResource,
@@ -25,8 +26,6 @@ from rbtools.api.resource.base import (
     RequestMethodResult,
     ResourceDictField,
     api_stub,
-    is_api_stub,
-    replace_api_stub,
     request_method,
     resource_mimetype,
 )
@@ -36,7 +35,7 @@ from rbtools.api.resource.muted_review_request import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
     from typing import ClassVar
 
     from typing_extensions import Self, Unpack
@@ -240,6 +239,11 @@ class RootResource(ItemResource):
     dictionary to the values parameter.
 
     This corresponds to Review Board's :ref:`rb:webapi2.0-root-resource`.
+
+    Version Changed:
+        7.0:
+        The URI templates are now looked up when their methods are used,
+        rather than when the resource is created.
     """
 
     #: Capabilities for the Review Board server.
@@ -252,6 +256,16 @@ class RootResource(ItemResource):
     _TEMPLATE_PARAM_RE: ClassVar[re.Pattern[str]] = \
         re.compile(r'\{(?P<key>[A-Za-z_0-9]*)\}')
 
+    ######################
+    # Instance variables #
+    ######################
+
+    #: A mapping of URI template names to templates.
+    #:
+    #: Version Added:
+    #:     7.0
+    _uri_templates: dict[str, str]
+
     def __init__(
         self,
         transport: Transport,
@@ -276,30 +290,10 @@ class RootResource(ItemResource):
         """
         super().__init__(transport, payload, url, token=None)
 
-        uri_templates = cast(dict[str, str], payload['uri_templates'])
-
-        # Generate methods for accessing resources directly using
-        # the uri-templates.
-        for name, uri in uri_templates.items():
-            attr_name = f'get_{name}'
-
-            def get_method(
-                resource: Self = self,
-                url: str = uri,
-                **kwargs,
-            ) -> RequestMethodResult:
-                return resource._get_template_request(url, **kwargs)
-
-            if not hasattr(self, attr_name):
-                # This log message is useful for adding new stubs. It will be
-                # removed once this work for resources is done.
-                params = self._TEMPLATE_PARAM_RE.findall(uri)
-                logger.debug('RootResource is missing API stub for %s (%s)',
-                             attr_name, ', '.join(params))
-
-                setattr(self, attr_name, get_method)
-            elif is_api_stub(stub := getattr(self, attr_name)):
-                replace_api_stub(self, attr_name, stub, get_method)
+        # Methods for the URI templates are looked up when they're used.
+        # Servers have well over a hundred templates, and most commands only
+        # use a few of them.
+        self._uri_templates = cast(dict[str, str], payload['uri_templates'])
 
         product = cast(JSONDict, payload.get('product', {}))
         server_version = cast(str | None, product.get('package_version'))
@@ -310,6 +304,73 @@ class RootResource(ItemResource):
             # bugs before this version). Disable caching.
             transport.disable_cache()
 
+    def _get_link_method(
+        self,
+        name: str,
+    ) -> Callable[..., RequestMethodResult] | None:
+        """Return a method for one of the resource's links or URI templates.
+
+        Links take precedence over URI templates.
+
+        Version Added:
+            7.0
+
+        Args:
+            name (str):
+                The name of the method.
+
+        Returns:
+            callable:
+            The method, or ``None`` if the resource doesn't have a matching
+            link or URI template.
+        """
+        method = super()._get_link_method(name)
+
+        if method is None and name.startswith('get_'):
+            uri_templates = self.__dict__.get('_uri_templates', {})
+            uri = uri_templates.get(name[4:])
+
+            if uri is not None:
+                method = self._make_template_method(uri, name[4:])
+
+        return method
+
+    def _make_template_method(
+        self,
+        uri: str,
+        resource_name: str,
+    ) -> Callable[..., RequestMethodResult]:
+        """Return a method for fetching a resource through a URI template.
+
+        Any projection for the resource will be applied to the request.
+
+        Version Added:
+            7.0
+
+        Args:
+            uri (str):
+                The URI template.
+
+            resource_name (str):
+                The name of the URI template.
+
+        Returns:
+            callable:
+            The method.
+        """
+        def get_method(
+            resource: Self = self,
+            url: str = uri,
+            **kwargs,
+        ) -> RequestMethodResult:
+            kwargs = apply_projection(
+                resource._transport.get_projection(resource_name),
+                kwargs)
+
+            return resource._get_template_request(url, **kwargs)
+
+        return get_method
+
     def _make_url_from_template(
         self,
         url_template: str,
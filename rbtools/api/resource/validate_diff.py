@@ -72,6 +72,9 @@ class ValidateDiffResource(DiffUploaderMixin, ItemResource):
 
         request.add_field('repository', repository)
 
+        # Validation has no side effects, so this can be safely retried.
+        request.idempotent = True
+
         if base_commit_id:
             request.add_field('base_commit_id', base_commit_id)
 
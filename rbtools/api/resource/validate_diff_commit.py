@@ -74,6 +74,10 @@ class ValidateDiffCommitResource(ItemResource):
 
         request = self._make_httprequest(url=self._url, method='POST',
                                          query_args=kwargs)
+
+        # Validation has no side effects, so this can be safely retried.
+        request.idempotent = True
+
         request.add_file('diff', 'diff', diff)
         request.add_field('repository', repository)
         request.add_field('commit_id', commit_id)
@@ -0,0 +1,342 @@
+"""Retrying and rate limiting of HTTP requests to the API.
+
+A busy Review Board server (or a proxy or load balancer in front of it) may
+respond with ``429 Too Many Requests``, ``502 Bad Gateway``,
+``503 Service Unavailable``, or ``504 Gateway Timeout``, or may reset
+connections. These are usually temporary, and requests can be retried after
+a delay.
+
+:py:class:`RetryPolicy` determines which requests can be retried and how long
+to wait between attempts, using exponential backoff with jitter and honoring
+any ``Retry-After`` header sent by the server.
+
+:py:class:`RateLimiter` caps the rate of requests made to a server, to avoid
+triggering server-side rate limits in the first place.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+logger = logging.getLogger(__name__)
+
+
+#: HTTP methods that can be safely retried.
+#:
+#: Requests with these methods have the same effect on the server no matter
+#: how many times they're made.
+#:
+#: Version Added:
+#:     7.0
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({
+    'DELETE',
+    'GET',
+    'HEAD',
+    'OPTIONS',
+    'PUT',
+})
+
+
+#: HTTP status codes indicating a temporary failure.
+#:
+#: Version Added:
+#:     7.0
+RETRY_STATUSES: frozenset[int] = frozenset({429, 502, 503, 504})
+
+
+#: HTTP status codes indicating the request was not processed.
+#:
+#: Requests failing with these can be retried even if they're not
+#: idempotent.
+#:
+#: Version Added:
+#:     7.0
+UNPROCESSED_STATUSES: frozenset[int] = frozenset({429})
+
+
+class RetryPolicy:
+    """A policy for retrying failed HTTP requests.
+
+    Idempotent requests are retried if the server responds with one of the
+    :py:data:`RETRY_STATUSES`, or if the connection fails. Other requests are
+    only retried if the server says it didn't process the request.
+
+    Delays between attempts use exponential backoff with full jitter, so that
+    many clients failing at once don't all retry at the same moment. If the
+    server provides a ``Retry-After`` header, that's used instead.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The base delay for backoff, in seconds.
+    #:
+    #: The maximum delay doubles for each attempt.
+    backoff: float
+
+    #: The maximum delay between attempts, in seconds.
+    #:
+    #: Requests won't be retried if the server asks for a longer delay.
+    max_delay: float
+
+    #: The maximum number of times a request will be retried.
+    max_retries: int
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 30.0,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_retries (int, optional):
+                The maximum number of times a request will be retried.
+
+            backoff (float, optional):
+                The base delay for backoff, in seconds.
+
+            max_delay (float, optional):
+                The maximum delay between attempts, in seconds.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+
+    def should_retry(
+        self,
+        *,
+        attempt: int,
+        idempotent: bool,
+        status: (int | None) = None,
+        error: (BaseException | None) = None,
+    ) -> bool:
+        """Return whether a failed request should be retried.
+
+        Args:
+            attempt (int):
+                The number of retries already made for the request.
+
+            idempotent (bool):
+                Whether the request can be safely repeated.
+
+            status (int, optional):
+                The HTTP status code of the failed response, if any.
+
+            error (BaseException, optional):
+                The error that caused the connection to fail, if any.
+
+        Returns:
+            bool:
+            Whether the request should be retried.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if status is not None:
+            return (status in UNPROCESSED_STATUSES or
+                    (idempotent and status in RETRY_STATUSES))
+
+        if error is not None:
+            return idempotent and isinstance(error, (ConnectionError,
+                                                     TimeoutError))
+
+        return False
+
+    def get_delay(
+        self,
+        *,
+        attempt: int,
+        retry_after: (str | None) = None,
+    ) -> float | None:
+        """Return the delay before retrying a request.
+
+        Args:
+            attempt (int):
+                The number of retries already made for the request.
+
+            retry_after (str, optional):
+                The value of the ``Retry-After`` header from the response,
+                if any.
+
+        Returns:
+            float:
+            The delay in seconds, or ``None`` if the server asked for a delay
+            longer than :py:attr:`max_delay`.
+        """
+        if retry_after:
+            delay = parse_retry_after(retry_after)
+
+            if delay is not None:
+                if delay > self.max_delay:
+                    return None
+
+                return delay
+
+        return random.uniform(0, min(self.max_delay,
+                                     self.backoff * (2 ** attempt)))
+
+
+class RateLimiter:
+    """A token bucket limiting the rate of requests.
+
+    The bucket holds up to :py:attr:`burst` tokens, refilling at
+    :py:attr:`rate` tokens per second. Each request takes a token, waiting
+    for one to become available if needed.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The maximum number of requests that can be made at once.
+    burst: float
+
+    #: The number of requests allowed per second.
+    rate: float
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: (float | None) = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate (float):
+                The number of requests allowed per second.
+
+            burst (float, optional):
+                The maximum number of requests that can be made at once.
+                This defaults to one second's worth of requests.
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst or rate)
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available.
+
+        Tokens are reserved in the order callers arrive, so waiting callers
+        can't be starved by later ones.
+
+        Returns:
+            float:
+            The time spent waiting, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst,
+                               self._tokens +
+                               (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = max(0.0, -self._tokens / self.rate)
+
+        if delay > 0:
+            logger.debug('Waiting %.2f seconds for the request rate limit.',
+                         delay)
+            time.sleep(delay)
+
+        return delay
+
+
+def parse_retry_after(
+    value: str,
+) -> float | None:
+    """Parse the value of a Retry-After header.
+
+    Version Added:
+        7.0
+
+    Args:
+        value (str):
+            The header value. This may be a number of seconds or an HTTP date.
+
+    Returns:
+        float:
+        The number of seconds to wait, or ``None`` if the value couldn't be
+        parsed.
+    """
+    value = value.strip()
+
+    try:
+        return max(0.0, float(int(value)))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+#: Shared rate limiters for each server.
+_rate_limiters: dict[str, RateLimiter] = {}
+
+#: A lock protecting :py:data:`_rate_limiters`.
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    server_url: str,
+    rate: float,
+) -> RateLimiter:
+    """Return the shared rate limiter for a server.
+
+    The limiter caps the rate of HTTP requests made to a server across all
+    clients, transports, and threads in the process.
+
+    The limiter is created the first time it's requested for a server. Later
+    calls return the same limiter, regardless of ``rate``.
+
+    Version Added:
+        7.0
+
+    Args:
+        server_url (str):
+            The URL of the server.
+
+        rate (float):
+            The number of requests allowed per second, if the limiter must
+            be created.
+
+    Returns:
+        RateLimiter:
+        The rate limiter for the server.
+    """
+    with _rate_limiters_lock:
+        try:
+            limiter = _rate_limiters[server_url]
+        except KeyError:
+            limiter = RateLimiter(rate)
+            _rate_limiters[server_url] = limiter
+
+    return limiter
@@ -0,0 +1,192 @@
+"""Unit tests for rbtools.api.transport.asynchronous.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import kgb
+
+from rbtools.api.client import AsyncRBClient
+from rbtools.api.request import ReviewBoardServer
+from rbtools.api.resource import ItemResource, ListResource, RootResource
+from rbtools.api.tests.base import MockResponse
+from rbtools.testing import TestCase
+
+if TYPE_CHECKING:
+    from rbtools.api.request import HttpRequest
+
+
+class AsyncTransportTests(kgb.SpyAgency, TestCase):
+    """Unit tests for AsyncTransport and AsyncRBClient.
+
+    Version Added:
+        7.0
+    """
+
+    server_url = 'https://reviews.example.com/'
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        api_url = f'{self.server_url}api/'
+        list_url = f'{api_url}review-requests/'
+
+        self.payloads = {
+            '/api/': {
+                'stat': 'ok',
+                'capabilities': {},
+                'links': {
+                    'self': {
+                        'href': api_url,
+                        'method': 'GET',
+                    },
+                    'review_requests': {
+                        'href': list_url,
+                        'method': 'GET',
+                    },
+                },
+                'product': {
+                    'package_version': '7.0',
+                },
+                'uri_templates': {},
+            },
+            '/api/review-requests/': {
+                'stat': 'ok',
+                'total_results': 3,
+                'links': {
+                    'next': {
+                        'href': f'{list_url}?start=2',
+                        'method': 'GET',
+                    },
+                },
+                'review_requests': [
+                    {'id': 1},
+                    {'id': 2},
+                ],
+            },
+            '/api/review-requests/?start=2': {
+                'stat': 'ok',
+                'total_results': 3,
+                'links': {},
+                'review_requests': [
+                    {'id': 3},
+                ],
+            },
+        }
+
+        def _make_request(
+            server: ReviewBoardServer,
+            request: HttpRequest,
+        ) -> MockResponse:
+            parts = urlparse(request.url)
+            path = parts.path
+
+            if parts.query:
+                path = f'{path}?{parts.query}'
+
+            if path == '/api/':
+                mimetype = 'application/vnd.reviewboard.org.root+json'
+            else:
+                mimetype = 'application/json'
+
+            return MockResponse(
+                200,
+                {'Content-Type': mimetype},
+                json.dumps(self.payloads[path]))
+
+        self.spy_on(ReviewBoardServer.make_request,
+                    owner=ReviewBoardServer,
+                    call_fake=_make_request)
+
+    def test_get_root(self) -> None:
+        """Testing AsyncRBClient.get_root"""
+        async def _run() -> RootResource:
+            async with self._create_client() as client:
+                return await client.get_root()
+
+        root = asyncio.run(_run())
+
+        self.assertIsInstance(root, RootResource)
+        self.assertEqual(root.product['package_version'], '7.0')
+
+    def test_request_methods_awaitable(self) -> None:
+        """Testing AsyncTransport request methods on resources are
+        awaitable
+        """
+        async def _run() -> ListResource:
+            async with self._create_client() as client:
+                root = await client.get_root()
+
+                return await root.get_review_requests()
+
+        review_requests = asyncio.run(_run())
+
+        self.assertIsInstance(review_requests, ListResource)
+        self.assertEqual(len(review_requests), 2)
+        self.assertEqual(review_requests[0].id, 1)
+
+    def test_all_items(self) -> None:
+        """Testing AsyncTransport with ListResource.all_items"""
+        async def _run() -> list[ItemResource]:
+            async with self._create_client() as client:
+                root = await client.get_root()
+                review_requests = await root.get_review_requests()
+
+                return [
+                    item
+                    async for item in review_requests.all_items
+                ]
+
+        items = asyncio.run(_run())
+
+        self.assertEqual([item.id for item in items], [1, 2, 3])
+
+    def test_all_pages(self) -> None:
+        """Testing AsyncTransport with ListResource.all_pages"""
+        async def _run() -> list[ListResource]:
+            async with self._create_client() as client:
+                root = await client.get_root()
+                review_requests = await root.get_review_requests()
+
+                return [
+                    page
+                    async for page in review_requests.all_pages
+                ]
+
+        pages = asyncio.run(_run())
+
+        self.assertEqual([len(page) for page in pages], [2, 1])
+
+    def test_concurrent_requests(self) -> None:
+        """Testing AsyncTransport with concurrent requests"""
+        async def _run() -> list[ListResource]:
+            async with self._create_client() as client:
+                root = await client.get_root()
+
+                return await asyncio.gather(*(
+                    root.get_review_requests()
+                    for i in range(5)
+                ))
+
+        results = asyncio.run(_run())
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(ReviewBoardServer.make_request.calls), 6)
+
+    def _create_client(self) -> AsyncRBClient:
+        """Return a new client for the tests.
+
+        Returns:
+            rbtools.api.client.AsyncRBClient:
+            The new client.
+        """
+        return AsyncRBClient(self.server_url,
+                             save_cookies=False,
+                             allow_caching=False)
@@ -0,0 +1,397 @@
+"""Unit tests for rbtools.api.batch.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from functools import partial
+from http.client import HTTPMessage
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import kgb
+
+from rbtools.api.client import AsyncRBClient, RBClient
+from rbtools.api.connections import (BufferedHTTPResponse,
+                                     PooledHTTPHandlerMixin,
+                                     get_request_limiter)
+from rbtools.api.errors import APIError
+from rbtools.api.request import (RBToolsContentDecodingProcessor,
+                                 ReviewBoardServer)
+from rbtools.api.resource import ItemResource, ListResource
+from rbtools.api.tests.base import MockResponse
+from rbtools.config import RBToolsConfig
+from rbtools.testing import TestCase
+
+if TYPE_CHECKING:
+    from http.client import HTTPConnection
+    from urllib.request import Request
+
+    from rbtools.api.request import HttpRequest
+
+
+class BatchTests(kgb.SpyAgency, TestCase):
+    """Unit tests for RBClient.batch and AsyncRBClient.batch.
+
+    Version Added:
+        7.0
+    """
+
+    server_url = 'https://reviews.example.com/'
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        api_url = f'{self.server_url}api/'
+
+        self.payloads = {
+            '/api/': {
+                'stat': 'ok',
+                'capabilities': {},
+                'links': {
+                    'review_requests': {
+                        'href': f'{api_url}review-requests/',
+                        'method': 'GET',
+                    },
+                },
+                'uri_templates': {},
+            },
+            '/api/review-requests/': {
+                'stat': 'ok',
+                'total_results': 3,
+                'links': {},
+                'review_requests': [
+                    {
+                        'id': i,
+                        'links': {
+                            'draft': {
+                                'href': f'{api_url}review-requests/{i}/'
+                                        f'draft/',
+                                'method': 'GET',
+                            },
+                        },
+                    }
+                    for i in (1, 2, 3)
+                ],
+            },
+            '/api/review-requests/1/draft/': {
+                'stat': 'ok',
+                'draft': {
+                    'id': 10,
+                },
+            },
+            '/api/review-requests/3/draft/': {
+                'stat': 'ok',
+                'draft': {
+                    'id': 30,
+                },
+            },
+        }
+
+    def test_batch(self) -> None:
+        """Testing RBClient.batch returns results in order with per-item
+        errors
+        """
+        self._spy_on_make_request()
+
+        client = self._create_client()
+        review_requests = self._get_review_requests(client)
+
+        results = client.batch([
+            review_request.get_draft
+            for review_request in review_requests
+        ])
+
+        self.assertEqual(len(results), 3)
+
+        self.assertTrue(results[0].succeeded)
+        self.assertEqual(results[0].get().id, 10)
+
+        self.assertFalse(results[1].succeeded)
+        self.assertIsNone(results[1].value)
+        self.assertIsInstance(results[1].error, APIError)
+
+        with self.assertRaises(APIError):
+            results[1].get()
+
+        self.assertTrue(results[2].succeeded)
+        self.assertEqual(results[2].get().id, 30)
+
+    def test_batch_with_http_requests(self) -> None:
+        """Testing RBClient.batch with HttpRequest items"""
+        self._spy_on_make_request()
+
+        client = self._create_client()
+        root = client.get_root()
+
+        results = client.batch([
+            root.get_review_requests(internal=True),
+            partial(root.get_review_requests, max_results=1),
+        ])
+
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0].value, ListResource)
+        self.assertIsInstance(results[1].value, ListResource)
+
+    def test_batch_with_invalid_item(self) -> None:
+        """Testing RBClient.batch with an invalid item"""
+        results = self._create_client().batch([123])  # type: ignore
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0].error, TypeError)
+
+    def test_batch_empty(self) -> None:
+        """Testing RBClient.batch with no items"""
+        self.assertEqual(self._create_client().batch([]), [])
+
+    def test_batch_concurrency_limit(self) -> None:
+        """Testing RBClient.batch honors HTTP_MAX_CONCURRENT_REQUESTS"""
+        lock = threading.Lock()
+        state = {
+            'active': 0,
+            'max_active': 0,
+        }
+
+        def _open_request(
+            handler: PooledHTTPHandlerMixin,
+            http_class: type[HTTPConnection],
+            req: Request,
+            **kwargs,
+        ) -> BufferedHTTPResponse:
+            with lock:
+                state['active'] += 1
+                state['max_active'] = max(state['max_active'],
+                                          state['active'])
+
+            time.sleep(0.05)
+
+            with lock:
+                state['active'] -= 1
+
+            return self._make_buffered_response(req.full_url)
+
+        self.spy_on(PooledHTTPHandlerMixin._open_request,
+                    owner=PooledHTTPHandlerMixin,
+                    call_fake=_open_request)
+
+        client = self._create_client(
+            url='https://limited.example.com/',
+            config=RBToolsConfig(config_dict={
+                'HTTP_MAX_CONCURRENT_REQUESTS': 2,
+            }))
+
+        results = client.batch(
+            [
+                client.get_root
+                for i in range(6)
+            ],
+            max_workers=6)
+
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(state['max_active'], 2)
+
+    def test_request_limiter_released_for_response_handlers(self) -> None:
+        """Testing HTTP_MAX_CONCURRENT_REQUESTS only holds a slot while
+        talking to the server
+        """
+        url = 'http://limited-handlers.example.com/'
+        limiter = get_request_limiter(f'{url}api/', 1)
+        state = {
+            'held': False,
+            'available': False,
+        }
+
+        def _open_request(
+            handler: PooledHTTPHandlerMixin,
+            http_class: type[HTTPConnection],
+            req: Request,
+            **kwargs,
+        ) -> BufferedHTTPResponse:
+            state['held'] = not limiter.acquire(blocking=False)
+
+            return self._make_buffered_response(req.full_url)
+
+        def _http_response(
+            processor: RBToolsContentDecodingProcessor,
+            request: Request,
+            response: BufferedHTTPResponse,
+        ) -> BufferedHTTPResponse:
+            # Handlers processing the response (such as authentication
+            # handlers) may need to make requests of their own.
+            state['available'] = limiter.acquire(blocking=False)
+
+            if state['available']:
+                limiter.release()
+
+            return response
+
+        self.spy_on(PooledHTTPHandlerMixin._open_request,
+                    owner=PooledHTTPHandlerMixin,
+                    call_fake=_open_request)
+        self.spy_on(RBToolsContentDecodingProcessor.http_response,
+                    owner=RBToolsContentDecodingProcessor,
+                    call_fake=_http_response)
+
+        client = self._create_client(
+            url=url,
+            config=RBToolsConfig(config_dict={
+                'HTTP_MAX_CONCURRENT_REQUESTS': 1,
+            }))
+        client.get_root()
+
+        self.assertTrue(state['held'])
+        self.assertTrue(state['available'])
+
+    def test_batch_async(self) -> None:
+        """Testing AsyncRBClient.batch"""
+        self._spy_on_make_request()
+
+        async def _run() -> list[ItemResource | None]:
+            async with AsyncRBClient(self.server_url,
+                                     save_cookies=False,
+                                     allow_caching=False) as client:
+                root = await client.get_root()
+                review_requests = await root.get_review_requests()
+
+                results = await client.batch([
+                    review_request.get_draft
+                    for review_request in review_requests
+                ])
+
+                return [
+                    result.value
+                    for result in results
+                ]
+
+        drafts = asyncio.run(_run())
+
+        self.assertEqual(len(drafts), 3)
+        self.assertEqual(drafts[0].id, 10)  # type: ignore
+        self.assertIsNone(drafts[1])
+        self.assertEqual(drafts[2].id, 30)  # type: ignore
+
+    def test_get_request_limiter_shared(self) -> None:
+        """Testing get_request_limiter returns a shared limiter per server"""
+        limiter = get_request_limiter('https://shared.example.com/api/', 3)
+
+        self.assertIs(
+            get_request_limiter('https://shared.example.com/api/', 5),
+            limiter)
+        self.assertIsNot(
+            get_request_limiter('https://other.example.com/api/', 3),
+            limiter)
+
+    def _create_client(
+        self,
+        url: (str | None) = None,
+        **kwargs,
+    ) -> RBClient:
+        """Return a new client for the tests.
+
+        Args:
+            url (str, optional):
+                The URL of the server.
+
+            **kwargs (dict):
+                Additional keyword arguments for the client.
+
+        Returns:
+            rbtools.api.client.RBClient:
+            The new client.
+        """
+        return RBClient(url or self.server_url,
+                        save_cookies=False,
+                        allow_caching=False,
+                        **kwargs)
+
+    def _get_review_requests(
+        self,
+        client: RBClient,
+    ) -> ListResource:
+        """Return the review request list for the tests.
+
+        Args:
+            client (rbtools.api.client.RBClient):
+                The client to use.
+
+        Returns:
+            rbtools.api.resource.ListResource:
+            The review request list resource.
+        """
+        return client.get_root().get_review_requests()
+
+    def _make_response(
+        self,
+        url: str,
+    ) -> MockResponse:
+        """Return a mock response for a URL.
+
+        Args:
+            url (str):
+                The URL being requested.
+
+        Returns:
+            rbtools.api.tests.base.MockResponse:
+            The mock response.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The URL has no payload registered.
+        """
+        path = urlparse(url).path
+
+        if path not in self.payloads:
+            raise APIError(http_status=404, error_code=100)
+
+        if path == '/api/':
+            mimetype = 'application/vnd.reviewboard.org.root+json'
+        else:
+            mimetype = 'application/json'
+
+        return MockResponse(200,
+                            {'Content-Type': mimetype},
+                            json.dumps(self.payloads[path]))
+
+    def _make_buffered_response(
+        self,
+        url: str,
+    ) -> BufferedHTTPResponse:
+        """Return a buffered HTTP response for a URL.
+
+        Args:
+            url (str):
+                The URL being requested.
+
+        Returns:
+            rbtools.api.connections.BufferedHTTPResponse:
+            The HTTP response.
+        """
+        rsp = self._make_response(url)
+        headers = HTTPMessage()
+
+        for name, value in rsp.headers.items():
+            headers[name] = value
+
+        return BufferedHTTPResponse(body=rsp.read(),
+                                    headers=headers,
+                                    status=rsp.status,
+                                    reason='OK',
+                                    url=url)
+
+    def _spy_on_make_request(self) -> None:
+        """Spy on HTTP requests, returning the test payloads."""
+        def _make_request(
+            server: ReviewBoardServer,
+            request: HttpRequest,
+        ) -> MockResponse:
+            return self._make_response(request.url)
+
+        self.spy_on(ReviewBoardServer.make_request,
+                    owner=ReviewBoardServer,
+                    call_fake=_make_request)
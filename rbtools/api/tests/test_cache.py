@@ -0,0 +1,668 @@
+"""Unit tests for rbtools.api.cache.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import sqlite3
+import threading
+from http.client import HTTPMessage
+from urllib.error import HTTPError
+
+import kgb
+
+from rbtools.api import cache as cache_module
+from rbtools.api.cache import (APICache,
+                               CacheEntry,
+                               CachedHTTPResponse,
+                               LiveHTTPResponse)
+from rbtools.api.client import RBClient
+from rbtools.api.connections import BufferedHTTPResponse
+from rbtools.api.request import Request
+from rbtools.api.transport import sync as sync_module
+from rbtools.config import RBToolsConfig
+from rbtools.testing import TestCase
+from rbtools.utils.filesystem import make_tempdir
+
+
+class APICacheTests(kgb.SpyAgency, TestCase):
+    """Unit tests for APICache.
+
+    Version Added:
+        7.0
+    """
+
+    url = 'https://reviews.example.com/api/'
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.cache = APICache(create_db_in_memory=True)
+        self.response_status = 200
+
+        def _urlopen(
+            request: Request,
+            *args,
+            **kwargs,
+        ) -> BufferedHTTPResponse:
+            headers = HTTPMessage()
+            headers['Content-Type'] = 'application/json'
+            headers['Cache-Control'] = 'max-age=60'
+            headers['ETag'] = '"abc123"'
+            headers['Vary'] = 'Accept, Accept-Encoding'
+
+            encoding = request.get_header('Accept-encoding') or 'identity'
+
+            return BufferedHTTPResponse(
+                body=self._build_body(encoding),
+                headers=headers,
+                status=self.response_status,
+                reason='OK',
+                url=request.get_full_url())
+
+        self.spy_on(cache_module.urlopen,
+                    call_fake=_urlopen)
+
+    def test_make_request_caches_response(self) -> None:
+        """Testing APICache.make_request caches responses"""
+        rsp = self.cache.make_request(self._build_request())
+        self.assertIsInstance(rsp, LiveHTTPResponse)
+
+        rsp = self.cache.make_request(self._build_request())
+        self.assertIsInstance(rsp, CachedHTTPResponse)
+        self.assertEqual(rsp.read(), self._build_body('identity'))
+
+        self.assertSpyCallCount(cache_module.urlopen, 1)
+
+    def test_make_request_with_vary_accept_encoding(self) -> None:
+        """Testing APICache.make_request keeps entries separate based on
+        Vary: Accept-Encoding
+        """
+        compressed_headers = {
+            'Accept-Encoding': 'gzip, deflate',
+        }
+
+        rsp = self.cache.make_request(self._build_request(
+            headers=compressed_headers))
+        self.assertIsInstance(rsp, LiveHTTPResponse)
+        self.assertEqual(rsp.read(), self._build_body('gzip, deflate'))
+
+        # A request without the header must not use the entry.
+        rsp = self.cache.make_request(self._build_request())
+        self.assertIsInstance(rsp, LiveHTTPResponse)
+        self.assertEqual(rsp.read(), self._build_body('identity'))
+
+        # Both variants should now be cached.
+        rsp = self.cache.make_request(self._build_request(
+            headers=compressed_headers))
+        self.assertIsInstance(rsp, CachedHTTPResponse)
+        self.assertEqual(rsp.read(), self._build_body('gzip, deflate'))
+
+        rsp = self.cache.make_request(self._build_request())
+        self.assertIsInstance(rsp, CachedHTTPResponse)
+        self.assertEqual(rsp.read(), self._build_body('identity'))
+
+        self.assertSpyCallCount(cache_module.urlopen, 2)
+
+    def test_make_request_with_non_get(self) -> None:
+        """Testing APICache.make_request does not cache non-GET requests"""
+        for i in range(2):
+            rsp = self.cache.make_request(self._build_request(method='POST'))
+            self.assertIsInstance(rsp, LiveHTTPResponse)
+
+        self.assertSpyCallCount(cache_module.urlopen, 2)
+
+    def test_make_request_uses_memo(self) -> None:
+        """Testing APICache.make_request serves fresh entries from memory"""
+        self.cache.make_request(self._build_request())
+
+        self.spy_on(self.cache._get_entry)
+
+        rsp1 = self.cache.make_request(self._build_request())
+        rsp2 = self.cache.make_request(self._build_request())
+
+        assert isinstance(rsp1, CachedHTTPResponse)
+        assert isinstance(rsp2, CachedHTTPResponse)
+        self.assertIs(rsp1.cache_entry, rsp2.cache_entry)
+        self.assertSpyNotCalled(self.cache._get_entry)
+        self.assertSpyCallCount(cache_module.urlopen, 1)
+
+    def test_transport_reuses_decoded_payload(self) -> None:
+        """Testing SyncTransport reuses decoded payloads for responses from
+        the cache
+        """
+        client = RBClient(self.url,
+                          save_cookies=False,
+                          in_memory_cache=True)
+        self.spy_on(sync_module.decode_response)
+
+        resource1 = client.get_url(self.url)
+        resource2 = client.get_url(self.url)
+
+        self.assertEqual(resource1.encoding, 'identity')
+        self.assertEqual(resource2.encoding, 'identity')
+        self.assertIs(resource1._payload, resource2._payload)
+        self.assertSpyCallCount(sync_module.decode_response, 1)
+        self.assertSpyCallCount(cache_module.urlopen, 1)
+
+    def test_make_request_with_non_get_invalidates(self) -> None:
+        """Testing APICache.make_request with a non-GET request expires
+        entries for the URL and its parent
+        """
+        parent_url = f'{self.url}review-requests/'
+        item_url = f'{parent_url}1/'
+        other_url = f'{self.url}repositories/'
+
+        for url in (parent_url, f'{parent_url}?start=25', item_url,
+                    other_url):
+            self.cache.make_request(Request(url, None, {}, 'GET'))
+
+        self.cache.make_request(Request(item_url, None, {}, 'PUT'))
+
+        self.assertEqual(list(self.cache._memo.keys()), [other_url])
+
+        for url in (parent_url, f'{parent_url}?start=25', item_url):
+            entry = self.cache._get_entry(Request(url, None, {}, 'GET'))
+            assert entry is not None
+            self.assertFalse(entry.up_to_date())
+
+        entry = self.cache._get_entry(Request(other_url, None, {}, 'GET'))
+        assert entry is not None
+        self.assertTrue(entry.up_to_date())
+
+    def test_make_request_with_non_get_queues_expiration(self) -> None:
+        """Testing APICache.make_request with a non-GET request queues
+        expiring stored entries with other pending writes
+        """
+        parent_url = f'{self.url}review-requests/'
+        item_url = f'{parent_url}1/'
+        urls = (parent_url, f'{parent_url}?start=25', item_url)
+
+        for url in urls:
+            self.cache.make_request(Request(url, None, {}, 'GET'))
+
+        self.cache.flush()
+        self.spy_on(self.cache.flush)
+
+        self.cache.make_request(Request(item_url, None, {}, 'PUT'))
+        self.assertSpyNotCalled(self.cache.flush)
+
+        for url in urls:
+            entry = self.cache._get_entry(Request(url, None, {}, 'GET'))
+            assert entry is not None
+            self.assertFalse(entry.up_to_date())
+
+        self.cache.flush()
+        self.assertEqual(self.cache._pending_expirations, set())
+
+        for url in urls:
+            entry = self.cache._get_entry(Request(url, None, {}, 'GET'))
+            assert entry is not None
+            self.assertFalse(entry.up_to_date())
+
+    def test_make_request_with_non_get_error(self) -> None:
+        """Testing APICache.make_request with a failed non-GET request
+        raises the error and expires entries
+        """
+        self.cache.make_request(self._build_request())
+
+        def _urlopen(
+            request: Request,
+            *args,
+            **kwargs,
+        ) -> BufferedHTTPResponse:
+            raise HTTPError(request.get_full_url(), 500, 'Error',
+                            HTTPMessage(), None)
+
+        cache_module.urlopen.unspy()
+        self.spy_on(cache_module.urlopen,
+                    call_fake=_urlopen)
+
+        with self.assertRaises(HTTPError):
+            self.cache.make_request(self._build_request(method='PUT'))
+
+        entry = self.cache._get_entry(self._build_request())
+        assert entry is not None
+        self.assertFalse(entry.up_to_date())
+
+    def test_make_request_with_stale_entry(self) -> None:
+        """Testing APICache.make_request with stale_max_age serves stale
+        entries and revalidates them in the background
+        """
+        self.cache.stale_max_age = 300
+        self.cache.make_request(self._build_request())
+
+        entry = self.cache._get_memo_entry(self._build_request())
+        assert entry is not None
+        entry.local_date -= datetime.timedelta(seconds=120)
+
+        rsp = self.cache.make_request(self._build_request())
+        self.assertIsInstance(rsp, CachedHTTPResponse)
+
+        self.cache.close()
+
+        self.assertSpyCallCount(cache_module.urlopen, 2)
+        self.assertEqual(
+            cache_module.urlopen.last_call.args[0].get_header('If-none-match'),
+            '"abc123"')
+        self.assertEqual(self.cache._stats.stale_hits, 1)
+
+        # The stale entry was handed out, so it must be replaced rather than
+        # modified.
+        self.assertFalse(entry.up_to_date())
+
+        new_entry = self.cache._get_memo_entry(self._build_request())
+        assert new_entry is not None
+        self.assertIsNot(new_entry, entry)
+        self.assertTrue(new_entry.up_to_date())
+
+    def test_make_request_with_expired_entry_not_modified(self) -> None:
+        """Testing APICache.make_request with an expired entry that was not
+        modified replaces the entry
+        """
+        self.cache.make_request(self._build_request())
+
+        entry = self.cache._get_memo_entry(self._build_request())
+        assert entry is not None
+        entry.local_date -= datetime.timedelta(seconds=120)
+        entry.decoded_payload = {'stat': 'ok'}
+        local_date = entry.local_date
+
+        self.response_status = 304
+        rsp = self.cache.make_request(self._build_request())
+
+        assert isinstance(rsp, CachedHTTPResponse)
+        self.assertEqual(rsp.cache_status, 'not_modified')
+        self.assertIsNot(rsp.cache_entry, entry)
+        self.assertTrue(rsp.cache_entry.up_to_date())
+        self.assertIs(rsp.cache_entry.decoded_payload, entry.decoded_payload)
+        self.assertEqual(rsp.read(), self._build_body('identity'))
+        self.assertEqual(entry.local_date, local_date)
+        self.assertIs(self.cache._get_memo_entry(self._build_request()),
+                      rsp.cache_entry)
+
+    def test_make_request_with_stale_entry_too_old(self) -> None:
+        """Testing APICache.make_request with stale_max_age revalidates
+        entries past the limit before returning
+        """
+        self.cache.stale_max_age = 30
+        self.cache.make_request(self._build_request())
+
+        entry = self.cache._get_memo_entry(self._build_request())
+        assert entry is not None
+        entry.local_date -= datetime.timedelta(seconds=120)
+
+        rsp = self.cache.make_request(self._build_request())
+        self.assertIsInstance(rsp, LiveHTTPResponse)
+        self.assertIsNone(self.cache._revalidate_executor)
+        self.assertSpyCallCount(cache_module.urlopen, 2)
+
+    def test_make_request_with_min_max_ages(self) -> None:
+        """Testing APICache.make_request with min_max_ages keeps responses
+        fresh for longer than the server's max-age
+        """
+        other_url = f'{self.url}info/'
+        self.cache.min_max_ages = {
+            self.url: 3600,
+        }
+
+        self.cache.make_request(self._build_request())
+        self.cache.make_request(Request(other_url, None, {}, 'GET'))
+
+        entry = self.cache._get_memo_entry(self._build_request())
+        assert entry is not None
+        self.assertEqual(entry.max_age, 3600)
+
+        entry = self.cache._get_memo_entry(Request(other_url, None, {}, 'GET'))
+        assert entry is not None
+        self.assertEqual(entry.max_age, 60)
+
+    def test_client_root_ttl(self) -> None:
+        """Testing RBClient reuses the cached API root for CACHE_ROOT_TTL"""
+        client = RBClient('https://reviews.example.com/',
+                          save_cookies=False,
+                          in_memory_cache=True,
+                          config=RBToolsConfig(config_dict={
+                              'CACHE_ROOT_TTL': 600,
+                          }))
+        cache = client._transport.server._cache
+        assert cache is not None
+
+        self.assertEqual(cache.min_max_ages, {
+            self.url: 600,
+        })
+
+    def test_save_entry_compresses_body(self) -> None:
+        """Testing APICache stores large response bodies compressed"""
+        self.addCleanup(setattr, cache_module, 'zstd', cache_module.zstd)
+        cache_module.zstd = None
+
+        body = b'{"links": {}}' * 1000
+        self._save_entry(f'{self.url}large/', body=body)
+        self._save_entry(f'{self.url}small/', body=b'{}')
+
+        with self.cache._db_lock:
+            rows = self.cache.db.execute(
+                'SELECT url, body_encoding, body_size, LENGTH(response_body)'
+                '  FROM api_cache ORDER BY url').fetchall()
+
+        self.assertEqual(rows[0][:3], (f'{self.url}large/', 'zlib', len(body)))
+        self.assertLess(rows[0][3], len(body) / 10)
+        self.assertEqual(rows[1], (f'{self.url}small/', None, 2, 2))
+
+        # Read the entry back from the database, rather than from memory.
+        self.cache._memo.clear()
+        entry = self.cache._get_entry(Request(f'{self.url}large/', None, {},
+                                              'GET'))
+        assert entry is not None
+        self.assertEqual(entry.response_body, body)
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats.total_bytes, len(body) + 2)
+        self.assertEqual(stats.stored_bytes, rows[0][3] + 2)
+        self.assertGreater(stats.compression_ratio, 10)
+
+    def test_get_entry_with_unknown_encoding(self) -> None:
+        """Testing APICache skips entries with unknown body encodings"""
+        self._save_entry(self.url)
+        self.cache._memo.clear()
+
+        with self.cache._db_lock:
+            self.cache.db.execute(
+                "UPDATE api_cache SET body_encoding='br' WHERE url=?",
+                (self.url,))
+
+        self.assertIsNone(self.cache._get_entry(self._build_request()))
+
+    def test_trim_with_max_entries(self) -> None:
+        """Testing APICache.trim evicts least-recently-used entries beyond
+        max_entries
+        """
+        for i in range(5):
+            self._save_entry(f'{self.url}{i}/', last_access_offset=i)
+
+        self.assertEqual(self.cache.trim(max_entries=3), 2)
+        self.assertEqual(self._get_cached_urls(), [
+            f'{self.url}0/',
+            f'{self.url}1/',
+            f'{self.url}2/',
+        ])
+
+    def test_trim_with_max_size(self) -> None:
+        """Testing APICache.trim evicts least-recently-used entries beyond
+        max_size
+        """
+        for i in range(5):
+            self._save_entry(f'{self.url}{i}/',
+                             body=b'x' * 100,
+                             last_access_offset=i)
+
+        self.assertEqual(self.cache.trim(max_size=250), 3)
+        self.assertEqual(self._get_cached_urls(), [
+            f'{self.url}0/',
+            f'{self.url}1/',
+        ])
+
+    def test_trim_removes_expired_entries(self) -> None:
+        """Testing APICache.trim removes expired entries that can't be
+        revalidated
+        """
+        self._save_entry(f'{self.url}fresh/', max_age=60)
+        self._save_entry(f'{self.url}expired/', max_age=60,
+                         local_date_offset=120)
+        self._save_entry(f'{self.url}etag/', max_age=60,
+                         local_date_offset=120, etag='"abc"')
+
+        self.assertEqual(self.cache.trim(), 1)
+        self.assertEqual(self._get_cached_urls(), [
+            f'{self.url}etag/',
+            f'{self.url}fresh/',
+        ])
+
+    def test_save_entry_trims_periodically(self) -> None:
+        """Testing APICache trims automatically when saving entries"""
+        cache = APICache(create_db_in_memory=True,
+                         max_entries=2)
+        self.cache = cache
+        self.spy_on(cache.trim)
+
+        for i in range(cache.TRIM_INTERVAL):
+            self._save_entry(f'{self.url}{i}/')
+
+        self.assertSpyCallCount(cache.trim, 1)
+        self.assertEqual(cache.get_stats().entries, 2)
+
+    def test_get_stats(self) -> None:
+        """Testing APICache.get_stats"""
+        self.cache.make_request(self._build_request())
+        self.cache.make_request(self._build_request())
+        self.cache.make_request(self._build_request())
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats.entries, 1)
+        self.assertEqual(stats.total_bytes, len(self._build_body('identity')))
+        self.assertEqual(stats.hits, 2)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.revalidations, 0)
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+
+    def test_on_disk_uses_wal(self) -> None:
+        """Testing APICache enables write-ahead logging for on-disk caches"""
+        cache = self._create_on_disk_cache()
+
+        self.assertEqual(
+            cache.db.execute('PRAGMA journal_mode').fetchone()[0],
+            'wal')
+
+    def test_on_disk_defers_commits(self) -> None:
+        """Testing APICache batches writes until flushed"""
+        cache = self._create_on_disk_cache()
+        other_cache = APICache(db_location=cache.cache_path)
+        self.addCleanup(other_cache.close)
+
+        cache.make_request(self._build_request())
+
+        # The entry is visible to this cache, but not yet committed.
+        self.assertIsInstance(cache.make_request(self._build_request()),
+                              CachedHTTPResponse)
+        self.assertIsNone(other_cache._get_entry(self._build_request()))
+
+        cache.flush()
+
+        self.assertIsNotNone(other_cache._get_entry(self._build_request()))
+        self.assertSpyCallCount(cache_module.urlopen, 1)
+
+    def test_on_disk_commits_after_batch_size(self) -> None:
+        """Testing APICache commits once COMMIT_BATCH_SIZE writes are
+        pending
+        """
+        cache = self._create_on_disk_cache()
+        self.cache = cache
+        self.spy_on(cache.flush)
+
+        for i in range(cache.COMMIT_BATCH_SIZE):
+            self._save_entry(f'{self.url}{i}/', flush=False)
+
+        self.assertSpyCallCount(cache.flush, 1)
+        self.assertEqual(cache._pending, {})
+
+    def test_on_disk_delete_pending_entry(self) -> None:
+        """Testing APICache hides committed entries with pending deletes"""
+        cache = self._create_on_disk_cache()
+        cache.make_request(self._build_request())
+        cache.flush()
+
+        entry = cache._get_entry(self._build_request())
+        assert entry is not None
+
+        cache._delete_entry(entry)
+        self.assertIsNone(cache._get_entry(self._build_request()))
+
+        cache.flush()
+        self.assertIsNone(cache._get_entry(self._build_request()))
+
+    def test_on_disk_per_thread_connections(self) -> None:
+        """Testing APICache uses a separate connection for each thread"""
+        cache = self._create_on_disk_cache()
+        connections: list[sqlite3.Connection | None] = []
+
+        thread = threading.Thread(target=lambda: connections.append(cache.db))
+        thread.start()
+        thread.join()
+
+        self.assertIsNotNone(connections[0])
+        self.assertIsNot(connections[0], cache.db)
+        self.assertEqual(len(cache._connections), 2)
+
+    def test_on_disk_flush_with_locked_database(self) -> None:
+        """Testing APICache.flush discards writes when the database is
+        locked by another process
+        """
+        cache = self._create_on_disk_cache()
+        cache.BUSY_TIMEOUT = 0
+        cache._thread_state.db = None
+        cache.make_request(self._build_request())
+
+        locker = sqlite3.connect(cache.cache_path, isolation_level=None)
+        self.addCleanup(locker.close)
+        locker.execute('BEGIN IMMEDIATE')
+
+        with self.assertLogs(cache_module.logger, level='WARNING'):
+            cache.flush()
+
+        self.assertEqual(cache._pending, {})
+
+        locker.execute('ROLLBACK')
+        self.assertIsNone(cache._get_entry(self._build_request()))
+
+    def _create_on_disk_cache(self) -> APICache:
+        """Return a new cache stored in a temporary directory.
+
+        Returns:
+            rbtools.api.cache.APICache:
+            The new cache.
+        """
+        cache = APICache(db_location=os.path.join(make_tempdir(),
+                                                  'apicache.db'))
+        self.addCleanup(cache.close)
+
+        return cache
+
+    def _save_entry(
+        self,
+        url: str,
+        *,
+        body: bytes = b'{}',
+        max_age: int = 60,
+        etag: (str | None) = None,
+        local_date_offset: int = 0,
+        last_access_offset: int = 0,
+        flush: bool = True,
+    ) -> None:
+        """Save an entry directly to the cache.
+
+        Args:
+            url (str):
+                The URL for the entry.
+
+            body (bytes, optional):
+                The response body.
+
+            max_age (int, optional):
+                The maximum age of the entry, in seconds.
+
+            etag (str, optional):
+                The ETag for the entry.
+
+            local_date_offset (int, optional):
+                The number of seconds in the past that the entry was fetched.
+
+            last_access_offset (int, optional):
+                The number of seconds in the past that the entry was last
+                used.
+
+            flush (bool, optional):
+                Whether to commit the entry immediately.
+        """
+        now = datetime.datetime.now()
+        entry = CacheEntry(
+            url=url,
+            vary_headers={},
+            max_age=max_age,
+            etag=etag,
+            local_date=now - datetime.timedelta(seconds=local_date_offset),
+            last_modified=None,
+            mime_type='application/json',
+            item_mime_type=None,
+            response_body=body)
+
+        self.cache._save_entry(entry)
+
+        if flush:
+            self.cache.flush()
+
+        if last_access_offset:
+            last_access = now - datetime.timedelta(seconds=last_access_offset)
+
+            with self.cache._db_lock:
+                self.cache.db.execute(
+                    'UPDATE api_cache SET last_access=? WHERE url=?',
+                    (last_access.strftime(CacheEntry.DATE_FORMAT), url))
+
+    def _get_cached_urls(self) -> list[str]:
+        """Return the URLs stored in the cache.
+
+        Returns:
+            list of str:
+            The sorted list of URLs.
+        """
+        with self.cache._db_lock:
+            return sorted(
+                row[0]
+                for row in self.cache.db.execute(
+                    'SELECT url FROM api_cache').fetchall()
+            )
+
+    def _build_body(
+        self,
+        encoding: str,
+    ) -> bytes:
+        """Return a response body for the tests.
+
+        Args:
+            encoding (str):
+                The Accept-Encoding header from the request.
+
+        Returns:
+            bytes:
+            The response body.
+        """
+        return (
+            f'{{"stat": "ok", "info": {{"encoding": "{encoding}"}}}}'
+            .encode('utf-8')
+        )
+
+    def _build_request(
+        self,
+        *,
+        headers: (dict[str, str] | None) = None,
+        method: str = 'GET',
+    ) -> Request:
+        """Return a new request for the cache.
+
+        Args:
+            headers (dict, optional):
+                Headers to send in the request.
+
+            method (str, optional):
+                The HTTP method for the request.
+
+        Returns:
+            rbtools.api.request.Request:
+            The new request.
+        """
+        return Request(self.url, None, headers or {}, method)
@@ -0,0 +1,294 @@
+"""Unit tests for rbtools.api.connections.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import zlib
+from http.client import HTTPConnection, HTTPResponse, RemoteDisconnected
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, build_opener
+
+import kgb
+
+from rbtools.api.connections import BufferedHTTPResponse, HTTPConnectionPool
+from rbtools.api.request import (RBToolsContentDecodingProcessor,
+                                 RBToolsHTTPHandler,
+                                 ReviewBoardHTTPErrorProcessor)
+from rbtools.testing import TestCase
+
+
+class _KeepAliveRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for a keep-alive test server.
+
+    Version Added:
+        7.0
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    #: The number of connections accepted by the server.
+    connections: ClassVar[int] = 0
+
+    #: Whether to close connections without telling the client.
+    drop_connections: ClassVar[bool] = False
+
+    def setup(self) -> None:
+        """Set up a new connection."""
+        super().setup()
+
+        type(self).connections += 1
+
+    def do_POST(self) -> None:
+        """Handle a HTTP POST request."""
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.do_GET()
+
+    def do_GET(self) -> None:
+        """Handle a HTTP GET request."""
+        encoding: (str | None) = None
+
+        if self.path.endswith('/missing/'):
+            status = 404
+            body = b'{"stat": "fail"}'
+        else:
+            status = 200
+            body = b'{"stat": "ok"}'
+
+        if self.path.endswith('/gzip/'):
+            encoding = 'gzip'
+            body = gzip.compress(body)
+        elif self.path.endswith('/deflate/'):
+            encoding = 'deflate'
+            body = zlib.compress(body)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        if self.drop_connections:
+            self.close_connection = True
+
+    def log_message(self, *args, **kwargs) -> None:
+        """Suppress log output."""
+        pass
+
+
+class HTTPConnectionPoolTests(kgb.SpyAgency, TestCase):
+    """Unit tests for HTTPConnectionPool and the pooled URL handlers.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        _KeepAliveRequestHandler.connections = 0
+        _KeepAliveRequestHandler.drop_connections = False
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                          _KeepAliveRequestHandler)
+        self.server.daemon_threads = True
+        self.server_thread = threading.Thread(target=self.server.serve_forever,
+                                              daemon=True)
+        self.server_thread.start()
+
+        host, port = self.server.server_address[:2]
+        self.url = f'http://{host}:{port}/api/'
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+        super().tearDown()
+
+    def test_reuses_connections(self) -> None:
+        """Testing pooled HTTP handler reuses connections"""
+        pool = HTTPConnectionPool()
+        opener = build_opener(RBToolsHTTPHandler(connection_pool=pool))
+
+        for i in range(3):
+            with opener.open(self.url) as rsp:
+                self.assertIsInstance(rsp, BufferedHTTPResponse)
+                self.assertEqual(rsp.status, 200)
+                self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+        self.assertEqual(_KeepAliveRequestHandler.connections, 1)
+        self.assertEqual(pool.get_idle_count(), 1)
+
+        pool.close_all()
+        self.assertEqual(pool.get_idle_count(), 0)
+
+    def test_without_pool(self) -> None:
+        """Testing pooled HTTP handler without a pool opens a connection per
+        request
+        """
+        opener = build_opener(RBToolsHTTPHandler())
+
+        for i in range(3):
+            with opener.open(self.url) as rsp:
+                self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+        self.assertEqual(_KeepAliveRequestHandler.connections, 3)
+
+    def test_idle_timeout(self) -> None:
+        """Testing pooled HTTP handler does not reuse connections past the
+        idle timeout
+        """
+        pool = HTTPConnectionPool(idle_timeout=0)
+        opener = build_opener(RBToolsHTTPHandler(connection_pool=pool))
+
+        for i in range(2):
+            with opener.open(self.url) as rsp:
+                self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+        self.assertEqual(_KeepAliveRequestHandler.connections, 2)
+
+    def test_max_idle_per_host(self) -> None:
+        """Testing HTTPConnectionPool.release closes connections beyond
+        max_idle_per_host
+        """
+        pool = HTTPConnectionPool(max_idle_per_host=1)
+        key = ('http', 'example.com', None)
+
+        conn1 = HTTPConnection('example.com')
+        conn2 = HTTPConnection('example.com')
+        conn1.sock = conn2.sock = object()  # type: ignore
+
+        self.spy_on(conn1.close, call_original=False)
+        self.spy_on(conn2.close, call_original=False)
+
+        pool.release(key, conn1)
+        pool.release(key, conn2)
+
+        self.assertEqual(pool.get_idle_count(key), 1)
+        self.assertSpyNotCalled(conn1.close)
+        self.assertSpyCalled(conn2.close)
+        self.assertIs(pool.acquire(key), conn1)
+        self.assertIsNone(pool.acquire(key))
+
+    def test_reconnects_stale_connection(self) -> None:
+        """Testing pooled HTTP handler reconnects when the server closed an
+        idle connection
+        """
+        _KeepAliveRequestHandler.drop_connections = True
+
+        pool = HTTPConnectionPool()
+        opener = build_opener(RBToolsHTTPHandler(connection_pool=pool))
+
+        for i in range(3):
+            with opener.open(self.url) as rsp:
+                self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+        self.assertEqual(_KeepAliveRequestHandler.connections, 3)
+
+    def test_disconnect_after_send(self) -> None:
+        """Testing pooled HTTP handler only resends idempotent requests when
+        a reused connection is closed after sending
+        """
+        pool = HTTPConnectionPool()
+        opener = build_opener(RBToolsHTTPHandler(connection_pool=pool))
+
+        def _getresponse(
+            conn: HTTPConnection,
+        ) -> HTTPResponse:
+            if len(HTTPConnection.getresponse.calls) == 1:
+                raise RemoteDisconnected('Remote end closed connection')
+
+            return HTTPConnection.getresponse.call_original(conn)
+
+        for method, data in (('POST', b'data'), ('GET', None)):
+            with opener.open(self.url) as rsp:
+                rsp.read()
+
+            self.assertEqual(pool.get_idle_count(), 1)
+            self.spy_on(HTTPConnection.getresponse,
+                        owner=HTTPConnection,
+                        call_fake=_getresponse)
+
+            try:
+                request = Request(self.url, data=data, method=method)
+
+                if method == 'POST':
+                    # The server may have processed the request before the
+                    # connection was closed, so it can't be sent again.
+                    with self.assertRaises(URLError):
+                        opener.open(request)
+
+                    self.assertSpyCallCount(HTTPConnection.getresponse, 1)
+                else:
+                    with opener.open(request) as rsp:
+                        self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+                    self.assertSpyCallCount(HTTPConnection.getresponse, 2)
+            finally:
+                HTTPConnection.getresponse.unspy()
+
+    def test_error_response(self) -> None:
+        """Testing pooled HTTP handler with HTTP error responses"""
+        pool = HTTPConnectionPool()
+        opener = build_opener(RBToolsHTTPHandler(connection_pool=pool))
+
+        with self.assertRaises(HTTPError) as ctx:
+            opener.open(f'{self.url}missing/')
+
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertEqual(ctx.exception.read(), b'{"stat": "fail"}')
+
+        with opener.open(self.url) as rsp:
+            self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+        self.assertEqual(_KeepAliveRequestHandler.connections, 1)
+
+    def test_content_decoding_gzip(self) -> None:
+        """Testing RBToolsContentDecodingProcessor with gzip responses"""
+        opener = build_opener(
+            RBToolsHTTPHandler(connection_pool=HTTPConnectionPool()),
+            RBToolsContentDecodingProcessor(),
+            ReviewBoardHTTPErrorProcessor())
+
+        with opener.open(f'{self.url}gzip/') as rsp:
+            self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+            self.assertNotIn('Content-Encoding', rsp.headers)
+            self.assertEqual(rsp.headers['Content-Length'], '14')
+            self.assertEqual(rsp.headers['Content-Type'], 'application/json')
+
+    def test_content_decoding_deflate(self) -> None:
+        """Testing RBToolsContentDecodingProcessor with deflate responses"""
+        opener = build_opener(RBToolsHTTPHandler(),
+                              RBToolsContentDecodingProcessor(),
+                              ReviewBoardHTTPErrorProcessor())
+
+        with opener.open(f'{self.url}deflate/') as rsp:
+            self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+            self.assertNotIn('Content-Encoding', rsp.headers)
+
+    def test_content_decoding_identity(self) -> None:
+        """Testing RBToolsContentDecodingProcessor with uncompressed
+        responses
+        """
+        processor = RBToolsContentDecodingProcessor()
+        opener = build_opener(RBToolsHTTPHandler(),
+                              processor,
+                              ReviewBoardHTTPErrorProcessor())
+
+        self.spy_on(processor._decompress_deflate)
+
+        with opener.open(self.url) as rsp:
+            self.assertEqual(rsp.read(), b'{"stat": "ok"}')
+
+        self.assertSpyNotCalled(processor._decompress_deflate)
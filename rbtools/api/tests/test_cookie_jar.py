@@ -0,0 +1,216 @@
+"""Unit tests for rbtools.api.request.PersistentCookieJar.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from http.cookiejar import Cookie, MozillaCookieJar
+
+import kgb
+
+from rbtools.api.request import (HttpRequest,
+                                 PersistentCookieJar,
+                                 ReviewBoardServer)
+from rbtools.api.tests.base import MockResponse
+from rbtools.config import RBToolsConfig
+from rbtools.testing import TestCase
+from rbtools.utils.filesystem import make_tempdir
+
+
+class PersistentCookieJarTests(kgb.SpyAgency, TestCase):
+    """Unit tests for PersistentCookieJar.
+
+    Version Added:
+        7.0
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.cookie_file = os.path.join(make_tempdir(), 'cookies.txt')
+        self.cookie_jar = PersistentCookieJar(self.cookie_file)
+
+    def test_set_cookie(self) -> None:
+        """Testing PersistentCookieJar.set_cookie marks the jar as changed
+        only for new or changed cookies
+        """
+        self.assertFalse(self.cookie_jar.dirty)
+
+        self.cookie_jar.set_cookie(self._build_cookie('abc'))
+        self.assertTrue(self.cookie_jar.dirty)
+
+        self.assertTrue(self.cookie_jar.save_if_changed())
+        self.assertFalse(self.cookie_jar.dirty)
+
+        self.cookie_jar.set_cookie(self._build_cookie('abc'))
+        self.assertFalse(self.cookie_jar.dirty)
+
+        self.cookie_jar.set_cookie(self._build_cookie('def'))
+        self.assertTrue(self.cookie_jar.dirty)
+
+    def test_clear(self) -> None:
+        """Testing PersistentCookieJar.clear marks the jar as changed"""
+        self.cookie_jar.set_cookie(self._build_cookie('abc'))
+        self.cookie_jar.save_if_changed()
+
+        self.cookie_jar.clear_session_cookies()
+        self.assertFalse(self.cookie_jar.dirty)
+
+        self.cookie_jar.clear()
+        self.assertTrue(self.cookie_jar.dirty)
+        self.assertEqual(len(self.cookie_jar), 0)
+
+    def test_save_if_changed(self) -> None:
+        """Testing PersistentCookieJar.save_if_changed only writes when
+        cookies have changed
+        """
+        self.spy_on(PersistentCookieJar.save,
+                    owner=PersistentCookieJar)
+
+        self.assertFalse(self.cookie_jar.save_if_changed())
+        self.assertFalse(os.path.exists(self.cookie_file))
+
+        self.cookie_jar.set_cookie(self._build_cookie('abc'))
+        self.assertTrue(self.cookie_jar.save_if_changed())
+        self.assertFalse(self.cookie_jar.save_if_changed())
+
+        self.assertSpyCallCount(PersistentCookieJar.save, 1)
+
+        cookie_jar = PersistentCookieJar(self.cookie_file)
+        cookie_jar.load()
+
+        self.assertFalse(cookie_jar.dirty)
+        self.assertEqual([cookie.value for cookie in cookie_jar], ['abc'])
+
+    def test_save_if_changed_lock_order(self) -> None:
+        """Testing PersistentCookieJar.save_if_changed doesn't hold the
+        cookies lock while saving
+        """
+        locked = []
+
+        def _save(
+            cookie_jar: PersistentCookieJar,
+            *args,
+            **kwargs,
+        ) -> None:
+            # The cookies lock is reentrant, so this must be checked from
+            # another thread.
+            def _check_lock() -> None:
+                acquired = cookie_jar._cookies_lock.acquire(blocking=False)
+                locked.append(not acquired)
+
+                if acquired:
+                    cookie_jar._cookies_lock.release()
+
+            thread = threading.Thread(target=_check_lock)
+            thread.start()
+            thread.join()
+
+            raise OSError('Disk full')
+
+        self.spy_on(PersistentCookieJar.save,
+                    owner=PersistentCookieJar,
+                    call_fake=_save)
+
+        self.cookie_jar.set_cookie(self._build_cookie('abc'))
+
+        with self.assertRaises(OSError):
+            self.cookie_jar.save_if_changed()
+
+        self.assertEqual(locked, [False])
+        self.assertTrue(self.cookie_jar.dirty)
+
+    def test_save_atomic(self) -> None:
+        """Testing PersistentCookieJar.save leaves the existing file intact
+        when writing fails
+        """
+        self.cookie_jar.set_cookie(self._build_cookie('abc'))
+        self.cookie_jar.save()
+
+        with open(self.cookie_file, 'rb') as fp:
+            old_content = fp.read()
+
+        def _save(
+            cookie_jar: MozillaCookieJar,
+            filename: str,
+            *args,
+            **kwargs,
+        ) -> None:
+            with open(filename, 'w') as fp:
+                fp.write('# Netscape HTTP Cookie File\n')
+
+            raise OSError('Disk full')
+
+        self.cookie_jar.set_cookie(self._build_cookie('def'))
+        self.spy_on(MozillaCookieJar.save,
+                    owner=MozillaCookieJar,
+                    call_fake=_save)
+
+        with self.assertRaises(OSError):
+            self.cookie_jar.save()
+
+        self.assertTrue(self.cookie_jar.dirty)
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(self.cookie_file))),
+            ['cookies.txt', 'cookies.txt.lock'])
+
+        with open(self.cookie_file, 'rb') as fp:
+            self.assertEqual(fp.read(), old_content)
+
+    def test_make_request_saves_only_changes(self) -> None:
+        """Testing ReviewBoardServer.make_request saves cookies only when
+        they change
+        """
+        server = ReviewBoardServer(
+            'https://reviews.example.com/',
+            cookie_file=self.cookie_file,
+            config=RBToolsConfig())
+        server._urlopen = (  # type: ignore
+            lambda request: MockResponse(200, {}, '{}'))
+        self.spy_on(PersistentCookieJar.save,
+                    owner=PersistentCookieJar)
+
+        assert isinstance(server.cookie_jar, PersistentCookieJar)
+        server.cookie_jar.set_cookie(self._build_cookie('abc'))
+
+        for i in range(3):
+            server.make_request(HttpRequest(server.url))
+
+        self.assertSpyCallCount(PersistentCookieJar.save, 1)
+
+    def _build_cookie(
+        self,
+        value: str,
+    ) -> Cookie:
+        """Return a cookie for the tests.
+
+        Args:
+            value (str):
+                The value of the cookie.
+
+        Returns:
+            http.cookiejar.Cookie:
+            The new cookie.
+        """
+        return Cookie(
+            version=0,
+            name='rbsessionid',
+            value=value,
+            port=None,
+            port_specified=False,
+            domain='reviews.example.com',
+            domain_specified=False,
+            domain_initial_dot=False,
+            path='/',
+            path_specified=True,
+            secure=False,
+            expires=int(time.time()) + 3600,
+            discard=False,
+            comment=None,
+            comment_url=None,
+            rest={})
@@ -0,0 +1,135 @@
+"""Unit tests for rbtools.api.decode.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import json
+
+import kgb
+
+from rbtools.api import decode as decode_module
+from rbtools.api.decode import (DECODER_MAP,
+                                JsonDecoder,
+                                OrjsonDecoder,
+                                decode_response,
+                                get_json_decoder)
+from rbtools.api.transport.sync import SyncTransport
+from rbtools.config import RBToolsConfig
+from rbtools.testing import TestCase
+
+
+class DecodeTests(kgb.SpyAgency, TestCase):
+    """Unit tests for rbtools.api.decode.
+
+    Version Added:
+        7.0
+    """
+
+    payload = {
+        'stat': 'ok',
+        'review_request': {
+            'id': 1,
+            'summary': 'Café',
+            'files': [
+                {'filename': 'a.txt', 'size': 12345678901},
+            ],
+        },
+    }
+
+    def test_json_decoder(self) -> None:
+        """Testing JsonDecoder"""
+        encoded = json.dumps(self.payload)
+
+        self.assertEqual(JsonDecoder(encoded.encode('utf-8')), self.payload)
+        self.assertEqual(JsonDecoder(encoded), self.payload)
+
+    def test_orjson_decoder(self) -> None:
+        """Testing OrjsonDecoder"""
+        if decode_module.orjson is None:
+            self.skipTest('orjson is not installed')
+
+        encoded = json.dumps(self.payload)
+
+        self.assertEqual(OrjsonDecoder(encoded.encode('utf-8')),
+                         self.payload)
+        self.assertEqual(OrjsonDecoder(encoded), self.payload)
+
+        with self.assertRaises(ValueError):
+            OrjsonDecoder(b'{')
+
+    def test_get_json_decoder(self) -> None:
+        """Testing get_json_decoder"""
+        self.assertIs(get_json_decoder('json'), JsonDecoder)
+
+        if decode_module.orjson is None:
+            self.assertIs(get_json_decoder(), JsonDecoder)
+            self.assertIs(get_json_decoder('auto'), JsonDecoder)
+        else:
+            self.assertIs(get_json_decoder(), OrjsonDecoder)
+            self.assertIs(get_json_decoder('auto'), OrjsonDecoder)
+            self.assertIs(get_json_decoder('orjson'), OrjsonDecoder)
+
+    def test_get_json_decoder_unavailable(self) -> None:
+        """Testing get_json_decoder with an unavailable backend"""
+        with self.assertLogs(decode_module.logger, level='WARNING') as cm:
+            self.assertIs(get_json_decoder('simplejson'), JsonDecoder)
+
+        self.assertEqual(
+            cm.output,
+            [
+                'WARNING:rbtools.api.decode:The "simplejson" JSON decoder '
+                'is not available. Falling back to the "json" decoder.',
+            ])
+
+    def test_decode_response(self) -> None:
+        """Testing decode_response with a vendor JSON mimetype"""
+        self.assertEqual(
+            decode_response(
+                json.dumps(self.payload).encode('utf-8'),
+                'application/vnd.reviewboard.org.review-request+json'),
+            self.payload)
+
+    def test_decode_response_with_decoder_map(self) -> None:
+        """Testing decode_response with decoder_map"""
+        self.spy_on(JsonDecoder)
+
+        self.assertEqual(
+            decode_response(
+                json.dumps(self.payload).encode('utf-8'),
+                'application/json',
+                decoder_map={
+                    'application/json': JsonDecoder,
+                }),
+            self.payload)
+        self.assertSpyCalledOnce(JsonDecoder)
+
+    def test_transport_with_api_json_decoder(self) -> None:
+        """Testing SyncTransport with API_JSON_DECODER"""
+        transport = SyncTransport(
+            'https://reviews.example.com/',
+            save_cookies=False,
+            allow_caching=False,
+            config=RBToolsConfig(config_dict={
+                'API_JSON_DECODER': 'json',
+            }))
+
+        self.assertEqual(
+            transport._decoder_map,
+            dict(DECODER_MAP, **{
+                'application/json': JsonDecoder,
+            }))
+
+    def test_transport_with_api_json_decoder_auto(self) -> None:
+        """Testing SyncTransport with API_JSON_DECODER=auto uses
+        DECODER_MAP
+        """
+        transport = SyncTransport(
+            'https://reviews.example.com/',
+            save_cookies=False,
+            allow_caching=False,
+            config=RBToolsConfig())
+
+        self.assertIsNone(transport._decoder_map)
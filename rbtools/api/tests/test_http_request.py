@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import io
+import os
+import tempfile
+from pathlib import Path
 from urllib.parse import parse_qsl, urlparse
 
 from kgb import SpyAgency
 
-from rbtools.api.request import HttpRequest
+from rbtools.api.request import HttpRequest, MultipartFormDataBody
 from rbtools.testing import TestCase
 
 
@@ -138,6 +142,116 @@ class HttpRequestTests(SpyAgency, TestCase):
             b'\r\n'
             b'--BOUNDARY--\r\n\r\n')
 
+    def test_encode_multipart_formdata_stream_with_file_object(self) -> None:
+        """Testing HttpRequest.encode_multipart_formdata_stream with a file
+        object
+        """
+        fp = io.BytesIO(b'XXXThis is a test.')
+        fp.seek(3)
+
+        request = HttpRequest(url='/',
+                              method='POST')
+        request.add_field('foo', 'bar')
+        request.add_file(name='my-file',
+                         filename='filename.txt',
+                         content=fp)
+
+        self.spy_on(request._make_mime_boundary,
+                    call_fake=lambda r: b'BOUNDARY')
+
+        ctype, body = request.encode_multipart_formdata_stream()
+
+        expected = (
+            b'--BOUNDARY\r\n'
+            b'Content-Disposition: form-data; name="foo"\r\n'
+            b'\r\n'
+            b'bar'
+            b'\r\n'
+            b'--BOUNDARY\r\n'
+            b'Content-Disposition: form-data; name="my-file";'
+            b' filename="filename.txt"\r\n'
+            b'Content-Type: text/plain\r\n'
+            b'\r\n'
+            b'This is a test.'
+            b'\r\n'
+            b'--BOUNDARY--\r\n\r\n')
+
+        self.assertEqual(ctype, 'multipart/form-data; boundary=BOUNDARY')
+        assert body is not None
+        self.assertIsInstance(body, MultipartFormDataBody)
+        self.assertEqual(body.content_length, len(expected))
+        self.assertEqual(b''.join(body), expected)
+
+        # The body must be able to be sent again.
+        self.assertEqual(b''.join(body), expected)
+
+    def test_encode_multipart_formdata_stream_with_path(self) -> None:
+        """Testing HttpRequest.encode_multipart_formdata_stream with a file
+        path
+        """
+        fd, filename = tempfile.mkstemp()
+        os.write(fd, b'abc' * 50000)
+        os.close(fd)
+
+        try:
+            request = HttpRequest(url='/',
+                                  method='POST')
+            request.add_file(name='path',
+                             filename='data.bin',
+                             content=Path(filename))
+
+            self.spy_on(request._make_mime_boundary,
+                        call_fake=lambda r: b'BOUNDARY')
+
+            ctype, body = request.encode_multipart_formdata_stream()
+            assert body is not None
+
+            chunks = list(body)
+            content = b''.join(chunks)
+
+            self.assertGreater(len(chunks), 2)
+            self.assertEqual(body.content_length, len(content))
+            self.assertIn(b'\r\n\r\n' + b'abc' * 50000 + b'\r\n', content)
+        finally:
+            os.unlink(filename)
+
+    def test_encode_multipart_formdata_stream_with_changed_file(self) -> None:
+        """Testing HttpRequest.encode_multipart_formdata_stream with a file
+        that shrinks after encoding
+        """
+        fp = io.BytesIO(b'This is a test.')
+
+        request = HttpRequest(url='/',
+                              method='POST')
+        request.add_file(name='my-file',
+                         filename='filename.txt',
+                         content=fp)
+
+        ctype, body = request.encode_multipart_formdata_stream()
+        assert body is not None
+
+        fp.truncate(4)
+
+        with self.assertRaises(OSError):
+            b''.join(body)
+
+    def test_add_file_with_unseekable_file_object(self) -> None:
+        """Testing HttpRequest.add_file with an unseekable file object"""
+        class _UnseekableIO(io.BytesIO):
+            def seekable(self) -> bool:
+                return False
+
+        request = HttpRequest(url='/',
+                              method='POST')
+        request.add_file(name='my-file',
+                         filename='filename.txt',
+                         content=_UnseekableIO(b'This is a test.'))
+
+        ctype, content = request.encode_multipart_formdata()
+
+        assert content is not None
+        self.assertIn(b'\r\nThis is a test.\r\n', content)
+
     def test_encode_query_args(self) -> None:
         """Testing the encoding of query arguments"""
         request = HttpRequest(
@@ -0,0 +1,194 @@
+"""Unit tests for rbtools.api.instrumentation.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+from rbtools.api import instrumentation
+from rbtools.api.instrumentation import (HTTPRequestRecord,
+                                         HTTPRequestStats,
+                                         get_active_request_record,
+                                         get_url_template,
+                                         track_request)
+from rbtools.testing import TestCase
+
+
+class HTTPRequestStatsTests(TestCase):
+    """Unit tests for rbtools.api.instrumentation.HTTPRequestStats.
+
+    Version Added:
+        7.0
+    """
+
+    def _make_record(
+        self,
+        url: str,
+        **kwargs,
+    ) -> HTTPRequestRecord:
+        """Return a new record for a request.
+
+        Args:
+            url (str):
+                The URL of the request.
+
+            **kwargs (dict):
+                Additional attributes for the record.
+
+        Returns:
+            rbtools.api.instrumentation.HTTPRequestRecord:
+            The new record.
+        """
+        return HTTPRequestRecord(method=kwargs.pop('method', 'GET'),
+                                 url=url,
+                                 url_template=get_url_template(url),
+                                 **kwargs)
+
+    def test_add_record(self) -> None:
+        """Testing HTTPRequestStats.add_record"""
+        stats = HTTPRequestStats()
+        record = self._make_record('https://example.com/api/')
+        stats.add_record(record)
+
+        self.assertEqual(stats.records, [])
+
+        stats.keep_records = True
+        stats.add_record(record)
+
+        self.assertEqual(stats.records, [record])
+
+    def test_add_record_with_callbacks(self) -> None:
+        """Testing HTTPRequestStats.add_record with callbacks"""
+        seen: list[HTTPRequestRecord] = []
+
+        def _bad_callback(record: HTTPRequestRecord) -> None:
+            raise Exception('Oh no')
+
+        stats = HTTPRequestStats()
+        stats.add_callback(_bad_callback)
+        stats.add_callback(seen.append)
+
+        record = self._make_record('https://example.com/api/')
+
+        with self.assertLogs(instrumentation.logger, level='ERROR'):
+            stats.add_record(record)
+
+        self.assertEqual(seen, [record])
+
+        stats.remove_callback(_bad_callback)
+        stats.remove_callback(seen.append)
+        stats.add_record(record)
+
+        self.assertEqual(seen, [record])
+
+    def test_get_summary(self) -> None:
+        """Testing HTTPRequestStats.get_summary"""
+        stats = HTTPRequestStats(keep_records=True)
+        stats.add_record(self._make_record(
+            'https://example.com/api/review-requests/1/',
+            bytes_received=100,
+            cache_status='miss',
+            total_time=0.5))
+        stats.add_record(self._make_record(
+            'https://example.com/api/review-requests/2/?expand=draft',
+            cache_status='not_modified',
+            total_time=0.25))
+        stats.add_record(self._make_record(
+            'https://example.com/api/review-requests/2/diffs/',
+            method='POST',
+            bytes_sent=2000,
+            auth_retries=1,
+            retries=2,
+            total_time=1.0))
+
+        self.assertEqual(
+            stats.get_summary(),
+            [
+                {
+                    'method': 'POST',
+                    'url_template': '/api/review-requests/{id}/diffs/',
+                    'requests': 1,
+                    'cache_hits': 0,
+                    'auth_retries': 1,
+                    'retries': 2,
+                    'bytes_sent': 2000,
+                    'bytes_received': 0,
+                    'total_time': 1.0,
+                },
+                {
+                    'method': 'GET',
+                    'url_template': '/api/review-requests/{id}/',
+                    'requests': 2,
+                    'cache_hits': 1,
+                    'auth_retries': 0,
+                    'retries': 0,
+                    'bytes_sent': 0,
+                    'bytes_received': 100,
+                    'total_time': 0.75,
+                },
+            ])
+
+    def test_to_json(self) -> None:
+        """Testing HTTPRequestStats.to_json"""
+        stats = HTTPRequestStats(keep_records=True)
+        stats.add_record(self._make_record('https://example.com/api/',
+                                           status=200))
+
+        data = stats.to_json()
+
+        self.assertEqual(len(data['summary']), 1)
+        self.assertEqual(
+            data['requests'],
+            [
+                {
+                    'method': 'GET',
+                    'url': 'https://example.com/api/',
+                    'url_template': '/api/',
+                    'status': 200,
+                    'bytes_sent': 0,
+                    'bytes_received': 0,
+                    'cache_status': None,
+                    'auth_retries': 0,
+                    'retries': 0,
+                    'wait_time': 0.0,
+                    'connect_time': 0.0,
+                    'tls_time': 0.0,
+                    'ttfb_time': 0.0,
+                    'body_time': 0.0,
+                    'total_time': 0.0,
+                },
+            ])
+
+
+class InstrumentationTests(TestCase):
+    """Unit tests for rbtools.api.instrumentation functions.
+
+    Version Added:
+        7.0
+    """
+
+    def test_get_url_template(self) -> None:
+        """Testing get_url_template"""
+        self.assertEqual(
+            get_url_template('https://example.com/api/review-requests/123/'
+                             'diffs/4/files/?only-fields=id'),
+            '/api/review-requests/{id}/diffs/{id}/files/')
+        self.assertEqual(
+            get_url_template('https://example.com/api/repositories/'
+                             'repo1/'),
+            '/api/repositories/repo1/')
+
+    def test_track_request(self) -> None:
+        """Testing track_request"""
+        record = HTTPRequestRecord(method='GET',
+                                   url='https://example.com/api/',
+                                   url_template='/api/')
+
+        self.assertIsNone(get_active_request_record())
+
+        with track_request(record):
+            self.assertIs(get_active_request_record(), record)
+
+        self.assertIsNone(get_active_request_record())
+        self.assertGreater(record.total_time, 0.0)
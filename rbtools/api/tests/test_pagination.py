@@ -0,0 +1,266 @@
+"""Unit tests for list resource pagination.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
+
+import kgb
+
+from rbtools.api.client import AsyncRBClient, RBClient
+from rbtools.api.request import ReviewBoardServer
+from rbtools.api.resource import ItemPayloadView
+from rbtools.api.tests.base import MockResponse
+from rbtools.config import RBToolsConfig
+from rbtools.testing import TestCase
+
+if TYPE_CHECKING:
+    from typelets.json import JSONDict
+
+    from rbtools.api.request import HttpRequest
+    from rbtools.api.resource import ListResource
+
+
+class PaginationTests(kgb.SpyAgency, TestCase):
+    """Unit tests for ListResource pagination and read-ahead.
+
+    Version Added:
+        7.0
+    """
+
+    server_url = 'https://reviews.example.com/'
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.total_results = 10
+        self.requested_starts: list[int] = []
+
+        def _make_request(
+            server: ReviewBoardServer,
+            request: HttpRequest,
+        ) -> MockResponse:
+            parts = urlparse(request.url)
+
+            if parts.path == '/api/':
+                return MockResponse(
+                    200,
+                    {
+                        'Content-Type':
+                            'application/vnd.reviewboard.org.root+json',
+                    },
+                    json.dumps(self._build_root_payload()))
+
+            query = parse_qs(parts.query)
+            start = int(query.get('start', ['0'])[0])
+            max_results = int(query.get('max-results', ['2'])[0])
+
+            self.requested_starts.append(start)
+
+            return MockResponse(
+                200,
+                {'Content-Type': 'application/json'},
+                json.dumps(self._build_list_payload(start, max_results)))
+
+        self.spy_on(ReviewBoardServer.make_request,
+                    owner=ReviewBoardServer,
+                    call_fake=_make_request)
+
+    def test_get_remaining_page_requests(self) -> None:
+        """Testing ListResource._get_remaining_page_requests"""
+        repositories = self._get_repositories()
+        requests = repositories._get_remaining_page_requests()
+
+        assert requests is not None
+        self.assertEqual(
+            [
+                request.url
+                for request in requests
+            ],
+            [
+                f'{self.server_url}api/repositories/?max-results=2&start=2',
+                f'{self.server_url}api/repositories/?max-results=2&start=4',
+                f'{self.server_url}api/repositories/?max-results=2&start=6',
+                f'{self.server_url}api/repositories/?max-results=2&start=8',
+            ])
+
+    def test_get_remaining_page_requests_without_total_results(self) -> None:
+        """Testing ListResource._get_remaining_page_requests without
+        total_results
+        """
+        repositories = self._get_repositories()
+        repositories.total_results = None
+
+        self.assertIsNone(repositories._get_remaining_page_requests())
+
+    def test_iter_items_with_read_ahead(self) -> None:
+        """Testing ListResource.iter_items with read_ahead"""
+        repositories = self._get_repositories()
+
+        self.assertEqual(
+            [
+                item.id
+                for item in repositories.iter_items(read_ahead=3)
+            ],
+            list(range(10)))
+        self.assertEqual(sorted(self.requested_starts), [0, 2, 4, 6, 8])
+
+    def test_iter_items_with_payload_views(self) -> None:
+        """Testing ListResource.iter_items with payload_views=True"""
+        repositories = self._get_repositories()
+        items = list(repositories.iter_items(payload_views=True))
+
+        self.assertEqual([item.id for item in items], list(range(10)))
+        self.assertIsInstance(items[0], ItemPayloadView)
+
+    def test_iter_pages_with_read_ahead_stops_early(self) -> None:
+        """Testing ListResource.iter_pages with read_ahead when the caller
+        stops early
+        """
+        repositories = self._get_repositories()
+
+        for page in repositories.iter_pages(read_ahead=2):
+            break
+
+        self.assertIs(page, repositories)
+
+    def test_iter_pages_with_read_ahead_and_grown_list(self) -> None:
+        """Testing ListResource.iter_pages with read_ahead when the list
+        grows during iteration
+        """
+        repositories = self._get_repositories()
+        self.total_results = 12
+
+        pages = list(repositories.iter_pages(read_ahead=2))
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 2, 2, 2])
+        self.assertEqual(pages[-1][1].id, 11)
+
+    def test_all_items_with_config(self) -> None:
+        """Testing ListResource.all_items with API_PAGINATION_READ_AHEAD"""
+        client = RBClient(
+            self.server_url,
+            save_cookies=False,
+            allow_caching=False,
+            config=RBToolsConfig(config_dict={
+                'API_PAGINATION_READ_AHEAD': 2,
+            }))
+
+        self.spy_on(client._transport._iter_read_ahead_pages)
+
+        repositories = client.get_root().get_repositories()
+
+        self.assertEqual(
+            [
+                item.id
+                for item in repositories.all_items
+            ],
+            list(range(10)))
+        self.assertSpyCalled(client._transport._iter_read_ahead_pages)
+
+    def test_all_items_without_read_ahead(self) -> None:
+        """Testing ListResource.all_items without read-ahead"""
+        repositories = self._get_repositories()
+
+        self.assertEqual(
+            [
+                item.id
+                for item in repositories.all_items
+            ],
+            list(range(10)))
+        self.assertEqual(self.requested_starts, [0, 2, 4, 6, 8])
+
+    def test_async_iter_items_with_read_ahead(self) -> None:
+        """Testing ListResource.iter_items with read_ahead and
+        AsyncTransport
+        """
+        async def _run() -> list[int]:
+            async with AsyncRBClient(self.server_url,
+                                     save_cookies=False,
+                                     allow_caching=False) as client:
+                root = await client.get_root()
+                repositories = await root.get_repositories()
+
+                return [
+                    item.id
+                    async for item in repositories.iter_items(read_ahead=3)
+                ]
+
+        self.assertEqual(asyncio.run(_run()), list(range(10)))
+
+    def _get_repositories(self) -> ListResource:
+        """Return the first page of the repository list.
+
+        Returns:
+            rbtools.api.resource.ListResource:
+            The first page of the repository list.
+        """
+        client = RBClient(self.server_url,
+                          save_cookies=False,
+                          allow_caching=False)
+
+        return client.get_root().get_repositories()
+
+    def _build_root_payload(self) -> JSONDict:
+        """Return a payload for the root resource.
+
+        Returns:
+            dict:
+            The root resource payload.
+        """
+        return {
+            'stat': 'ok',
+            'capabilities': {},
+            'links': {
+                'repositories': {
+                    'href': f'{self.server_url}api/repositories/',
+                    'method': 'GET',
+                },
+            },
+            'uri_templates': {},
+        }
+
+    def _build_list_payload(
+        self,
+        start: int,
+        max_results: int,
+    ) -> JSONDict:
+        """Return a payload for a page of the repository list.
+
+        Args:
+            start (int):
+                The index of the first item in the page.
+
+            max_results (int):
+                The number of items per page.
+
+        Returns:
+            dict:
+            The list payload.
+        """
+        list_url = f'{self.server_url}api/repositories/'
+        total_results = self.total_results
+        end = min(start + max_results, total_results)
+        links: JSONDict = {}
+
+        if end < total_results:
+            links['next'] = {
+                'href': f'{list_url}?start={end}&max-results={max_results}',
+                'method': 'GET',
+            }
+
+        return {
+            'stat': 'ok',
+            'total_results': total_results,
+            'links': links,
+            'repositories': [
+                {'id': i}
+                for i in range(start, end)
+            ],
+        }
@@ -0,0 +1,151 @@
+"""Unit tests for rbtools.api.projection.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+from rbtools.api.factory import create_resource
+from rbtools.api.projection import (APIProjection,
+                                    apply_projection,
+                                    get_projected_fields)
+from rbtools.api.resource import base as resource_base
+from rbtools.api.tests.base import MockTransport, TestWithPayloads
+
+
+class APIProjectionTests(TestWithPayloads):
+    """Unit tests for rbtools.api.projection.
+
+    Version Added:
+        7.0
+    """
+
+    def test_get_query_args(self) -> None:
+        """Testing APIProjection.get_query_args"""
+        projection = APIProjection(fields=['id', 'summary'],
+                                   links=['draft'],
+                                   expand=['draft'])
+
+        self.assertEqual(
+            projection.get_query_args(),
+            {
+                'expand': 'draft',
+                'only_fields': 'id,summary',
+                'only_links': 'draft',
+            })
+
+    def test_get_query_args_with_empty(self) -> None:
+        """Testing APIProjection.get_query_args with empty fields and links"""
+        projection = APIProjection(fields=[], links=[])
+
+        self.assertEqual(
+            projection.get_query_args(),
+            {
+                'only_fields': '',
+                'only_links': '',
+            })
+
+    def test_apply_projection(self) -> None:
+        """Testing apply_projection"""
+        projection = APIProjection(fields=['id'],
+                                   links=[],
+                                   expand=['draft'])
+
+        self.assertEqual(
+            apply_projection(projection, {
+                'expand': 'repository',
+                'status': 'pending',
+            }),
+            {
+                'expand': 'repository',
+                'only_fields': 'id',
+                'only_links': '',
+                'status': 'pending',
+            })
+
+    def test_apply_projection_without_projection(self) -> None:
+        """Testing apply_projection without a projection"""
+        self.assertEqual(apply_projection(None, {'status': 'pending'}),
+                         {'status': 'pending'})
+
+    def test_get_projected_fields(self) -> None:
+        """Testing get_projected_fields"""
+        self.assertEqual(
+            get_projected_fields('http://localhost:8080/api/review-requests/'
+                                 '?only-fields=id%2Csummary&status=pending'),
+            {'id', 'summary'})
+        self.assertEqual(
+            get_projected_fields('http://localhost:8080/api/review-requests/'
+                                 '?only-fields='),
+            set())
+        self.assertIsNone(
+            get_projected_fields('http://localhost:8080/api/review-requests/'
+                                 '?status=pending'))
+
+    def test_link_methods(self) -> None:
+        """Testing resource link methods with projections"""
+        transport = MockTransport()
+        transport.projections = {
+            'other_link': APIProjection(fields=['id'], links=[]),
+        }
+
+        r = create_resource(
+            transport=transport,
+            payload=self.list_payload,
+            url='')
+
+        request = r.get_other_link()
+        self.assertEqual(request.url,
+                         'http://localhost:8080/api/?only-fields=id'
+                         '&only-links=')
+
+        request = r.get_other_link(only_fields='id,summary')
+        self.assertEqual(request.url,
+                         'http://localhost:8080/api/'
+                         '?only-fields=id%2Csummary&only-links=')
+
+    def test_root_template_methods(self) -> None:
+        """Testing RootResource URI template methods with projections"""
+        transport = MockTransport()
+        transport.projections = {
+            'reviews': APIProjection(fields=['id', 'ship_it']),
+        }
+
+        r = create_resource(
+            transport=transport,
+            payload=self.root_payload,
+            url='',
+            mime_type='application/vnd.reviewboard.org.root+json')
+
+        request = r.get_reviews(review_request_id=1, internal=True)
+        self.assertEqual(
+            request.url,
+            'http://localhost:8080/api/review-requests/1/reviews/'
+            '?only-fields=id%2Cship_it')
+
+    def test_debug_projections(self) -> None:
+        """Testing ItemResource with debug_projections warns when accessing
+        fields left out of the projection
+        """
+        transport = MockTransport()
+        transport.debug_projections = True
+
+        r = create_resource(
+            transport=transport,
+            payload=self.item_payload,
+            url='http://localhost:8080/api/?only-fields=field1')
+
+        self.assertEqual(r.field1, 1)
+
+        with self.assertLogs(resource_base.logger, level='WARNING') as cm:
+            with self.assertRaises(AttributeError):
+                r.summary
+
+        self.assertEqual(
+            cm.output,
+            [
+                'WARNING:rbtools.api.resource.base:The "summary" field was '
+                'accessed on ItemResource, but was not requested with '
+                'only-fields (field1).',
+            ])
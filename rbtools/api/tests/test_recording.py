@@ -0,0 +1,258 @@
+"""Unit tests for recording and replaying API sessions.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from typing import TYPE_CHECKING
+
+from rbtools.api.client import RBClient
+from rbtools.api.errors import APIError, ServerInterfaceError
+from rbtools.api.recording import (RecordedExchange,
+                                   SessionArchive,
+                                   SessionRecorder)
+from rbtools.api.resource import ItemResource, RootResource
+from rbtools.api.tests.base import MockResponse
+from rbtools.api.transport.replay import ReplayTransport
+from rbtools.testing import TestCase
+
+if TYPE_CHECKING:
+    from urllib.request import Request
+
+
+ROOT_MIMETYPE = 'application/vnd.reviewboard.org.root+json'
+
+
+class SessionRecorderTests(TestCase):
+    """Unit tests for rbtools.api.recording.SessionRecorder.
+
+    Version Added:
+        7.0
+    """
+
+    def test_add_exchange_filters_credentials(self) -> None:
+        """Testing SessionRecorder.add_exchange leaves out credentials"""
+        recorder = SessionRecorder('https://reviews.example.com/')
+        recorder.add_exchange(RecordedExchange(
+            method='GET',
+            url='https://reviews.example.com/api/',
+            status=200,
+            request_headers={
+                'Accept': 'application/json',
+                'Authorization': 'token abc123',
+            },
+            response_headers={
+                'Content-Type': ROOT_MIMETYPE,
+                'Set-Cookie': 'rbsessionid=abc123',
+            }))
+
+        exchange = recorder.exchanges[0]
+        self.assertEqual(exchange.request_headers,
+                         {'Accept': 'application/json'})
+        self.assertEqual(exchange.response_headers,
+                         {'Content-Type': ROOT_MIMETYPE})
+
+    def test_save_and_load(self) -> None:
+        """Testing SessionRecorder.save and SessionArchive.load"""
+        recorder = SessionRecorder('https://reviews.example.com/')
+        recorder.add_exchange(RecordedExchange(
+            method='GET',
+            url='https://reviews.example.com/api/',
+            status=200,
+            response_headers={'Content-Type': ROOT_MIMETYPE},
+            body=b'{"stat": "ok"}',
+            elapsed=0.5))
+        recorder.add_exchange(RecordedExchange(
+            method='GET',
+            url='https://reviews.example.com/r/1/diff/raw/',
+            status=200,
+            response_headers={'Content-Type': 'text/x-patch'},
+            body=b'\xff\xfe'))
+
+        for filename in ('session.json', 'session.json.gz'):
+            with tempfile.TemporaryDirectory() as tempdir:
+                path = os.path.join(tempdir, filename)
+                recorder.save(path)
+
+                archive = SessionArchive.load(path)
+
+            self.assertEqual(archive.server_url,
+                             'https://reviews.example.com/')
+            self.assertEqual(archive.exchanges, recorder.exchanges)
+
+    def test_load_with_invalid(self) -> None:
+        """Testing SessionArchive.load with an unsupported file"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'session.json')
+
+            with open(path, 'w', encoding='utf-8') as fp:
+                json.dump({'version': 999}, fp)
+
+            with self.assertRaises(ValueError):
+                SessionArchive.load(path)
+
+
+class SessionArchiveTests(TestCase):
+    """Unit tests for rbtools.api.recording.SessionArchive.
+
+    Version Added:
+        7.0
+    """
+
+    def test_get_exchange(self) -> None:
+        """Testing SessionArchive.get_exchange serves exchanges in order"""
+        url = 'https://reviews.example.com/api/review-requests/1/'
+        exchanges = [
+            RecordedExchange(method='GET', url=url, status=200, body=b'1'),
+            RecordedExchange(method='PUT', url=url, status=200, body=b'2'),
+            RecordedExchange(method='GET', url=url, status=200, body=b'3'),
+        ]
+        archive = SessionArchive(server_url='https://reviews.example.com/',
+                                 exchanges=exchanges)
+
+        self.assertIs(archive.get_exchange('GET', url), exchanges[0])
+        self.assertIs(archive.get_exchange('GET', url), exchanges[2])
+        self.assertIs(archive.get_exchange('GET', url), exchanges[2])
+        self.assertIs(archive.get_exchange('PUT', url), exchanges[1])
+        self.assertIsNone(archive.get_exchange('DELETE', url))
+
+
+class RecordReplayTests(TestCase):
+    """Unit tests for recording with SyncTransport and replaying with
+    ReplayTransport.
+
+    Version Added:
+        7.0
+    """
+
+    server_url = 'https://record.example.com/'
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        api_url = f'{self.server_url}api/'
+
+        self.responses = {
+            api_url: MockResponse(
+                200,
+                {'Content-Type': ROOT_MIMETYPE},
+                json.dumps({
+                    'stat': 'ok',
+                    'capabilities': {},
+                    'links': {
+                        'info': {
+                            'href': f'{api_url}info/',
+                            'method': 'GET',
+                        },
+                    },
+                    'uri_templates': {},
+                })),
+            f'{api_url}info/': MockResponse(
+                200,
+                {'Content-Type': 'application/vnd.reviewboard.org.server-info'
+                                 '+json'},
+                json.dumps({
+                    'stat': 'ok',
+                    'info': {
+                        'product': {
+                            'version': '7.0',
+                        },
+                    },
+                })),
+        }
+
+    def test_record_and_replay(self) -> None:
+        """Testing recording a session and replaying it"""
+        recorder = SessionRecorder(self.server_url)
+        client = RBClient(self.server_url,
+                          save_cookies=False,
+                          allow_caching=False,
+                          session_recorder=recorder)
+        client._transport.server._urlopen = self._urlopen  # type: ignore
+
+        root = client.get_root()
+        root.get_info()
+
+        with self.assertRaises(APIError):
+            client.get_path('missing/')
+
+        self.assertEqual(
+            [
+                (exchange.method, exchange.url, exchange.status)
+                for exchange in recorder.exchanges
+            ],
+            [
+                ('GET', f'{self.server_url}api/', 200),
+                ('GET', f'{self.server_url}api/info/', 200),
+                ('GET', f'{self.server_url}api/missing/', 404),
+            ])
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, 'session.json')
+            recorder.save(path)
+
+            replay_client = RBClient('https://ignored.example.com/',
+                                     transport_cls=ReplayTransport,
+                                     session_file=path,
+                                     latency=0.001)
+
+        root = replay_client.get_root()
+        self.assertIsInstance(root, RootResource)
+
+        info = root.get_info()
+        self.assertIsInstance(info, ItemResource)
+        self.assertEqual(info.product.version, '7.0')
+
+        with self.assertRaises(APIError) as ctx:
+            replay_client.get_path('missing/')
+
+        self.assertEqual(ctx.exception.http_status, 404)
+        self.assertEqual(ctx.exception.error_code, 100)
+
+        with self.assertRaises(ServerInterfaceError):
+            replay_client.get_path('review-requests/')
+
+        request_stats = replay_client.get_request_stats()
+        assert request_stats is not None
+        request_stats.keep_records = True
+
+        replay_client.get_root()
+
+        self.assertEqual(len(request_stats.records), 1)
+        self.assertGreaterEqual(request_stats.records[0].total_time, 0.001)
+
+    def _urlopen(
+        self,
+        request: Request,
+    ) -> MockResponse:
+        """Return a response for a request.
+
+        Args:
+            request (urllib.request.Request):
+                The request being made.
+
+        Returns:
+            rbtools.api.tests.base.MockResponse:
+            The mock response.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The URL has no response registered.
+        """
+        try:
+            return self.responses[request.full_url]
+        except KeyError:
+            raise APIError(http_status=404,
+                           error_code=100,
+                           rsp={
+                               'stat': 'fail',
+                               'err': {
+                                   'code': 100,
+                                   'msg': 'Object does not exist',
+                               },
+                           })
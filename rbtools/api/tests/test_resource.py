@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import copy
+import timeit
+from typing import TYPE_CHECKING
 
 from rbtools.api.factory import create_resource
 from rbtools.api.request import HttpRequest
 from rbtools.api.resource import (CountResource,
+                                  ItemPayloadView,
                                   ItemResource,
                                   ListResource,
                                   RESOURCE_MAP,
@@ -15,9 +18,12 @@ from rbtools.api.resource import (CountResource,
                                   ResourceLinkField,
                                   ResourceListField,
                                   RootResource)
-from rbtools.api.resource.base import _EXTRA_DATA_DOCS_URL
+from rbtools.api.resource.base import _EXTRA_DATA_DOCS_URL, api_stub
 from rbtools.api.tests.base import TestWithPayloads
 
+if TYPE_CHECKING:
+    from typelets.json import JSONDict
+
 
 class _ExpandedItemResource(ItemResource):
     """Resource definition for an expanded item."""
@@ -181,6 +187,73 @@ class ItemResourceTests(TestWithPayloads):
 
         self.assertFalse(hasattr(r, 'create'))
 
+    def test_item_resource_links_with_api_stubs(self) -> None:
+        """Testing item resource link methods replacing API stubs"""
+        class _StubbedItemResource(ItemResource):
+            @api_stub
+            def get_other_link(self, **kwargs) -> ItemResource:
+                """Get the other link."""
+                raise NotImplementedError
+
+            @api_stub
+            def get_missing_link(self, **kwargs) -> ItemResource:
+                """Get a link not in the payload."""
+                raise NotImplementedError
+
+        r = _StubbedItemResource(self.transport, self.item_payload, '',
+                                 token='resource_token')
+
+        # Link methods are set up once for the class, not for each resource.
+        self.assertEqual(
+            [
+                name
+                for name in vars(r)
+                if name.startswith('get_')
+            ],
+            [])
+        self.assertEqual(_StubbedItemResource.get_other_link.__doc__,
+                         'Get the other link.')
+
+        request = r.get_other_link(internal=True)
+        self.assertIsInstance(request, HttpRequest)
+        self.assertEqual(request.url,
+                         self.item_payload['links']['other_link']['href'])
+
+        with self.assertRaises(NotImplementedError):
+            r.get_missing_link()
+
+    def test_item_resource_init_with_many_links(self) -> None:
+        """Testing item resource creation time doesn't grow with the number
+        of links
+        """
+        def _make_payload(num_links: int) -> JSONDict:
+            return {
+                'resource_token': {
+                    'field1': 1,
+                    'links': {
+                        f'link-{i}': {
+                            'href': f'http://localhost:8080/api/links/{i}/',
+                            'method': 'GET',
+                        }
+                        for i in range(num_links)
+                    },
+                },
+            }
+
+        def _time_init(payload: JSONDict) -> float:
+            return min(timeit.repeat(
+                lambda: ItemResource(self.transport, payload, '',
+                                     token='resource_token'),
+                number=200,
+                repeat=5))
+
+        few_links_time = _time_init(_make_payload(2))
+        many_links_time = _time_init(_make_payload(500))
+
+        # This used to set up a method for every link on each resource.
+        # Allow plenty of room for noise.
+        self.assertLess(many_links_time, few_links_time * 5)
+
     def test_getattr_with_expanded_item_resource(self) -> None:
         """Testing ItemResource.__getattr__ with field as expanded item
         resource
@@ -412,6 +485,57 @@ class ListResourceTests(TestWithPayloads):
                     r[index][field],
                     self.list_payload['resource_token'][index][field])
 
+    def test_list_resource_getitem_reuses_items(self) -> None:
+        """Testing ListResource.__getitem__ reuses item resources"""
+        r = create_resource(
+            transport=self.transport,
+            payload=self.list_payload,
+            url='')
+        assert isinstance(r, ListResource)
+
+        self.assertIs(r[0], r[0])
+        self.assertIs(r[-1], r[r.num_items - 1])
+        self.assertEqual(list(r), list(r))
+        self.assertEqual([id(item) for item in r],
+                         [id(item) for item in r])
+
+        with self.assertRaises(IndexError):
+            r[-(r.num_items + 1)]
+
+        with self.assertRaises(IndexError):
+            r[r.num_items]
+
+    def test_list_resource_iter_payload_views(self) -> None:
+        """Testing ListResource.iter_payload_views"""
+        payload = copy.deepcopy(self.list_payload)
+        payload['resource_token'][0]['extra_data'] = {
+            'nested': [{'key': 'value'}],
+        }
+
+        r = create_resource(
+            transport=self.transport,
+            payload=payload,
+            url='')
+        assert isinstance(r, ListResource)
+
+        views = list(r.iter_payload_views())
+
+        self.assertEqual(len(views), r.num_items)
+        self.assertIsInstance(views[0], ItemPayloadView)
+        self.assertEqual(views[0].name, 'testname1')
+        self.assertEqual(views[1]['path'], 'testpath2')
+        self.assertEqual(views[0].extra_data.nested[0].key, 'value')
+        self.assertIsInstance(views[0].extra_data.nested, tuple)
+        self.assertEqual(dict(views[1]),
+                         payload['resource_token'][1])
+        self.assertFalse(hasattr(views[0], '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            views[0].missing
+
+        with self.assertRaises(TypeError):
+            views[0]['name'] = 'new-name'  # type: ignore
+
     def test_list_resource_list_without_total_results(self) -> None:
         """Testing ListResource without total_results"""
         payload = copy.deepcopy(self.list_payload)
@@ -470,6 +594,36 @@ class ListResourceTests(TestWithPayloads):
             self.assertTrue(hasattr(r, method_name))
             self.assertTrue(callable(getattr(r, method_name)))
 
+    def test_root_resource_template_methods(self) -> None:
+        """Testing RootResource API stubs and methods for uri templates
+        without stubs
+        """
+        payload = copy.deepcopy(self.root_payload)
+        payload['uri_templates']['not_a_stub'] = \
+            'http://localhost:8080/api/not-a-stub/{id}/'
+
+        r = create_resource(
+            transport=self.transport,
+            payload=payload,
+            url='',
+            mime_type='application/vnd.reviewboard.org.root+json')
+
+        self.assertNotIn('get_not_a_stub', r.__dict__)
+
+        request = r.get_not_a_stub(id=1, internal=True)
+        self.assertEqual(request.url,
+                         'http://localhost:8080/api/not-a-stub/1/')
+        self.assertIn('get_not_a_stub', r.__dict__)
+
+        request = r.get_reviews(review_request_id=1, internal=True)
+        self.assertEqual(request.url,
+                         'http://localhost:8080/api/review-requests/1/'
+                         'reviews/')
+
+        # Stubs without a uri template are left alone.
+        with self.assertRaises(NotImplementedError):
+            r.get_webhooks()
+
     def test_root_resource_template_params_not_in_query_args(self) -> None:
         """Testing that template parameters are consumed by the URI template
         and not added as query arguments
@@ -0,0 +1,348 @@
+"""Unit tests for rbtools.api.retry.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from email.message import Message
+from email.utils import format_datetime
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError, URLError
+
+from rbtools.api import request as api_request
+from rbtools.api.errors import APIError, ServerInterfaceError
+from rbtools.api.request import HttpRequest, ReviewBoardServer
+from rbtools.api.retry import (RateLimiter,
+                               RetryPolicy,
+                               get_rate_limiter,
+                               parse_retry_after)
+from rbtools.api.tests.base import MockResponse
+from rbtools.config import RBToolsConfig
+from rbtools.testing import TestCase
+
+if TYPE_CHECKING:
+    from urllib.request import Request
+
+
+class RetryPolicyTests(TestCase):
+    """Unit tests for rbtools.api.retry.RetryPolicy.
+
+    Version Added:
+        7.0
+    """
+
+    def test_should_retry_with_status(self) -> None:
+        """Testing RetryPolicy.should_retry with HTTP status codes"""
+        policy = RetryPolicy(max_retries=2)
+
+        for status in (429, 502, 503, 504):
+            self.assertTrue(policy.should_retry(attempt=0,
+                                                idempotent=True,
+                                                status=status))
+
+        self.assertFalse(policy.should_retry(attempt=0,
+                                             idempotent=True,
+                                             status=500))
+        self.assertFalse(policy.should_retry(attempt=2,
+                                             idempotent=True,
+                                             status=503))
+
+    def test_should_retry_with_status_not_idempotent(self) -> None:
+        """Testing RetryPolicy.should_retry with HTTP status codes for
+        requests that aren't idempotent
+        """
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.should_retry(attempt=0,
+                                            idempotent=False,
+                                            status=429))
+        self.assertFalse(policy.should_retry(attempt=0,
+                                             idempotent=False,
+                                             status=503))
+
+    def test_should_retry_with_error(self) -> None:
+        """Testing RetryPolicy.should_retry with connection errors"""
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.should_retry(attempt=0,
+                                            idempotent=True,
+                                            error=ConnectionResetError()))
+        self.assertTrue(policy.should_retry(attempt=0,
+                                            idempotent=True,
+                                            error=TimeoutError()))
+        self.assertFalse(policy.should_retry(attempt=0,
+                                             idempotent=False,
+                                             error=ConnectionResetError()))
+        self.assertFalse(policy.should_retry(attempt=0,
+                                             idempotent=True,
+                                             error=ValueError()))
+
+    def test_get_delay(self) -> None:
+        """Testing RetryPolicy.get_delay uses capped exponential backoff"""
+        policy = RetryPolicy(backoff=1.0, max_delay=5.0)
+
+        for attempt, max_delay in ((0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)):
+            for i in range(20):
+                delay = policy.get_delay(attempt=attempt)
+
+                assert delay is not None
+                self.assertGreaterEqual(delay, 0.0)
+                self.assertLessEqual(delay, max_delay)
+
+    def test_get_delay_with_retry_after(self) -> None:
+        """Testing RetryPolicy.get_delay with Retry-After"""
+        policy = RetryPolicy(max_delay=10.0)
+
+        self.assertEqual(policy.get_delay(attempt=0, retry_after='3'), 3.0)
+        self.assertIsNone(policy.get_delay(attempt=0, retry_after='60'))
+
+
+class RateLimiterTests(TestCase):
+    """Unit tests for rbtools.api.retry.RateLimiter.
+
+    Version Added:
+        7.0
+    """
+
+    def test_acquire(self) -> None:
+        """Testing RateLimiter.acquire waits once the burst is used"""
+        limiter = RateLimiter(100, burst=2)
+
+        self.assertEqual(limiter.acquire(), 0.0)
+        self.assertEqual(limiter.acquire(), 0.0)
+
+        delay = limiter.acquire()
+        self.assertGreater(delay, 0.0)
+        self.assertLessEqual(delay, 0.01)
+
+    def test_get_rate_limiter_shared(self) -> None:
+        """Testing get_rate_limiter returns a shared limiter per server"""
+        limiter = get_rate_limiter('https://rate1.example.com/api/', 5)
+
+        self.assertIs(get_rate_limiter('https://rate1.example.com/api/', 10),
+                      limiter)
+        self.assertEqual(limiter.rate, 5)
+        self.assertIsNot(
+            get_rate_limiter('https://rate2.example.com/api/', 5),
+            limiter)
+
+
+class ParseRetryAfterTests(TestCase):
+    """Unit tests for rbtools.api.retry.parse_retry_after.
+
+    Version Added:
+        7.0
+    """
+
+    def test_with_seconds(self) -> None:
+        """Testing parse_retry_after with seconds"""
+        self.assertEqual(parse_retry_after('120'), 120.0)
+        self.assertEqual(parse_retry_after(' 0 '), 0.0)
+
+    def test_with_date(self) -> None:
+        """Testing parse_retry_after with an HTTP date"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay is not None
+        self.assertGreater(delay, 25.0)
+        self.assertLessEqual(delay, 30.0)
+
+        self.assertEqual(
+            parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'),
+            0.0)
+
+    def test_with_invalid(self) -> None:
+        """Testing parse_retry_after with an invalid value"""
+        self.assertIsNone(parse_retry_after('soon'))
+
+
+class ReviewBoardServerRetryTests(TestCase):
+    """Unit tests for retrying requests in ReviewBoardServer.
+
+    Version Added:
+        7.0
+    """
+
+    def test_retry_with_status(self) -> None:
+        """Testing ReviewBoardServer.make_request retries on HTTP 503"""
+        server = self._create_server()
+        statuses = [503, 503, 200]
+        server._urlopen = self._make_urlopen(statuses)  # type: ignore
+
+        with self.assertLogs(api_request.logger, level='WARNING') as cm:
+            rsp = server.make_request(HttpRequest(server.url))
+
+        assert rsp is not None
+        self.assertEqual(rsp.status, 200)
+        self.assertEqual(statuses, [])
+        self.assertEqual(len(cm.output), 2)
+
+        record = server.request_stats.records[0]
+        self.assertEqual(record.retries, 2)
+        self.assertEqual(record.status, 200)
+
+    def test_retry_gives_up(self) -> None:
+        """Testing ReviewBoardServer.make_request stops retrying after
+        HTTP_MAX_RETRIES
+        """
+        server = self._create_server(HTTP_MAX_RETRIES=1)
+        statuses = [502, 502, 200]
+        server._urlopen = self._make_urlopen(statuses)  # type: ignore
+
+        with self.assertLogs(api_request.logger, level='WARNING'):
+            with self.assertRaises(APIError) as ctx:
+                server.make_request(HttpRequest(server.url))
+
+        self.assertEqual(ctx.exception.http_status, 502)
+        self.assertEqual(statuses, [200])
+        self.assertEqual(server.request_stats.records[0].retries, 1)
+
+    def test_retry_post(self) -> None:
+        """Testing ReviewBoardServer.make_request only retries POST requests
+        when they were not processed
+        """
+        server = self._create_server()
+
+        statuses = [503, 200]
+        server._urlopen = self._make_urlopen(statuses)  # type: ignore
+
+        with self.assertRaises(APIError):
+            server.make_request(HttpRequest(server.url, method='POST'))
+
+        self.assertEqual(statuses, [200])
+
+        statuses = [429, 200]
+        server._urlopen = self._make_urlopen(statuses)  # type: ignore
+
+        with self.assertLogs(api_request.logger, level='WARNING'):
+            rsp = server.make_request(HttpRequest(server.url, method='POST'))
+
+        assert rsp is not None
+        self.assertEqual(rsp.status, 200)
+
+        statuses = [503, 200]
+        server._urlopen = self._make_urlopen(statuses)  # type: ignore
+
+        request = HttpRequest(server.url, method='POST')
+        request.idempotent = True
+
+        with self.assertLogs(api_request.logger, level='WARNING'):
+            rsp = server.make_request(request)
+
+        assert rsp is not None
+        self.assertEqual(rsp.status, 200)
+
+    def test_retry_with_connection_error(self) -> None:
+        """Testing ReviewBoardServer.make_request retries on connection
+        errors
+        """
+        server = self._create_server()
+        attempts = []
+
+        def _urlopen(
+            request: Request,
+        ) -> MockResponse:
+            attempts.append(request)
+
+            if len(attempts) == 1:
+                raise URLError(ConnectionResetError(104, 'Reset by peer'))
+
+            return MockResponse(200, {}, '')
+
+        server._urlopen = _urlopen  # type: ignore
+
+        with self.assertLogs(api_request.logger, level='WARNING'):
+            rsp = server.make_request(HttpRequest(server.url))
+
+        assert rsp is not None
+        self.assertEqual(rsp.status, 200)
+        self.assertEqual(len(attempts), 2)
+
+    def test_no_retry_with_other_url_error(self) -> None:
+        """Testing ReviewBoardServer.make_request does not retry on other
+        URL errors
+        """
+        server = self._create_server()
+        attempts = []
+
+        def _urlopen(
+            request: Request,
+        ) -> MockResponse:
+            attempts.append(request)
+
+            raise URLError('Name or service not known')
+
+        server._urlopen = _urlopen  # type: ignore
+
+        with self.assertRaises(ServerInterfaceError):
+            server.make_request(HttpRequest(server.url))
+
+        self.assertEqual(len(attempts), 1)
+
+    def _create_server(
+        self,
+        **config: object,
+    ) -> ReviewBoardServer:
+        """Return a new server for the tests.
+
+        Args:
+            **config (dict):
+                Configuration to set for the server.
+
+        Returns:
+            rbtools.api.request.ReviewBoardServer:
+            The new server.
+        """
+        server = ReviewBoardServer(
+            'https://retry.example.com/',
+            save_cookies=False,
+            config=RBToolsConfig(config_dict=dict({
+                'HTTP_RETRY_BACKOFF': 0,
+            }, **config)))
+        server.request_stats.keep_records = True
+
+        return server
+
+    def _make_urlopen(
+        self,
+        statuses: list[int],
+    ) -> object:
+        """Return a fake urlopen responding with the given statuses.
+
+        Args:
+            statuses (list of int):
+                The HTTP status codes to respond with, in order. Each will be
+                removed from the list once used.
+
+        Returns:
+            callable:
+            The fake urlopen function.
+        """
+        def _urlopen(
+            request: Request,
+        ) -> MockResponse:
+            status = statuses.pop(0)
+
+            if status != 200:
+                headers = Message()
+                headers['Retry-After'] = '0'
+
+                raise HTTPError(
+                    request.full_url, status, 'Error', headers,
+                    io.BytesIO(json.dumps({
+                        'stat': 'fail',
+                        'err': {
+                            'code': 100,
+                            'msg': 'Error',
+                        },
+                    }).encode('utf-8')))
+
+            return MockResponse(200, {}, '')
+
+        return _urlopen
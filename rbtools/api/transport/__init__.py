@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
     from typing import Any
 
-    from rbtools.api.resource import Resource, RootResource
+    from rbtools.api.instrumentation import HTTPRequestStats
+    from rbtools.api.projection import APIProjection, APIProjections
+    from rbtools.api.request import HttpRequest
+    from rbtools.api.resource import ListResource, Resource, RootResource
+    from rbtools.api.resource.base import ItemPayloadView, TItemResource
 
 
 class Transport:
@@ -23,6 +30,36 @@ class Transport:
     asynchronous implementation of the transport.
     """
 
+    #: The default number of pages to fetch ahead when iterating lists.
+    #:
+    #: This is used by :py:attr:`ListResource.all_pages
+    #: <rbtools.api.resource.ListResource.all_pages>` and
+    #: :py:attr:`ListResource.all_items
+    #: <rbtools.api.resource.ListResource.all_items>`. A value of ``0``
+    #: disables read-ahead.
+    #:
+    #: Version Added:
+    #:     7.0
+    pagination_read_ahead: int = 0
+
+    #: Projections to apply to requests for resources.
+    #:
+    #: This maps resource names (such as ``review_request``) to the fields,
+    #: links, and expansions to request. See :py:mod:`rbtools.api.projection`.
+    #:
+    #: Version Added:
+    #:     7.0
+    projections: APIProjections = {}
+
+    #: Whether to warn when accessing fields left out of a projection.
+    #:
+    #: This is useful for finding fields that need to be added to a
+    #: projection.
+    #:
+    #: Version Added:
+    #:     7.0
+    debug_projections: bool = False
+
     def __init__(
         self,
         url: str,
@@ -160,6 +197,27 @@ class Transport:
         """Log out of a session on the Review Board server."""
         raise NotImplementedError
 
+    def get_projection(
+        self,
+        name: str,
+    ) -> APIProjection | None:
+        """Return the projection for a resource.
+
+        Version Added:
+            7.0
+
+        Args:
+            name (str):
+                The name of the resource's link or URI template, such as
+                ``review_request``.
+
+        Returns:
+            rbtools.api.projection.APIProjection:
+            The projection for the resource, or ``None`` if the full payload
+            should be requested.
+        """
+        return self.projections.get(name)
+
     def execute_request_method(
         self,
         method: Callable[..., Any],
@@ -186,6 +244,160 @@ class Transport:
         """
         return method(*args, **kwargs)
 
+    def iter_list_pages(
+        self,
+        list_resource: ListResource[TItemResource],
+        *,
+        read_ahead: (int | None) = None,
+    ) -> Iterator[ListResource[TItemResource]]:
+        """Iterate through all pages of a list resource.
+
+        This backs :py:attr:`ListResource.all_pages
+        <rbtools.api.resource.ListResource.all_pages>`. Transports with
+        different interfaces (such as asynchronous transports) can override
+        this to return a suitable iterator.
+
+        Version Added:
+            7.0
+
+        Args:
+            list_resource (rbtools.api.resource.ListResource):
+                The first page of the list resource.
+
+            read_ahead (int, optional):
+                The number of pages to fetch concurrently ahead of the page
+                being consumed. If not provided,
+                :py:attr:`pagination_read_ahead` will be used.
+
+        Yields:
+            rbtools.api.resource.ListResource:
+            Each page of the list resource, starting with ``list_resource``.
+        """
+        if read_ahead is None:
+            read_ahead = self.pagination_read_ahead
+
+        page = list_resource
+
+        if read_ahead > 0:
+            requests = list_resource._get_remaining_page_requests()
+
+            if requests:
+                for page in self._iter_read_ahead_pages(
+                        list_resource, requests, read_ahead):
+                    yield page
+
+                # If the list grew while we were fetching it, continue on
+                # from the last page.
+                try:
+                    page = page.get_next()
+                except StopIteration:
+                    return
+
+        while True:
+            yield page
+
+            try:
+                page = page.get_next()
+            except StopIteration:
+                break
+
+    def iter_list_items(
+        self,
+        list_resource: ListResource[TItemResource],
+        *,
+        read_ahead: (int | None) = None,
+        payload_views: bool = False,
+    ) -> Iterator[TItemResource] | Iterator[ItemPayloadView]:
+        """Iterate through all items in all pages of a list resource.
+
+        This backs :py:attr:`ListResource.all_items
+        <rbtools.api.resource.ListResource.all_items>`. Transports with
+        different interfaces (such as asynchronous transports) can override
+        this to return a suitable iterator.
+
+        Version Added:
+            7.0
+
+        Args:
+            list_resource (rbtools.api.resource.ListResource):
+                The first page of the list resource.
+
+            read_ahead (int, optional):
+                The number of pages to fetch concurrently ahead of the page
+                being consumed. If not provided,
+                :py:attr:`pagination_read_ahead` will be used.
+
+            payload_views (bool, optional):
+                Whether to yield read-only views of the item payloads,
+                instead of item resources.
+
+        Yields:
+            rbtools.api.resource.ItemResource or
+            rbtools.api.resource.ItemPayloadView:
+            Each item in the list.
+        """
+        for page in self.iter_list_pages(list_resource,
+                                         read_ahead=read_ahead):
+            if payload_views:
+                yield from page.iter_payload_views()
+            else:
+                yield from page
+
+    def _iter_read_ahead_pages(
+        self,
+        list_resource: ListResource[TItemResource],
+        requests: list[HttpRequest],
+        read_ahead: int,
+    ) -> Iterator[ListResource[TItemResource]]:
+        """Iterate through pages, fetching several ahead concurrently.
+
+        Version Added:
+            7.0
+
+        Args:
+            list_resource (rbtools.api.resource.ListResource):
+                The first page of the list resource.
+
+            requests (list of rbtools.api.request.HttpRequest):
+                The requests for each remaining page, in order.
+
+            read_ahead (int):
+                The maximum number of pages to fetch at once.
+
+        Yields:
+            rbtools.api.resource.ListResource:
+            Each page of the list resource, starting with ``list_resource``.
+        """
+        def _fetch_page(
+            request: HttpRequest,
+        ) -> ListResource[TItemResource]:
+            return self.execute_request_method(lambda: request)
+
+        pending_requests = iter(requests)
+        pending: deque[Future[ListResource[TItemResource]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=read_ahead,
+                                      thread_name_prefix='rbtools-pages')
+
+        try:
+            def _queue_next() -> None:
+                request = next(pending_requests, None)
+
+                if request is not None:
+                    pending.append(executor.submit(_fetch_page, request))
+
+            for i in range(read_ahead):
+                _queue_next()
+
+            yield list_resource
+
+            while pending:
+                page = pending.popleft().result()
+                _queue_next()
+
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def enable_cache(
         self,
         cache_location: (str | None) = None,
@@ -232,3 +444,19 @@ class Transport:
             Whether a local session cookie exists for this server.
         """
         raise NotImplementedError
+
+    def get_request_stats(self) -> HTTPRequestStats | None:
+        """Return statistics on the HTTP requests made by the transport.
+
+        Callbacks can be registered on the result to receive information on
+        each completed request.
+
+        Version Added:
+            7.0
+
+        Returns:
+            rbtools.api.instrumentation.HTTPRequestStats:
+            The request statistics, or ``None`` if the transport doesn't
+            record them.
+        """
+        return None
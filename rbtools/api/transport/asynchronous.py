@@ -0,0 +1,389 @@
+"""Transport for asynchronous API access.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+
+from rbtools.api.request import HttpRequest
+from rbtools.api.transport.sync import SyncTransport
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+    from typing import Any, TypeVar
+
+    from rbtools.api.resource import ListResource, Resource, RootResource
+    from rbtools.api.resource.base import ItemPayloadView, TItemResource
+
+    _T = TypeVar('_T')
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTransport(SyncTransport):
+    """An asynchronous transport layer for the API client.
+
+    This provides the same resources as :py:class:`SyncTransport`, but
+    all methods that communicate with the server return awaitables, and
+    :py:attr:`ListResource.all_pages
+    <rbtools.api.resource.ListResource.all_pages>` and
+    :py:attr:`ListResource.all_items
+    <rbtools.api.resource.ListResource.all_items>` return asynchronous
+    iterators. For example:
+
+    .. code-block:: python
+
+       client = AsyncRBClient('https://reviews.example.com/')
+       root = await client.get_root()
+       review_requests = await root.get_review_requests()
+
+       async for review_request in review_requests.all_items:
+           draft = await review_request.get_draft()
+
+    HTTP requests are performed on a pool of worker threads through the
+    standard :py:class:`~rbtools.api.request.ReviewBoardServer`, so
+    authentication, cookies, keep-alive connections, and the API cache all
+    behave the same as with :py:class:`SyncTransport`.
+
+    The network I/O itself is still blocking. Each request in flight
+    occupies one worker thread until it completes, so at most
+    ``max_workers`` requests (:py:attr:`DEFAULT_MAX_WORKERS` by default)
+    run at once. Any further requests wait in a queue for a free worker,
+    even though the event loop itself is never blocked.
+
+    Version Added:
+        7.0
+    """
+
+    #: The default maximum number of concurrent HTTP requests.
+    DEFAULT_MAX_WORKERS = 8
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The executor used to perform HTTP requests.
+    _executor: ThreadPoolExecutor
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            url (str):
+                The URL of the Review Board server.
+
+            *args (tuple):
+                Positional arguments to pass to the base class.
+
+            max_workers (int, optional):
+                The maximum number of HTTP requests that can be performed
+                concurrently. This is the number of worker threads in the
+                pool. Requests beyond this wait for a free thread.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the base class. See
+                :py:class:`SyncTransport` for the supported arguments.
+        """
+        super().__init__(url, *args, **kwargs)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='rbtools-api')
+
+    async def get_root(  # type: ignore[override]
+        self,
+        *args,
+        **kwargs,
+    ) -> RootResource:
+        """Return the root API resource.
+
+        Args:
+            *args (tuple, unused):
+                Positional arguments (may be used by the transport
+                implementation).
+
+            **kwargs (dict, unused):
+                Keyword arguments (may be used by the transport
+                implementation).
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The root API resource.
+        """
+        return await self._run_in_executor(super().get_root, *args, **kwargs)
+
+    async def get_path(  # type: ignore[override]
+        self,
+        path: str,
+        *args,
+        **kwargs,
+    ) -> Resource:
+        """Return the API resource at the provided path.
+
+        Args:
+            path (str):
+                The path to the API resource.
+
+            *args (tuple, unused):
+                Additional positional arguments.
+
+            **kwargs (dict, unused):
+                Additional keyword arguments.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource at the given path.
+        """
+        return await self._run_in_executor(super().get_path, path,
+                                           *args, **kwargs)
+
+    async def get_url(  # type: ignore[override]
+        self,
+        url: str,
+        *args,
+        **kwargs,
+    ) -> Resource:
+        """Return the API resource at the provided URL.
+
+        Args:
+            url (str):
+                The URL to the API resource.
+
+            *args (tuple, unused):
+                Additional positional arguments.
+
+            **kwargs (dict, unused):
+                Additional keyword arguments.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource at the given path.
+        """
+        return await self._run_in_executor(super().get_url, url,
+                                           *args, **kwargs)
+
+    async def logout(self) -> None:  # type: ignore[override]
+        """Log out of a session on the Review Board server."""
+        await self._run_in_executor(super().logout)
+
+    def execute_request_method(
+        self,
+        method: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> Awaitable[Any]:
+        """Execute a method and return an awaitable for the result.
+
+        The method is called immediately, so any errors building the
+        request (such as :py:exc:`StopIteration` from
+        :py:meth:`ListResource.get_next()
+        <rbtools.api.resource.ListResource.get_next>`) are raised directly.
+        The HTTP request itself is performed when the result is awaited.
+
+        Args:
+            method (callable):
+                The method to run.
+
+            *args (tuple):
+                Positional arguments to pass to the method.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the method.
+
+        Returns:
+            collections.abc.Awaitable:
+            An awaitable for the result. If the method returns an
+            HttpRequest, this will resolve to a resource constructed from
+            the response. If it returns another value, that value will be
+            the result.
+        """
+        request = method(*args, **kwargs)
+
+        if isinstance(request, HttpRequest):
+            return self._run_in_executor(self._execute_request, request)
+
+        return self._as_awaitable(request)
+
+    async def iter_list_pages(  # type: ignore[override]
+        self,
+        list_resource: ListResource[TItemResource],
+        *,
+        read_ahead: (int | None) = None,
+    ) -> AsyncIterator[ListResource[TItemResource]]:
+        """Iterate through all pages of a list resource.
+
+        Args:
+            list_resource (rbtools.api.resource.ListResource):
+                The first page of the list resource.
+
+            read_ahead (int, optional):
+                The number of pages to fetch concurrently ahead of the page
+                being consumed. If not provided,
+                :py:attr:`pagination_read_ahead` will be used.
+
+        Yields:
+            rbtools.api.resource.ListResource:
+            Each page of the list resource, starting with ``list_resource``.
+        """
+        if read_ahead is None:
+            read_ahead = self.pagination_read_ahead
+
+        page = list_resource
+
+        if read_ahead > 0:
+            requests = list_resource._get_remaining_page_requests()
+
+            if requests:
+                pending_requests = iter(requests)
+                pending: deque[asyncio.Future[Any]] = deque()
+
+                def _queue_next() -> None:
+                    request = next(pending_requests, None)
+
+                    if request is not None:
+                        pending.append(asyncio.ensure_future(
+                            self._run_in_executor(self._execute_request,
+                                                  request)))
+
+                try:
+                    for i in range(read_ahead):
+                        _queue_next()
+
+                    yield page
+
+                    while pending:
+                        page = await pending.popleft()
+                        _queue_next()
+
+                        yield page
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+                # If the list grew while we were fetching it, continue on
+                # from the last page.
+                try:
+                    next_page = page.get_next()
+                except StopIteration:
+                    return
+
+                page = await next_page
+
+        while True:
+            yield page
+
+            try:
+                next_page = page.get_next()
+            except StopIteration:
+                break
+
+            page = await next_page
+
+    async def iter_list_items(  # type: ignore[override]
+        self,
+        list_resource: ListResource[TItemResource],
+        *,
+        read_ahead: (int | None) = None,
+        payload_views: bool = False,
+    ) -> AsyncIterator[TItemResource] | AsyncIterator[ItemPayloadView]:
+        """Iterate through all items in all pages of a list resource.
+
+        Args:
+            list_resource (rbtools.api.resource.ListResource):
+                The first page of the list resource.
+
+            read_ahead (int, optional):
+                The number of pages to fetch concurrently ahead of the page
+                being consumed. If not provided,
+                :py:attr:`pagination_read_ahead` will be used.
+
+            payload_views (bool, optional):
+                Whether to yield read-only views of the item payloads,
+                instead of item resources.
+
+        Yields:
+            rbtools.api.resource.ItemResource or
+            rbtools.api.resource.ItemPayloadView:
+            Each item in the list.
+        """
+        async for page in self.iter_list_pages(list_resource,
+                                               read_ahead=read_ahead):
+            items = page.iter_payload_views() if payload_views else page
+
+            for item in items:
+                yield item
+
+    def close(self) -> None:
+        """Shut down the transport.
+
+        This will stop the worker threads once any pending requests have
+        finished, and close any idle connections to the server.
+        """
+        self._executor.shutdown(wait=True)
+        self.server.close_connections()
+
+    async def aclose(self) -> None:
+        """Shut down the transport without blocking the event loop.
+
+        This will stop the worker threads once any pending requests have
+        finished, and close any idle connections to the server.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _run_in_executor(
+        self,
+        func: Callable[..., _T],
+        *args,
+        **kwargs,
+    ) -> _T:
+        """Run a blocking function on the worker threads.
+
+        Args:
+            func (callable):
+                The function to run.
+
+            *args (tuple):
+                Positional arguments to pass to the function.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the function.
+
+        Returns:
+            object:
+            The result of the function.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor,
+                                          partial(func, *args, **kwargs))
+
+    async def _as_awaitable(
+        self,
+        value: _T,
+    ) -> _T:
+        """Return a value from an awaitable.
+
+        Args:
+            value (object):
+                The value to return.
+
+        Returns:
+            object:
+            The provided value.
+        """
+        return value
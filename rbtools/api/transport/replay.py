@@ -0,0 +1,423 @@
+"""Transport for replaying recorded API sessions.
+
+Version Added:
+    7.0
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from rbtools.api.decode import decode_response
+from rbtools.api.errors import ServerInterfaceError, create_api_error
+from rbtools.api.factory import create_resource
+from rbtools.api.instrumentation import (HTTPRequestRecord,
+                                         HTTPRequestStats,
+                                         get_url_template,
+                                         track_request)
+from rbtools.api.recording import SessionArchive
+from rbtools.api.request import HttpRequest
+from rbtools.api.transport import Transport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Literal
+
+    from rbtools.api.projection import APIProjections
+    from rbtools.api.resource import Resource, RootResource
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayTransport(Transport):
+    """A transport serving responses from a recorded API session.
+
+    Sessions are recorded by setting a
+    :py:class:`~rbtools.api.recording.SessionRecorder` on a
+    :py:class:`~rbtools.api.transport.sync.SyncTransport`. Replaying them
+    doesn't require a network connection or a Review Board server, making
+    it possible to reproduce the API behavior of a command offline.
+
+    Latency can be injected into each response, either using the time
+    recorded for the request or a fixed delay, in order to simulate a real
+    server.
+
+    Requests are tracked in the :py:class:`~rbtools.api.instrumentation.
+    HTTPRequestStats` returned by :py:meth:`get_request_stats`, allowing
+    request counts and times to be compared against the recorded session.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The recorded session being replayed.
+    archive: SessionArchive
+
+    #: The latency to inject into each response.
+    #:
+    #: This is either ``recorded`` to use the time recorded for each request,
+    #: a fixed number of seconds, or ``None`` to respond immediately.
+    latency: Literal['recorded'] | float | None
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        session_file: (str | None) = None,
+        archive: (SessionArchive | None) = None,
+        latency: (Literal['recorded'] | float | None) = None,
+        projections: (APIProjections | None) = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the transport.
+
+        Either ``session_file`` or ``archive`` must be provided.
+
+        Args:
+            url (str):
+                The URL of the Review Board server. This is ignored in favor
+                of the URL recorded in the session.
+
+            *args (tuple):
+                Positional arguments to pass to the base class.
+
+            session_file (str, optional):
+                The filename of the session archive to replay.
+
+            archive (rbtools.api.recording.SessionArchive, optional):
+                A loaded session archive to replay.
+
+            latency (str or float, optional):
+                The latency to inject into each response. See
+                :py:attr:`latency`.
+
+            projections (dict, optional):
+                Projections to apply to requests for resources. These must
+                match those used when recording the session.
+
+            **kwargs (dict):
+                Additional keyword arguments. Options for connecting to a
+                server are accepted and ignored.
+
+        Raises:
+            ValueError:
+                Neither a session file or archive was provided, or the
+                session file was not valid.
+        """
+        if archive is None:
+            if not session_file:
+                raise ValueError('A session file or archive must be '
+                                 'provided.')
+
+            try:
+                archive = SessionArchive.load(session_file)
+            except OSError as e:
+                raise ValueError(
+                    f'Unable to read the session archive {session_file}: '
+                    f'{e}')
+
+        super().__init__(archive.server_url)
+
+        self.archive = archive
+        self.latency = latency
+        self._request_stats = HTTPRequestStats()
+
+        if projections:
+            self.projections = projections
+
+        # Keep the URL consistent with that of a SyncTransport, so that
+        # paths resolve to the recorded URLs.
+        self._api_url = archive.server_url.rstrip('/') + '/api/'
+
+    def get_root(
+        self,
+        *args,
+        **kwargs,
+    ) -> RootResource:
+        """Return the root API resource.
+
+        Args:
+            *args (tuple, unused):
+                Unused positional arguments.
+
+            **kwargs (dict, unused):
+                Unused keyword arguments.
+
+        Returns:
+            rbtools.api.resource.RootResource:
+            The root API resource.
+        """
+        resource = self._execute_request(HttpRequest(self._api_url))
+
+        from rbtools.api.resource import RootResource
+        assert isinstance(resource, RootResource)
+
+        return resource
+
+    def get_path(
+        self,
+        path: str,
+        *args,
+        **kwargs,
+    ) -> Resource:
+        """Return the API resource at the provided path.
+
+        Args:
+            path (str):
+                The path to the API resource.
+
+            *args (tuple, unused):
+                Unused positional arguments.
+
+            **kwargs (dict):
+                Query arguments to include in the request.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource at the given path.
+        """
+        if not path.endswith('/'):
+            path = path + '/'
+
+        if path.startswith('/'):
+            path = path[1:]
+
+        resource = self._execute_request(
+            HttpRequest(self._api_url + path, query_args=kwargs))
+        assert resource is not None
+
+        return resource
+
+    def get_url(
+        self,
+        url: str,
+        *args,
+        **kwargs,
+    ) -> Resource:
+        """Return the API resource at the provided URL.
+
+        Args:
+            url (str):
+                The URL to the API resource.
+
+            *args (tuple, unused):
+                Unused positional arguments.
+
+            **kwargs (dict):
+                Query arguments to include in the request.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource at the given URL.
+        """
+        if not url.endswith('/'):
+            url = url + '/'
+
+        resource = self._execute_request(HttpRequest(url, query_args=kwargs))
+        assert resource is not None
+
+        return resource
+
+    def login(
+        self,
+        username: (str | None) = None,
+        password: (str | None) = None,
+        api_token: (str | None) = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Log in to the Review Board server.
+
+        Replayed sessions are always logged in, so this does nothing.
+
+        Args:
+            username (str, unused):
+                The username to log in with.
+
+            password (str, unused):
+                The password to log in with.
+
+            api_token (str, unused):
+                The API token to log in with.
+
+            *args (tuple, unused):
+                Unused positional arguments.
+
+            **kwargs (dict, unused):
+                Unused keyword arguments.
+        """
+        pass
+
+    def logout(self) -> None:
+        """Log out of a session on the Review Board server.
+
+        This does nothing for replayed sessions.
+        """
+        pass
+
+    def execute_request_method(
+        self,
+        method: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Execute a method and return the resulting resource.
+
+        Args:
+            method (callable):
+                The method to run.
+
+            *args (tuple):
+                Positional arguments to pass to the method.
+
+            **kwargs (dict):
+                Keyword arguments to pass to the method.
+
+        Returns:
+            rbtools.api.resource.Resource or object:
+            If the method returns an HttpRequest, this will construct a
+            resource from the recorded response. If it returns another
+            value, that value will be returned directly.
+        """
+        request = method(*args, **kwargs)
+
+        if isinstance(request, HttpRequest):
+            return self._execute_request(request)
+
+        return request
+
+    def enable_cache(
+        self,
+        cache_location: (str | None) = None,
+        in_memory: bool = False,
+    ) -> None:
+        """Enable caching for all future HTTP requests.
+
+        Replayed sessions aren't cached, so this does nothing.
+
+        Args:
+            cache_location (str, unused):
+                The filename to store the cache in.
+
+            in_memory (bool, unused):
+                Whether to keep the cache data in memory.
+        """
+        pass
+
+    def disable_cache(self) -> None:
+        """Disable caching for all future HTTP requests.
+
+        Replayed sessions aren't cached, so this does nothing.
+        """
+        pass
+
+    def has_session_cookie(self) -> bool:
+        """Return whether a local session cookie exists for this server.
+
+        Replayed sessions are always logged in.
+
+        Returns:
+            bool:
+            ``True``, always.
+        """
+        return True
+
+    def get_request_stats(self) -> HTTPRequestStats:
+        """Return statistics on the replayed requests.
+
+        Returns:
+            rbtools.api.instrumentation.HTTPRequestStats:
+            The request statistics.
+        """
+        return self._request_stats
+
+    def _execute_request(
+        self,
+        request: HttpRequest,
+    ) -> Resource | None:
+        """Serve a request from the recorded session.
+
+        Args:
+            request (rbtools.api.request.HttpRequest):
+                The HTTP request.
+
+        Returns:
+            rbtools.api.resource.Resource:
+            The resource object, if available.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                An API error was recorded for the request.
+
+            rbtools.api.errors.ServerInterfaceError:
+                The request was not recorded in the session.
+        """
+        logger.debug('Replaying HTTP %s request to %s',
+                     request.method, request.url)
+
+        record = HTTPRequestRecord(method=request.method,
+                                   url=request.url,
+                                   url_template=get_url_template(request.url))
+
+        try:
+            with track_request(record):
+                exchange = self.archive.get_exchange(request.method,
+                                                     request.url)
+
+                if exchange is None:
+                    raise ServerInterfaceError(
+                        f'No response was recorded for HTTP '
+                        f'{request.method} {request.url}')
+
+                latency = self.latency
+
+                if latency == 'recorded':
+                    time.sleep(exchange.elapsed)
+                elif latency:
+                    time.sleep(latency)
+
+                record.status = exchange.status
+                record.bytes_received = len(exchange.body)
+        finally:
+            self._request_stats.add_record(record)
+
+        if exchange.error is not None:
+            raise create_api_error(exchange.status,
+                                   exchange.error.get('error_code'),
+                                   exchange.error.get('rsp'),
+                                   exchange.error.get('message'))
+
+        if request.method == 'DELETE':
+            return None
+
+        headers = {
+            key.lower(): value
+            for key, value in exchange.response_headers.items()
+        }
+        mime_type = headers['content-type']
+
+        return create_resource(
+            transport=self,
+            payload=decode_response(exchange.body, mime_type),
+            url=request.url,
+            mime_type=mime_type,
+            item_mime_type=headers.get('item-content-type'))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object.
+
+        Returns:
+            str:
+            A string representation of the object.
+        """
+        return '<%s(url=%r, exchanges=%d)>' % (
+            self.__class__.__name__,
+            self.url,
+            len(self.archive.exchanges))
@@ -3,21 +3,29 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
-from rbtools.api.decode import decode_response
+from rbtools.api.decode import DECODER_MAP, decode_response, get_json_decoder
+from rbtools.api.errors import APIError
 from rbtools.api.factory import create_resource
+from rbtools.api.recording import RecordedExchange
 from rbtools.api.request import (AuthCallback,
                                  HttpRequest,
                                  OTPCallback,
                                  ReviewBoardServer,
                                  WebLoginCallback)
 from rbtools.api.transport import Transport
+from rbtools.utils.encoding import force_unicode
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any
 
+    from rbtools.api.decode import Decoder
+    from rbtools.api.instrumentation import HTTPRequestStats
+    from rbtools.api.projection import APIProjections
+    from rbtools.api.recording import SessionRecorder
     from rbtools.api.resource import Resource, RootResource
     from rbtools.config import RBToolsConfig
 
@@ -37,8 +45,22 @@ class SyncTransport(Transport):
 
     The optional session can be used to specify an 'rbsessionid' to use when
     authenticating with reviewboard.
+
+    If a :py:class:`~rbtools.api.recording.SessionRecorder` is provided, all
+    API requests and responses will be recorded to it, for later replay
+    through :py:class:`~rbtools.api.transport.replay.ReplayTransport`.
     """
 
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The recorder for API requests and responses, if recording.
+    #:
+    #: Version Added:
+    #:     7.0
+    session_recorder: SessionRecorder | None
+
     def __init__(
         self,
         url: str,
@@ -64,6 +86,9 @@ class SyncTransport(Transport):
         proxy_authorization: (str | None) = None,
         config: (RBToolsConfig | None) = None,
         web_login_callback: (WebLoginCallback | None) = None,
+        cache_stale_max_age: int = 0,
+        projections: (APIProjections | None) = None,
+        session_recorder: (SessionRecorder | None) = None,
         **kwargs,
     ) -> None:
         """Initialize the transport.
@@ -152,6 +177,30 @@ class SyncTransport(Transport):
                 Version Added:
                     6.0
 
+            cache_stale_max_age (int, optional):
+                The maximum number of seconds an expired cached response may
+                be used while it's revalidated in the background. If 0,
+                expired responses are always revalidated first.
+
+                This should only be used for read-only operations.
+
+                Version Added:
+                    7.0
+
+            projections (dict, optional):
+                Projections to apply to requests for resources. See
+                :py:attr:`projections`.
+
+                Version Added:
+                    7.0
+
+            session_recorder (rbtools.api.recording.SessionRecorder,
+                              optional):
+                A recorder for all API requests and responses.
+
+                Version Added:
+                    7.0
+
             **kwargs (dict):
                 Keyword arguments to pass to the base class.
         """
@@ -160,6 +209,8 @@ class SyncTransport(Transport):
         self.allow_caching = allow_caching
         self.cache_location = cache_location
         self.in_memory_cache = in_memory_cache
+        self.cache_stale_max_age = cache_stale_max_age
+        self.session_recorder = session_recorder
         self.server = ReviewBoardServer(
             self.url,
             cookie_file=cookie_file,
@@ -180,6 +231,22 @@ class SyncTransport(Transport):
             client_cert=client_cert,
             proxy_authorization=proxy_authorization,
             config=config)
+        self.pagination_read_ahead = \
+            self.server.config.API_PAGINATION_READ_AHEAD
+        self.debug_projections = self.server.config.API_DEBUG_PROJECTIONS
+
+        if projections:
+            self.projections = projections
+
+        # Only override the default decoders if a specific JSON decoder was
+        # configured, so that changes to DECODER_MAP are still honored.
+        json_decoder = self.server.config.API_JSON_DECODER
+        self._decoder_map: (dict[str, Decoder] | None) = None
+
+        if json_decoder and json_decoder != 'auto':
+            self._decoder_map = dict(
+                DECODER_MAP,
+                **{'application/json': get_json_decoder(json_decoder)})
 
         # Default to enabling the cache. This is safe for all versions of
         # Review Board >= 2.0.14. Caching will be automatically disabled if
@@ -376,7 +443,13 @@ class SyncTransport(Transport):
         logger.debug('Making HTTP %s request to %s',
                      request.method, request.url)
 
-        rsp = self.server.make_request(request)
+        body: bytes | None = None
+
+        if self.session_recorder is None:
+            rsp = self.server.make_request(request)
+        else:
+            rsp, body = self._make_recorded_request(request)
+
         assert rsp is not None
 
         info = rsp.headers
@@ -387,7 +460,22 @@ class SyncTransport(Transport):
             # DELETE calls don't return any data. Everything else should.
             return None
         else:
-            payload = decode_response(rsp.read(), mime_type)
+            # Responses served from the API cache keep their decoded payload
+            # in memory, so repeated requests don't need to decode it again.
+            cache_entry = getattr(rsp, 'cache_entry', None)
+
+            if (cache_entry is not None and
+                cache_entry.decoded_payload is not None):
+                payload = cache_entry.decoded_payload
+            else:
+                if body is None:
+                    body = rsp.read()
+
+                payload = decode_response(body, mime_type,
+                                          decoder_map=self._decoder_map)
+
+                if cache_entry is not None:
+                    cache_entry.decoded_payload = payload
 
             return create_resource(
                 transport=self,
@@ -396,6 +484,72 @@ class SyncTransport(Transport):
                 mime_type=mime_type,
                 item_mime_type=item_content_type)
 
+    def _make_recorded_request(
+        self,
+        request: HttpRequest,
+    ) -> tuple[Any, bytes]:
+        """Make an HTTP request, recording the request and response.
+
+        Version Added:
+            7.0
+
+        Args:
+            request (rbtools.api.request.HttpRequest):
+                The HTTP request.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (object):
+                    The HTTP response.
+
+                1 (bytes):
+                    The body of the response.
+
+        Raises:
+            rbtools.api.errors.APIError:
+                The server returned an error. This will be recorded.
+        """
+        recorder = self.session_recorder
+        assert recorder is not None
+
+        exchange = RecordedExchange(
+            method=request.method,
+            url=request.url,
+            status=0,
+            request_headers=dict(request.headers),
+            request_fields=[
+                force_unicode(name)
+                for name in (*request._fields, *request._files)
+            ])
+        start = time.perf_counter()
+
+        try:
+            rsp = self.server.make_request(request)
+            assert rsp is not None
+
+            body = rsp.read()
+        except APIError as e:
+            exchange.status = e.http_status or 0
+            exchange.error = {
+                'error_code': e.error_code,
+                'message': e.message,
+                'rsp': e.rsp,
+            }
+            exchange.elapsed = time.perf_counter() - start
+            recorder.add_exchange(exchange)
+            raise
+
+        exchange.status = rsp.status
+        exchange.response_headers = dict(rsp.headers.items())
+        exchange.body = body
+        exchange.elapsed = time.perf_counter() - start
+        recorder.add_exchange(exchange)
+
+        return rsp, body
+
     def enable_cache(
         self,
         cache_location: (str | None) = None,
@@ -418,8 +572,10 @@ class SyncTransport(Transport):
             cache_location = cache_location or self.cache_location
             in_memory = in_memory or self.in_memory_cache
 
-            self.server.enable_cache(cache_location=cache_location,
-                                     in_memory=in_memory)
+            self.server.enable_cache(
+                cache_location=cache_location,
+                in_memory=in_memory,
+                stale_max_age=self.cache_stale_max_age)
 
     def disable_cache(self) -> None:
         """Disable caching for all future HTTP requests.
@@ -446,6 +602,21 @@ class SyncTransport(Transport):
         """
         return self.server.has_session_cookie()
 
+    def get_request_stats(self) -> HTTPRequestStats:
+        """Return statistics on the HTTP requests made by the transport.
+
+        Callbacks can be registered on the result to receive information on
+        each completed request.
+
+        Version Added:
+            7.0
+
+        Returns:
+            rbtools.api.instrumentation.HTTPRequestStats:
+            The request statistics.
+        """
+        return self.server.request_stats
+
     def __repr__(self) -> str:
         """Return a string representation of the object.
 
@@ -28,7 +28,7 @@ from rbtools.diffs.tools.registry import diff_tools_registry
 
 if TYPE_CHECKING:
     import argparse
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
     from rbtools.api.capabilities import Capabilities
     from rbtools.api.resource import (
@@ -246,6 +246,19 @@ class SCMClientCommitHistoryItem(TypedDict):
     #:     str
     committer_date: NotRequired[str | None]
 
+    #: The diff of the commit against its parent.
+    #:
+    #: This is only set by :py:meth:`BaseSCMClient.
+    #: get_commit_history_with_diffs` and :py:meth:`BaseSCMClient.
+    #: iter_commit_history_with_diffs`.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bytes
+    diff: NotRequired[bytes | None]
+
 
 class SCMClientCommitMessage(TypedDict):
     """A commit message from a local repository.
@@ -1290,6 +1303,90 @@ class BaseSCMClient:
         """
         raise NotImplementedError
 
+    def get_commit_history_with_diffs(
+        self,
+        revisions: SCMClientRevisionSpec,
+        **kwargs,
+    ) -> Sequence[SCMClientCommitHistoryItem] | None:
+        """Return the commit history between the given revisions with diffs.
+
+        Each history entry will contain the ``diff`` of the commit against its
+        parent.
+
+        This collects the entries from
+        :py:meth:`iter_commit_history_with_diffs`.
+
+        Version Added:
+            7.0
+
+        Args:
+            revisions (dict):
+                The parsed revision spec to use to generate the history.
+
+            **kwargs (dict):
+                Keyword arguments to pass to :py:meth:`diff`, such as
+                ``include_files`` or ``exclude_patterns``.
+
+        Returns:
+            list of dict:
+            The history entries, or ``None`` if there is no history.
+        """
+        return list(self.iter_commit_history_with_diffs(revisions,
+                                                        **kwargs)) or None
+
+    def iter_commit_history_with_diffs(
+        self,
+        revisions: SCMClientRevisionSpec,
+        *,
+        history: (Sequence[SCMClientCommitHistoryItem] | None) = None,
+        **kwargs,
+    ) -> Iterator[SCMClientCommitHistoryItem]:
+        """Iterate through the commit history with diffs.
+
+        Each history entry is yielded as soon as its diff is generated,
+        allowing callers to start working with earlier commits while later
+        ones are still being diffed.
+
+        By default, this calls :py:meth:`get_commit_history` and then
+        :py:meth:`diff` for each commit. Subclasses can override this to
+        generate the diffs more efficiently.
+
+        Version Added:
+            7.0
+
+        Args:
+            revisions (dict):
+                The parsed revision spec to use to generate the history.
+
+            history (list of dict, optional):
+                The history already returned by :py:meth:`get_commit_history`
+                for these revisions. If provided, the history won't be
+                looked up again.
+
+            **kwargs (dict):
+                Keyword arguments to pass to :py:meth:`diff`, such as
+                ``include_files`` or ``exclude_patterns``.
+
+        Yields:
+            dict:
+            Each history entry, in order, with its ``diff`` set.
+        """
+        if history is None:
+            history = self.get_commit_history(revisions) or []
+
+        for history_entry in history:
+            diff_info = self.diff(
+                revisions={
+                    'base': history_entry['parent_id'],
+                    'tip': history_entry['commit_id'],
+                },
+                with_parent_diff=False,
+                **kwargs)
+
+            history_entry['diff'] = diff_info['diff']
+
+            yield history_entry
+
     def _get_p_number(
         self,
         base_path: str,
@@ -5,7 +5,10 @@ from __future__ import annotations
 import logging
 import os
 import re
+import subprocess
 import sys
+import threading
+import weakref
 from gettext import gettext as _
 from typing import TYPE_CHECKING
 
@@ -37,8 +40,8 @@ from rbtools.utils.process import (RunProcessError,
                                    run_process)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
-    from typing import ClassVar
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from typing import ClassVar, IO
 
     from rbtools.diffs.patches import Patch, PatchAuthor
     from rbtools.clients.base.scmclient import (
@@ -84,6 +87,376 @@ def get_git_candidates(
     return candidates
 
 
+#: Escape sequences used by Git when quoting paths.
+#:
+#: Version Added:
+#:     7.0
+_GIT_PATH_ESCAPES: Mapping[bytes, bytes] = {
+    b'a': b'\a',
+    b'b': b'\b',
+    b'f': b'\f',
+    b'n': b'\n',
+    b'r': b'\r',
+    b't': b'\t',
+    b'v': b'\v',
+}
+
+
+_GIT_PATH_ESCAPE_RE = re.compile(rb'\\([0-7]{3}|.)')
+
+
+def _unquote_git_path(
+    path: bytes,
+) -> bytes:
+    """Return a path from Git output with any C-style quoting removed.
+
+    Git quotes paths containing special characters, such as control
+    characters, double quotes, or backslashes (and non-ASCII characters, if
+    ``core.quotepath`` is enabled).
+
+    Version Added:
+        7.0
+
+    Args:
+        path (bytes):
+            The path, which may be quoted.
+
+    Returns:
+        bytes:
+        The unquoted path.
+    """
+    if len(path) < 2 or not path.startswith(b'"') or not path.endswith(b'"'):
+        return path
+
+    def _unescape(
+        m: re.Match[bytes],
+    ) -> bytes:
+        value = m.group(1)
+
+        if len(value) == 3:
+            return bytes([int(value, 8)])
+
+        return _GIT_PATH_ESCAPES.get(value, value)
+
+    return _GIT_PATH_ESCAPE_RE.sub(_unescape, path[1:-1])
+
+
+def _normalize_git_config_key(
+    key: str,
+) -> str:
+    """Return a normalized Git configuration key.
+
+    Section and variable names are case-insensitive, while subsection names
+    are case-sensitive.
+
+    Version Added:
+        7.0
+
+    Args:
+        key (str):
+            The configuration key, such as ``branch.<name>.merge``.
+
+    Returns:
+        str:
+        The normalized key.
+    """
+    section, _sep, rest = key.partition('.')
+    subsection, _sep, name = rest.rpartition('.')
+
+    if subsection:
+        return f'{section.lower()}.{subsection}.{name.lower()}'
+    else:
+        return f'{section.lower()}.{name.lower()}'
+
+
+class GitObjectReader:
+    """A long-lived reader for the sizes and contents of Git blobs.
+
+    This runs a single :command:`git cat-file --batch-command` process, which
+    serves every lookup over one pipe, rather than spawning :command:`git`
+    for each one. This requires Git 2.36 or higher.
+
+    Only blobs can be looked up. Any other type of object is treated as an
+    error, as it would be by :command:`git cat-file blob`.
+
+    The process is started on first use and stopped when calling
+    :py:meth:`close`, when the reader is garbage-collected, or at exit.
+
+    Lookups may be made from any thread.
+
+    Version Added:
+        7.0
+    """
+
+    ######################
+    # Instance variables #
+    ######################
+
+    #: The directory the process runs in.
+    cwd: str | None
+
+    #: The git executable to use.
+    git: str
+
+    def __init__(
+        self,
+        *,
+        git: str,
+        cwd: (str | None) = None,
+    ) -> None:
+        """Initialize the reader.
+
+        Args:
+            git (str):
+                The git executable to use.
+
+            cwd (str, optional):
+                The directory to run the process in.
+        """
+        self.git = git
+        self.cwd = cwd
+
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    def get_size(
+        self,
+        obj: str,
+    ) -> int:
+        """Return the size of a blob.
+
+        Args:
+            obj (str):
+                The name of the object, such as a blob SHA.
+
+        Returns:
+            int:
+            The size of the blob, in bytes.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The object could not be found, was not a blob, or the
+                process failed.
+        """
+        with self._lock:
+            return self._send_command('info', obj)[0]
+
+    def get_content(
+        self,
+        obj: str,
+    ) -> bytes:
+        """Return the contents of a blob.
+
+        The contents are read directly from the pipe into the result, so
+        large blobs are only held in memory once.
+
+        Args:
+            obj (str):
+                The name of the object, such as a blob SHA.
+
+        Returns:
+            bytes:
+            The contents of the blob.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The object could not be found, was not a blob, or the
+                process failed.
+        """
+        with self._lock:
+            size, stdout = self._send_command('contents', obj)
+
+            try:
+                content = stdout.read(size)
+
+                # The contents are followed by a newline.
+                stdout.read(1)
+            except OSError as e:
+                self.close()
+
+                raise SCMError(
+                    _('Unable to read {obj} from git cat-file: {error}')
+                    .format(obj=obj, error=e))
+
+            if len(content) != size:
+                self.close()
+
+                raise SCMError(
+                    _('git cat-file exited while reading {obj}.')
+                    .format(obj=obj))
+
+            return content
+
+    def close(self) -> None:
+        """Stop the process.
+
+        It will be started again if needed.
+        """
+        finalizer = self._finalizer
+
+        if finalizer is not None:
+            finalizer()
+
+        self._process = None
+        self._finalizer = None
+
+    def _send_command(
+        self,
+        command: str,
+        obj: str,
+    ) -> tuple[int, IO[bytes]]:
+        """Send a command for a blob and read the response header.
+
+        If the object isn't a blob, any contents will be skipped before
+        raising an error, so the process can be used for further lookups.
+
+        The caller must hold the lock.
+
+        Args:
+            command (str):
+                The command to send (``info`` or ``contents``).
+
+            obj (str):
+                The name of the object.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (int):
+                    The size of the blob, in bytes.
+
+                1 (io.BufferedReader):
+                    The process's output, positioned at any contents.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The object could not be found, was not a blob, or the
+                process failed.
+        """
+        if '\n' in obj:
+            raise SCMError(_('Invalid Git object name: {obj!r}')
+                           .format(obj=obj))
+
+        process = self._process
+
+        if process is None:
+            process = self._start()
+
+        stdin = process.stdin
+        stdout = process.stdout
+        assert stdin is not None
+        assert stdout is not None
+
+        try:
+            stdin.write(f'{command} {obj}\n'.encode('utf-8'))
+            stdin.flush()
+
+            header = stdout.readline()
+        except OSError as e:
+            self.close()
+
+            raise SCMError(
+                _('Unable to communicate with git cat-file: {error}')
+                .format(error=e))
+
+        if not header:
+            self.close()
+
+            raise SCMError(_('git cat-file exited unexpectedly.'))
+
+        # The header is "<oid> <type> <size>" for a found object, or
+        # "<obj> missing" or "<obj> ambiguous" otherwise.
+        parts = header.rsplit(None, 2)
+
+        if len(parts) != 3 or not parts[2].isdigit():
+            raise SCMError(_('Could not find Git object {obj}.')
+                           .format(obj=obj))
+
+        size = int(parts[2])
+
+        if parts[1] != b'blob':
+            if command == 'contents':
+                # Skip the contents and the newline following them.
+                try:
+                    skipped = len(stdout.read(size + 1))
+                except OSError:
+                    skipped = -1
+
+                if skipped != size + 1:
+                    self.close()
+
+            raise SCMError(
+                _('Git object {obj} is a {type}, not a blob.')
+                .format(obj=obj,
+                        type=force_unicode(parts[1])))
+
+        return size, stdout
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        """Start the process.
+
+        Returns:
+            subprocess.Popen:
+            The new process.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The process could not be started.
+        """
+        logger.debug('Starting git cat-file --batch-command in %s',
+                     self.cwd)
+
+        try:
+            process = subprocess.Popen(
+                [self.git, 'cat-file', '--batch-command'],
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=True)
+        except OSError as e:
+            raise SCMError(
+                _('Unable to start git cat-file: {error}')
+                .format(error=e))
+
+        self._process = process
+        self._finalizer = weakref.finalize(self, _stop_process, process)
+
+        return process
+
+
+def _stop_process(
+    process: subprocess.Popen[bytes],
+) -> None:
+    """Stop a git cat-file process.
+
+    Closing its input lets the process exit on its own. If it doesn't, it
+    will be killed.
+
+    Version Added:
+        7.0
+
+    Args:
+        process (subprocess.Popen):
+            The process to stop.
+    """
+    for fp in (process.stdin, process.stdout):
+        if fp is not None:
+            try:
+                fp.close()
+            except OSError:
+                pass
+
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
 class GitPatcher(SCMClientPatcher['GitClient']):
     """A patcher that applies Git patches to a tree.
 
@@ -363,6 +736,19 @@ class GitClient(BaseSCMClient):
     _NUL: ClassVar[str] = '\x00'
     _FIELD_SEP: ClassVar[str] = '\x1f'
 
+    #: The history entry fields and their git log format placeholders.
+    _HISTORY_LOG_FIELDS: ClassVar[Mapping[str, str]] = {
+        'commit_id': '%H',
+        'parent_id': '%P',
+        'author_name': '%an',
+        'author_email': '%ae',
+        'author_date': '%ad',
+        'committer_name': '%cn',
+        'committer_email': '%ce',
+        'committer_date': '%cd',
+        'commit_message': '%B',
+    }
+
     ######################
     # Instance variables #
     ######################
@@ -373,21 +759,78 @@ class GitClient(BaseSCMClient):
     #: The git executable to use.
     _git: str
 
+    #: The cached Git configuration, mapping normalized keys to values.
+    #:
+    #: Version Added:
+    #:     7.0
+    _git_config: dict[str, str] | None
+
     #: The path to the .git directory.
     _git_dir: str | None
 
+    #: The cached global Git configuration.
+    #:
+    #: Version Added:
+    #:     7.0
+    _git_global_config: dict[str, str] | None
+
     #: The top-level directory of the git checkout.
     _git_toplevel: str | None
 
     #: The remote info for git-svn repositories.
     _git_svn_remote_info: Mapping[str, str] | None
 
+    #: The installed git version, if it could be determined.
+    #:
+    #: This is only valid once :py:attr:`_git_version_checked` is set.
+    #:
+    #: Version Added:
+    #:     7.0
+    _git_version: tuple[int, int, int] | None
+
+    #: Whether the installed git version has been checked.
+    #:
+    #: Version Added:
+    #:     7.0
+    _git_version_checked: bool
+
     #: Whether the git version is at least 1.8.0.
     _git_version_at_least_180: bool
 
     #: The name of the current branch HEAD.
     _head_ref: str
 
+    #: The cached paths and HEAD reference for the current directory.
+    #:
+    #: This is a tuple of the directory these were computed in, the git
+    #: directory, the top-level directory, and the HEAD reference. The
+    #: latter two may be ``None`` if they couldn't be determined in a single
+    #: :command:`git rev-parse`.
+    #:
+    #: Version Added:
+    #:     7.0
+    _repository_paths: (
+        tuple[str, str | None, str | None, str | None] | None
+    )
+
+    #: Whether the results of get_local_path() can be reused.
+    #:
+    #: This allows :py:meth:`get_repository_info` to skip looking up the
+    #: repository again right after :py:meth:`get_local_path` was called.
+    #:
+    #: Version Added:
+    #:     7.0
+    _local_path_reusable: bool
+
+    #: The reader for object sizes and contents.
+    #:
+    #: This is ``None`` until first used, or if the installed git does not
+    #: support it.
+    #:
+    #: Version Added:
+    #:     7.0
+    _object_reader: GitObjectReader | None
+
     #: The repository type.
     #:
     #: This will be one of TYPE_GIT, TYPE_GIT_SVN, or TYPE_GIT_P4.
@@ -405,8 +848,15 @@ class GitClient(BaseSCMClient):
         # Store the 'correct' way to invoke git, just plain old 'git' by
         # default.
         self._git = ''
+        self._git_config = None
+        self._git_global_config = None
         self._git_toplevel = None
         self._git_svn_remote_info = None
+        self._git_version = None
+        self._git_version_checked = False
+        self._local_path_reusable = False
+        self._object_reader = None
+        self._repository_paths = None
         self._type = None
 
     @property
@@ -468,7 +918,29 @@ class GitClient(BaseSCMClient):
             ``True`` if the user's installed git supports ``-c``.
         """
         if not hasattr(self, '_git_version_at_least_180'):
-            self._git_version_at_least_180 = False
+            git_version = self._get_git_version()
+
+            self._git_version_at_least_180 = (git_version is not None and
+                                              git_version >= (1, 8, 0))
+
+        return self._git_version_at_least_180
+
+    def _get_git_version(self) -> tuple[int, int, int] | None:
+        """Return the installed version of git.
+
+        This will execute ``git --version`` on the first call and cache the
+        result.
+
+        Version Added:
+            7.0
+
+        Returns:
+            tuple:
+            The major, minor, and patch versions of git, or ``None`` if the
+            version could not be determined.
+        """
+        if not self._git_version_checked:
+            self._git_version_checked = True
 
             version_str = (
                 self._run_git(['version'],
@@ -482,13 +954,35 @@ class GitClient(BaseSCMClient):
                 m = re.search(r'(\d+)\.(\d+)\.(\d+)', version_str)
 
                 if m:
-                    git_version = (int(m.group(1)),
-                                   int(m.group(2)),
-                                   int(m.group(3)))
+                    self._git_version = (int(m.group(1)),
+                                         int(m.group(2)),
+                                         int(m.group(3)))
 
-                    self._git_version_at_least_180 = (git_version >= (1, 8, 0))
+        return self._git_version
 
-        return self._git_version_at_least_180
+    def _get_object_reader(self) -> GitObjectReader | None:
+        """Return the reader for object sizes and contents.
+
+        The reader will be created on first use.
+
+        Version Added:
+            7.0
+
+        Returns:
+            GitObjectReader:
+            The reader, or ``None`` if the installed git is older than 2.36.
+        """
+        reader = self._object_reader
+
+        if reader is None:
+            git_version = self._get_git_version()
+
+            if git_version is not None and git_version >= (2, 36, 0):
+                reader = GitObjectReader(git=self.git,
+                                         cwd=self._git_toplevel)
+                self._object_reader = reader
+
+        return reader
 
     def parse_revision_spec(
         self,
@@ -547,10 +1041,10 @@ class GitClient(BaseSCMClient):
         if n_revs == 0:
             # No revisions were passed in. Start with HEAD, and find the
             # tracking branch automatically.
-            head_ref = self._rev_parse(self.get_head_ref())[0]
             parent_branch = self._get_parent_branch()
             remote = self._find_remote(parent_branch)
-            parent_ref = self._rev_parse(parent_branch)[0]
+            head_ref, parent_ref = self._rev_parse([self.get_head_ref(),
+                                                    parent_branch])
 
             merge_base = self._rev_list_youngest_remote_ancestor(
                 parent_ref, remote)
@@ -653,10 +1147,12 @@ class GitClient(BaseSCMClient):
             str:
             The filesystem path of the repository on the client system.
         """
-        # Temporarily reset the toplevel. This is necessary for making things
-        # work correctly in unit tests where we may be moving the cwd around a
-        # lot.
+        # Temporarily reset the toplevel and cached repository state. This is
+        # necessary for making things work correctly in unit tests where we
+        # may be moving the cwd around a lot.
         self._git_toplevel = None
+        self._local_path_reusable = False
+        self._repository_paths = None
 
         # NOTE: This can be removed once check_dependencies() is mandatory.
         if not self.has_dependencies(expect_checked=True):
@@ -665,7 +1161,7 @@ class GitClient(BaseSCMClient):
 
             return None
 
-        git_dir = self._get_git_dir()
+        git_dir, git_toplevel, _head_ref = self._get_repository_paths()
         self._git_dir = git_dir
 
         if git_dir is None:
@@ -677,26 +1173,16 @@ class GitClient(BaseSCMClient):
 
         # Running in directories other than the top level of
         # of a work-tree would result in broken diffs on the server.
-        if self.bare:
-            git_toplevel = os.path.abspath(git_dir)
-        else:
-            process_result = self._run_git(['rev-parse', '--show-toplevel'],
-                                           ignore_errors=True)
-
-            stderr = process_result.stderr_bytes.read()
-
-            # Top level might not work on old git version se we use git dir
+        if self.bare or not git_toplevel:
+            # Top level might not work on old git version so we use git dir
             # to find it.
-            if (stderr.startswith((b'fatal:', b'cygdrive')) or
-                not os.path.isdir(git_dir)):
-                git_toplevel = git_dir
-            else:
-                git_toplevel = process_result.stdout.read().strip()
+            git_toplevel = git_dir
 
-            git_toplevel = os.path.abspath(git_toplevel)
+        git_toplevel = os.path.abspath(git_toplevel)
 
         assert git_toplevel
         self._git_toplevel = git_toplevel
+        self._local_path_reusable = True
 
         return git_toplevel
 
@@ -707,20 +1193,36 @@ class GitClient(BaseSCMClient):
             rbtools.clients.base.repository.RepositoryInfo:
             The repository info structure.
         """
-        local_path = self.get_local_path()
+        repository_paths = self._repository_paths
+
+        if (self._local_path_reusable and
+            repository_paths is not None and
+            repository_paths[0] == os.getcwd()):
+            # The repository was just looked up by get_local_path(), so
+            # there's no need to look it up again.
+            local_path = self._git_toplevel
+        else:
+            local_path = self.get_local_path()
+
+        self._local_path_reusable = False
 
         if not local_path:
             return None
 
         assert self._git_dir
 
-        self._head_ref = (
-            self._run_git(['symbolic-ref', '-q', 'HEAD'],
-                          ignore_errors=True)
-            .stdout
-            .read()
-            .strip()
-        )
+        head_ref = self._get_repository_paths()[2]
+
+        if head_ref is None:
+            head_ref = (
+                self._run_git(['symbolic-ref', '-q', 'HEAD'],
+                              ignore_errors=True)
+                .stdout
+                .read()
+                .strip()
+            )
+
+        self._head_ref = head_ref
 
         # We know we have something we can work with. Let's find out
         # what it is. We'll try SVN first, but only if there's a .git/svn
@@ -866,30 +1368,88 @@ class GitClient(BaseSCMClient):
             str:
             The path to the :file:`.git` directory for the repository.
         """
-        try:
-            git_dir = (
-                self._run_git(['rev-parse', '--git-dir'],
-                              redirect_stderr=True,
-                              ignore_errors=True)
-                .stdout
-                .read()
-                .rstrip('\n')
-            )
-        except RunProcessError:
-            return None
+        return self._get_repository_paths()[0]
 
-        if not os.path.isdir(git_dir):
-            return None
+    def _get_repository_paths(
+        self,
+    ) -> tuple[str | None, str | None, str | None]:
+        """Return the paths and HEAD reference for the current directory.
 
-        try:
-            # In the case of a worktree, find the common gitdir.
-            with open(os.path.join(git_dir, 'commondir')) as f:
-                common_dir = f.read().strip()
-                git_dir = os.path.abspath(os.path.join(git_dir, common_dir))
-        except OSError:
-            pass
+        These are all looked up with a single :command:`git rev-parse` and
+        cached until the current directory changes.
+
+        Version Added:
+            7.0
 
-        return git_dir
+        Returns:
+            tuple:
+            A 3-tuple of:
+
+            Tuple:
+                0 (str):
+                    The path to the :file:`.git` directory for the
+                    repository, or ``None`` if not in a repository. For
+                    worktrees, this is the common directory.
+
+                1 (str):
+                    The top-level directory of the work tree, or ``None`` if
+                    it couldn't be determined (such as in a bare repository).
+
+                2 (str):
+                    The full name of the HEAD reference, an empty string if
+                    HEAD is detached, or ``None`` if it couldn't be
+                    determined (such as on an unborn branch).
+        """
+        cwd = os.getcwd()
+        repository_paths = self._repository_paths
+
+        if repository_paths is not None and repository_paths[0] == cwd:
+            return repository_paths[1:]
+
+        # Anything cached for another directory may no longer apply.
+        self._git_config = None
+
+        git_dir: str | None = None
+        git_toplevel: str | None = None
+        head_ref: str | None = None
+
+        # Each option prints a line, and git stops at the first that fails.
+        # --show-toplevel fails in bare repositories, and HEAD fails on
+        # unborn branches.
+        result = self._run_git(
+            ['rev-parse', '--git-dir', '--show-toplevel',
+             '--symbolic-full-name', 'HEAD'],
+            ignore_errors=True)
+        lines = result.stdout.read().splitlines()
+
+        if lines and os.path.isdir(lines[0]):
+            git_dir = lines[0]
+
+            try:
+                # In the case of a worktree, find the common gitdir.
+                with open(os.path.join(git_dir, 'commondir')) as f:
+                    common_dir = f.read().strip()
+                    git_dir = os.path.abspath(os.path.join(git_dir,
+                                                           common_dir))
+            except OSError:
+                pass
+
+            # Top level might not work on old git versions, which may report
+            # cygdrive paths.
+            if (len(lines) > 1 and
+                not result.stderr_bytes.read().startswith(b'cygdrive')):
+                git_toplevel = lines[1]
+
+            if len(lines) > 2 and result.exit_code == 0:
+                if lines[2] == 'HEAD':
+                    # HEAD is detached.
+                    head_ref = ''
+                else:
+                    head_ref = lines[2]
+
+        self._repository_paths = (cwd, git_dir, git_toplevel, head_ref)
+
+        return git_dir, git_toplevel, head_ref
 
     def _strip_heads_prefix(
         self,
@@ -1322,6 +1882,169 @@ class GitClient(BaseSCMClient):
         if include_files:
             include_files = ['--', *include_files]
 
+        git_args, diff_cmd_params = self._get_diff_options(
+            no_renames=no_renames,
+            find_renames_threshold=find_renames_threshold)
+
+        diff_cmd = [*git_args, 'diff', *diff_cmd_params]
+
+        diff_lines = (
+            self._run_git([*diff_cmd, rev_range, *include_files],
+                          ignore_errors=True,
+                          log_debug_output_on_error=False)
+            .stdout_bytes
+            .readlines()
+        )
+
+        if exclude_patterns:
+            # Filter the excluded files out of the full diff, rather than
+            # running `git diff` separately for every other file.
+            diff_lines = self._filter_diff_files(
+                diff_lines,
+                exclude_patterns=exclude_patterns,
+                base_dir=git_toplevel)
+
+        if self._type == self.TYPE_GIT_SVN:
+            return self.make_svn_diff(merge_base, diff_lines)
+        elif self._type == self.TYPE_GIT_P4:
+            return self.make_perforce_diff(merge_base, diff_lines)
+        else:
+            return b''.join(diff_lines)
+
+    def _filter_diff_files(
+        self,
+        diff_lines: Sequence[bytes],
+        *,
+        exclude_patterns: Sequence[str],
+        base_dir: str,
+    ) -> list[bytes]:
+        """Filter files matching exclude patterns out of a diff.
+
+        Each file in the diff is matched against the patterns using its new
+        path, which is the destination of any rename or copy.
+
+        Version Added:
+            7.0
+
+        Args:
+            diff_lines (list of bytes):
+                The lines of the diff generated by :command:`git diff`.
+
+            exclude_patterns (list of str):
+                The normalized shell-style glob patterns of files to exclude.
+
+            base_dir (str):
+                The top-level directory of the repository, which paths in the
+                diff are relative to.
+
+        Returns:
+            list of bytes:
+            The lines of the diff for the files that weren't excluded.
+        """
+        result: list[bytes] = []
+        file_lines: list[bytes] = []
+
+        def _add_file_lines() -> None:
+            filename = self._get_diff_file_path(file_lines)
+
+            if filename is None or not filename_match_any_patterns(
+                filename=filename,
+                patterns=exclude_patterns,
+                base_dir=base_dir):
+                result.extend(file_lines)
+
+        for line in diff_lines:
+            if line.startswith(b'diff --git ') and file_lines:
+                _add_file_lines()
+                file_lines = []
+
+            file_lines.append(line)
+
+        if file_lines:
+            _add_file_lines()
+
+        return result
+
+    def _get_diff_file_path(
+        self,
+        file_lines: Sequence[bytes],
+    ) -> str | None:
+        """Return the new path of a file in a diff.
+
+        Version Added:
+            7.0
+
+        Args:
+            file_lines (list of bytes):
+                The lines of the diff for the file, starting with the
+                ``diff --git`` header.
+
+        Returns:
+            str:
+            The new path of the file, relative to the top of the repository,
+            or ``None`` if the lines don't start with a file header.
+        """
+        header = file_lines[0]
+
+        if not header.startswith(b'diff --git '):
+            return None
+
+        for line in file_lines[1:]:
+            if line.startswith((b'--- ', b'@@ ', b'Binary files ',
+                                b'GIT binary patch')):
+                break
+
+            for prefix in (b'rename to ', b'copy to '):
+                if line.startswith(prefix):
+                    return force_unicode(_unquote_git_path(
+                        line[len(prefix):].rstrip(b'\r\n')))
+
+        # Without a rename or copy, both paths in the header name the same
+        # file, differing only in their "a/" and "b/" prefixes (if any). That
+        # makes them the same length, even when quoted.
+        paths = header[len(b'diff --git '):].rstrip(b'\r\n')
+        half = len(paths) // 2
+        old_path = _unquote_git_path(paths[:half])
+        new_path = _unquote_git_path(paths[half + 1:])
+
+        if old_path != new_path:
+            new_path = new_path[2:]
+
+        return force_unicode(new_path)
+
+    def _get_diff_options(
+        self,
+        *,
+        no_renames: bool,
+        find_renames_threshold: str | None,
+    ) -> tuple[list[str], list[str]]:
+        """Return the options used to generate diffs.
+
+        Version Added:
+            7.0
+
+        Args:
+            no_renames (bool):
+                Whether to skip rename detection.
+
+            find_renames_threshold (str):
+                The threshold to pass to ``--find-renames``, if any.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            Tuple:
+                0 (list of str):
+                    The global options to pass to :command:`git`.
+
+                1 (list of str):
+                    The options to pass to the diff command.
+
+        Raises:
+            ValueError:
+                The Git client type is unknown.
+        """
         git_args: list[str] = []
 
         if self._supports_git_config_flag():
@@ -1358,91 +2081,7 @@ class GitClient(BaseSCMClient):
         if not self.config.get('GIT_USE_EXT_DIFF', False):
             diff_cmd_params.append('--no-ext-diff')
 
-        diff_cmd = [*git_args, 'diff', *diff_cmd_params]
-
-        if exclude_patterns:
-            # If we have specified files to exclude, we will get a list of all
-            # changed files and run `git diff` on each un-excluded file
-            # individually.
-            changed_files_cmd = [
-                *git_args,
-                'diff-tree',
-                '-z',
-                *diff_cmd_params,
-            ]
-
-            if self._type in {self.TYPE_GIT_SVN, self.TYPE_GIT_P4}:
-                # We don't want to send -u along to git diff-tree because it
-                # will generate diff information along with the list of
-                # changed files.
-                changed_files_cmd.remove('-u')
-            elif self._type == self.TYPE_GIT:
-                changed_files_cmd.append('-r')
-
-            diff_tree_output = (
-                self._run_git(
-                    [*changed_files_cmd, rev_range, *include_files],
-                    ignore_errors=True,
-                    log_debug_output_on_error=False)
-                .stdout
-                .read()
-                .rstrip('\0')
-                .split('\0')
-            )
-
-            diff_lines: list[bytes] = []
-            diff_tree_iter = iter(diff_tree_output)
-
-            for part in diff_tree_iter:
-                _unused, change = part.rsplit(' ', 1)
-
-                if change[0] in {'C', 'R'}:
-                    # This is a copy or rename.
-                    next(diff_tree_iter)
-                    new_file = next(diff_tree_iter)
-                    filename = new_file
-                else:
-                    # This is a regular file operation.
-                    filename = next(diff_tree_iter)
-
-                if filename_match_any_patterns(filename=filename,
-                                               patterns=exclude_patterns,
-                                               base_dir=git_toplevel):
-                    continue
-
-                lines = (
-                    self._run_git([*diff_cmd, rev_range, '--', filename],
-                                  ignore_errors=True,
-                                  log_debug_output_on_error=False)
-                    .stdout_bytes
-                    .readlines()
-                )
-
-                if not lines:
-                    logger.error(
-                        'Could not get diff for all files (git-diff failed '
-                        'for "%s"). Refusing to return a partial diff.',
-                        filename)
-
-                    diff_lines = []
-                    break
-
-                diff_lines += lines
-        else:
-            diff_lines = (
-                self._run_git([*diff_cmd, rev_range, *include_files],
-                              ignore_errors=True,
-                              log_debug_output_on_error=False)
-                .stdout_bytes
-                .readlines()
-            )
-
-        if self._type == self.TYPE_GIT_SVN:
-            return self.make_svn_diff(merge_base, diff_lines)
-        elif self._type == self.TYPE_GIT_P4:
-            return self.make_perforce_diff(merge_base, diff_lines)
-        else:
-            return b''.join(diff_lines)
+        return git_args, diff_cmd_params
 
     def make_svn_diff(
         self,
@@ -2091,6 +2730,12 @@ class GitClient(BaseSCMClient):
 
         The value will be stripped, if found.
 
+        Version Changed:
+            7.0:
+            All configuration is now read with a single :command:`git config
+            --list` and cached, rather than running :command:`git config` for
+            each key.
+
         Args:
             key (str):
                 The key to retrieve.
@@ -2107,27 +2752,84 @@ class GitClient(BaseSCMClient):
             rbtools.clients.errors.SCMError:
                 There was a fatal error retrieving Git configuration.
         """
+        if global_config:
+            git_config = self._git_global_config
+
+            if git_config is None:
+                git_config = self._load_git_config(global_config=True)
+                self._git_global_config = git_config
+        else:
+            # Make sure any configuration cached for another directory is
+            # discarded.
+            self._get_repository_paths()
+
+            git_config = self._git_config
+
+            if git_config is None:
+                git_config = self._load_git_config()
+                self._git_config = git_config
+
+        return git_config.get(_normalize_git_config_key(key))
+
+    def _load_git_config(
+        self,
+        *,
+        global_config: bool = False,
+    ) -> dict[str, str]:
+        """Load all Git configuration.
+
+        Version Added:
+            7.0
+
+        Args:
+            global_config (bool, optional):
+                Whether to load the global Git config, rather than the local
+                clone's.
+
+        Returns:
+            dict:
+            A mapping of normalized configuration keys to stripped values.
+            If a key has multiple values, the last one is used, matching
+            :command:`git config --get`.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                There was a fatal error retrieving the local Git
+                configuration.
+        """
         cmdline: list[str] = ['config']
 
         if global_config:
             cmdline.append('--global')
 
-        cmdline += ['--get', key]
+        cmdline += ['-z', '--list']
 
         try:
-            return (
+            data = (
                 self._run_git(cmdline)
                 .stdout
                 .read()
-                .strip()
             )
         except RunProcessError as e:
             errors = e.result.stderr.read()
 
-            if errors.startswith('fatal:'):
+            # A missing global config file is reported as a fatal error, so
+            # only treat fatal errors as such for the local config.
+            if errors.startswith('fatal:') and not global_config:
                 raise SCMError(errors)
 
-            return None
+            return {}
+
+        git_config: dict[str, str] = {}
+
+        for entry in data.split('\0'):
+            if entry:
+                # Keys without a value (implicitly true booleans) have no
+                # newline.
+                key, _sep, value = entry.partition('\n')
+                git_config[_normalize_git_config_key(key)] = value.strip()
+
+        return git_config
 
     def _run_git(
         self,
@@ -2198,17 +2900,7 @@ class GitClient(BaseSCMClient):
         assert isinstance(base, str)
         assert isinstance(tip, str)
 
-        log_fields = {
-            'commit_id': '%H',
-            'parent_id': '%P',
-            'author_name': '%an',
-            'author_email': '%ae',
-            'author_date': '%ad',
-            'committer_name': '%cn',
-            'committer_email': '%ce',
-            'committer_date': '%cd',
-            'commit_message': '%B',
-        }
+        log_fields = self._HISTORY_LOG_FIELDS
 
         # 0x1f is the ASCII field separator. It is a non-printable character
         # that should not appear in any field in `git log`.
@@ -2239,21 +2931,358 @@ class GitClient(BaseSCMClient):
             fields = log_entry.split(self._FIELD_SEP)
             entry = dict(zip(field_names, fields))
 
-            parents = entry['parent_id'].split()
-
-            if len(parents) > 1:
-                raise SCMError(_(
-                    'The Git SCMClient only supports posting commit histories '
-                    'that are entirely linear.'))
-            elif len(parents) == 0:
-                raise SCMError(_(
-                    'The Git SCMClient only supports posting commits that '
-                    'have exactly one parent.'))
-
+            self._check_history_parents(entry)
             history.append(entry)
 
         return history
 
+    def iter_commit_history_with_diffs(
+        self,
+        revisions: SCMClientRevisionSpec,
+        *,
+        history: (Sequence[SCMClientCommitHistoryItem] | None) = None,
+        include_files: (Sequence[str] | None) = None,
+        exclude_patterns: (Sequence[str] | None) = None,
+        no_renames: bool = False,
+        **kwargs,
+    ) -> Iterator[SCMClientCommitHistoryItem]:
+        """Iterate through the commit history with diffs.
+
+        For Git repositories, the history and the diffs for every commit are
+        generated in a single :command:`git log -p` pass, rather than running
+        :command:`git diff` for each commit. Each entry is yielded as soon as
+        its part of the output has been read. The diffs are identical to
+        those generated by :py:meth:`diff`.
+
+        Version Added:
+            7.0
+
+        Args:
+            revisions (dict):
+                The parsed revision spec to use to generate the history.
+
+            history (list of rbtools.clients.base.scmclient.
+                     SCMClientCommitHistoryItem, optional):
+                The history already returned by :py:meth:`get_commit_history`
+                for these revisions. If provided, the history won't be
+                looked up again, and only the diffs will be read from
+                :command:`git log`.
+
+            include_files (list of str, optional):
+                A list of files to whitelist during the diff generation.
+
+            exclude_patterns (list of str, optional):
+                A list of shell-style glob patterns to blacklist during diff
+                generation.
+
+            no_renames (bool, optional):
+                Whether to avoid rename detection.
+
+            **kwargs (dict):
+                Additional keyword arguments to pass to :py:meth:`diff`.
+
+        Yields:
+            rbtools.clients.base.scmclient.SCMClientCommitHistoryItem:
+            Each history entry, in order, with its ``diff`` set.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The history is non-linear or there is a commit with no parents.
+        """
+        if self._type != self.TYPE_GIT:
+            # git-svn and git-p4 diffs need to be converted per-commit, so
+            # use the standard per-commit diffs.
+            yield from super().iter_commit_history_with_diffs(
+                revisions,
+                history=history,
+                include_files=include_files,
+                exclude_patterns=exclude_patterns,
+                no_renames=no_renames,
+                **kwargs)
+            return
+
+        base = revisions['base']
+        tip = revisions['tip']
+
+        assert isinstance(base, str)
+        assert isinstance(tip, str)
+
+        git_toplevel = self._git_toplevel
+        assert git_toplevel
+
+        if exclude_patterns:
+            exclude_patterns = normalize_patterns(patterns=exclude_patterns,
+                                                  base_dir=git_toplevel,
+                                                  cwd=os.getcwd())
+
+        git_args, diff_cmd_params = self._get_diff_options(
+            no_renames=no_renames,
+            find_renames_threshold=getattr(
+                self.options, 'git_find_renames_threshold', None))
+
+        # Each entry starts with a NUL and ends its fields with a field
+        # separator, followed by the diff. Neither can appear in a text diff.
+        log_format = ''.join(
+            f'{placeholder}%x1f'
+            for placeholder in self._HISTORY_LOG_FIELDS.values()
+        )
+        log_cmd = [
+            *git_args,
+            'log',
+            '-p',
+            *diff_cmd_params,
+            f'--format=%x00{log_format}',
+            '--date=iso8601-strict',
+        ]
+
+        if include_files or history is not None:
+            # Limiting git log to paths would leave out any commits that
+            # don't touch them, so diff each commit in the history
+            # explicitly. This is also used when the caller has already
+            # loaded the history, so that it isn't read twice.
+            if history is None:
+                history = self.get_commit_history(revisions) or []
+
+            log_args = [*log_cmd, '--no-walk=unsorted', '--stdin']
+
+            if include_files:
+                log_args += ['--', *include_files]
+
+            check_parents = False
+            entries = self._iter_history_with_diffs(
+                history,
+                self._iter_log_with_diffs(
+                    log_args,
+                    input_bytes=''.join(
+                        f'{history_entry["commit_id"]}\n'
+                        for history_entry in history
+                    ).encode('utf-8')))
+        else:
+            check_parents = True
+            entries = self._iter_log_with_diffs(
+                [*log_cmd, '--reverse', f'{base}..{tip}'])
+
+        for history_entry in entries:
+            if check_parents:
+                self._check_history_parents(history_entry)
+
+            if exclude_patterns:
+                diff = history_entry['diff']
+                assert diff is not None
+
+                history_entry['diff'] = b''.join(self._filter_diff_files(
+                    diff.splitlines(True),
+                    exclude_patterns=exclude_patterns,
+                    base_dir=git_toplevel))
+
+            yield history_entry
+
+    def _iter_history_with_diffs(
+        self,
+        history: Iterable[SCMClientCommitHistoryItem],
+        log_entries: Iterable[SCMClientCommitHistoryItem],
+    ) -> Iterator[SCMClientCommitHistoryItem]:
+        """Match history entries to the diffs from a path-limited git log.
+
+        Commits that don't touch any of the paths are left out of the
+        output of :command:`git log`, and are given empty diffs.
+
+        Version Added:
+            7.0
+
+        Args:
+            history (list of rbtools.clients.base.scmclient.
+                     SCMClientCommitHistoryItem):
+                The full history, in order.
+
+            log_entries (iterable of rbtools.clients.base.scmclient.
+                         SCMClientCommitHistoryItem):
+                The entries from :command:`git log`, in the same order as
+                ``history``.
+
+        Yields:
+            rbtools.clients.base.scmclient.SCMClientCommitHistoryItem:
+            Each history entry, in order, with its ``diff`` set.
+        """
+        history_iter = iter(history)
+
+        for log_entry in log_entries:
+            for history_entry in history_iter:
+                if history_entry['commit_id'] == log_entry['commit_id']:
+                    history_entry['diff'] = log_entry['diff']
+                    yield history_entry
+                    break
+
+                history_entry['diff'] = b''
+                yield history_entry
+
+        for history_entry in history_iter:
+            history_entry['diff'] = b''
+            yield history_entry
+
+    def _iter_log_with_diffs(
+        self,
+        git_args: Sequence[str],
+        *,
+        input_bytes: (bytes | None) = None,
+    ) -> Iterator[SCMClientCommitHistoryItem]:
+        """Run git log and parse each history entry as it's output.
+
+        Each entry in the output starts with a NUL. An entry is parsed once
+        the next one starts, or the output ends, so that callers can work
+        with earlier entries while later ones are still being generated.
+
+        If iteration stops early, the process will be killed.
+
+        Version Added:
+            7.0
+
+        Args:
+            git_args (list of str):
+                The arguments to pass to :command:`git`, using the format
+                built by :py:meth:`iter_commit_history_with_diffs`.
+
+            input_bytes (bytes, optional):
+                Data to pass to the command's standard input.
+
+        Yields:
+            rbtools.clients.base.scmclient.SCMClientCommitHistoryItem:
+            Each history entry, in order, with its ``diff`` set.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The process could not be started.
+        """
+        cmdline = [self.git, *git_args]
+        logger.debug('Running: %s', subprocess.list2cmdline(cmdline))
+
+        try:
+            process = subprocess.Popen(
+                cmdline,
+                cwd=self._git_toplevel,
+                stdin=(subprocess.PIPE if input_bytes is not None
+                       else subprocess.DEVNULL),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=True)
+        except OSError as e:
+            raise SCMError(
+                _('Unable to start git log: {error}')
+                .format(error=e))
+
+        stdout = process.stdout
+        assert stdout is not None
+
+        try:
+            if input_bytes is not None:
+                stdin = process.stdin
+                assert stdin is not None
+
+                # git reads all revisions from --stdin before writing any
+                # output, so this can't block on a full output pipe.
+                stdin.write(input_bytes)
+                stdin.close()
+
+            nul = self._NUL.encode('ascii')
+            pending: list[bytes] = []
+
+            while chunk := stdout.read1(65536):
+                # Only the new data needs to be searched for the start of
+                # the next entry.
+                parts = chunk.split(nul)
+                pending.append(parts[0])
+
+                for part in parts[1:]:
+                    if log_entry := b''.join(pending):
+                        yield self._parse_log_entry(log_entry)
+
+                    pending = [part]
+
+            if log_entry := b''.join(pending):
+                yield self._parse_log_entry(log_entry)
+
+            stdout.close()
+            exit_code = process.wait()
+
+            if exit_code != 0:
+                logger.debug('Command exited with rc=%s (errors ignored): %s',
+                             exit_code, subprocess.list2cmdline(cmdline))
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+            stdout.close()
+
+    def _parse_log_entry(
+        self,
+        log_entry: bytes,
+    ) -> SCMClientCommitHistoryItem:
+        """Parse a history entry and diff from git log output.
+
+        Version Added:
+            7.0
+
+        Args:
+            log_entry (bytes):
+                A single entry from the output of :command:`git log -p`,
+                without the leading NUL, using the format built by
+                :py:meth:`iter_commit_history_with_diffs`.
+
+        Returns:
+            rbtools.clients.base.scmclient.SCMClientCommitHistoryItem:
+            The history entry, with its ``diff`` set.
+        """
+        field_names = list(self._HISTORY_LOG_FIELDS.keys())
+
+        *fields, diff = log_entry.split(self._FIELD_SEP.encode('ascii'),
+                                        len(field_names))
+        entry = {
+            field_name: force_unicode(value)
+            for field_name, value in zip(field_names, fields)
+        }
+
+        # The format is followed by a newline, and then a blank line before
+        # any diff.
+        if diff.startswith(b'\n'):
+            diff = diff[1:]
+
+        if diff.startswith(b'\n'):
+            diff = diff[1:]
+
+        entry['diff'] = diff  # type: ignore
+
+        return entry  # type: ignore
+
+    def _check_history_parents(
+        self,
+        entry: Mapping[str, str],
+    ) -> None:
+        """Check that a history entry has exactly one parent.
+
+        Version Added:
+            7.0
+
+        Args:
+            entry (dict):
+                The history entry, with a ``parent_id`` containing all parent
+                IDs.
+
+        Raises:
+            rbtools.clients.errors.SCMError:
+                The commit is a merge or has no parents.
+        """
+        parents = entry['parent_id'].split()
+
+        if len(parents) > 1:
+            raise SCMError(_(
+                'The Git SCMClient only supports posting commit histories '
+                'that are entirely linear.'))
+        elif len(parents) == 0:
+            raise SCMError(_(
+                'The Git SCMClient only supports posting commits that '
+                'have exactly one parent.'))
+
     def _get_remote(
         self,
         local_branch: str,
@@ -2423,6 +3452,11 @@ class GitClient(BaseSCMClient):
             rbtools.clients.errors.SCMError:
                 The file could not be found.
         """
+        reader = self._get_object_reader()
+
+        if reader is not None:
+            return reader.get_content(revision)
+
         try:
             return (
                 self._run_git(['cat-file', 'blob', revision])
@@ -2458,6 +3492,11 @@ class GitClient(BaseSCMClient):
             rbtools.clients.errors.SCMError:
                 The file could not be found.
         """
+        reader = self._get_object_reader()
+
+        if reader is not None:
+            return reader.get_size(revision)
+
         try:
             return int(
                 self._run_git(['cat-file', '-s', revision])
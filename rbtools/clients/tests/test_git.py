@@ -11,13 +11,16 @@ import kgb
 
 from rbtools.api.resource import FileAttachmentItemResource
 from rbtools.clients import RepositoryInfo
+from rbtools.clients.base.scmclient import BaseSCMClient
 from rbtools.clients.errors import (CreateCommitError,
                                     MergeError,
                                     PushError,
                                     SCMClientDependencyError,
                                     SCMError,
                                     TooManyRevisionsError)
-from rbtools.clients.git import GitClient, get_git_candidates
+from rbtools.clients.git import (GitClient,
+                                 GitObjectReader,
+                                 get_git_candidates)
 from rbtools.clients.tests import FOO1, FOO2, FOO3, FOO4, SCMClientTestCase
 from rbtools.diffs.patches import BinaryFilePatch, Patch, PatchAuthor
 from rbtools.testing.api.transport import URLMapTransport
@@ -400,6 +403,67 @@ class GitClientTests(BaseGitClientTests):
         self.assertEqual(ri.base_path, '')
         self.assertEqual(ri.path.rstrip('/.git'), self.git_dir)
 
+    def test_get_repository_info_git_calls(self) -> None:
+        """Testing GitClient.get_local_path and get_repository_info batch
+        repository lookups
+        """
+        client = self.build_client()
+
+        self.spy_on(client._run_git)
+
+        local_path = client.get_local_path()
+        ri = client.get_repository_info()
+        assert ri is not None
+
+        self.assertEqual(local_path, ri.local_path)
+        self.assertEqual(client.get_head_ref(), 'refs/heads/master')
+        self.assertFalse(client.bare)
+        self.assertEqual(
+            [
+                call.args[0]
+                for call in client._run_git.calls
+            ],
+            [
+                ['rev-parse', '--git-dir', '--show-toplevel',
+                 '--symbolic-full-name', 'HEAD'],
+                ['config', '-z', '--list'],
+                ['show-ref', '--verify', 'refs/remotes/p4/master'],
+            ])
+
+    def test_get_repository_info_with_detached_head(self) -> None:
+        """Testing GitClient.get_repository_info with a detached HEAD"""
+        client = self.build_client()
+
+        self._run_git(['checkout', '--detach'])
+
+        self.assertIsNotNone(client.get_repository_info())
+        self.assertEqual(client.get_head_ref(), 'HEAD')
+
+    def test_get_git_config(self) -> None:
+        """Testing GitClient._get_git_config"""
+        client = self.build_client()
+
+        self._run_git(['config', 'branch.Feature.merge', 'refs/heads/a'])
+        self._run_git(['config', '--add', 'branch.Feature.merge',
+                       'refs/heads/b'])
+
+        with open(os.path.join('.git', 'config'), 'a') as fp:
+            fp.write('[rbtools]\n\tflag\n')
+
+        client.get_repository_info()
+
+        self.spy_on(client._run_git)
+
+        self.assertEqual(client._get_git_config('branch.Feature.merge'),
+                         'refs/heads/b')
+        self.assertEqual(client._get_git_config('BRANCH.Feature.Merge'),
+                         'refs/heads/b')
+        self.assertIsNone(client._get_git_config('branch.feature.merge'))
+        self.assertEqual(client._get_git_config('rbtools.flag'), '')
+        self.assertIsNone(client._get_git_config('rbtools.missing'))
+
+        self.assertSpyNotCalled(client._run_git)
+
     def test_get_repository_info_with_deps_missing(self) -> None:
         """Testing GitClient.get_repository_info with dependencies
         missing
@@ -542,6 +606,142 @@ class GitClientTests(BaseGitClientTests):
                 'parent_diff': None,
             })
 
+    def test_get_commit_history_with_diffs(self) -> None:
+        """Testing GitClient.get_commit_history_with_diffs matches
+        per-commit diffs
+        """
+        client = self.build_client(needs_diff=True)
+        client.get_repository_info()
+
+        self._git_add_file_commit('foo.txt', FOO1, 'commit 1')
+        self._git_add_file_commit('bar.txt', FOO2, 'commit 2')
+        self._run_git(['commit', '--allow-empty', '-m', 'commit 3'])
+        self._run_git(['mv', 'bar.txt', 'baz.txt'])
+        self._run_git(['commit', '-m', 'commit 4'])
+        self._git_add_file_commit('foo.txt', FOO3, 'commit 5\n\nDetails.')
+
+        revisions = client.parse_revision_spec([])
+        history = client.get_commit_history_with_diffs(revisions)
+        expected = list(BaseSCMClient.iter_commit_history_with_diffs(
+            client,
+            revisions))
+
+        assert history is not None
+        assert expected is not None
+
+        self.assertEqual(len(history), 5)
+        self.assertEqual(history, expected)
+        self.assertEqual(history[2]['diff'], b'')
+        self.assertEqual(history[4]['commit_message'],
+                         'commit 5\n\nDetails.\n')
+
+    def test_iter_commit_history_with_diffs(self) -> None:
+        """Testing GitClient.iter_commit_history_with_diffs yields entries
+        as git log outputs them
+        """
+        client = self.build_client(needs_diff=True)
+        client.get_repository_info()
+
+        self._git_add_file_commit('foo.txt', FOO1, 'commit 1')
+        self._git_add_file_commit('bar.txt', FOO2, 'commit 2')
+        self._git_add_file_commit('foo.txt', FOO3, 'commit 3')
+
+        revisions = client.parse_revision_spec([])
+        expected = list(BaseSCMClient.iter_commit_history_with_diffs(
+            client,
+            revisions))
+
+        self.spy_on(client._parse_log_entry)
+
+        iterator = client.iter_commit_history_with_diffs(revisions)
+
+        self.assertEqual(next(iterator), expected[0])
+        self.assertSpyCallCount(client._parse_log_entry, 1)
+
+        self.assertEqual(list(iterator), expected[1:])
+        self.assertSpyCallCount(client._parse_log_entry, 3)
+
+    def test_iter_commit_history_with_diffs_with_history(self) -> None:
+        """Testing GitClient.iter_commit_history_with_diffs with a history
+        that was already loaded
+        """
+        client = self.build_client(needs_diff=True)
+        client.get_repository_info()
+
+        self._git_add_file_commit('foo.txt', FOO1, 'commit 1')
+        self._git_add_file_commit('bar.txt', FOO2, 'commit 2')
+        self._run_git(['commit', '--allow-empty', '-m', 'commit 3'])
+        self._git_add_file_commit('foo.txt', FOO3, 'commit 4')
+
+        revisions = client.parse_revision_spec([])
+        expected = list(BaseSCMClient.iter_commit_history_with_diffs(
+            client,
+            revisions))
+        history = client.get_commit_history(revisions)
+
+        assert history is not None
+
+        self.spy_on(client.get_commit_history)
+
+        self.assertEqual(
+            list(client.iter_commit_history_with_diffs(revisions,
+                                                       history=history)),
+            expected)
+        self.assertSpyNotCalled(client.get_commit_history)
+
+    def test_get_commit_history_with_diffs_with_include_files(self) -> None:
+        """Testing GitClient.get_commit_history_with_diffs with
+        include_files
+        """
+        client = self.build_client(needs_diff=True)
+        client.get_repository_info()
+
+        self._git_add_file_commit('foo.txt', FOO1, 'commit 1')
+        self._git_add_file_commit('bar.txt', FOO2, 'commit 2')
+        self._git_add_file_commit('foo.txt', FOO3, 'commit 3')
+
+        revisions = client.parse_revision_spec([])
+        history = client.get_commit_history_with_diffs(
+            revisions,
+            include_files=['foo.txt'])
+        expected = list(BaseSCMClient.iter_commit_history_with_diffs(
+            client,
+            revisions,
+            include_files=['foo.txt']))
+
+        assert history is not None
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history, expected)
+        self.assertEqual(history[1]['diff'], b'')
+        self.assertNotEqual(history[2]['diff'], b'')
+
+    def test_get_commit_history_with_diffs_with_exclude_patterns(self) -> None:
+        """Testing GitClient.get_commit_history_with_diffs with
+        exclude_patterns
+        """
+        client = self.build_client(needs_diff=True)
+        client.get_repository_info()
+
+        self._git_add_file_commit('foo.txt', FOO1, 'commit 1')
+        self._git_add_file_commit('bar.txt', FOO2, 'commit 2')
+        self._git_add_file_commit('foo.txt', FOO3, 'commit 3')
+
+        revisions = client.parse_revision_spec([])
+        history = client.get_commit_history_with_diffs(
+            revisions,
+            exclude_patterns=['bar.txt'])
+        expected = list(BaseSCMClient.iter_commit_history_with_diffs(
+            client,
+            revisions,
+            exclude_patterns=['bar.txt']))
+
+        assert history is not None
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history, expected)
+        self.assertEqual(history[1]['diff'], b'')
+
     def test_diff_with_exclude_patterns(self) -> None:
         """Testing GitClient.diff with file exclusion"""
         client = self.build_client(needs_diff=True)
@@ -727,6 +927,57 @@ class GitClientTests(BaseGitClientTests):
         self.assertIn(b'renamed.txt', diff_content)
         self.assertNotIn(b'exclude.txt', diff_content)
 
+    def test_diff_with_exclude_patterns_special_filenames(self) -> None:
+        """Testing GitClient.diff with file exclusion and renamed or quoted
+        filenames
+        """
+        client = self.build_client(
+            needs_diff=True,
+            caps={
+                'diffs': {
+                    'moved_files': True,
+                },
+            })
+        client.get_repository_info()
+
+        self._git_add_file_commit('original.txt', FOO1, 'create original.txt')
+
+        base_commit_id = self._git_get_head()
+
+        os.mkdir('vendor')
+        self._run_git(['mv', 'original.txt', 'vendor/renamed.txt'])
+        self._git_add_file_commit('a b.txt', FOO2, 'add a b.txt')
+        self._git_add_file_commit('tab\tb "c".txt', FOO3, 'add quoted')
+        self._git_add_file_commit('vendor/a b.txt', FOO4, 'add vendor')
+
+        commit_id = self._git_get_head()
+        revisions = client.parse_revision_spec([base_commit_id, commit_id])
+
+        self.spy_on(client._run_git)
+
+        result = client.diff(revisions,
+                             exclude_patterns=['vendor/*'],
+                             with_parent_diff=False)
+
+        self.assertEqual(
+            len([
+                call
+                for call in client._run_git.calls
+                if 'diff' in call.args[0]
+            ]),
+            1)
+
+        self.assertEqual(
+            result['diff'],
+            client.diff(revisions,
+                        include_files=['a b.txt', 'tab\tb "c".txt'],
+                        with_parent_diff=False)['diff'])
+
+        result = client.diff(revisions,
+                             exclude_patterns=['*.txt'],
+                             with_parent_diff=False)
+        self.assertEqual(result['diff'], b'')
+
     def test_diff_with_branch_diverge(self) -> None:
         """Testing GitClient.diff with divergent branches"""
         client = self.build_client(needs_diff=True)
@@ -1954,6 +2205,134 @@ class GitClientTests(BaseGitClientTests):
                 filename='foo.txt',
                 revision='5e98e9540e1b741b5be240000000000000000000')
 
+    def test_get_file_content_and_size_with_object_reader(self) -> None:
+        """Testing GitClient.get_file_content and get_file_size share one
+        git cat-file process
+        """
+        client = self.build_client()
+        client.get_repository_info()
+
+        if client._get_object_reader() is None:
+            raise unittest.SkipTest('git cat-file --batch-command is not '
+                                    'supported by the installed git')
+
+        large_data = os.urandom(1024 * 1024)
+
+        self._git_add_file_commit('foo.txt', FOO1, 'add foo.txt')
+        self._git_add_file_commit('large.bin', large_data, 'add large.bin')
+
+        foo_sha = (
+            self._run_git(['rev-parse', 'HEAD:foo.txt'])
+            .stdout
+            .read()
+            .strip()
+        )
+        large_sha = (
+            self._run_git(['rev-parse', 'HEAD:large.bin'])
+            .stdout
+            .read()
+            .strip()
+        )
+
+        self.spy_on(GitObjectReader._start, owner=GitObjectReader)
+        self.spy_on(client._run_git)
+
+        for i in range(2):
+            self.assertEqual(
+                client.get_file_size(filename='large.bin',
+                                     revision=large_sha),
+                len(large_data))
+            self.assertEqual(
+                client.get_file_content(filename='large.bin',
+                                        revision=large_sha),
+                large_data)
+            self.assertEqual(
+                client.get_file_content(filename='foo.txt',
+                                        revision=foo_sha),
+                FOO1)
+
+        with self.assertRaises(SCMError):
+            client.get_file_content(
+                filename='foo.txt',
+                revision='5e98e9540e1b741b5be240000000000000000000')
+
+        self.assertEqual(
+            client.get_file_size(filename='foo.txt',
+                                 revision=foo_sha),
+            len(FOO1))
+
+        self.assertSpyCallCount(GitObjectReader._start, 1)
+        self.assertSpyNotCalled(client._run_git)
+
+        reader = client._object_reader
+        assert reader is not None
+
+        process = reader._process
+        assert process is not None
+
+        reader.close()
+
+        self.assertIsNotNone(process.poll())
+        self.assertIsNone(reader._process)
+
+        # The process is started again when needed.
+        self.assertEqual(
+            client.get_file_size(filename='foo.txt',
+                                 revision=foo_sha),
+            len(FOO1))
+        self.assertSpyCallCount(GitObjectReader._start, 2)
+
+        reader.close()
+
+    def test_get_file_content_and_size_with_object_reader_non_blob(
+        self,
+    ) -> None:
+        """Testing GitClient.get_file_content and get_file_size with the
+        object reader and an object that isn't a blob
+        """
+        client = self.build_client()
+        client.get_repository_info()
+
+        reader = client._get_object_reader()
+
+        if reader is None:
+            raise unittest.SkipTest('git cat-file --batch-command is not '
+                                    'supported by the installed git')
+
+        self._git_add_file_commit('foo.txt', FOO1, 'add foo.txt')
+
+        for revision in ('HEAD', 'HEAD^{tree}'):
+            with self.assertRaisesMessage(SCMError, 'not a blob'):
+                client.get_file_content(filename='foo.txt',
+                                        revision=revision)
+
+            with self.assertRaisesMessage(SCMError, 'not a blob'):
+                client.get_file_size(filename='foo.txt',
+                                     revision=revision)
+
+        # The process can still be used after skipping the contents.
+        self.assertEqual(
+            client.get_file_content(filename='foo.txt',
+                                    revision='HEAD:foo.txt'),
+            FOO1)
+
+        reader.close()
+
+    def test_get_file_content_without_object_reader(self) -> None:
+        """Testing GitClient.get_file_content with git older than 2.36"""
+        client = self.build_client()
+        client._git_version = (2, 35, 0)
+        client._git_version_checked = True
+
+        self._git_add_file_commit('foo.txt', FOO1, 'delete and modify stuff')
+
+        content = client.get_file_content(
+            filename='foo.txt',
+            revision='5e98e9540e1b741b5be24fcb33c40c1c8069c1fb')
+
+        self.assertEqual(content, FOO1)
+        self.assertIsNone(client._object_reader)
+
 
 class GitPerforceClientTests(BaseGitClientTests):
     """Unit tests for GitClient wrapping Perforce.
@@ -19,6 +19,7 @@ class APIGet(BaseCommand):
     description = 'Retrieve raw API resource payloads.'
 
     needs_api = True
+    allow_stale_cache = True
 
     args = '<path> [--<query-arg>=<value> ...]'
     option_list = [
@@ -48,8 +48,7 @@ class Attach(BaseCommand):
         path_to_file = os.path.abspath(path_to_file)
 
         try:
-            with open(path_to_file, 'rb') as f:
-                content = f.read()
+            f = open(path_to_file, 'rb')
         except IOError:
             raise CommandError('%s is not a valid file.' % path_to_file)
 
@@ -57,17 +56,20 @@ class Attach(BaseCommand):
         # use the original filename.
         filename = self.options.filename or os.path.basename(path_to_file)
 
-        try:
-            attachment = (
-                review_request.get_file_attachments()
-                .upload_attachment(
-                    filename=filename,
-                    content=content,
-                    caption=self.options.caption,
-                    attachment_history=self.options.attachment_history_id)
-            )
-        except APIError as e:
-            raise CommandError('Error uploading file: %s' % e)
+        # The file is streamed to the server, rather than being read into
+        # memory up-front.
+        with f:
+            try:
+                attachment = (
+                    review_request.get_file_attachments()
+                    .upload_attachment(
+                        filename=filename,
+                        content=f,
+                        caption=self.options.caption,
+                        attachment_history=self.options.attachment_history_id)
+                )
+            except APIError as e:
+                raise CommandError('Error uploading file: %s' % e)
 
         self.stdout.write('Uploaded %s to review request %s.'
                           % (path_to_file, review_request_id))
@@ -8,22 +8,27 @@ from __future__ import annotations
 
 import argparse
 import inspect
+import json
 import logging
 import os
 import platform
 import subprocess
 import sys
 from http import HTTPStatus
+from shutil import get_terminal_size
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import colorama
+import texttable as tt
 from typing_extensions import override
 
 from rbtools import get_version_string
 from rbtools.api.capabilities import Capabilities
 from rbtools.api.client import RBClient, RBClientWebLoginOptions
 from rbtools.api.errors import APIError, ServerInterfaceError
+from rbtools.api.recording import SessionArchive, SessionRecorder
+from rbtools.api.transport.replay import ReplayTransport
 from rbtools.api.transport.sync import SyncTransport
 from rbtools.clients import scan_usable_client
 from rbtools.clients.errors import OptionsCheckError
@@ -45,8 +50,9 @@ from rbtools.utils.web_login import WebLoginNotAllowed, attempt_web_login
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
-    from typing import ClassVar, TextIO
+    from typing import Any, ClassVar, TextIO
 
+    from rbtools.api.projection import APIProjections
     from rbtools.api.resource import (
         RepositoryItemResource,
         RootResource,
@@ -228,6 +234,38 @@ class BaseCommand:
     #:     bool
     needs_repository: ClassVar[bool] = False
 
+    #: Whether the command may use stale responses from the API cache.
+    #:
+    #: This should only be set for read-only commands. If set, expired
+    #: cached responses up to :rbtconfig:`CACHE_STALE_MAX_AGE` seconds old
+    #: will be used immediately, while they're revalidated in the background.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     bool
+    allow_stale_cache: ClassVar[bool] = False
+
+    #: The fields and links the command reads from API resources.
+    #:
+    #: This maps resource names (such as ``review_request`` or
+    #: ``review_requests``) to :py:class:`~rbtools.api.projection.
+    #: APIProjection` instances. Requests for those resources will only
+    #: fetch the listed fields and links, unless the caller asks for
+    #: something else.
+    #:
+    #: Any fields the command accesses must be listed. Setting
+    #: :rbtconfig:`API_DEBUG_PROJECTIONS` will log a warning when a field
+    #: that wasn't listed is accessed.
+    #:
+    #: Version Added:
+    #:     7.0
+    #:
+    #: Type:
+    #:     dict
+    api_projections: ClassVar[APIProjections] = {}
+
     #: Usage text for what arguments the command takes.
     #:
     #: Arguments for the command are anything passed in other than defined
@@ -395,6 +433,49 @@ class BaseCommand:
                     'with --web-login, this will open a browser to the '
                     'login page.',
                added_in='6.0'),
+        Option('--http-stats',
+               dest='http_stats',
+               action='store_true',
+               default=False,
+               added_in='7.0',
+               help='Displays a summary of the HTTP requests made to the '
+                    'Review Board server once the command finishes.'),
+        Option('--http-stats-json',
+               dest='http_stats_json',
+               metavar='FILENAME',
+               default=None,
+               added_in='7.0',
+               help='Writes information on each HTTP request made to the '
+                    'Review Board server to the given file as JSON once '
+                    'the command finishes.'),
+        Option('--record-session',
+               dest='record_session',
+               metavar='FILENAME',
+               default=None,
+               added_in='7.0',
+               help='Records all API requests made to the Review Board '
+                    'server and their responses to the given file once the '
+                    'command finishes, for replay with --replay-session. '
+                    'The file will be compressed if it ends with ".gz". '
+                    'Recordings may contain private information from the '
+                    'server.'),
+        Option('--replay-session',
+               dest='replay_session',
+               metavar='FILENAME',
+               default=None,
+               added_in='7.0',
+               help='Serves all API requests from a session recorded with '
+                    '--record-session, instead of talking to the Review '
+                    'Board server. This is useful for measuring performance '
+                    'without a network connection.'),
+        Option('--replay-latency',
+               dest='replay_latency',
+               metavar='recorded|SECONDS',
+               default=None,
+               added_in='7.0',
+               help='When using --replay-session, delays each response by '
+                    'the time recorded for it ("recorded"), or by a fixed '
+                    'number of seconds.'),
     ]
 
     server_options = OptionGroup(
@@ -843,6 +924,7 @@ class BaseCommand:
         self.transport_cls = transport_cls or self.default_transport_cls
         self.api_client = None
         self.api_root = None
+        self._session_recorder: SessionRecorder | None = None
         self.capabilities = None
         self.repository = None
         self.repository_info = None
@@ -1224,6 +1306,8 @@ class BaseCommand:
             self.log.critical(e)
             exit_code = 1
 
+        self._report_http_stats()
+        self._save_session_recording()
         cleanup_tempfiles()
 
         if self.options.json_output:
@@ -1464,8 +1548,33 @@ class BaseCommand:
         Returns:
             rbtools.api.client.RBClient:
             The new API client.
+
+        Raises:
+            rbtools.commands.base.errors.CommandError:
+                The options for recording or replaying API sessions were
+                not valid.
         """
         options = self.options
+        transport_cls = self.transport_cls
+        transport_kwargs: dict[str, Any] = {}
+
+        if getattr(options, 'replay_session', None):
+            try:
+                archive = SessionArchive.load(options.replay_session)
+            except (KeyError, OSError, ValueError) as e:
+                raise CommandError(
+                    f'Unable to load the API session from '
+                    f'{options.replay_session}: {e}')
+
+            transport_cls = ReplayTransport
+            transport_kwargs.update({
+                'archive': archive,
+                'latency': self._get_replay_latency(),
+            })
+        elif (getattr(options, 'record_session', None) and
+              issubclass(transport_cls, SyncTransport)):
+            self._session_recorder = SessionRecorder(server_url)
+            transport_kwargs['session_recorder'] = self._session_recorder
 
         web_login_options = RBClientWebLoginOptions(
             allow=options.web_login,
@@ -1491,9 +1600,69 @@ class BaseCommand:
             client_key=options.client_key,
             client_cert=options.client_cert,
             proxy_authorization=options.proxy_authorization,
-            transport_cls=self.transport_cls,
+            transport_cls=transport_cls,
             config=self.config,
-            web_login_options=web_login_options)
+            web_login_options=web_login_options,
+            cache_stale_max_age=self.get_cache_stale_max_age(),
+            projections=self.api_projections,
+            **transport_kwargs)
+
+    def _get_replay_latency(self) -> str | float | None:
+        """Return the latency to inject into replayed API responses.
+
+        Version Added:
+            7.0
+
+        Returns:
+            str or float:
+            ``recorded`` to use the recorded latency, a number of seconds, or
+            ``None`` to respond immediately.
+
+        Raises:
+            rbtools.commands.base.errors.CommandError:
+                The ``--replay-latency`` option was not valid.
+        """
+        latency = getattr(self.options, 'replay_latency', None)
+
+        if not latency or latency == 'recorded':
+            return latency or None
+
+        try:
+            return float(latency)
+        except ValueError:
+            raise CommandError(
+                f'--replay-latency must be "recorded" or a number of '
+                f'seconds, not "{latency}".')
+
+    def get_cache_stale_max_age(self) -> int:
+        """Return how long expired API cache responses may be used.
+
+        By default, this returns :rbtconfig:`CACHE_STALE_MAX_AGE` if
+        :py:attr:`allow_stale_cache` is set, and 0 otherwise. This can be
+        overridden for a command through :rbtconfig:`CACHE_STALE_COMMANDS`.
+
+        Subclasses can override this to decide based on the command's
+        options.
+
+        Version Added:
+            7.0
+
+        Returns:
+            int:
+            The maximum number of seconds an expired response may be used
+            while it's revalidated in the background. 0 disables this.
+        """
+        config = self.config
+        assert config is not None
+
+        stale_commands = config.CACHE_STALE_COMMANDS
+
+        if self.name in stale_commands:
+            return stale_commands[self.name]
+        elif self.allow_stale_cache:
+            return config.CACHE_STALE_MAX_AGE
+        else:
+            return 0
 
     def get_api(
         self,
@@ -1532,6 +1701,11 @@ class BaseCommand:
         api_root = None
         self.api_client = api_client
 
+        if ((getattr(self.options, 'http_stats', False) or
+             getattr(self.options, 'http_stats_json', None)) and
+            (request_stats := api_client.get_request_stats()) is not None):
+            request_stats.keep_records = True
+
         try:
             api_root = api_client.get_root()
         except ServerInterfaceError as e:
@@ -1564,6 +1738,85 @@ class BaseCommand:
 
         return api_client, api_root
 
+    def _save_session_recording(self) -> None:
+        """Save the API session recorded for the command.
+
+        This is only done if ``--record-session`` was passed.
+
+        Version Added:
+            7.0
+        """
+        recorder = self._session_recorder
+        filename = getattr(self.options, 'record_session', None)
+
+        if recorder is None or not filename:
+            return
+
+        try:
+            recorder.save(filename)
+        except IOError as e:
+            self.log.error('Unable to write the API session to %s: %s',
+                           filename, e)
+
+    def _report_http_stats(self) -> None:
+        """Report on the HTTP requests made by the command.
+
+        If ``--http-stats`` was passed, this will print a summary table to
+        stderr. If ``--http-stats-json`` was passed, information on each
+        request will be written to the given file.
+
+        Version Added:
+            7.0
+        """
+        show_table = getattr(self.options, 'http_stats', False)
+        json_filename = getattr(self.options, 'http_stats_json', None)
+
+        if ((not show_table and not json_filename) or
+            self.api_client is None or
+            (request_stats := self.api_client.get_request_stats()) is None):
+            return
+
+        if json_filename:
+            try:
+                with open(json_filename, 'w', encoding='utf-8') as fp:
+                    json.dump(request_stats.to_json(), fp, indent=2)
+            except IOError as e:
+                self.log.error('Unable to write HTTP stats to %s: %s',
+                               json_filename, e)
+
+        if show_table:
+            summary = request_stats.get_summary()
+
+            table = tt.Texttable(get_terminal_size().columns)
+            table.set_deco(tt.Texttable.HEADER)
+            table.set_cols_dtype(['t', 't', 'i', 'i', 'i', 'i', 'i', 'i',
+                                  't'])
+            table.set_cols_align(['l', 'l', 'r', 'r', 'r', 'r', 'r', 'r',
+                                  'r'])
+            table.header(['Method', 'URL', 'Requests', 'Cached',
+                          'Auth Retries', 'Retries', 'Sent', 'Received',
+                          'Time'])
+
+            for group in summary:
+                table.add_row([
+                    group['method'],
+                    group['url_template'],
+                    group['requests'],
+                    group['cache_hits'],
+                    group['auth_retries'],
+                    group['retries'],
+                    group['bytes_sent'],
+                    group['bytes_received'],
+                    '%.3fs' % group['total_time'],
+                ])
+
+            self.stderr.new_line()
+            self.stderr.write(table.draw())
+            self.stderr.write(
+                '%d HTTP requests in %.3fs'
+                % (sum(group['requests'] for group in summary),
+                   sum(group['total_time'] for group in summary)))
+
     def get_capabilities(
         self,
         api_root: RootResource,
@@ -21,12 +21,64 @@ class ClearCache(BaseCommand):
                default=None,
                help='The file to use for the API cache database.',
                added_in='0.7.3'),
+        Option('--trim',
+               dest='trim',
+               action='store_true',
+               default=False,
+               help='Remove expired and least-recently-used responses to '
+                    'bring the cache within its limits, instead of '
+                    'deleting the whole cache.',
+               added_in='7.0'),
+        Option('--max-size',
+               dest='max_size',
+               metavar='MB',
+               type=int,
+               config_key='CACHE_MAX_SIZE_MB',
+               default=None,
+               help='The maximum size of the cache in megabytes when using '
+                    '--trim.',
+               added_in='7.0'),
     ]
 
     def main(self):
-        """Unlink the API cache's path."""
+        """Unlink or trim the API cache's path."""
         cache_location = (self.options.cache_location or
                           APICache.DEFAULT_CACHE_PATH)
 
-        if clear_cache(cache_location):
+        if self.options.trim:
+            self._trim_cache(cache_location)
+        elif clear_cache(cache_location):
             self.stdout.write('Cleared cache in "%s"' % cache_location)
+
+    def _trim_cache(
+        self,
+        cache_location: str,
+    ) -> None:
+        """Trim the API cache to its configured limits.
+
+        Version Added:
+            7.0
+
+        Args:
+            cache_location (str):
+                The path to the cache database.
+        """
+        max_size = self.options.max_size
+
+        cache = APICache(db_location=cache_location)
+
+        try:
+            removed = cache.trim(
+                max_size=(max_size or 0) * 1024 * 1024,
+                max_entries=self.config.CACHE_MAX_ENTRIES,
+                vacuum=True)
+            stats = cache.get_stats()
+        finally:
+            cache.close()
+
+        self.stdout.write(
+            'Removed %d entries from the cache in "%s". %d entries '
+            '(%.1f MB, %.1f MB compressed) remain.'
+            % (removed, cache_location, stats.entries,
+               stats.total_bytes / (1024 * 1024),
+               stats.stored_bytes / (1024 * 1024)))
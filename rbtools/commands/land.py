@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from rbtools.api.errors import APIError
+from rbtools.api.projection import APIProjection
 from rbtools.clients.errors import MergeError, PushError
 from rbtools.commands import RB_MAIN
 from rbtools.commands.base import BaseCommand, CommandError, Option
@@ -45,6 +46,33 @@ class Land(BaseCommand):
     needs_scm_client = True
     needs_repository = True
 
+    api_projections = {
+        # This covers the review request being landed, along with any
+        # dependencies being landed with --recursive.
+        'review_request': APIProjection(
+            fields=[
+                'absolute_url',
+                'approval_failure',
+                'approved',
+                'bugs_closed',
+                'depends_on',
+                'description',
+                'id',
+                'repository',
+                'ship_it_count',
+                'status',
+                'summary',
+                'testing_done',
+            ],
+            links=['repository', 'submitter']),
+        'repository': APIProjection(
+            fields=['id'],
+            links=[]),
+        'submitter': APIProjection(
+            fields=['email', 'fullname'],
+            links=[]),
+    }
+
     args = '[<branch-name>]'
     option_list = [
         Option('--dest',
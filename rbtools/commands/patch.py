@@ -502,6 +502,10 @@ class PatchCommand(BaseCommand):
                                  not options.patch_outfile)
         self.needs_repository = self.needs_scm_client
 
+        # Printing the patch doesn't modify anything, so slightly stale
+        # responses are fine.
+        self.allow_stale_cache = bool(options.patch_stdout)
+
         super().initialize()
 
     def main(
@@ -6,6 +6,8 @@ import copy
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple, TYPE_CHECKING, TypedDict
 
 from tqdm import tqdm
@@ -32,7 +34,8 @@ from rbtools.utils.users import get_user
 
 if TYPE_CHECKING:
     import argparse
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
 
     from typelets.json import JSONDict
 
@@ -48,6 +51,68 @@ if TYPE_CHECKING:
 _T = TypeVar('_T')
 
 
+#: The maximum number of commit diffs to generate ahead of validation.
+#:
+#: Version Added:
+#:     7.0
+_DIFF_READ_AHEAD = 4
+
+
+def _iter_read_ahead(
+    iterable: Iterable[_T],
+    read_ahead: int,
+) -> Iterator[_T]:
+    """Iterate through items, producing several ahead in a background thread.
+
+    Items are produced in order by a single worker thread, so the iterable
+    never needs to be thread-safe. At most ``read_ahead`` items will be
+    produced before they've been consumed.
+
+    Version Added:
+        7.0
+
+    Args:
+        iterable (iterable):
+            The items to iterate through.
+
+        read_ahead (int):
+            The maximum number of items to produce ahead of the consumer.
+
+    Yields:
+        object:
+        Each item, in order.
+
+    Raises:
+        Exception:
+            Any exception raised while producing an item is raised when that
+            item would have been yielded.
+    """
+    iterator = iter(iterable)
+    done = object()
+    pending: deque[Future[_T | object]] = deque()
+    executor = ThreadPoolExecutor(max_workers=1,
+                                  thread_name_prefix='rbtools-post')
+
+    try:
+        def _queue_next() -> None:
+            pending.append(executor.submit(next, iterator, done))
+
+        for i in range(read_ahead):
+            _queue_next()
+
+        while True:
+            item = pending.popleft().result()
+
+            if item is done:
+                break
+
+            _queue_next()
+
+            yield item  # type: ignore
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class SquashedDiff(NamedTuple):
     """A squashed diff that may be the product of one or more revisions.
 
@@ -958,35 +1023,24 @@ class Post(BaseCommand):
                 extra_args = self.cmd_args
 
             if with_history:
+                # The history is generated along with its validation below.
                 squashed_diff = None
-                diff_history = self._get_diff_history(extra_args)
-                parent_diff = (diff_history.entries and
-                               diff_history.entries[0].get('parent_diff'))
             else:
                 squashed_diff = self._get_squashed_diff(extra_args)
-                diff_history = None
                 parent_diff = squashed_diff.parent_diff
 
-            if parent_diff:
-                self.log.debug('Generated parent diff size: %d bytes',
-                               len(parent_diff))
+                if parent_diff:
+                    self.log.debug('Generated parent diff size: %d bytes',
+                                   len(parent_diff))
 
-        if squashed_diff is not None:
-            if not squashed_diff.diff:
-                raise CommandError("There don't seem to be any diffs!")
-        else:
-            for entry in diff_history.entries:
-                if not entry['diff']:
-                    raise CommandError(
-                        'Your history contains an empty diff at commit %s, '
-                        'which is not supported.'
-                        % entry['commit_id'])
+        if squashed_diff is not None and not squashed_diff.diff:
+            raise CommandError("There don't seem to be any diffs!")
 
         try:
             if squashed_diff:
                 self._validate_squashed_diff(squashed_diff)
             else:
-                diff_history = self._validate_diff_history(diff_history)
+                diff_history = self._get_diff_history(extra_args)
         except APIError as e:
             msg_prefix = ''
 
@@ -1429,7 +1483,20 @@ class Post(BaseCommand):
                 })
 
     def _get_diff_history(self, extra_args):
-        """Compute and return the diff history of the selected revisions.
+        """Compute, validate, and return the diff history of the revisions.
+
+        Diffs for each commit are generated in a background thread while
+        earlier commits are being validated, so that generating diffs locally
+        and validating them on the server overlap.
+
+        Version Changed:
+            7.0:
+            This now validates the history as well, replacing
+            ``_validate_diff_history()``. An empty diff in a commit is now
+            reported when that commit is reached, after the commits before
+            it have been validated, rather than before any commit is
+            validated. No review request is created or updated in either
+            case.
 
         Args:
             extra_args (list):
@@ -1437,44 +1504,86 @@ class Post(BaseCommand):
 
         Returns:
             DiffHistory:
-            The computed history.
+            The computed history, with validation information.
 
         Raises:
+            rbtools.api.errors.APIError:
+                An error occurred during validation.
+
             rbtools.commands.CommandError:
-                The diff history is empty.
+                The diff history is empty or contains an empty diff.
         """
+        assert self.api_root is not None
+        assert self.repository is not None
+
         tool = self.tool
+        diff_kwargs = self._build_get_diff_kwargs(extra_args)
+
+        # The cumulative diff provides the parent diff and base commit ID
+        # that each commit is validated against.
+        cumulative_diff_info = tool.diff(revisions=self.revisions,
+                                         **diff_kwargs)
+        base_commit_id = cumulative_diff_info.get('base_commit_id')
+        parent_diff = cumulative_diff_info.get('parent_diff')
+
+        if parent_diff:
+            self.log.debug('Generated parent diff size: %d bytes',
+                           len(parent_diff))
 
-        history_entries = tool.get_commit_history(self.revisions)
+        validator = self.api_root.get_commit_validation()
+        validation_info = None
+        validation_info_list = [None]
+        history_entries = []
 
-        if history_entries is None:
+        # The diffs are generated as they're needed, so the number of
+        # commits comes from the history alone. The history is handed to
+        # the tool so that it doesn't need to be looked up again.
+        history = tool.get_commit_history(self.revisions) or []
+
+        if not history:
             raise CommandError("There don't seem to be any diffs.")
 
-        diff_kwargs = self._build_get_diff_kwargs(extra_args)
-        cumulative_diff_info = tool.diff(revisions=self.revisions,
-                                         **diff_kwargs)
+        # Generate a diff for each commit against the revisions or
+        # arguments, filtering by the requested files if provided.
+        iterable = _iter_read_ahead(
+            tool.iter_commit_history_with_diffs(self.revisions,
+                                                history=history,
+                                                **diff_kwargs),
+            read_ahead=_DIFF_READ_AHEAD)
+
+        for history_entry in self._show_progress(iterable=iterable,
+                                                 desc='Validating commits...',
+                                                 total=len(history)):
+            if not history_entry['diff']:
+                raise CommandError(
+                    'Your history contains an empty diff at commit %s, '
+                    'which is not supported.'
+                    % history_entry['commit_id'])
 
-        for history_entry in history_entries:
-            # Generate a diff against the revisions or arguments, filtering
-            # by the requested files if provided.
-            diff_info = tool.diff(
-                revisions={
-                    'base': history_entry['parent_id'],
-                    'tip': history_entry['commit_id'],
-                },
-                with_parent_diff=False,
-                **diff_kwargs)
+            validation_rsp = validator.validate_commit(
+                repository=str(self.repository.id),
+                diff=history_entry['diff'],
+                commit_id=history_entry['commit_id'],
+                parent_id=history_entry['parent_id'],
+                parent_diff=parent_diff,
+                base_commit_id=base_commit_id,
+                validation_info=validation_info)
 
-            history_entry['diff'] = diff_info['diff']
+            validation_info = validation_rsp.validation_info
+            validation_info_list.append(validation_info)
+            history_entries.append(history_entry)
+
+        if not history_entries:
+            raise CommandError("There don't seem to be any diffs.")
 
         return DiffHistory(
-            base_commit_id=cumulative_diff_info.get('base_commit_id'),
+            base_commit_id=base_commit_id,
             cumulative_diff=cumulative_diff_info['diff'],
             entries=history_entries,
-            parent_diff=cumulative_diff_info.get('parent_diff'),
+            parent_diff=parent_diff,
             review_request_extra_data=cumulative_diff_info.get(
                 'review_request_extra_data'),
-            validation_info=None)
+            validation_info=validation_info_list)
 
     def _get_squashed_diff(self, extra_args):
         """Return the squashed diff for the requested revisions.
@@ -1896,52 +2005,6 @@ class Post(BaseCommand):
                 base_dir=squashed_diff.base_dir,
                 **validate_kwargs)
 
-    def _validate_diff_history(
-        self,
-        diff_history: DiffHistory,
-    ) -> DiffHistory:
-        """Validate the diffs.
-
-        This will ensure that the diffs can be parsed and that all files
-        mentioned exist.
-
-        Args:
-            diff_history (DiffHistory):
-                The history to validate.
-
-        Returns:
-            diff_history:
-            The updated history, with validation information.
-
-        Raises:
-            rbtools.api.errors.APIError:
-                An error occurred during validation.
-        """
-        assert self.api_root is not None
-        assert self.capabilities is not None
-        assert self.repository is not None
-        assert self.tool is not None
-
-        validator = self.api_root.get_commit_validation()
-        validation_info = None
-        validation_info_list = [None]
-
-        for history_entry in self._show_progress(iterable=diff_history.entries,
-                                                 desc='Validating commits...'):
-            validation_rsp = validator.validate_commit(
-                repository=str(self.repository.id),
-                diff=history_entry['diff'],
-                commit_id=history_entry['commit_id'],
-                parent_id=history_entry['parent_id'],
-                parent_diff=diff_history.parent_diff,
-                base_commit_id=diff_history.base_commit_id,
-                validation_info=validation_info)
-
-            validation_info = validation_rsp.validation_info
-            validation_info_list.append(validation_info)
-
-        return diff_history._replace(validation_info=validation_info_list)
-
     def _show_progress(
         self,
         iterable: Iterable[_T],
@@ -7,6 +7,7 @@ from shutil import get_terminal_size
 
 import texttable as tt
 
+from rbtools.api.projection import APIProjection
 from rbtools.commands.base import BaseCommand, Option
 from rbtools.utils.users import get_username
 
@@ -19,6 +20,25 @@ class Status(BaseCommand):
     description = 'Output a list of your pending review requests.'
 
     needs_api = True
+    allow_stale_cache = True
+
+    api_projections = {
+        'review_requests': APIProjection(
+            fields=[
+                'absolute_url',
+                'approval_failure',
+                'approved',
+                'description',
+                'draft',
+                'extra_data',
+                'id',
+                'issue_open_count',
+                'ship_it_count',
+                'summary',
+            ],
+            links=['draft'],
+            expand=['draft']),
+    }
 
     args = '[review-request [revision]]'
     option_list = [
@@ -200,7 +220,6 @@ class Status(BaseCommand):
         query_args = {
             'from_user': username,
             'status': 'pending',
-            'expand': 'draft',
         }
 
         if not self.options.all_repositories:
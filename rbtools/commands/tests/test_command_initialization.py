@@ -197,6 +197,32 @@ class CommandInitializationTests(CommandTestsMixin[_TestCommand], TestCase):
         self.assertEqual(command.server_url,
                          'http://reviews2.example.com/')
 
+    def test_get_cache_stale_max_age(self) -> None:
+        """Testing BaseCommand.get_cache_stale_max_age"""
+        command = self._run_stale_cache_command({})
+        self.assertEqual(command.get_cache_stale_max_age(), 0)
+
+        # This must be enabled through configuration.
+        command.allow_stale_cache = True
+        self.assertEqual(command.get_cache_stale_max_age(), 0)
+
+    def test_get_cache_stale_max_age_with_config(self) -> None:
+        """Testing BaseCommand.get_cache_stale_max_age with
+        CACHE_STALE_MAX_AGE and CACHE_STALE_COMMANDS
+        """
+        command = self._run_stale_cache_command({
+            'CACHE_STALE_MAX_AGE': 60,
+        })
+        command.allow_stale_cache = True
+        self.assertEqual(command.get_cache_stale_max_age(), 60)
+
+        command = self._run_stale_cache_command({
+            'CACHE_STALE_COMMANDS': {
+                'test-command': 30,
+            },
+        })
+        self.assertEqual(command.get_cache_stale_max_age(), 30)
+
     def test_with_deprecated_option(self) -> None:
         """Testing warning and help output when passing a deprecated option"""
         self.spy_on(argparse.ArgumentParser.add_argument,
@@ -320,6 +346,29 @@ class CommandInitializationTests(CommandTestsMixin[_TestCommand], TestCase):
                   '[Deprecated since 5.2 and will be removed in 6.0. '
                   'Use --debug instead.]'))
 
+    def _run_stale_cache_command(
+        self,
+        config: dict[str, Any],
+    ) -> _TestCommand:
+        """Run the test command with the given configuration.
+
+        Args:
+            config (dict):
+                The configuration for the .reviewboardrc.
+
+        Returns:
+            _TestCommand:
+            The command that was run.
+        """
+        with self.reviewboardrc(config):
+            result = self.run_command(
+                repository_info=RepositoryInfo(path='/path'),
+                tool=GitClient())
+
+        self.assertEqual(result['exit_code'], 0)
+
+        return result['command']
+
 
 class MultiCommandInitializationTests(CommandTestsMixin[_TestMultiCommand],
                                       TestCase):
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 from rbtools.clients import RepositoryInfo
 from rbtools.clients.git import GitClient
 from rbtools.commands import CommandError
-from rbtools.commands.post import DiffHistory, Post, SquashedDiff
+from rbtools.commands.post import (DiffHistory,
+                                   Post,
+                                   SquashedDiff,
+                                   _iter_read_ahead)
 from rbtools.testing import CommandTestsMixin, TestCase
 
 
@@ -1381,3 +1387,64 @@ class BuildReviewRequestDraftDataTests(BasePostCommandTests):
             diff_history=diff_history)
 
         self.assertEqual(request_data, expected_request_data)
+
+
+class IterReadAheadTests(TestCase):
+    """Unit tests for rbtools.commands.post._iter_read_ahead.
+
+    Version Added:
+        7.0
+    """
+
+    def test_iter_read_ahead(self) -> None:
+        """Testing _iter_read_ahead yields items in order from a background
+        thread
+        """
+        threads = set()
+
+        def _gen():
+            for i in range(10):
+                threads.add(threading.current_thread())
+                yield i
+
+        self.assertEqual(list(_iter_read_ahead(_gen(), read_ahead=4)),
+                         list(range(10)))
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_iter_read_ahead_bounded(self) -> None:
+        """Testing _iter_read_ahead only produces up to read_ahead items
+        before they're consumed
+        """
+        produced = []
+
+        def _gen():
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        iterator = _iter_read_ahead(_gen(), read_ahead=2)
+
+        self.assertEqual(next(iterator), 0)
+
+        # Give the worker time to produce anything it's allowed to.
+        time.sleep(0.1)
+        self.assertLessEqual(len(produced), 3)
+
+        self.assertEqual(list(iterator), list(range(1, 10)))
+
+    def test_iter_read_ahead_with_error(self) -> None:
+        """Testing _iter_read_ahead raises errors from the iterable in
+        order
+        """
+        def _gen():
+            yield 1
+            yield 2
+            raise ValueError('Oops')
+
+        iterator = _iter_read_ahead(_gen(), read_ahead=4)
+
+        self.assertEqual(next(iterator), 1)
+        self.assertEqual(next(iterator), 2)
+
+        with self.assertRaisesMessage(ValueError, 'Oops'):
+            next(iterator)
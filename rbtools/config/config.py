@@ -484,6 +484,117 @@ class RBToolsConfig(ConfigData):
     #:     5.0
     WEB_LOGIN: bool = False
 
+    #######################################################################
+    # HTTP connections
+    #######################################################################
+
+    #: The maximum number of idle keep-alive connections kept per server.
+    #:
+    #: Connections to the Review Board server are reused across API
+    #: requests, avoiding a new TCP connection and TLS handshake for each
+    #: request. Setting this to 0 disables connection reuse.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_CONNECTION_POOL_SIZE: int = 4
+
+    #: The number of seconds an idle keep-alive connection may be reused.
+    #:
+    #: Connections left idle for longer than this will be closed instead of
+    #: reused. This should generally be lower than the keep-alive timeout
+    #: configured on the server.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_CONNECTION_IDLE_TIMEOUT: int = 15
+
+    #: The maximum number of concurrent HTTP requests made to a server.
+    #:
+    #: This is shared by all API clients in a process, and applies to
+    #: batched and asynchronous requests. Setting this to 0 removes the
+    #: limit.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_MAX_CONCURRENT_REQUESTS: int = 8
+
+    #: Whether to request compressed responses from the server.
+    #:
+    #: If enabled, gzip or deflate-encoded responses will be requested and
+    #: transparently decoded. This can greatly reduce transfer sizes for
+    #: large diffs and lists.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_COMPRESSION: bool = False
+
+    #: The maximum number of times to retry a failed HTTP request.
+    #:
+    #: Requests are retried when the server is temporarily unavailable or
+    #: rate limiting requests (HTTP 429, 502, 503, or 504), or when the
+    #: connection fails. Only requests that are safe to repeat are retried.
+    #: Setting this to 0 disables retries.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_MAX_RETRIES: int = 3
+
+    #: The base delay in seconds for backing off between retries.
+    #:
+    #: The maximum delay doubles for each retry, with a random delay up to
+    #: that maximum being used.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_RETRY_BACKOFF: float = 0.5
+
+    #: The maximum delay in seconds between retries.
+    #:
+    #: Requests won't be retried if the server asks to wait longer than this.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_RETRY_MAX_DELAY: float = 30
+
+    #: The maximum number of HTTP requests per second to make to a server.
+    #:
+    #: This is shared across all clients talking to the same server in the
+    #: process. Setting this to 0 disables the limit.
+    #:
+    #: Version Added:
+    #:     7.0
+    HTTP_RATE_LIMIT: float = 0
+
+    #: The number of list pages to fetch ahead when paginating API results.
+    #:
+    #: When iterating through all pages of a list, this many of the
+    #: following pages will be fetched concurrently while the current page
+    #: is processed. Setting this to 0 fetches one page at a time.
+    #:
+    #: Version Added:
+    #:     7.0
+    API_PAGINATION_READ_AHEAD: int = 0
+
+    #: The JSON decoder used for API responses.
+    #:
+    #: This can be ``json`` (the Python standard library) or ``orjson``
+    #: (if installed). The default of ``auto`` uses the fastest available
+    #: decoder.
+    #:
+    #: Version Added:
+    #:     7.0
+    API_JSON_DECODER: str = 'auto'
+
+    #: Whether to warn when code accesses fields left out of API payloads.
+    #:
+    #: Commands can limit the fields they request from the API. When this
+    #: is enabled, a warning will be logged if a command accesses a field
+    #: that was not requested.
+    #:
+    #: Version Added:
+    #:     7.0
+    API_DEBUG_PROJECTIONS: bool = False
+
     #######################################################################
     # HTTP proxy
     #######################################################################
@@ -522,6 +633,58 @@ class RBToolsConfig(ConfigData):
     #:     0.7.3
     IN_MEMORY_CACHE: bool = False
 
+    #: The maximum size of the API cache, in megabytes.
+    #:
+    #: Once the cache grows beyond this, the least-recently-used responses
+    #: will be evicted. A value of 0 disables the limit.
+    #:
+    #: Version Added:
+    #:     7.0
+    CACHE_MAX_SIZE_MB: int = 100
+
+    #: The maximum number of responses to store in the API cache.
+    #:
+    #: Once the cache holds more than this, the least-recently-used responses
+    #: will be evicted. A value of 0 disables the limit.
+    #:
+    #: Version Added:
+    #:     7.0
+    CACHE_MAX_ENTRIES: int = 10000
+
+    #: How long a cached API root resource is used without revalidation.
+    #:
+    #: The root resource (along with its URI templates and the server's
+    #: capabilities) rarely changes, so it can be reused from the API cache
+    #: for up to this many seconds before being revalidated with the server.
+    #: Changes to the server's capabilities won't be seen until then.
+    #:
+    #: This defaults to 0, which revalidates it whenever the server asks.
+    #:
+    #: Version Added:
+    #:     7.0
+    CACHE_ROOT_TTL: int = 0
+
+    #: The maximum age of expired API cache responses used by some commands.
+    #:
+    #: Read-only commands (such as :command:`rbt status`) may use expired
+    #: cached responses up to this many seconds past their expiration, while
+    #: revalidating them in the background. A value of 0 (the default)
+    #: disables this.
+    #:
+    #: Version Added:
+    #:     7.0
+    CACHE_STALE_MAX_AGE: int = 0
+
+    #: Per-command overrides for :py:attr:`CACHE_STALE_MAX_AGE`.
+    #:
+    #: This maps command names to the maximum age, in seconds, of expired API
+    #: cache responses the command may use. A value of 0 disables this for
+    #: the command.
+    #:
+    #: Version Added:
+    #:     7.0
+    CACHE_STALE_COMMANDS: dict[str, int] = {}
+
     #######################################################################
     # SSL/TLS
     #######################################################################
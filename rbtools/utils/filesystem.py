@@ -287,3 +287,55 @@ def chdir(
         yield
     finally:
         os.chdir(old_cwd)
+
+
+@contextmanager
+def lock_file(
+    path: str,
+) -> Generator[None, None, None]:
+    """Hold an exclusive lock on a file for the duration of the context.
+
+    The lock is taken on a separate :file:`{path}.lock` file, so that the
+    file itself can be atomically replaced while the lock is held. This only
+    coordinates with other callers of this function. It's an advisory lock,
+    and won't stop other programs from modifying the file.
+
+    Version Added:
+        7.0
+
+    Args:
+        path (str):
+            The path to the file to lock.
+
+    Context:
+        The lock is held for the duration of the context.
+
+    Raises:
+        OSError:
+            The lock file could not be opened or locked.
+    """
+    fd = os.open(f'{path}.lock', os.O_CREAT | os.O_RDWR, 0o600)
+
+    try:
+        if sys.platform.startswith('win'):
+            import msvcrt
+
+            # This blocks, retrying for up to 10 seconds before failing.
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
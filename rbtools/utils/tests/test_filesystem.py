@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import os
 import shutil
+import threading
+import time
 
 from rbtools.testing import TestCase
 from rbtools.utils import filesystem
-from rbtools.utils.filesystem import (cleanup_tempfiles, make_empty_files,
-                                      make_tempdir, make_tempfile)
+from rbtools.utils.filesystem import (cleanup_tempfiles, lock_file,
+                                      make_empty_files, make_tempdir,
+                                      make_tempfile)
 
 
 class FilesystemTests(TestCase):
@@ -75,3 +78,26 @@ class FilesystemTests(TestCase):
         self.assertTrue(os.access(fname, os.R_OK | os.W_OK))
 
         shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_lock_file(self) -> None:
+        """Testing lock_file excludes other holders of the lock"""
+        path = os.path.join(make_tempdir(), 'file')
+        events: list[str] = []
+
+        def _lock_in_thread() -> None:
+            with lock_file(path):
+                events.append('thread')
+
+        with lock_file(path):
+            thread = threading.Thread(target=_lock_in_thread)
+            thread.start()
+
+            # Give the thread a chance to try to take the lock.
+            time.sleep(0.1)
+            events.append('main')
+
+        thread.join()
+
+        self.assertEqual(events, ['main', 'thread'])
+        self.assertTrue(os.path.exists(f'{path}.lock'))
+        self.assertFalse(os.path.exists(path))